@@ -1,15 +1,18 @@
-from datetime import datetime, timezone
 from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.schemas import TokenPayload
+from src.api.schemas import PaginationParams, TokenPayload
+from src.core.cache import user_cache
 from src.core.config import settings
-from src.domain.models import User
+from src.db.quiz_session_store import QuizSessionStore
+from src.db.repositories.sqlalchemy.deck_repository import DeckRepository
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import Deck, User
 
 # Create a callable object that will look for and parse the request for the `Authorization` header
 # Note that the `tokenUrl` parameter is only used for the OpenAPI documentation, not for the authentication itself
@@ -38,6 +41,27 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 async_session_dependency = Annotated[AsyncSession, Depends(get_db_session)]
+
+
+def get_quiz_session_store() -> QuizSessionStore:
+    """Get the quiz session store shared by all requests.
+
+    Raises:
+        Exception: If the quiz_session_store is not set.
+
+    Returns:
+        QuizSessionStore: The quiz session store.
+    """
+    from src.core.main import quiz_session_store
+
+    if quiz_session_store is None:
+        raise Exception("quiz_session_store is not set")
+    return quiz_session_store
+
+
+quiz_session_store_dependency = Annotated[
+    QuizSessionStore, Depends(get_quiz_session_store)
+]
 token_dependency = Annotated[str, Depends(reusable_oauth2)]
 
 
@@ -55,10 +79,9 @@ async def get_current_user(
         HTTPException: If the authentication token is invalid.
 
     Returns:
-        User: The current user.
+        User: The current user, which is shared with other requests and must not be modified.
     """
     try:
-        print(f"Received a request with authentication header of token {token}.")
         # Decrypt the received token and retrieve the payload.
         # Note that the payload will not be retrieved correctly unless the received token
         # is encrypted with the secret key and algorithm used at authentication (login) ,
@@ -73,18 +96,13 @@ async def get_current_user(
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
-    # user = session.get(User, token_data.sub)
-    user = User(
-        user_id=1,
-        user_name=token_data.sub,
-        email="dummy@gmail.com",
-        password="$2b$12$gjLw4vccsNb41k/eHJeGtemKhjzw3aKxW6ANle2ZXzJTfhiRyvgNy",
-        full_name="dummy user",
-        is_active=True,
-        is_superuser=True,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
-    )
+    # Reuse the user resolved by a recent request to avoid a database round trip per request.
+    # The cache is invalidated when `UserRepository` updates or deletes the user.
+    user = user_cache.get(token_data.sub)
+    if user is None:
+        user = await UserRepository(async_session).read_by_username(token_data.sub)
+        if user is not None:
+            user_cache.set(token_data.sub, user)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     if not user.is_active:
@@ -115,3 +133,72 @@ def get_current_active_superuser(current_user: current_user_dependency) -> User:
             detail="The user doesn't have enough privileges",
         )
     return current_user
+
+
+def get_pagination_params(
+    cursor: Annotated[
+        int | None,
+        Query(description="The id of the last record of the previous page."),
+    ] = None,
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=settings.MAX_PAGE_SIZE,
+            description="The maximum number of records in a page.",
+        ),
+    ] = settings.DEFAULT_PAGE_SIZE,
+    stream: Annotated[
+        bool,
+        Query(
+            description="Stream all the records after the cursor as NDJSON, ignoring the limit."
+        ),
+    ] = False,
+) -> PaginationParams:
+    """Get the keyset pagination parameters of a list endpoint from the query string.
+
+    Args:
+        cursor (int | None): The id of the last record of the previous page, if any.
+        limit (int): The maximum number of records in a page.
+        stream (bool): Whether to stream all the records after the cursor as NDJSON.
+
+    Returns:
+        PaginationParams: The pagination parameters.
+    """
+    return PaginationParams(cursor=cursor, limit=limit, stream=stream)
+
+
+pagination_dependency = Annotated[PaginationParams, Depends(get_pagination_params)]
+
+
+async def read_own_deck(
+    async_session: AsyncSession, deck_id: int, user: User, allow_shared: bool = False
+) -> Deck:
+    """Read a deck that belongs to a user.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        deck_id (int): The deck id.
+        user (User): The user who should own the deck.
+        allow_shared (bool): Whether a shared deck (i.e. a deck without an owner) can be read as well.
+
+    Raises:
+        HTTPException: If the deck is not found or belongs to another user.
+
+    Returns:
+        Deck: The deck.
+    """
+    try:
+        deck = await DeckRepository(async_session).read(deck_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Deck not found"
+        ) from e
+    if allow_shared and deck.user_id is None:
+        return deck
+    # Do not reveal the existence of decks of other users.
+    if deck.user_id != user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Deck not found"
+        )
+    return deck
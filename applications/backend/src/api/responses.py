@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import TypeVar
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# The response header that holds the cursor of the next page of a list endpoint.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor(
+    response: Response,
+    records: Sequence[BaseModel],
+    limit: int,
+    id_field: str = "self_id",
+) -> None:
+    """Set the cursor of the next page to the response header of a list endpoint.
+
+    The header is omitted when the page is not full, which means that it is the last page.
+
+    Args:
+        response (Response): The response of the list endpoint.
+        records (Sequence[BaseModel]): The domain entities or projections in the current page.
+        limit (int): The maximum number of records in a page.
+        id_field (str): The name of the attribute of a record that holds its id.
+    """
+    if records and len(records) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(getattr(records[-1], id_field))
+
+
+def ndjson_response(
+    records: AsyncIterator[ModelType],
+    to_response: Callable[[ModelType], BaseModel] | None = None,
+) -> StreamingResponse:
+    """Make a response that streams records as newline-delimited JSON.
+
+    Each record is serialized as soon as it is read from the database,
+    so the whole result is never held in memory.
+
+    Args:
+        records (AsyncIterator[ModelType]): The domain entities or projections to stream.
+        to_response (Callable[[ModelType], BaseModel] | None): The function that converts
+            a record into its response schema. None means the records are already
+            response schemas.
+
+    Returns:
+        StreamingResponse: The response with the `application/x-ndjson` media type.
+    """
+
+    async def generate() -> AsyncIterator[str]:
+        async for record in records:
+            if to_response is not None:
+                yield to_response(record).model_dump_json() + "\n"
+            else:
+                yield record.model_dump_json() + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
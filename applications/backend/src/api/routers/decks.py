@@ -1,36 +1,78 @@
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Response, status
 
-from src.api.dependencies import async_session_dependency, current_user_dependency
+from src.api.dependencies import (
+    async_session_dependency,
+    current_user_dependency,
+    pagination_dependency,
+    read_own_deck,
+)
+from src.api.responses import ndjson_response, set_next_cursor
 from src.api.schemas import (
+    AddDeckItemsRequest,
+    AddDeckItemsResponse,
+    CombineDecksRequest,
     CreateDeckRequest,
     CreateItemRequest,
     DeckResponse,
+    DeckSummaryResponse,
     ItemResponse,
+    RemoveDeckItemsRequest,
+    RemoveDeckItemsResponse,
 )
+from src.db.repositories.deck_repository_interface import DeckItemOrder
 from src.db.repositories.sqlalchemy.deck_repository import DeckRepository
-from src.domain.models import Deck
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.domain.models import Deck, Item
+from src.domain.services.deck_service.deck_item_listing import (
+    list_deck_items,
+    stream_deck_items,
+)
+from src.domain.services.deck_service.deck_listing import (
+    DeckSummary,
+    list_decks,
+    stream_decks,
+)
+from src.domain.services.item_service.item_addition import check_item_texts
+from src.domain.services.item_service.typeahead_index import typeahead_index
+from src.domain.services.quiz_service.item_index import item_index
 
 router = APIRouter()
 
 
-@router.get("/", response_model=list[DeckResponse])
+@router.get("/", response_model=list[DeckSummaryResponse])
 async def read_all_decks(
+    response: Response,
     current_user: current_user_dependency,
     async_session: async_session_dependency,
+    pagination: pagination_dependency,
 ) -> Any:
-    """Read all the decks registered by a user.
+    """Read a page of the decks registered by a user, or stream all of them as NDJSON.
+
+    Each deck comes with its number of items and the time of the last quiz taken on it,
+    which are read in the same query as the decks.
 
     Args:
+        response (Response): The response, whose `X-Next-Cursor` header is set if there may be a next page.
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
+        pagination (PaginationParams): The keyset pagination parameters.
 
     Returns:
-        list[DeckResponse]: The list of decks.
+        list[DeckSummaryResponse]: The list of decks.
     """
-    decks = [DeckResponse(deck_id=1, deck_name="dummy_deck")]
-    return decks
+    repo = DeckRepository(async_session)
+    if pagination.stream:
+        return ndjson_response(
+            stream_decks(repo, current_user.user_id, pagination.cursor),  # type: ignore
+            _to_deck_summary_response,
+        )
+    decks = await list_decks(
+        repo, current_user.user_id, pagination.cursor, pagination.limit  # type: ignore
+    )
+    set_next_cursor(response, decks, pagination.limit, id_field="deck_id")
+    return [_to_deck_summary_response(deck) for deck in decks]
 
 
 @router.post("/", response_model=DeckResponse)
@@ -49,12 +91,74 @@ async def create_deck(
     Returns:
         DeckResponse: The created deck.
     """
-    entity = Deck(user_id=1, deck_name=deck.deck_name)
+    entity = Deck(user_id=current_user.user_id, deck_name=deck.deck_name)
     repo = DeckRepository(async_session)
     created_deck = await repo.create(entity)
     return DeckResponse(deck_id=created_deck.deck_id, deck_name=created_deck.deck_name)  # type: ignore
 
 
+@router.post("/combine", response_model=DeckSummaryResponse)
+async def combine_decks(
+    request: CombineDecksRequest,
+    current_user: current_user_dependency,
+    async_session: async_session_dependency,
+) -> Any:
+    """Create a deck of the items in any, all, or only the first of the given decks.
+
+    The items are combined and copied by the database in a single statement, however many there are.
+    The decks of the user and the shared decks can be combined.
+
+    Args:
+        request (CombineDecksRequest): The name of the new deck, the set operation and the decks.
+        current_user (User): The current user.
+        async_session (AsyncSession): The async session.
+
+    Raises:
+        HTTPException: If a deck is not found.
+
+    Returns:
+        DeckSummaryResponse: The created deck.
+    """
+    for deck_id in request.deck_ids:
+        await read_own_deck(async_session, deck_id, current_user, allow_shared=True)
+    deck, item_count = await DeckRepository(async_session).create_from_decks(
+        request.operation,
+        request.deck_ids,
+        Deck(user_id=current_user.user_id, deck_name=request.deck_name),
+    )
+    return _to_created_deck_response(deck, item_count)
+
+
+@router.post("/{deck_id}/clone", response_model=DeckSummaryResponse)
+async def clone_deck(
+    deck_id: int,
+    deck: CreateDeckRequest,
+    current_user: current_user_dependency,
+    async_session: async_session_dependency,
+) -> Any:
+    """Copy a deck of the user or a shared deck into a new deck of the user.
+
+    The items are copied by the database in a single statement, however many there are.
+
+    Args:
+        deck_id (int): The id of the deck to copy.
+        deck (CreateDeckRequest): The new deck.
+        current_user (User): The current user.
+        async_session (AsyncSession): The async session.
+
+    Raises:
+        HTTPException: If the deck is not found.
+
+    Returns:
+        DeckSummaryResponse: The created deck.
+    """
+    await read_own_deck(async_session, deck_id, current_user, allow_shared=True)
+    created_deck, item_count = await DeckRepository(async_session).clone(
+        deck_id, Deck(user_id=current_user.user_id, deck_name=deck.deck_name)
+    )
+    return _to_created_deck_response(created_deck, item_count)
+
+
 @router.put("/{deck_id}", response_model=DeckResponse)
 async def update_deck(
     deck_id: int,
@@ -98,24 +202,55 @@ async def delete_deck(
 @router.get("/{deck_id}/items", response_model=list[ItemResponse])
 async def read_deck_items(
     deck_id: int,
+    response: Response,
     current_user: current_user_dependency,
     async_session: async_session_dependency,
+    pagination: pagination_dependency,
+    order_by: Annotated[
+        DeckItemOrder,
+        Query(
+            description="The order of the items: the order they were added in, by grade, or by creation time."
+        ),
+    ] = "position",
+    grade: Annotated[
+        int | None, Query(description="The grade of the items to read.")
+    ] = None,
 ) -> Any:
-    """Get all the items in a deck.
+    """Get a page of the items in a deck, or stream all of them as NDJSON.
+
+    Only the columns of `ItemResponse` are read by joining the items to the deck,
+    without constructing ORM instances.
 
     Args:
         deck_id (int): The deck id.
+        response (Response): The response, whose `X-Next-Cursor` header is set if there may be a next page.
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
+        pagination (PaginationParams): The keyset pagination parameters.
+        order_by (DeckItemOrder): The order of the items, where ties are ordered by their ids.
+        grade (int | None): The grade of the items to read. None means all grades.
 
     Returns:
         list[ItemResponse]: The list of deck items.
     """
-    items = [
-        ItemResponse(
-            item_id=1, english="dummy_english", japanese="dummy_japanese", grade=1
+    await read_own_deck(async_session, deck_id, current_user)
+    repo = DeckRepository(async_session)
+    if pagination.stream:
+        return ndjson_response(
+            stream_deck_items(
+                repo, ItemResponse, deck_id, order_by, grade, pagination.cursor
+            )
         )
-    ]
+    items = await list_deck_items(
+        repo,
+        ItemResponse,
+        deck_id,
+        order_by,
+        grade,
+        pagination.cursor,
+        pagination.limit,
+    )
+    set_next_cursor(response, items, pagination.limit, id_field="item_id")
     return items
 
 
@@ -126,7 +261,7 @@ async def create_deck_item(
     current_user: current_user_dependency,
     async_session: async_session_dependency,
 ) -> Any:
-    """Create a new item in a deck.
+    """Create a new item in a deck, or add the existing one if the user already has the same item.
 
     Args:
         deck_id (int): The deck id.
@@ -134,11 +269,99 @@ async def create_deck_item(
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
 
+    Raises:
+        HTTPException: If the deck is not found or a text of the item is blank.
+
+    Returns:
+        ItemResponse: The created item, or the existing one if the user already has the same item.
+    """
+    await read_own_deck(async_session, deck_id, current_user)
+    new_item_ids, _ = await DeckRepository(async_session).add_items(
+        deck_id,
+        [],
+        _to_new_items(current_user.user_id, [item]),
+        current_user.user_id,
+    )
+    item_index.expire()
+    typeahead_index.expire()
+    return await ItemRepository(async_session).read(new_item_ids[0])
+
+
+@router.post("/{deck_id}/items/batch", response_model=AddDeckItemsResponse)
+async def add_deck_items(
+    deck_id: int,
+    request: AddDeckItemsRequest,
+    current_user: current_user_dependency,
+    async_session: async_session_dependency,
+) -> Any:
+    """Add existing items and new items to a deck at once.
+
+    The new items are created and all the items are added in a single transaction by three
+    statements, however many there are. The new items that the user already has are added
+    instead of being created again. The items already in the deck, and the items that do not
+    exist or belong to other users, are skipped.
+
+    Args:
+        deck_id (int): The deck id.
+        request (AddDeckItemsRequest): The ids of the existing items and the new items to add.
+        current_user (User): The current user.
+        async_session (AsyncSession): The async session.
+
+    Raises:
+        HTTPException: If the deck is not found or a text of a new item is blank.
+
     Returns:
-        ItemResponse: The created item.
+        AddDeckItemsResponse: The numbers of the added and the skipped items, and the ids of the new items,
+            which are the ids of the existing items for the duplicates.
     """
-    return ItemResponse(
-        item_id=1, english="dummy_english", japanese="dummy_japanese", grade=1
+    await read_own_deck(async_session, deck_id, current_user)
+    new_item_ids, added_item_ids = await DeckRepository(async_session).add_items(
+        deck_id,
+        request.item_ids,
+        _to_new_items(current_user.user_id, request.items),
+        current_user.user_id,
+    )
+    item_index.expire()
+    if new_item_ids:
+        typeahead_index.expire()
+    return AddDeckItemsResponse(
+        num_added=len(added_item_ids),
+        num_skipped=len(request.item_ids) + len(request.items) - len(added_item_ids),
+        item_ids=new_item_ids,
+    )
+
+
+@router.delete("/{deck_id}/items", response_model=RemoveDeckItemsResponse)
+async def remove_deck_items(
+    deck_id: int,
+    request: RemoveDeckItemsRequest,
+    current_user: current_user_dependency,
+    async_session: async_session_dependency,
+) -> Any:
+    """Remove items from a deck at once by a single statement, however many there are.
+
+    The items themselves are not deleted. The items not in the deck are skipped.
+
+    Args:
+        deck_id (int): The deck id.
+        request (RemoveDeckItemsRequest): The ids of the items to remove.
+        current_user (User): The current user.
+        async_session (AsyncSession): The async session.
+
+    Raises:
+        HTTPException: If the deck is not found.
+
+    Returns:
+        RemoveDeckItemsResponse: The numbers of the removed and the skipped items.
+    """
+    await read_own_deck(async_session, deck_id, current_user)
+    removed_item_ids = await DeckRepository(async_session).remove_items(
+        deck_id, request.item_ids
+    )
+    item_index.expire()
+    return RemoveDeckItemsResponse(
+        num_removed=len(removed_item_ids),
+        num_skipped=len(request.item_ids) - len(removed_item_ids),
     )
 
 
@@ -151,13 +374,82 @@ async def delete_deck_item(
 ) -> bool:
     """Delete an item from a deck.
 
+    The item itself is not deleted.
+
     Args:
         deck_id (int): The deck id.
         item_id (int): The item id.
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
 
+    Raises:
+        HTTPException: If the deck is not found or the item is not in the deck.
+
     Returns:
         bool: True if the item was deleted successfully.
     """
+    await read_own_deck(async_session, deck_id, current_user)
+    if not await DeckRepository(async_session).remove_items(deck_id, [item_id]):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Item not found in the deck"
+        )
+    item_index.expire()
     return True
+
+
+def _to_deck_summary_response(deck: DeckSummary) -> DeckSummaryResponse:
+    """Convert a deck in the list of the decks into its response schema.
+
+    Args:
+        deck (DeckSummary): The deck.
+
+    Returns:
+        DeckSummaryResponse: The response schema of the deck.
+    """
+    return DeckSummaryResponse(
+        deck_id=deck.deck_id,
+        deck_name=deck.deck_name,
+        item_count=deck.item_count,
+        last_studied_at=deck.last_studied_at,
+    )
+
+
+def _to_created_deck_response(deck: Deck, item_count: int) -> DeckSummaryResponse:
+    """Convert a deck that has just been created into its response schema.
+
+    Args:
+        deck (Deck): The deck.
+        item_count (int): The number of items in the deck.
+
+    Returns:
+        DeckSummaryResponse: The response schema of the deck, which has not been studied yet.
+    """
+    return DeckSummaryResponse(
+        deck_id=deck.deck_id,  # type: ignore
+        deck_name=deck.deck_name,
+        item_count=item_count,
+        last_studied_at=None,
+    )
+
+
+def _to_new_items(user_id: int | None, items: list[CreateItemRequest]) -> list[Item]:
+    """Convert the requested new items of a user into domain models, checking their texts.
+
+    Args:
+        user_id (int | None): The unique identifier for the user.
+        items (list[CreateItemRequest]): The requested new items.
+
+    Raises:
+        HTTPException: If a text of an item is blank.
+
+    Returns:
+        list[Item]: The new items.
+    """
+    new_items = [Item(user_id=user_id, **item.model_dump()) for item in items]
+    try:
+        check_item_texts(new_items)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    return new_items
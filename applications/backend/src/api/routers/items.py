@@ -1,32 +1,110 @@
-from typing import Any
+import io
+from typing import Annotated, Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Response, UploadFile, status
 
-from src.api.dependencies import async_session_dependency, current_user_dependency
-from src.api.schemas import CreateItemRequest, ItemResponse, UpdateItemRequest
+from src.api.dependencies import (
+    async_session_dependency,
+    current_user_dependency,
+    pagination_dependency,
+    read_own_deck,
+)
+from src.api.responses import ndjson_response, set_next_cursor
+from src.api.schemas import (
+    AddItemsRequest,
+    AddItemsResponse,
+    CreateItemRequest,
+    ImportItemsResponse,
+    ItemResponse,
+    UpdateItemRequest,
+)
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.domain.models import Item
+from src.domain.services.item_service.item_addition import (
+    ItemAdditionResult,
+    add_items,
+)
+from src.domain.services.item_service.typeahead_index import typeahead_index
+from src.domain.services.item_service.word_list_import import (
+    WordListImportResult,
+    import_word_list,
+)
+from src.domain.services.quiz_service.item_index import item_index
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[ItemResponse])
 async def search_items(
+    response: Response,
     current_user: current_user_dependency,
     async_session: async_session_dependency,
+    pagination: pagination_dependency,
+    q: Annotated[
+        str | None,
+        Query(
+            max_length=100,
+            description="The text to search for in English, or else in Japanese.",
+        ),
+    ] = None,
+    grades: Annotated[
+        list[int] | None, Query(description="The grades of the items.")
+    ] = None,
+    deck_id: int | None = None,
+    genre_id: int | None = None,
+    fuzzy: Annotated[
+        bool, Query(description="Also match English words similar to the text.")
+    ] = False,
 ) -> Any:
-    """Search for items.
+    """Search the items made by a user page by page, or stream all of them as NDJSON.
+
+    Only the columns of `ItemResponse` are read, without constructing ORM instances.
 
     Args:
+        response (Response): The response, whose `X-Next-Cursor` header is set if there may be a next page.
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
+        pagination (PaginationParams): The keyset pagination parameters.
+        q (str | None): The text to search for. None means all items.
+        grades (list[int] | None): The grades of the items. None means all grades.
+        deck_id (int | None): The deck id of the items, if any.
+        genre_id (int | None): The genre id of the items, if any.
+        fuzzy (bool): Whether English words similar to the text also match.
+
+    Raises:
+        HTTPException: If the deck is not found.
 
     Returns:
         list[ItemResponse]: The list of serached items.
     """
-    items = [
-        ItemResponse(
-            item_id=1, english="dummy_english", japanese="dummy_japanese", grade=1
+    if deck_id is not None:
+        await read_own_deck(async_session, deck_id, current_user)
+    repo = ItemRepository(async_session)
+    if pagination.stream:
+        return ndjson_response(
+            repo.stream_search_projected(
+                ItemResponse,
+                q,
+                current_user.user_id,
+                grades,
+                deck_id,
+                genre_id,
+                fuzzy,
+                pagination.cursor,
+            )
         )
-    ]
+    items = await repo.search_projected(
+        ItemResponse,
+        q,
+        current_user.user_id,
+        grades,
+        deck_id,
+        genre_id,
+        fuzzy,
+        pagination.cursor,
+        pagination.limit,
+    )
+    set_next_cursor(response, items, pagination.limit, id_field="item_id")
     return items
 
 
@@ -36,19 +114,149 @@ async def create_item(
     current_user: current_user_dependency,
     async_session: async_session_dependency,
 ) -> Any:
-    """Create a new item.
+    """Create a new item, or get the existing one if the user already has the same item.
+
+    Items are the same if their texts are the same after normalizing case, whitespace and the
+    widths of characters, so creating an item again is idempotent.
 
     Args:
         item (CreateItemRequest): The item to create.
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
 
+    Raises:
+        HTTPException: If a text of the item is blank.
+
     Returns:
-        ItemResponse: The created item.
+        ItemResponse: The created item, or the existing one.
     """
-    return ItemResponse(
-        item_id=1, english="dummy_english", japanese="dummy_japanese", grade=1
+    repo = ItemRepository(async_session)
+    result = await _add_items(repo, current_user.user_id, [item])
+    return await repo.read(result.item_ids[0])
+
+
+@router.post("/batch", response_model=AddItemsResponse)
+async def create_items(
+    request: AddItemsRequest,
+    current_user: current_user_dependency,
+    async_session: async_session_dependency,
+) -> Any:
+    """Create new items at once, skipping the ones that the user already has.
+
+    The items are created by a single statement however many there are, in which the duplicates
+    of existing items and of each other are skipped by the database.
+
+    Args:
+        request (AddItemsRequest): The items to create.
+        current_user (User): The current user.
+        async_session (AsyncSession): The async session.
+
+    Raises:
+        HTTPException: If a text of an item is blank.
+
+    Returns:
+        AddItemsResponse: The numbers of the created and the skipped items, and the ids of the items
+            in the order they were given, which are the ids of the existing items for the duplicates.
+    """
+    result = await _add_items(
+        ItemRepository(async_session), current_user.user_id, request.items
     )
+    return AddItemsResponse(**result.model_dump())
+
+
+@router.post("/import", response_model=ImportItemsResponse)
+async def import_items(
+    file: UploadFile,
+    current_user: current_user_dependency,
+    async_session: async_session_dependency,
+    deck_id: int | None = None,
+    genre_id: int | None = None,
+) -> Any:
+    """Import a CSV/TSV word list with `english`, `japanese` and `grade` columns as new items.
+
+    Args:
+        file (UploadFile): The word list to import.
+        current_user (User): The current user.
+        async_session (AsyncSession): The async session.
+        deck_id (int | None): The deck id to add the imported items to, if any.
+        genre_id (int | None): The genre id to tag the imported items with, if any.
+
+    Raises:
+        HTTPException: If the deck is not found, the genre does not exist or the word list is malformed.
+            The word list is imported in chunks, and the detail of the error tells how many items
+            had been imported before it, which are kept.
+
+    Returns:
+        ImportItemsResponse: The statistics of the import.
+    """
+    if deck_id is not None:
+        await read_own_deck(async_session, deck_id, current_user)
+
+    # `utf-8-sig` also accepts word lists saved with a BOM (e.g. by Excel).
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    # The chunks are committed one by one, so keep track of how many items are already imported.
+    progress: list[WordListImportResult] = []
+    try:
+        result = await import_word_list(
+            ItemRepository(async_session),
+            stream,
+            user_id=current_user.user_id,
+            deck_id=deck_id,
+            genre_id=genre_id,
+            on_progress=progress.append,
+        )
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": str(e),
+                "num_items": progress[-1].num_items if progress else 0,
+            },
+        ) from e
+    finally:
+        if progress:
+            # Let the next quiz of this process ask about the imported items without waiting for a refresh.
+            item_index.expire()
+            typeahead_index.expire()
+    return ImportItemsResponse(**result.model_dump())
+
+
+@router.get("/suggest", response_model=list[ItemResponse])
+async def suggest_items(
+    q: Annotated[
+        str,
+        Query(
+            min_length=1,
+            max_length=100,
+            description="The prefix typed so far, in English or else in Japanese.",
+        ),
+    ],
+    current_user: current_user_dependency,
+    async_session: async_session_dependency,
+    grades: Annotated[
+        list[int] | None, Query(description="The grades of the items.")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> Any:
+    """Suggest the items of a user and the shared items starting with a prefix, as the user types.
+
+    The suggestions are made from the typeahead index in the memory of the process, which reads
+    only the items updated since its previous refresh from the database.
+
+    Args:
+        q (str): The prefix typed so far.
+        current_user (User): The current user.
+        async_session (AsyncSession): The async session.
+        grades (list[int] | None): The grades of the items. None means all grades.
+        limit (int): The maximum number of suggestions.
+
+    Returns:
+        list[ItemResponse]: The suggested items, shortest completions first. Empty while the
+            index is loaded for the first time.
+    """
+    if not await typeahead_index.refresh(ItemRepository(async_session)):
+        return []
+    return typeahead_index.suggest(q, current_user.user_id, grades, limit)
 
 
 @router.get("/{item_id}", response_model=ItemResponse)
@@ -112,3 +320,34 @@ async def delete_item(
         bool: True if the item was deleted successfully.
     """
     return True
+
+
+async def _add_items(
+    repo: ItemRepository, user_id: int | None, items: list[CreateItemRequest]
+) -> ItemAdditionResult:
+    """Add items of a user, skipping the ones that the user already has.
+
+    Args:
+        repo (ItemRepository): The repository of items.
+        user_id (int | None): The unique identifier for the user.
+        items (list[CreateItemRequest]): The items to add.
+
+    Raises:
+        HTTPException: If a text of an item is blank.
+
+    Returns:
+        ItemAdditionResult: The ids of the items and the numbers of the created and the skipped items.
+    """
+    try:
+        result = await add_items(
+            repo, [Item(user_id=user_id, **item.model_dump()) for item in items]
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    if result.num_created:
+        # Let the next quiz and suggestions of this process include the new items without waiting for a refresh.
+        item_index.expire()
+        typeahead_index.expire()
+    return result
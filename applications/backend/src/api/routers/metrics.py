@@ -0,0 +1,45 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.api.dependencies import get_current_active_superuser
+from src.api.schemas import (
+    DatabasePoolMetricsResponse,
+    MetricsResponse,
+    PasswordHashingMetricsResponse,
+)
+from src.core.security import password_hashing_executor
+from src.db.engine import get_pool_statistics
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_model=MetricsResponse,
+)
+async def read_metrics() -> Any:
+    """Get the runtime metrics of the server, such as the connection pool and password hashing usage.
+
+    Raises:
+        HTTPException: If the database engine is not set.
+
+    Returns:
+        MetricsResponse: The runtime metrics.
+    """
+    from src.core.main import engine
+
+    if engine is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The database engine is not set",
+        )
+    pool_statistics = get_pool_statistics(engine)
+    return MetricsResponse(
+        database_pool=DatabasePoolMetricsResponse(**pool_statistics.model_dump()),
+        password_hashing=PasswordHashingMetricsResponse(
+            max_workers=password_hashing_executor.max_workers,
+            **password_hashing_executor.metrics.model_dump(),
+        ),
+    )
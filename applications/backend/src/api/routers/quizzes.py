@@ -1,131 +1,352 @@
-import datetime
+from datetime import date, datetime
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Response, status
 
-from src.api.dependencies import async_session_dependency, current_user_dependency
+from src.api.dependencies import (
+    async_session_dependency,
+    current_user_dependency,
+    pagination_dependency,
+    quiz_session_store_dependency,
+    read_own_deck,
+)
+from src.api.responses import ndjson_response, set_next_cursor
 from src.api.schemas import (
+    CreateQuizRequest,
     QuizCheckedResponse,
+    QuizDayStatsResponse,
+    QuizGradeStatsResponse,
     QuizItemAfterAttemptRequest,
     QuizItemBeforeAttemptResponse,
     QuizItemCheckedResponse,
     QuizMetaDataResponse,
+    QuizStatsResponse,
     QuizUnsolvedResponse,
 )
+from src.core.config import settings
+from src.db.quiz_session_store import QuizSession, QuizSessionQuestion
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.db.repositories.sqlalchemy.quiz_item_repository import QuizItemRepository
+from src.db.repositories.sqlalchemy.quiz_repository import QuizRepository
+from src.db.repositories.sqlalchemy.quiz_stat_repository import QuizStatRepository
+from src.db.repositories.sqlalchemy.review_state_repository import (
+    ReviewStateRepository,
+)
+from src.domain.models import Quiz, QuizWithItems
+from src.domain.services.quiz_service.item_index import item_index
+from src.domain.services.quiz_service.quiz_generation import generate_quiz
+from src.domain.services.quiz_service.quiz_history import (
+    QuizStatsTotal,
+    summarize_quiz_stats,
+)
+from src.domain.services.quiz_service.quiz_solving import (
+    QuizAnswer,
+    grade_answers,
+    read_choices,
+)
+from src.domain.services.quiz_service.review_scheduling import schedule_reviews
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[QuizMetaDataResponse])
 async def read_all_quizzes(
+    response: Response,
     current_user: current_user_dependency,
     async_session: async_session_dependency,
+    pagination: pagination_dependency,
 ) -> Any:
-    """Read all the quizzes attempted by a user.
+    """Read a page of the quizzes attempted by a user, or stream all of them as NDJSON.
 
     Args:
+        response (Response): The response, whose `X-Next-Cursor` header is set if there may be a next page.
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
+        pagination (PaginationParams): The keyset pagination parameters.
 
     Returns:
         list[QuizMetaDataResponse]: The list of all quizzes.
     """
-    quizzes = [
-        QuizMetaDataResponse(
-            quiz_id=1,
-            timestamp=datetime.datetime.now(),
+    repo = QuizRepository(async_session)
+    if pagination.stream:
+        return ndjson_response(
+            repo.stream_by_user_id(current_user.user_id, pagination.cursor),  # type: ignore
+            _to_quiz_meta_data_response,
         )
-    ]
-    return quizzes
+    quizzes = await repo.read_by_user_id(
+        current_user.user_id, pagination.cursor, pagination.limit  # type: ignore
+    )
+    set_next_cursor(response, quizzes, pagination.limit)
+    return [_to_quiz_meta_data_response(quiz) for quiz in quizzes]
 
 
 @router.post("/", response_model=QuizUnsolvedResponse)
 async def create_quiz(
+    quiz_in: CreateQuizRequest,
     current_user: current_user_dependency,
     async_session: async_session_dependency,
+    quiz_session_store: quiz_session_store_dependency,
 ) -> Any:
-    """Create a new quiz.
+    """Create a new multiple-choice quiz out of the items of a deck or of the user.
+
+    The quiz is also kept as a quiz session until it is answered, so that it is not rebuilt from the items.
 
     Args:
+        quiz_in (CreateQuizRequest): The deck, the number of questions and the grades to ask about,
+            whether the distractors are similar to the questions, and whether the items due to be
+            reviewed are asked first.
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
+        quiz_session_store (QuizSessionStore): The store of the quizzes being taken.
+
+    Raises:
+        HTTPException: If the deck is not found or there are not enough items to make a quiz.
 
     Returns:
         QuizUnsolvedResponse: The created quiz.
     """
-    return QuizUnsolvedResponse(
-        quiz_id=1,
-        quiz_items=[
-            QuizItemBeforeAttemptResponse(
-                question_number=1,
-                choices=[
-                    "dummy_choice_1",
-                    "dummy_choice_2",
-                    "dummy_choice_3",
-                    "dummy_choice_4",
-                ],
-            ),
-            QuizItemBeforeAttemptResponse(
-                question_number=2,
-                choices=[
-                    "dummy_choice_1",
-                    "dummy_choice_2",
-                    "dummy_choice_3",
-                    "dummy_choice_4",
-                ],
+    if quiz_in.deck_id is not None:
+        await read_own_deck(async_session, quiz_in.deck_id, current_user)
+    try:
+        generated_quiz = await generate_quiz(
+            ItemRepository(async_session),
+            QuizRepository(async_session),
+            current_user.user_id,  # type: ignore
+            quiz_in.num_questions,
+            deck_id=quiz_in.deck_id,
+            grades=quiz_in.grades,
+            item_index=item_index if settings.ITEM_INDEX_ENABLED else None,
+            similar_distractors=quiz_in.similar_distractors,
+            review_state_repository=(
+                ReviewStateRepository(async_session) if quiz_in.review_due else None
             ),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    quiz_session = QuizSession(
+        quiz_id=generated_quiz.quiz.quiz_id,  # type: ignore
+        user_id=generated_quiz.quiz.user_id,
+        quiz_timestamp=generated_quiz.quiz.quiz_timestamp,
+        questions=[
+            QuizSessionQuestion(
+                question_number=question.quiz_item.question_number,
+                question=question.question.english,
+                choices=question.choices,
+                correct_answer=question.quiz_item.correct_answer,
+            )
+            for question in generated_quiz.questions
+        ],
+    )
+    await quiz_session_store.save(quiz_session)
+    return _to_quiz_unsolved_response(quiz_session)
+
+
+@router.get("/history", response_model=list[QuizCheckedResponse])
+async def read_quiz_history(
+    response: Response,
+    current_user: current_user_dependency,
+    async_session: async_session_dependency,
+    pagination: pagination_dependency,
+) -> Any:
+    """Read a page of the answered quizzes of a user with their quiz items and the texts of their choices.
+
+    A page is read by three queries, however many quizzes, questions and choices it has.
+
+    Args:
+        response (Response): The response, whose `X-Next-Cursor` header is set if there may be a next page.
+        current_user (User): The current user.
+        async_session (AsyncSession): The async session.
+        pagination (PaginationParams): The keyset pagination parameters.
+
+    Raises:
+        HTTPException: If streaming is requested, which the history does not support.
+
+    Returns:
+        list[QuizCheckedResponse]: The answered quizzes.
+    """
+    if pagination.stream:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The quiz history cannot be streamed",
+        )
+    quizzes_with_items = await QuizRepository(async_session).read_answered_with_items(
+        current_user.user_id, pagination.cursor, pagination.limit  # type: ignore
+    )
+    set_next_cursor(
+        response,
+        [quiz_with_items.quiz for quiz_with_items in quizzes_with_items],
+        pagination.limit,
+    )
+    return [
+        _to_quiz_checked_response(quiz_with_items)
+        for quiz_with_items in quizzes_with_items
+    ]
+
+
+@router.get("/stats", response_model=QuizStatsResponse)
+async def read_quiz_stats(
+    current_user: current_user_dependency,
+    async_session: async_session_dependency,
+    deck_id: int | None = None,
+    since: date | None = None,
+) -> Any:
+    """Read the accuracy and the average answer time of a user in total, by grade and by day.
+
+    The statistics are kept up to date when quizzes are answered, so they are read without
+    scanning the quizzes of the user, however many there are.
+
+    Args:
+        current_user (User): The current user.
+        async_session (AsyncSession): The async session.
+        deck_id (int | None): The deck to read the statistics of, if any. Otherwise, all quizzes are counted.
+        since (date | None): The first day to count the quizzes of. None means all days.
+
+    Returns:
+        QuizStatsResponse: The statistics.
+    """
+    quiz_stats = await QuizStatRepository(async_session).read_by_user_id(
+        current_user.user_id, deck_id=deck_id, since=since  # type: ignore
+    )
+    summary = summarize_quiz_stats(quiz_stats)
+    return QuizStatsResponse(
+        **_to_quiz_stats_entry(summary.total),
+        grades=[
+            QuizGradeStatsResponse(grade=grade, **_to_quiz_stats_entry(total))
+            for grade, total in summary.by_grade.items()
+        ],
+        days=[
+            QuizDayStatsResponse(day=day, **_to_quiz_stats_entry(total))
+            for day, total in summary.by_day.items()
         ],
-        timestamp=datetime.datetime.now(),
     )
 
 
+@router.get("/{quiz_id}", response_model=QuizUnsolvedResponse)
+async def read_quiz(
+    quiz_id: int,
+    current_user: current_user_dependency,
+    quiz_session_store: quiz_session_store_dependency,
+) -> Any:
+    """Read a quiz being taken, e.g. to resume it after reloading the page.
+
+    Args:
+        quiz_id (int): The quiz id.
+        current_user (User): The current user.
+        quiz_session_store (QuizSessionStore): The store of the quizzes being taken.
+
+    Raises:
+        HTTPException: If the quiz of the user is not being taken, e.g. it has expired.
+
+    Returns:
+        QuizUnsolvedResponse: The quiz.
+    """
+    quiz_session = await quiz_session_store.read(quiz_id)
+    if quiz_session is None or quiz_session.user_id != current_user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+    return _to_quiz_unsolved_response(quiz_session)
+
+
 @router.post("/{quiz_id}", response_model=QuizCheckedResponse)
 async def answer_quiz(
     quiz_id: int,
     solved_items: list[QuizItemAfterAttemptRequest],
     current_user: current_user_dependency,
     async_session: async_session_dependency,
+    quiz_session_store: quiz_session_store_dependency,
 ) -> Any:
     """Answer a quiz.
 
+    The quiz items are read by a single query, graded in a single pass and their answers are
+    written back by a single statement regardless of the number of questions, and so are the
+    review states of the items, which schedule their next reviews. The choices are taken from
+    the quiz session, and read from the items only if it has expired.
+
     Args:
         quiz_id (int): The quiz id.
         solved_items (list[QuizItemAfterAttemptRequest]): The list of solved items.
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
+        quiz_session_store (QuizSessionStore): The store of the quizzes being taken.
+
+    Raises:
+        HTTPException: If the quiz of the user is not found, it has already been answered,
+            or the answers do not match its questions.
 
     Returns:
         QuizCheckedResponse: The checked quiz.
     """
+    repo = QuizItemRepository(async_session)
+    quiz_items = await repo.read_by_quiz_id(quiz_id, current_user.user_id)
+    if not quiz_items:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+    if any(quiz_item.user_answer is not None for quiz_item in quiz_items):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Quiz already answered"
+        )
+    try:
+        answered_items = grade_answers(
+            quiz_items,
+            (
+                QuizAnswer(
+                    question_number=solved_item.question_number,
+                    user_answer=solved_item.user_answer,
+                    answer_time=solved_item.answer_time,
+                )
+                for solved_item in solved_items
+            ),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    review_states = await schedule_reviews(
+        ReviewStateRepository(async_session),
+        current_user.user_id,  # type: ignore
+        answered_items,
+        datetime.now(),
+    )
+    try:
+        # The review states are written in the same transaction as the answers, so that a quiz
+        # is never graded without its items being rescheduled.
+        await repo.update_answers(answered_items, review_states)
+    except ValueError as e:
+        # Another submission of the same quiz answered it after the check above.
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Quiz already answered"
+        ) from e
+
+    quiz_session = await quiz_session_store.read(quiz_id)
+    if quiz_session is not None:
+        choices = {
+            question.question_number: question.choices
+            for question in quiz_session.questions
+        }
+        quiz_timestamp = quiz_session.quiz_timestamp
+    else:
+        choices = await read_choices(ItemRepository(async_session), answered_items)
+        quiz_timestamp = (
+            await QuizRepository(async_session).read(quiz_id)
+        ).quiz_timestamp
+    await quiz_session_store.delete(quiz_id)
     return QuizCheckedResponse(
         quiz_id=quiz_id,
+        timestamp=quiz_timestamp,
         quiz_items=[
             QuizItemCheckedResponse(
-                question_number=1,
-                choices=[
-                    "dummy_choice_1",
-                    "dummy_choice_2",
-                    "dummy_choice_3",
-                    "dummy_choice_4",
-                ],
-                user_answer=1,
-                correct_answer=1,
-                answer_time=1000,
-            ),
-            QuizItemCheckedResponse(
-                question_number=2,
-                choices=[
-                    "dummy_choice_1",
-                    "dummy_choice_2",
-                    "dummy_choice_3",
-                    "dummy_choice_4",
-                ],
-                user_answer=1,
-                correct_answer=1,
-                answer_time=1000,
-            ),
+                question_number=quiz_item.question_number,
+                choices=choices[quiz_item.question_number],
+                user_answer=quiz_item.user_answer,  # type: ignore
+                correct_answer=quiz_item.correct_answer,
+                answer_time=quiz_item.answer_time,  # type: ignore
+            )
+            for quiz_item in answered_items
         ],
-        timestamp=datetime.datetime.now(),
     )
 
 
@@ -135,39 +356,114 @@ async def read_quiz_items(
     current_user: current_user_dependency,
     async_session: async_session_dependency,
 ) -> Any:
-    """Get all the items in a quiz.
+    """Get all the items in an answered quiz with the texts of their choices.
 
     Args:
         quiz_id (int): The quiz id.
         current_user (User): The current user.
         async_session (AsyncSession): The async session.
 
+    Raises:
+        HTTPException: If the quiz of the user is not found or has not been answered yet.
+
     Returns:
         list[QuizItemCheckedResponse]: The list of quiz items.
     """
-    return [
-        QuizItemCheckedResponse(
-            question_number=1,
-            choices=[
-                "dummy_choice_1",
-                "dummy_choice_2",
-                "dummy_choice_3",
-                "dummy_choice_4",
-            ],
-            user_answer=1,
-            correct_answer=1,
-            answer_time=1000,
-        ),
-        QuizItemCheckedResponse(
-            question_number=2,
-            choices=[
-                "dummy_choice_1",
-                "dummy_choice_2",
-                "dummy_choice_3",
-                "dummy_choice_4",
-            ],
-            user_answer=1,
-            correct_answer=1,
-            answer_time=1000,
-        ),
-    ]
+    try:
+        quiz_with_items = await QuizRepository(async_session).read_with_items(
+            quiz_id, current_user.user_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        ) from e
+    if any(quiz_item.user_answer is None for quiz_item in quiz_with_items.quiz_items):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Quiz not answered yet"
+        )
+    return _to_quiz_checked_response(quiz_with_items).quiz_items
+
+
+def _to_quiz_unsolved_response(quiz_session: QuizSession) -> QuizUnsolvedResponse:
+    """Convert a quiz session into the response schema of a quiz being taken.
+
+    Args:
+        quiz_session (QuizSession): The quiz session.
+
+    Returns:
+        QuizUnsolvedResponse: The response schema of the quiz, without the correct answers.
+    """
+    return QuizUnsolvedResponse(
+        quiz_id=quiz_session.quiz_id,
+        timestamp=quiz_session.quiz_timestamp,
+        quiz_items=[
+            QuizItemBeforeAttemptResponse(
+                question_number=question.question_number,
+                question=question.question,
+                choices=question.choices,
+            )
+            for question in quiz_session.questions
+        ],
+    )
+
+
+def _to_quiz_checked_response(quiz_with_items: QuizWithItems) -> QuizCheckedResponse:
+    """Convert an answered quiz with its quiz items into the response schema of a checked quiz.
+
+    Args:
+        quiz_with_items (QuizWithItems): The quiz with its quiz items and the items of their choices.
+
+    Returns:
+        QuizCheckedResponse: The response schema of the quiz. The choices whose items have been
+            deleted since the quiz was taken are empty.
+    """
+    return QuizCheckedResponse(
+        quiz_id=quiz_with_items.quiz.quiz_id,  # type: ignore
+        timestamp=quiz_with_items.quiz.quiz_timestamp,
+        quiz_items=[
+            QuizItemCheckedResponse(
+                question_number=quiz_item.question_number,
+                choices=[
+                    (
+                        quiz_with_items.choice_items[id].japanese
+                        if id in quiz_with_items.choice_items
+                        else ""
+                    )
+                    for id in quiz_item.choice_item_ids
+                ],
+                user_answer=quiz_item.user_answer,  # type: ignore
+                correct_answer=quiz_item.correct_answer,
+                answer_time=quiz_item.answer_time,  # type: ignore
+            )
+            for quiz_item in quiz_with_items.quiz_items
+        ],
+    )
+
+
+def _to_quiz_meta_data_response(quiz: Quiz) -> QuizMetaDataResponse:
+    """Convert a quiz into the response schema of its metadata.
+
+    Args:
+        quiz (Quiz): The quiz.
+
+    Returns:
+        QuizMetaDataResponse: The response schema of the quiz metadata.
+    """
+    return QuizMetaDataResponse(quiz_id=quiz.quiz_id, timestamp=quiz.quiz_timestamp)  # type: ignore
+
+
+def _to_quiz_stats_entry(total: QuizStatsTotal) -> dict[str, Any]:
+    """Convert summed statistics into the fields of the response schema of statistics.
+
+    Args:
+        total (QuizStatsTotal): The summed statistics.
+
+    Returns:
+        dict[str, Any]: The fields of `QuizStatsEntryResponse`.
+    """
+    return {
+        "attempts": total.attempts,
+        "correct": total.correct,
+        "accuracy": total.accuracy,
+        "average_answer_time": total.average_answer_time,
+    }
@@ -1,13 +1,17 @@
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from src.api.dependencies import (
     async_session_dependency,
     current_user_dependency,
     get_current_active_superuser,
+    pagination_dependency,
 )
+from src.api.responses import ndjson_response, set_next_cursor
 from src.api.schemas import CreateUserRequest, UpdateUserRequest, UserResponse
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import User
 
 router = APIRouter()
 
@@ -18,25 +22,26 @@ router = APIRouter()
     response_model=list[UserResponse],
 )
 async def read_all_users(
+    response: Response,
     async_session: async_session_dependency,
+    pagination: pagination_dependency,
 ) -> Any:
-    """Get all users.
+    """Get a page of all users, or stream all of them as NDJSON.
 
     Args:
+        response (Response): The response, whose `X-Next-Cursor` header is set if there may be a next page.
         async_session (AsyncSession): The async session.
+        pagination (PaginationParams): The keyset pagination parameters.
 
     Returns:
         list[UserResponse]: The list of all users.
     """
-    users = [
-        UserResponse(
-            user_id=1,
-            user_name="dummy_user_name",
-            email="dummy_user",
-            full_name="dummy_full_name",
-        )
-    ]
-    return users
+    repo = UserRepository(async_session)
+    if pagination.stream:
+        return ndjson_response(repo.stream_all(pagination.cursor), _to_user_response)
+    users = await repo.read_all(pagination.cursor, pagination.limit)
+    set_next_cursor(response, users, pagination.limit)
+    return [_to_user_response(user) for user in users]
 
 
 @router.post(
@@ -123,3 +128,20 @@ async def delete_own_user(
         bool: True if the user was deleted successfully.
     """
     return True
+
+
+def _to_user_response(user: User) -> UserResponse:
+    """Convert a user into its response schema, which excludes the password.
+
+    Args:
+        user (User): The user.
+
+    Returns:
+        UserResponse: The response schema of the user.
+    """
+    return UserResponse(
+        user_id=user.user_id,  # type: ignore
+        user_name=user.user_name,
+        email=user.email,
+        full_name=user.full_name,
+    )
@@ -1,16 +1,38 @@
-from .decks_schema import CreateDeckRequest, DeckResponse
+from .decks_schema import (
+    AddDeckItemsRequest,
+    AddDeckItemsResponse,
+    CombineDecksRequest,
+    CreateDeckRequest,
+    DeckResponse,
+    DeckSummaryResponse,
+    RemoveDeckItemsRequest,
+    RemoveDeckItemsResponse,
+)
 from .items_schema import (
+    AddItemsRequest,
+    AddItemsResponse,
     CreateItemRequest,
+    ImportItemsResponse,
     ItemResponse,
     UpdateItemRequest,
 )
 from .login_schema import Token, TokenPayload
+from .metrics_schema import (
+    DatabasePoolMetricsResponse,
+    MetricsResponse,
+    PasswordHashingMetricsResponse,
+)
+from .pagination_schema import PaginationParams
 from .quizzes_schema import (
+    CreateQuizRequest,
     QuizCheckedResponse,
+    QuizDayStatsResponse,
+    QuizGradeStatsResponse,
     QuizItemAfterAttemptRequest,
     QuizItemBeforeAttemptResponse,
     QuizItemCheckedResponse,
     QuizMetaDataResponse,
+    QuizStatsResponse,
     QuizUnsolvedResponse,
 )
 from .users_schema import (
@@ -20,20 +42,37 @@ from .users_schema import (
 )
 
 __all__ = [
+    "AddDeckItemsRequest",
+    "AddDeckItemsResponse",
+    "CombineDecksRequest",
     "CreateDeckRequest",
     "DeckResponse",
+    "DeckSummaryResponse",
+    "RemoveDeckItemsRequest",
+    "RemoveDeckItemsResponse",
+    "AddItemsRequest",
+    "AddItemsResponse",
     "CreateItemRequest",
+    "ImportItemsResponse",
     "ItemResponse",
     "UpdateItemRequest",
     "Token",
     "TokenPayload",
+    "DatabasePoolMetricsResponse",
+    "MetricsResponse",
+    "PasswordHashingMetricsResponse",
+    "PaginationParams",
     "CreateUserRequest",
     "UpdateUserRequest",
     "UserResponse",
+    "CreateQuizRequest",
     "QuizItemAfterAttemptRequest",
     "QuizItemBeforeAttemptResponse",
     "QuizItemCheckedResponse",
     "QuizMetaDataResponse",
     "QuizUnsolvedResponse",
     "QuizCheckedResponse",
+    "QuizGradeStatsResponse",
+    "QuizDayStatsResponse",
+    "QuizStatsResponse",
 ]
@@ -1,5 +1,10 @@
 # ruff: noqa: D101
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .items_schema import CreateItemRequest
 
 
 class CreateDeckRequest(BaseModel):
@@ -9,3 +14,34 @@ class CreateDeckRequest(BaseModel):
 class DeckResponse(BaseModel):
     deck_id: int
     deck_name: str
+
+
+class DeckSummaryResponse(DeckResponse):
+    item_count: int
+    last_studied_at: datetime | None
+
+
+class CombineDecksRequest(BaseModel):
+    deck_name: str
+    operation: Literal["union", "intersect", "difference"]
+    deck_ids: list[int] = Field(min_length=1)
+
+
+class AddDeckItemsRequest(BaseModel):
+    item_ids: list[int] = []
+    items: list[CreateItemRequest] = []
+
+
+class AddDeckItemsResponse(BaseModel):
+    num_added: int
+    num_skipped: int
+    item_ids: list[int]
+
+
+class RemoveDeckItemsRequest(BaseModel):
+    item_ids: list[int]
+
+
+class RemoveDeckItemsResponse(BaseModel):
+    num_removed: int
+    num_skipped: int
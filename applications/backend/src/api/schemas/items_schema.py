@@ -1,5 +1,5 @@
 # ruff: noqa: D101
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class CreateItemRequest(BaseModel):
@@ -8,6 +8,16 @@ class CreateItemRequest(BaseModel):
     grade: int
 
 
+class AddItemsRequest(BaseModel):
+    items: list[CreateItemRequest] = Field(min_length=1)
+
+
+class AddItemsResponse(BaseModel):
+    num_created: int
+    num_skipped: int
+    item_ids: list[int]
+
+
 class UpdateItemRequest(BaseModel):
     english: str
     japanese: str
@@ -19,3 +29,9 @@ class ItemResponse(BaseModel):
     english: str
     japanese: str
     grade: int
+
+
+class ImportItemsResponse(BaseModel):
+    num_items: int
+    elapsed_seconds: float
+    items_per_second: float
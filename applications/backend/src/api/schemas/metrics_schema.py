@@ -0,0 +1,29 @@
+# ruff: noqa: D101
+from pydantic import BaseModel
+
+
+class DatabasePoolMetricsResponse(BaseModel):
+    pool_size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    total_checkout_seconds: float
+    max_checkout_seconds: float
+    connects: int
+    invalidations: int
+
+
+class PasswordHashingMetricsResponse(BaseModel):
+    max_workers: int
+    tasks: int
+    in_flight: int
+    total_queue_wait_seconds: float
+    max_queue_wait_seconds: float
+    total_run_seconds: float
+
+
+class MetricsResponse(BaseModel):
+    database_pool: DatabasePoolMetricsResponse
+    password_hashing: PasswordHashingMetricsResponse
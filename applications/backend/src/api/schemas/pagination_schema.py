@@ -0,0 +1,8 @@
+# ruff: noqa: D101
+from pydantic import BaseModel
+
+
+class PaginationParams(BaseModel):
+    cursor: int | None = None
+    limit: int
+    stream: bool = False
@@ -1,5 +1,15 @@
 # ruff: noqa: D101
-from pydantic import BaseModel, PastDatetime
+from datetime import date
+
+from pydantic import BaseModel, Field, PastDatetime
+
+
+class CreateQuizRequest(BaseModel):
+    deck_id: int | None = None
+    num_questions: int = Field(default=10, ge=1, le=100)
+    grades: list[int] | None = None
+    similar_distractors: bool = True
+    review_due: bool = True
 
 
 class QuizItemAfterAttemptRequest(BaseModel):
@@ -11,6 +21,7 @@ class QuizItemAfterAttemptRequest(BaseModel):
 
 class QuizItemBeforeAttemptResponse(BaseModel):
     question_number: int
+    question: str
     choices: list[str]
 
 
@@ -33,3 +44,23 @@ class QuizUnsolvedResponse(QuizMetaDataResponse):
 
 class QuizCheckedResponse(QuizMetaDataResponse):
     quiz_items: list[QuizItemCheckedResponse]
+
+
+class QuizStatsEntryResponse(BaseModel):
+    attempts: int
+    correct: int
+    accuracy: float
+    average_answer_time: float
+
+
+class QuizGradeStatsResponse(QuizStatsEntryResponse):
+    grade: int
+
+
+class QuizDayStatsResponse(QuizStatsEntryResponse):
+    day: date
+
+
+class QuizStatsResponse(QuizStatsEntryResponse):
+    grades: list[QuizGradeStatsResponse]
+    days: list[QuizDayStatsResponse]
@@ -20,4 +20,4 @@ class UserResponse(BaseModel):
     user_id: int
     user_name: str
     email: str
-    full_name: str
+    full_name: str | None = None
@@ -0,0 +1,115 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+from src.core.config import settings
+from src.domain.models import User
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[KeyType, ValueType]):
+    """An in-process cache whose entries expire after a fixed time and which evicts the least recently used entry when full.
+
+    The cache is not shared between worker processes and is not thread-safe, which is sufficient
+    for the coroutines of a single event loop as no method awaits.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size (int): The maximum number of entries.
+            ttl_seconds (float): The seconds after which an entry expires. 0 disables the cache.
+            clock (Callable[[], float]): The function that returns the current time in seconds.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        # The entries with their expiration times, ordered from the least recently used.
+        self._entries: OrderedDict[KeyType, tuple[float, ValueType]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of entries, including the expired ones not evicted yet.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+    def get(self, key: KeyType) -> ValueType | None:
+        """Get the value of a key unless it has expired.
+
+        Args:
+            key (KeyType): The key.
+
+        Returns:
+            ValueType | None: The value, or None if the key is not cached or has expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: KeyType, value: ValueType) -> None:
+        """Cache the value of a key, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (KeyType): The key.
+            value (ValueType): The value.
+        """
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+        self._entries[key] = (self.clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: KeyType) -> None:
+        """Remove a key from the cache if it is cached.
+
+        Args:
+            key (KeyType): The key.
+        """
+        self._entries.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[ValueType], bool]) -> None:
+        """Remove all entries whose values satisfy a condition.
+
+        Args:
+            predicate (Callable[[ValueType], bool]): The condition of the values to remove.
+        """
+        keys = [key for key, (_, value) in self._entries.items() if predicate(value)]
+        for key in keys:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+# The authenticated users keyed by their usernames, i.e. the subjects of their access tokens.
+user_cache: TTLCache[str, User] = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl_seconds=settings.USER_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_cached_users(user_ids: set[int]) -> None:
+    """Remove users from the cache of authenticated users after they have been changed.
+
+    Args:
+        user_ids (set[int]): The unique identifiers for the changed users.
+    """
+    user_cache.pop_where(lambda user: user.user_id in user_ids)
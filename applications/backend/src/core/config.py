@@ -21,6 +21,29 @@ class Settings(BaseSettings, case_sensitive=True):
         SECRET_KEY (str): The secret key for the JWT signature.
         ALGORITHM (str): The algorithm used to encode and decode the JWT.
         ACCESS_TOKEN_EXPIRE_MINUTES (int): The expiration time for the access token in minutes.
+        DEFAULT_PAGE_SIZE (int): The number of records in a page of a list endpoint by default.
+        MAX_PAGE_SIZE (int): The maximum number of records in a page of a list endpoint.
+        USER_CACHE_TTL_SECONDS (float): The seconds for which an authenticated user is cached
+            in each worker process. 0 disables the cache.
+        USER_CACHE_MAX_SIZE (int): The maximum number of users cached in each worker process.
+        PASSWORD_HASHING_MAX_WORKERS (int): The maximum number of passwords hashed or verified
+            at once in each worker process, off the event loop. 0 runs them on the event loop.
+        ITEM_INDEX_ENABLED (bool): Whether quizzes sample their items from an index in memory
+            of each worker process instead of the database.
+        ITEM_INDEX_REFRESH_SECONDS (float): The minimum seconds between refreshes of the item index
+            from the database. Items added or updated by other worker processes appear after it.
+        TYPEAHEAD_INDEX_PRELOAD (bool): Whether each worker process loads the typeahead index of
+            the items on startup rather than on the first suggestion. Off by default, since
+            loading reads all the items, which would slow down the startup of every worker.
+        TYPEAHEAD_INDEX_REFRESH_SECONDS (float): The minimum seconds between refreshes of the
+            typeahead index from the database.
+        QUIZ_SESSION_TTL_SECONDS (int): The seconds for which a quiz being taken is kept.
+        QUIZ_SESSION_MAX_SIZE (int): The maximum number of quizzes being taken kept in the memory
+            of each worker process, which is used without Redis or while it is unavailable.
+        REDIS_URL (str | None): The URL of the Redis server shared by the worker processes, if any.
+        REDIS_MAX_CONNECTIONS (int): The maximum number of connections to Redis of each worker process.
+        REDIS_TIMEOUT_SECONDS (float): The seconds to wait for connecting to Redis and for its replies.
+        REDIS_RETRY_SECONDS (float): The seconds after a Redis failure for which Redis is not tried.
         BACKEND_CORS_ORIGINS (tuple[AnyHttpUrl]): The list of allowed origins for CORS.
         POSTGRES_SERVER (str): The name of the PostgreSQL server.
         POSTGRES_USER (str): The username for the PostgreSQL server.
@@ -28,6 +51,17 @@ class Settings(BaseSettings, case_sensitive=True):
         POSTGRES_DB (str): The name of the PostgreSQL database.
         POSTGRES_SCHEMA (str): The name of the PostgreSQL schema.
         SQLALCHEMY_DATABASE_URI (PostgresDsn | None): The connection URI for the PostgreSQL database.
+        SQLALCHEMY_POOL_SIZE (int): The number of connections kept open in the connection pool.
+        SQLALCHEMY_MAX_OVERFLOW (int): The number of connections allowed beyond the pool size.
+        SQLALCHEMY_POOL_TIMEOUT (float): The seconds to wait for a connection from a full pool.
+        SQLALCHEMY_POOL_RECYCLE (int): The seconds after which a connection is replaced. -1 disables it.
+        SQLALCHEMY_POOL_PRE_PING (bool): Whether to test a connection for liveness on checkout.
+        SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE (int): The size of the prepared statement cache
+            of SQLAlchemy for each asyncpg connection.
+        ASYNCPG_STATEMENT_CACHE_SIZE (int): The size of the statement cache of asyncpg itself for
+            each connection. Set 0 behind a PgBouncer in transaction pooling mode.
+        POSTGRES_STATEMENT_TIMEOUT_MS (int): The server-side timeout of a statement in milliseconds.
+            0 disables it.
         TEST_USER_EMAIL (EmailStr): The email address of the test user.
         FIRST_SUPERUSER (str): The name of the first superuser.
         FIRST_SUPERUSER_EMAIL (EmailStr): The email address of the first superuser.
@@ -39,6 +73,21 @@ class Settings(BaseSettings, case_sensitive=True):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    DEFAULT_PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 1000
+    USER_CACHE_TTL_SECONDS: float = 30.0
+    USER_CACHE_MAX_SIZE: int = 1024
+    PASSWORD_HASHING_MAX_WORKERS: int = 4
+    ITEM_INDEX_ENABLED: bool = True
+    ITEM_INDEX_REFRESH_SECONDS: float = 10.0
+    TYPEAHEAD_INDEX_PRELOAD: bool = False
+    TYPEAHEAD_INDEX_REFRESH_SECONDS: float = 10.0
+    QUIZ_SESSION_TTL_SECONDS: int = 3600
+    QUIZ_SESSION_MAX_SIZE: int = 10000
+    REDIS_URL: str | None = None
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_TIMEOUT_SECONDS: float = 0.5
+    REDIS_RETRY_SECONDS: float = 30.0
     # SERVER_NAME: str
     # SERVER_HOST: AnyHttpUrl
 
@@ -115,6 +164,15 @@ class Settings(BaseSettings, case_sensitive=True):
             path=f"{info.data.get('POSTGRES_DB') or ''}",
         ).unicode_string()
 
+    SQLALCHEMY_POOL_SIZE: int = 10
+    SQLALCHEMY_MAX_OVERFLOW: int = 20
+    SQLALCHEMY_POOL_TIMEOUT: float = 30.0
+    SQLALCHEMY_POOL_RECYCLE: int = 1800
+    SQLALCHEMY_POOL_PRE_PING: bool = True
+    SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    ASYNCPG_STATEMENT_CACHE_SIZE: int = 100
+    POSTGRES_STATEMENT_TIMEOUT_MS: int = 30000
+
     # SMTP_TLS: bool = True
     # SMTP_PORT: Optional[int] = None
     # SMTP_HOST: Optional[str] = None
@@ -1,20 +1,23 @@
 import json
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import cast
 
 from fastapi import APIRouter, FastAPI
 from fastapi.routing import APIRoute
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from starlette.middleware.cors import CORSMiddleware
 
-from src.api.routers import decks, items, login, quizzes, users
-from src.db.models.sqlalchemy_data_models import Base
+from src.api.routers import decks, items, login, metrics, quizzes, users
+from src.db.engine import create_database_engine
+from src.db.migrations import check_schema_version
+from src.db.quiz_session_store import (
+    QuizSessionStore,
+    create_quiz_session_store,
+    create_redis_client,
+)
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.domain.services.item_service.typeahead_index import typeahead_index
 
 from .config import settings
 
@@ -33,6 +36,8 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 
 async_session_factory: async_sessionmaker[AsyncSession] | None = None
 engine: AsyncEngine | None = None
+redis_client: Redis | None = None
+quiz_session_store: QuizSessionStore | None = None
 
 
 # This is the lifespan context manager, which is called once before/after the server starts/stops.
@@ -54,21 +59,38 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     global engine
     global async_session_factory
+    global redis_client
+    global quiz_session_store
     # Create a new async engine instance, which offers a session environment to manage a database.
-    engine = create_async_engine(cast(str, settings.SQLALCHEMY_DATABASE_URI))
+    # Its connection pool is configured by the settings.
+    engine = create_database_engine()
     # Create a factiry that returns a new AsyncSession instance.
     async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
 
-    # Create all tables defined as data models under `src/db` if they do not exist.
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Fail fast if the database has not been migrated, instead of issuing DDL from every worker.
+    # The schema is created and upgraded once by `make migrate` before the app is deployed.
+    async with engine.connect() as conn:
+        await check_schema_version(conn)
+
+    # Load the typeahead index before serving if asked, so that the first keystrokes are not
+    # answered empty. Otherwise it is loaded by the first suggestion, sparing the startup a full scan of the items.
+    if settings.TYPEAHEAD_INDEX_PRELOAD:
+        async with async_session_factory() as async_session:
+            await typeahead_index.refresh(ItemRepository(async_session))
+
+    # Create a single Redis client whose connection pool is shared by all requests, if Redis is configured.
+    # It connects lazily, so the app starts even if Redis is down, and the quizzes fall back to the process.
+    redis_client = create_redis_client()
+    quiz_session_store = create_quiz_session_store(redis_client)
 
     # Yield nothing, but boot up the FastAPI app instance. If the app stops, the code after the yield will run.
     yield
 
     print("Running shutdown lifespan events ...")
-    # Close the engine instance as a clean-up operation.
+    # Close the engine instance and the Redis client as a clean-up operation.
     await engine.dispose()
+    if redis_client is not None:
+        await redis_client.aclose()
 
 
 app = FastAPI(
@@ -94,5 +116,6 @@ api_router.include_router(decks.router, prefix="/decks", tags=["decks"])
 api_router.include_router(items.router, prefix="/items", tags=["items"])
 api_router.include_router(quizzes.router, prefix="/quizzes", tags=["quizzes"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
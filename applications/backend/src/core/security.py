@@ -1,8 +1,13 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import cast
+from typing import Any, TypeVar, cast
 
 from jose import jwt
 from passlib.context import CryptContext
+from pydantic import BaseModel
 
 from src.api.dependencies import async_session_dependency
 from src.core.config import settings
@@ -11,6 +16,96 @@ from src.domain.models import User
 
 password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
+
+class PasswordHashingMetrics(BaseModel):
+    """The cumulative metrics of the password hashing executor.
+
+    Attributes:
+        tasks (int): The number of passwords hashed or verified.
+        in_flight (int): The number of passwords waiting for a thread or being processed.
+        total_queue_wait_seconds (float): The total time spent waiting for a thread.
+        max_queue_wait_seconds (float): The longest time spent waiting for a thread.
+        total_run_seconds (float): The total time spent hashing or verifying passwords.
+    """
+
+    tasks: int = 0
+    in_flight: int = 0
+    total_queue_wait_seconds: float = 0.0
+    max_queue_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+
+
+class PasswordHashingExecutor:
+    """The executor that hashes and verifies passwords in a bounded thread pool.
+
+    Bcrypt spends hundreds of milliseconds of CPU per password, which would block every other request
+    if it ran on the event loop. The bcrypt backend releases the GIL while hashing, so threads suffice.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers (int): The maximum number of passwords processed at once.
+                0 processes them on the event loop.
+        """
+        self.max_workers = max_workers
+        self.metrics = PasswordHashingMetrics()
+        # Threads are started on demand, so an idle executor costs nothing.
+        self._executor = (
+            ThreadPoolExecutor(max_workers, thread_name_prefix="password-hashing")
+            if max_workers > 0
+            else None
+        )
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a function in a thread of the pool, waiting in a queue if all threads are busy.
+
+        Args:
+            function (Callable[..., T]): The function to run.
+            *args (Any): The arguments of the function.
+
+        Returns:
+            T: The return value of the function.
+        """
+        submitted_at = time.perf_counter()
+
+        def run_timed() -> tuple[T, float, float]:
+            started_at = time.perf_counter()
+            result = function(*args)
+            return result, started_at, time.perf_counter()
+
+        self.metrics.in_flight += 1
+        try:
+            if self._executor is None:
+                result, started_at, finished_at = run_timed()
+            else:
+                (
+                    result,
+                    started_at,
+                    finished_at,
+                ) = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, run_timed
+                )
+        finally:
+            self.metrics.in_flight -= 1
+        # Update the metrics on the event loop rather than in the threads to avoid races.
+        queue_wait_seconds = started_at - submitted_at
+        self.metrics.tasks += 1
+        self.metrics.total_queue_wait_seconds += queue_wait_seconds
+        self.metrics.max_queue_wait_seconds = max(
+            self.metrics.max_queue_wait_seconds, queue_wait_seconds
+        )
+        self.metrics.total_run_seconds += finished_at - started_at
+        return result
+
+
+password_hashing_executor = PasswordHashingExecutor(
+    settings.PASSWORD_HASHING_MAX_WORKERS
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify the password.
@@ -37,6 +132,33 @@ def get_password_hash(password: str) -> str:
     return cast(str, password_context.hash(password))
 
 
+async def async_verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify the password without blocking the event loop.
+
+    Args:
+        plain_password (str): The plain password.
+        hashed_password (str): The hashed password.
+
+    Returns:
+        bool: True if the plain password matches the hashed password when hashed, False otherwise.
+    """
+    return await password_hashing_executor.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def async_get_password_hash(password: str) -> str:
+    """Get the password hash without blocking the event loop.
+
+    Args:
+        password (str): The plain password.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await password_hashing_executor.run(get_password_hash, password)
+
+
 async def authenticate_user(
     async_session: async_session_dependency,
     user_name: str,
@@ -61,7 +183,7 @@ async def authenticate_user(
     if user is None:
         return None
     # If the password is incorrect, return None.
-    if not verify_password(password, user.password):
+    if not await async_verify_password(password, user.password):
         return None
     # If the user exists and the password is correct, return the user.
     return user
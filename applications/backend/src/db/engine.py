@@ -0,0 +1,161 @@
+import time
+from typing import Any, cast
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from src.core.config import settings
+
+
+class PoolMetrics(BaseModel):
+    """The cumulative metrics of a connection pool.
+
+    Attributes:
+        checkouts (int): The number of connections checked out from the pool.
+        checkout_timeouts (int): The number of checkouts that timed out waiting for a connection.
+        total_checkout_seconds (float): The total time spent checking out connections,
+            which includes waiting for a connection to be returned and opening a new one.
+        max_checkout_seconds (float): The longest time spent checking out a connection.
+        connects (int): The number of new connections opened to the database.
+        invalidations (int): The number of connections invalidated, e.g. due to a failed pre-ping.
+    """
+
+    checkouts: int = 0
+    checkout_timeouts: int = 0
+    total_checkout_seconds: float = 0.0
+    max_checkout_seconds: float = 0.0
+    connects: int = 0
+    invalidations: int = 0
+
+
+class PoolStatistics(PoolMetrics):
+    """The current state and the cumulative metrics of a connection pool.
+
+    Attributes:
+        pool_size (int): The number of connections kept open in the pool.
+        checked_in (int): The number of idle connections in the pool.
+        checked_out (int): The number of connections in use.
+        overflow (int): The number of connections opened beyond the pool size.
+    """
+
+    pool_size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """The default pool of async engines that also records how long checkouts take."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool.
+
+        Args:
+            *args (Any): The positional arguments of `AsyncAdaptedQueuePool`.
+            **kwargs (Any): The keyword arguments of `AsyncAdaptedQueuePool`.
+        """
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Get a connection from the pool, timing how long it takes.
+
+        Raises:
+            TimeoutError: If no connection becomes available within the pool timeout.
+
+        Returns:
+            ConnectionPoolEntry: The connection.
+        """
+        start_time = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            self.metrics.checkout_timeouts += 1
+            raise
+        checkout_seconds = time.perf_counter() - start_time
+        self.metrics.checkouts += 1
+        self.metrics.total_checkout_seconds += checkout_seconds
+        self.metrics.max_checkout_seconds = max(
+            self.metrics.max_checkout_seconds, checkout_seconds
+        )
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        """Create a new pool with the same configuration, e.g. on `AsyncEngine.dispose`.
+
+        Returns:
+            InstrumentedAsyncAdaptedQueuePool: The new pool, which keeps the metrics so far.
+        """
+        pool = cast(InstrumentedAsyncAdaptedQueuePool, super().recreate())
+        pool.metrics = self.metrics
+        return pool
+
+    def statistics(self) -> PoolStatistics:
+        """Get the current state and the cumulative metrics of the pool.
+
+        Returns:
+            PoolStatistics: The statistics of the pool.
+        """
+        return PoolStatistics(
+            **self.metrics.model_dump(),
+            pool_size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+        )
+
+
+def create_database_engine(database_uri: str | None = None) -> AsyncEngine:
+    """Create an async engine whose connection pool is configured by the settings.
+
+    Args:
+        database_uri (str | None): The connection URI of the database.
+            None means `settings.SQLALCHEMY_DATABASE_URI`.
+
+    Returns:
+        AsyncEngine: The async engine.
+    """
+    engine = create_async_engine(
+        cast(str, database_uri or settings.SQLALCHEMY_DATABASE_URI),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.SQLALCHEMY_POOL_SIZE,
+        max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
+        pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
+        pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+        # Replace connections broken by e.g. a database failover before they are used.
+        pool_pre_ping=settings.SQLALCHEMY_POOL_PRE_PING,
+        connect_args={
+            "prepared_statement_cache_size": settings.SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.ASYNCPG_STATEMENT_CACHE_SIZE,
+            "server_settings": {
+                "statement_timeout": str(settings.POSTGRES_STATEMENT_TIMEOUT_MS)
+            },
+        },
+    )
+    # The metrics and the listeners are carried over to the pool recreated on `AsyncEngine.dispose`.
+    metrics = cast(InstrumentedAsyncAdaptedQueuePool, engine.sync_engine.pool).metrics
+
+    @event.listens_for(engine.sync_engine.pool, "connect")
+    def count_connect(*args: Any) -> None:
+        metrics.connects += 1
+
+    @event.listens_for(engine.sync_engine.pool, "invalidate")
+    def count_invalidation(*args: Any) -> None:
+        metrics.invalidations += 1
+
+    return engine
+
+
+def get_pool_statistics(engine: AsyncEngine) -> PoolStatistics:
+    """Get the statistics of the connection pool of an engine created by `create_database_engine`.
+
+    Args:
+        engine (AsyncEngine): The async engine.
+
+    Returns:
+        PoolStatistics: The statistics of the connection pool.
+    """
+    return cast(InstrumentedAsyncAdaptedQueuePool, engine.sync_engine.pool).statistics()
@@ -0,0 +1,519 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateColumn
+
+from src.core.config import settings
+from src.db.models.sqlalchemy_data_models import (
+    Base,
+    SQLAlchemyDeck,
+    SQLAlchemyItem,
+    SQLAlchemyQuiz,
+    SQLAlchemyQuizItem,
+    SQLAlchemyQuizItemChoice,
+    SQLAlchemyQuizStat,
+    SQLAlchemyReviewState,
+    item_deck_mapper_table,
+    item_genre_mapper_table,
+)
+from src.db.repositories.sqlalchemy.quiz_stat_repository import upsert_quiz_stats
+from src.domain.models.item_model import normalize_text
+
+Migration = Callable[[AsyncConnection], Awaitable[None]]
+
+# The table of the applied schema versions lives in its own metadata so that
+# `Base.metadata.drop_all` and `Base.metadata.create_all` never touch it.
+migration_metadata = MetaData(schema=settings.POSTGRES_SCHEMA)
+schema_migrations_table = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("applied_at", DateTime, nullable=False, server_default=func.now()),
+)
+
+# The migrations keyed by their schema versions, which are applied in ascending order.
+# Every migration must be idempotent: on a fresh database, the first migration already
+# creates the tables and columns of the current data models, which later migrations add
+# to existing databases (e.g. use `checkfirst` and `IF NOT EXISTS`).
+MIGRATIONS: dict[int, Migration] = {}
+
+# The columns of the items searched for substrings and similar words by their trigram indexes.
+ITEM_TRIGRAM_COLUMNS = ("english", "japanese")
+# The number of items whose texts are normalized by a single statement when migrating.
+NORMALIZATION_BATCH_SIZE = 10000
+
+
+def migration(version: int) -> Callable[[Migration], Migration]:
+    """Register a migration with its schema version.
+
+    Args:
+        version (int): The schema version that the migration upgrades the database to.
+
+    Raises:
+        ValueError: If a migration is already registered with the version.
+
+    Returns:
+        Callable[[Migration], Migration]: The decorator that registers the migration.
+    """
+
+    def register(migration: Migration) -> Migration:
+        if version in MIGRATIONS:
+            raise ValueError(f"The migration of version {version} already exists.")
+        MIGRATIONS[version] = migration
+        return migration
+
+    return register
+
+
+def latest_schema_version() -> int:
+    """Get the schema version that the app requires.
+
+    Returns:
+        int: The version of the last migration.
+    """
+    return max(MIGRATIONS)
+
+
+async def migrate(connection: AsyncConnection) -> list[int]:
+    """Apply the migrations that have not been applied to the database yet.
+
+    The migrations run in the transaction of the connection under an advisory lock,
+    so concurrent runs are serialized and a failed migration leaves no partial changes.
+
+    Args:
+        connection (AsyncConnection): The connection in a transaction to migrate with.
+
+    Returns:
+        list[int]: The versions of the applied migrations.
+    """
+    await connection.execute(
+        select(func.pg_advisory_xact_lock(func.hashtext("schema_migrations")))
+    )
+    await connection.execute(
+        text(f'CREATE SCHEMA IF NOT EXISTS "{settings.POSTGRES_SCHEMA}"')
+    )
+    await connection.run_sync(migration_metadata.create_all)
+    results = await connection.execute(select(schema_migrations_table.c.version))
+    applied_versions = set(results.scalars().all())
+
+    migrated_versions = []
+    for version in sorted(MIGRATIONS):
+        if version in applied_versions:
+            continue
+        await MIGRATIONS[version](connection)
+        await connection.execute(
+            insert(schema_migrations_table).values(version=version)
+        )
+        migrated_versions.append(version)
+    return migrated_versions
+
+
+async def read_schema_version(connection: AsyncConnection) -> int | None:
+    """Read the schema version of the database.
+
+    Args:
+        connection (AsyncConnection): The connection to the database.
+
+    Returns:
+        int | None: The latest applied version, or None if no migration has been applied.
+    """
+    # Look up the catalog first, since querying a missing table would abort the transaction.
+    results = await connection.execute(
+        select(func.to_regclass(schema_migrations_table.fullname))
+    )
+    if results.scalar_one() is None:
+        return None
+    results = await connection.execute(
+        select(func.max(schema_migrations_table.c.version))
+    )
+    version: int | None = results.scalar_one()
+    return version
+
+
+async def check_schema_version(connection: AsyncConnection) -> int:
+    """Check that the database has been migrated to the schema version that the app requires.
+
+    Unlike migrating, this issues no DDL and takes no locks, so it is cheap enough to run
+    on every worker startup.
+
+    Args:
+        connection (AsyncConnection): The connection to the database.
+
+    Raises:
+        RuntimeError: If the database has not been migrated to the required version.
+
+    Returns:
+        int: The schema version of the database.
+    """
+    version = await read_schema_version(connection)
+    if version is None or version < latest_schema_version():
+        raise RuntimeError(
+            f"The database schema is at version {version}, but the app requires version "
+            f"{latest_schema_version()}. Run `make migrate` before starting the app."
+        )
+    return version
+
+
+@migration(1)
+async def create_initial_tables(connection: AsyncConnection) -> None:
+    """Create the tables of the data models that do not exist yet.
+
+    Args:
+        connection (AsyncConnection): The connection in the migration transaction.
+    """
+    await connection.run_sync(Base.metadata.create_all)
+
+
+@migration(2)
+async def create_review_states_table(connection: AsyncConnection) -> None:
+    """Create the table of the spaced-repetition states and its due-date index if they do not exist yet.
+
+    Args:
+        connection (AsyncConnection): The connection in the migration transaction.
+    """
+    review_states_table = SQLAlchemyReviewState.__table__
+    await connection.run_sync(review_states_table.create, checkfirst=True)  # type: ignore
+    for index in review_states_table.indexes:  # type: ignore
+        await connection.run_sync(index.create, checkfirst=True)
+
+
+@migration(3)
+async def create_quiz_stats_table(connection: AsyncConnection) -> None:
+    """Create the table of the quiz statistics if it does not exist yet, and fill it from the answered quiz items.
+
+    The statistics are recomputed from all the answered quiz items rather than added to,
+    so running the migration again leaves them unchanged.
+
+    Args:
+        connection (AsyncConnection): The connection in the migration transaction.
+    """
+    quiz_stats_table = SQLAlchemyQuizStat.__table__
+    await connection.run_sync(quiz_stats_table.create, checkfirst=True)  # type: ignore
+    for index in quiz_stats_table.indexes:  # type: ignore
+        await connection.run_sync(index.create, checkfirst=True)
+    await connection.execute(upsert_quiz_stats(true(), accumulate=False))
+
+
+@migration(4)
+async def create_quiz_item_choices_table(connection: AsyncConnection) -> None:
+    """Create the table of the choices of quiz items if it does not exist yet, and fill it from the JSON column.
+
+    The choices already in the table are left as they are, so running the migration again
+    leaves the table unchanged.
+
+    Args:
+        connection (AsyncConnection): The connection in the migration transaction.
+    """
+    quiz_item_choices_table = SQLAlchemyQuizItemChoice.__table__
+    await connection.run_sync(quiz_item_choices_table.create, checkfirst=True)  # type: ignore
+    for index in quiz_item_choices_table.indexes:  # type: ignore
+        await connection.run_sync(index.create, checkfirst=True)
+    choices = func.jsonb_array_elements_text(
+        SQLAlchemyQuizItem.choice_item_ids
+    ).table_valued("value", with_ordinality="ordinality")
+    await connection.execute(
+        pg_insert(SQLAlchemyQuizItemChoice)
+        .from_select(
+            ["quiz_item_id", "position", "item_id"],
+            select(
+                SQLAlchemyQuizItem.quiz_item_id,
+                choices.c.ordinality - 1,
+                cast(choices.c.value, Integer),
+            ).join_from(SQLAlchemyQuizItem, choices, true()),
+        )
+        .on_conflict_do_nothing()
+    )
+
+
+@migration(5)
+async def create_item_search_indexes(connection: AsyncConnection) -> None:
+    """Create the indexes that the search of items uses if they do not exist yet.
+
+    The words of the English text are kept in a generated `tsvector` column with a GIN index.
+    The trigram indexes need the `pg_trgm` extension, so they are skipped if it is not available,
+    in which case the search still works by scanning the items, except for fuzzy matching.
+
+    Args:
+        connection (AsyncConnection): The connection in the migration transaction.
+    """
+    items_table = SQLAlchemyItem.__table__
+    english_tsv = CreateColumn(items_table.c.english_tsv).compile(  # type: ignore
+        dialect=connection.dialect
+    )
+    await connection.execute(
+        text(f"ALTER TABLE {items_table.fullname} ADD COLUMN IF NOT EXISTS {english_tsv}")  # type: ignore
+    )
+    for index in items_table.indexes:  # type: ignore
+        await connection.run_sync(index.create, checkfirst=True)
+    await create_item_trigram_indexes(connection)
+
+
+@migration(6)
+async def create_deck_listing_indexes(connection: AsyncConnection) -> None:
+    """Create the indexes that the listing of decks uses if they do not exist yet.
+
+    Args:
+        connection (AsyncConnection): The connection in the migration transaction.
+    """
+    for table in (
+        SQLAlchemyDeck.__table__,
+        SQLAlchemyQuiz.__table__,
+        item_deck_mapper_table,
+    ):
+        for index in table.indexes:  # type: ignore
+            await connection.run_sync(index.create, checkfirst=True)
+
+
+@migration(7)
+async def add_deck_item_positions(connection: AsyncConnection) -> None:
+    """Add the column of the positions of the items in decks and its index if they do not exist yet.
+
+    Adding the identity column numbers the existing rows, so the items already in decks keep
+    an order, although not necessarily the one they were added in.
+
+    Args:
+        connection (AsyncConnection): The connection in the migration transaction.
+    """
+    position = CreateColumn(item_deck_mapper_table.c.position).compile(
+        dialect=connection.dialect
+    )
+    await connection.execute(
+        text(
+            f"ALTER TABLE {item_deck_mapper_table.fullname} ADD COLUMN IF NOT EXISTS {position}"
+        )
+    )
+    for index in item_deck_mapper_table.indexes:
+        await connection.run_sync(index.create, checkfirst=True)
+
+
+@migration(8)
+async def add_item_normalized_texts(connection: AsyncConnection) -> None:
+    """Add the columns of the normalized texts of items and their unique index if they do not exist yet.
+
+    The texts are normalized by `normalize_text` in Python, as PostgreSQL normalizes Unicode only
+    in UTF-8 databases. The duplicates already in the database are merged into the item with
+    the smallest id, which takes over their places in decks, genres and quizzes, including the
+    choices of quiz items, before the index is created. Their review states are deleted with them.
+
+    Args:
+        connection (AsyncConnection): The connection in the migration transaction.
+    """
+    items = SQLAlchemyItem.__table__
+    for column in (items.c.normalized_english, items.c.normalized_japanese):
+        # The columns are filled before they are made non-nullable.
+        await connection.execute(
+            text(
+                f"ALTER TABLE {items.fullname} ADD COLUMN IF NOT EXISTS "  # type: ignore
+                f"{column.name} {column.type.compile(dialect=connection.dialect)}"
+            )
+        )
+    while True:
+        results = await connection.execute(
+            select(
+                SQLAlchemyItem.item_id, SQLAlchemyItem.english, SQLAlchemyItem.japanese
+            )
+            .where(SQLAlchemyItem.normalized_english.is_(None))
+            .limit(NORMALIZATION_BATCH_SIZE)
+        )
+        rows = results.all()
+        if not rows:
+            break
+        await connection.execute(
+            update(SQLAlchemyItem)
+            .where(SQLAlchemyItem.item_id == bindparam("b_item_id"))
+            .values(
+                normalized_english=bindparam("b_normalized_english"),
+                normalized_japanese=bindparam("b_normalized_japanese"),
+            ),
+            [
+                {
+                    "b_item_id": item_id,
+                    "b_normalized_english": normalize_text(english),
+                    "b_normalized_japanese": normalize_text(japanese),
+                }
+                for item_id, english, japanese in rows
+            ],
+        )
+
+    ranked = select(
+        SQLAlchemyItem.item_id,
+        func.min(SQLAlchemyItem.item_id)
+        .over(
+            partition_by=(
+                SQLAlchemyItem.user_id,
+                SQLAlchemyItem.normalized_english,
+                SQLAlchemyItem.normalized_japanese,
+            )
+        )
+        .label("kept_item_id"),
+    ).subquery("ranked")
+    duplicates = (
+        select(ranked.c.item_id, ranked.c.kept_item_id)
+        .where(ranked.c.item_id != ranked.c.kept_item_id)
+        .subquery("duplicates")
+    )
+    for mapper_table, other_columns in (
+        (item_deck_mapper_table, ("deck_id", "position")),
+        (item_genre_mapper_table, ("genre_id",)),
+    ):
+        await connection.execute(
+            pg_insert(mapper_table)
+            .from_select(
+                ["item_id", *other_columns],
+                select(
+                    duplicates.c.kept_item_id,
+                    *(mapper_table.c[column] for column in other_columns),
+                ).join_from(
+                    mapper_table,
+                    duplicates,
+                    mapper_table.c.item_id == duplicates.c.item_id,
+                ),
+            )
+            .on_conflict_do_nothing()
+        )
+        await connection.execute(
+            delete(mapper_table).where(
+                mapper_table.c.item_id.in_(select(duplicates.c.item_id))
+            )
+        )
+    await connection.execute(
+        update(SQLAlchemyQuizItem)
+        .where(SQLAlchemyQuizItem.item_id == duplicates.c.item_id)
+        .values(item_id=duplicates.c.kept_item_id)
+    )
+    # Rewrite the JSON choices of the quiz items found by their normalized copy, keeping the order
+    # of the choices and the JSON types of their ids, before the copy itself is rewritten.
+    choices = func.jsonb_array_elements(
+        SQLAlchemyQuizItem.choice_item_ids
+    ).table_valued("value", with_ordinality="ordinality")
+    remapped_choice = case(
+        (duplicates.c.kept_item_id.is_(None), choices.c.value),
+        (
+            func.jsonb_typeof(choices.c.value) == "string",
+            func.to_jsonb(cast(duplicates.c.kept_item_id, Text)),
+        ),
+        else_=func.to_jsonb(duplicates.c.kept_item_id),
+    )
+    await connection.execute(
+        update(SQLAlchemyQuizItem)
+        .where(
+            SQLAlchemyQuizItem.quiz_item_id.in_(
+                select(SQLAlchemyQuizItemChoice.quiz_item_id).join_from(
+                    SQLAlchemyQuizItemChoice,
+                    duplicates,
+                    SQLAlchemyQuizItemChoice.item_id == duplicates.c.item_id,
+                )
+            )
+        )
+        .values(
+            choice_item_ids=select(
+                func.jsonb_agg(
+                    aggregate_order_by(remapped_choice, choices.c.ordinality)
+                )
+            )
+            .select_from(
+                choices.outerjoin(
+                    duplicates,
+                    duplicates.c.item_id
+                    == cast(func.btrim(cast(choices.c.value, Text), '"'), Integer),
+                )
+            )
+            .scalar_subquery()
+        )
+    )
+    await connection.execute(
+        update(SQLAlchemyQuizItemChoice)
+        .where(SQLAlchemyQuizItemChoice.item_id == duplicates.c.item_id)
+        .values(item_id=duplicates.c.kept_item_id)
+    )
+    await connection.execute(
+        delete(SQLAlchemyItem).where(
+            SQLAlchemyItem.item_id.in_(select(duplicates.c.item_id))
+        )
+    )
+
+    await connection.execute(
+        text(
+            f"ALTER TABLE {items.fullname} "  # type: ignore
+            "ALTER COLUMN normalized_english SET NOT NULL, "
+            "ALTER COLUMN normalized_japanese SET NOT NULL"
+        )
+    )
+    for index in items.indexes:  # type: ignore
+        await connection.run_sync(index.create, checkfirst=True)
+
+
+@migration(9)
+async def replace_quiz_stats_key_index(connection: AsyncConnection) -> None:
+    """Replace the unique index of the quiz statistics on `coalesce(deck_id, 0)` with one on `deck_id`.
+
+    The new index treats NULLs as not distinct (PostgreSQL 15 or later), so upserts name its
+    columns instead of repeating the expression. The keys are unique in both indexes alike,
+    since no deck has the id 0.
+
+    Args:
+        connection (AsyncConnection): The connection in the migration transaction.
+    """
+    quiz_stats_table = SQLAlchemyQuizStat.__table__
+    for index in quiz_stats_table.indexes:  # type: ignore
+        await connection.run_sync(index.create, checkfirst=True)
+    await connection.execute(
+        text(
+            "DROP INDEX IF EXISTS "
+            f"{settings.POSTGRES_SCHEMA}.uq_quiz_stats_user_id_deck_id_grade_day"
+        )
+    )
+
+
+async def create_item_trigram_indexes(connection: AsyncConnection) -> bool:
+    """Install the `pg_trgm` extension and create the trigram indexes of items if they do not exist yet.
+
+    The trigram GIN indexes serve `LIKE` patterns with wildcards at both ends as well as the
+    similarity operator `%`. This can be called again after installing `pg_trgm` on a database
+    migrated without it.
+
+    Args:
+        connection (AsyncConnection): The connection in a transaction.
+
+    Returns:
+        bool: True if the indexes exist, or False if `pg_trgm` is not available.
+    """
+    results = await connection.execute(
+        text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    )
+    if results.first() is None:
+        logging.getLogger(__name__).warning(
+            "Skipping the trigram indexes of items, as pg_trgm is not available."
+        )
+        return False
+    await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    items_table = SQLAlchemyItem.__table__
+    for column in ITEM_TRIGRAM_COLUMNS:
+        await connection.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_items_{column}_trgm "
+                f"ON {items_table.fullname} USING gin ({column} gin_trgm_ops)"  # type: ignore
+            )
+        )
+    return True
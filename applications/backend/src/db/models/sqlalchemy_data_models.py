@@ -1,10 +1,24 @@
 import datetime
+from collections.abc import Callable
+from functools import cache
 from ipaddress import IPv4Address, IPv6Address
+from operator import attrgetter
 from typing import Any, ClassVar, Optional, Type
 
 from pydantic.networks import IPvAnyAddress
-from sqlalchemy import JSON, Column, ForeignKey, MetaData, Table
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    JSON,
+    Column,
+    Computed,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import (
@@ -16,6 +30,43 @@ from sqlalchemy.orm import (
 )
 
 from src.core.config import settings
+from src.domain.models.item_model import normalize_text
+
+
+@cache
+def column_keys(data_model: Type["Base"]) -> tuple[str, ...]:
+    """Get the attribute names of the columns of a data model.
+
+    The mapper is inspected only once per data model, as the result is cached.
+
+    Args:
+        data_model (Type[Base]): The data model.
+
+    Returns:
+        tuple[str, ...]: The attribute names of the columns in the order of the mapper.
+    """
+    return tuple(c.key for c in inspect(data_model).column_attrs)
+
+
+@cache
+def column_getter(
+    data_model: Type["Base"], keys: tuple[str, ...]
+) -> Callable[["Base"], tuple[Any, ...]]:
+    """Get a function that reads the values of the given columns from an ORM object at once.
+
+    Args:
+        data_model (Type[Base]): The data model.
+        keys (tuple[str, ...]): The attribute names of the columns to read.
+
+    Returns:
+        Callable[[Base], tuple[Any, ...]]: The function that returns the values of the columns
+            in the order of `keys`.
+    """
+    getter = attrgetter(*keys)
+    # `attrgetter` with a single attribute returns the value itself instead of a tuple.
+    if len(keys) == 1:
+        return lambda model: (getter(model),)
+    return getter
 
 
 def orm_object_to_dict(model: "Base") -> dict[str, Any]:
@@ -27,7 +78,8 @@ def orm_object_to_dict(model: "Base") -> dict[str, Any]:
     Returns:
         dict[str, Any]: The dictionary representation of the ORM object.
     """
-    return {c.key: getattr(model, c.key) for c in inspect(model).mapper.column_attrs}
+    keys = column_keys(type(model))
+    return dict(zip(keys, column_getter(type(model), keys)(model)))
 
 
 class Base(DeclarativeBase, AsyncAttrs):
@@ -51,6 +103,13 @@ item_deck_mapper_table = Table(
     Base.metadata,
     Column("item_id", ForeignKey("items.item_id"), primary_key=True),
     Column("deck_id", ForeignKey("decks.deck_id"), primary_key=True),
+    # The order in which the items were added to decks, which is ascending within each deck.
+    Column("position", Integer, Identity(), nullable=False),
+    # The items in a deck are counted and listed by a range scan of this index, as the primary
+    # key leads with the item id.
+    Index("ix_item_deck_mapper_deck_id_item_id", "deck_id", "item_id"),
+    # The items in a deck are listed in the order they were added by a range scan of this index.
+    Index("ix_item_deck_mapper_deck_id_position", "deck_id", "position"),
 )
 
 
@@ -85,6 +144,18 @@ class SQLAlchemyUser(Base):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+    # One-to-many relationship with ReviewState. If a user is deleted, all related review states will be deleted as well.
+    review_states: Mapped[list["SQLAlchemyReviewState"]] = relationship(
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    # One-to-many relationship with QuizStat. If a user is deleted, all related statistics will be deleted as well.
+    quiz_stats: Mapped[list["SQLAlchemyQuizStat"]] = relationship(
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
 
 class SQLAlchemyUserLoginHistory(Base):
@@ -133,6 +204,21 @@ class SQLAlchemyItem(Base):
     """The SQLAlchemy data model for items."""
 
     __tablename__ = "items"
+    __table_args__ = (
+        # The words of the English text are matched by their prefixes by a scan of this index.
+        Index("ix_items_english_tsv", "english_tsv", postgresql_using="gin"),
+        # A user has a single item per pair of texts, however they are cased or spaced, and so do
+        # the shared items, whose user id is null. New items are inserted with
+        # `ON CONFLICT DO NOTHING` on this index, so the duplicates are skipped by the database.
+        Index(
+            "ix_items_user_id_normalized_texts",
+            "user_id",
+            "normalized_english",
+            "normalized_japanese",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
 
     item_id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), nullable=True)
@@ -141,6 +227,17 @@ class SQLAlchemyItem(Base):
     grade: Mapped[int]
     created_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.now)
     updated_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.now)
+    # The words of the English text, which the database keeps up to date. It is only searched,
+    # so it is not loaded with the item.
+    english_tsv: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', english)", persisted=True),
+        deferred=True,
+    )
+    # The texts normalized by `normalize_text`, which are set whenever the texts are. They are
+    # only compared, so they are not loaded with the item.
+    normalized_english: Mapped[str] = mapped_column(deferred=True)
+    normalized_japanese: Mapped[str] = mapped_column(deferred=True)
 
     # Many-to-one relationship with User
     user: Mapped[SQLAlchemyUser] = relationship(back_populates="items")
@@ -157,6 +254,20 @@ class SQLAlchemyItem(Base):
     # One-to-many relationship with QuizItem
     quiz_items: Mapped[list["SQLAlchemyQuizItem"]] = relationship(back_populates="item")
 
+    @validates("english", "japanese")
+    def normalize_texts(self, key: str, text: str) -> str:
+        """Set the normalized copy of `english` or `japanese` when it is set.
+
+        Args:
+            key (str): The attribute name, which is either "english" or "japanese".
+            text (str): The text to set.
+
+        Returns:
+            str: The text as it is.
+        """
+        setattr(self, f"normalized_{key}", normalize_text(text))
+        return text
+
 
 class SQLAlchemyGenre(Base):
     """The SQLAlchemy data model for genres."""
@@ -177,6 +288,10 @@ class SQLAlchemyDeck(Base):
     """The SQLAlchemy data model for decks."""
 
     __tablename__ = "decks"
+    __table_args__ = (
+        # The decks of a user are paginated by a range scan of this index in id order.
+        Index("ix_decks_user_id_deck_id", "user_id", "deck_id"),
+    )
 
     deck_id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), nullable=True)
@@ -215,10 +330,32 @@ class SQLAlchemyQuizItem(Base):
     item: Mapped[SQLAlchemyItem] = relationship(back_populates="quiz_items")
 
 
+class SQLAlchemyQuizItemChoice(Base):
+    """The SQLAlchemy data model for the choices of quiz items.
+
+    This is the normalized copy of `SQLAlchemyQuizItem.choice_item_ids`, which is written together
+    with it, so that the quiz items using an item as a choice are found by an index lookup.
+    The item id has no foreign key, as in the JSON column, so that an item used only as
+    a distractor can still be deleted.
+    """
+
+    __tablename__ = "quiz_item_choices"
+
+    quiz_item_id: Mapped[int] = mapped_column(
+        ForeignKey("quiz_items.quiz_item_id", ondelete="CASCADE"), primary_key=True
+    )
+    position: Mapped[int] = mapped_column(primary_key=True)
+    item_id: Mapped[int] = mapped_column(index=True)
+
+
 class SQLAlchemyQuiz(Base):
     """The SQLAlchemy data model for quizzes."""
 
     __tablename__ = "quizzes"
+    __table_args__ = (
+        # The last quiz taken on a deck is read from the end of its range in this index.
+        Index("ix_quizzes_deck_id_quiz_timestamp", "deck_id", "quiz_timestamp"),
+    )
 
     quiz_id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(
@@ -240,3 +377,71 @@ class SQLAlchemyQuiz(Base):
     user: Mapped[SQLAlchemyUser] = relationship(back_populates="quizzes")
     # Many-to-one relationship with Deck
     deck: Mapped[SQLAlchemyDeck] = relationship(back_populates="quizzes")
+
+
+class SQLAlchemyReviewState(Base):
+    """The SQLAlchemy data model for the spaced-repetition states of the items studied by users."""
+
+    __tablename__ = "review_states"
+    __table_args__ = (
+        # A user has a single review state per item, which is upserted after each quiz.
+        UniqueConstraint("user_id", "item_id"),
+        # The items of a user due to be reviewed are read by a range scan of this index in due order.
+        Index("ix_review_states_user_id_due_at", "user_id", "due_at"),
+    )
+
+    review_state_id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.user_id", ondelete="CASCADE")
+    )
+    item_id: Mapped[int] = mapped_column(
+        ForeignKey("items.item_id", ondelete="CASCADE")
+    )
+    repetitions: Mapped[int]
+    ease: Mapped[float]
+    interval_days: Mapped[int]
+    due_at: Mapped[datetime.datetime]
+    reviewed_at: Mapped[datetime.datetime]
+
+    # Many-to-one relationship with User
+    user: Mapped[SQLAlchemyUser] = relationship(back_populates="review_states")
+
+
+class SQLAlchemyQuizStat(Base):
+    """The SQLAlchemy data model for the answers of users aggregated by deck, grade and day.
+
+    The statistics are added to when a quiz is answered, so that they are read without
+    scanning the quiz items of all the quizzes of a user.
+    """
+
+    __tablename__ = "quiz_stats"
+    __table_args__ = (
+        # The statistics are keyed by user, deck, grade and day. NULLs are not distinct in this
+        # index, so the quizzes without a deck share a row per grade and day too. This is what
+        # upserts infer.
+        Index(
+            "uq_quiz_stats_key",
+            "user_id",
+            "deck_id",
+            "grade",
+            "day",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    quiz_stat_id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.user_id", ondelete="CASCADE")
+    )
+    deck_id: Mapped[int] = mapped_column(
+        ForeignKey("decks.deck_id", ondelete="CASCADE"), nullable=True
+    )
+    grade: Mapped[int]
+    day: Mapped[datetime.date]
+    attempts: Mapped[int]
+    correct: Mapped[int]
+    total_answer_time: Mapped[int]
+
+    # Many-to-one relationship with User
+    user: Mapped[SQLAlchemyUser] = relationship(back_populates="quiz_stats")
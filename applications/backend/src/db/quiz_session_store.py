@@ -0,0 +1,334 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import datetime
+
+from pydantic import BaseModel
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+
+# The prefix of the Redis keys of quiz sessions.
+QUIZ_SESSION_KEY_PREFIX = "quiz_session:"
+# The field of a quiz session hash that holds the quiz itself. The other fields are question numbers.
+QUIZ_FIELD = "quiz"
+
+
+class QuizSessionQuestion(BaseModel):
+    """A question of a quiz as shown to the user.
+
+    Attributes:
+        question_number (int): The number of the question in the quiz.
+        question (str): The English word asked for.
+        choices (list[str]): The Japanese translations of the choices.
+        correct_answer (int): The index of the correct choice.
+    """
+
+    question_number: int
+    question: str
+    choices: list[str]
+    correct_answer: int
+
+
+class QuizSession(BaseModel):
+    """A quiz being taken, kept until it is answered or expires so that it is not rebuilt from the items.
+
+    Attributes:
+        quiz_id (int): The unique identifier for the quiz.
+        user_id (int): The unique identifier for the user who takes the quiz.
+        quiz_timestamp (datetime): The date and time when the quiz was created.
+        questions (list[QuizSessionQuestion]): The questions ordered by their numbers.
+    """
+
+    quiz_id: int
+    user_id: int
+    quiz_timestamp: datetime
+    questions: list[QuizSessionQuestion]
+
+
+class QuizSessionStore(ABC):
+    """The store of the quiz sessions, which expire after a fixed time."""
+
+    @abstractmethod
+    async def save(self, quiz_session: QuizSession) -> None:
+        """Save a quiz session.
+
+        Args:
+            quiz_session (QuizSession): The quiz session.
+        """
+        pass
+
+    @abstractmethod
+    async def read(self, quiz_id: int) -> QuizSession | None:
+        """Read a quiz session.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+
+        Returns:
+            QuizSession | None: The quiz session, or None if it is not found or has expired.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, quiz_id: int) -> None:
+        """Delete a quiz session if it exists.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+        """
+        pass
+
+
+class InMemoryQuizSessionStore(QuizSessionStore):
+    """The store of the quiz sessions in the memory of the worker process."""
+
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        """Initialize the store.
+
+        Args:
+            ttl_seconds (float): The seconds after which a quiz session expires.
+            max_size (int): The maximum number of quiz sessions, beyond which the least recently used is evicted.
+        """
+        self._cache: TTLCache[int, QuizSession] = TTLCache(max_size, ttl_seconds)
+
+    async def save(self, quiz_session: QuizSession) -> None:
+        """Save a quiz session.
+
+        Args:
+            quiz_session (QuizSession): The quiz session.
+        """
+        self._cache.set(quiz_session.quiz_id, quiz_session)
+
+    async def read(self, quiz_id: int) -> QuizSession | None:
+        """Read a quiz session.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+
+        Returns:
+            QuizSession | None: The quiz session, or None if it is not found or has expired.
+        """
+        return self._cache.get(quiz_id)
+
+    async def delete(self, quiz_id: int) -> None:
+        """Delete a quiz session if it exists.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+        """
+        self._cache.pop(quiz_id)
+
+
+class RedisQuizSessionStore(QuizSessionStore):
+    """The store of the quiz sessions in Redis, shared by all worker processes.
+
+    A quiz session is a hash with a JSON field for the quiz and one per question, which is written
+    with its expiration by a single transaction and read by a single `HGETALL`, so that a quiz
+    takes one round trip either way regardless of the number of questions.
+    """
+
+    def __init__(self, redis_client: Redis, ttl_seconds: int) -> None:
+        """Initialize the store.
+
+        Args:
+            redis_client (Redis): The client, whose connection pool is shared by the app.
+            ttl_seconds (int): The seconds after which a quiz session expires.
+        """
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    async def save(self, quiz_session: QuizSession) -> None:
+        """Save a quiz session.
+
+        Args:
+            quiz_session (QuizSession): The quiz session.
+        """
+        key = _key(quiz_session.quiz_id)
+        mapping = {QUIZ_FIELD: quiz_session.model_dump_json(exclude={"questions"})} | {
+            str(question.question_number): question.model_dump_json()
+            for question in quiz_session.questions
+        }
+        async with self.redis_client.pipeline(transaction=True) as pipeline:
+            pipeline.hset(key, mapping=mapping)
+            pipeline.expire(key, self.ttl_seconds)
+            await pipeline.execute()
+
+    async def read(self, quiz_id: int) -> QuizSession | None:
+        """Read a quiz session.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+
+        Returns:
+            QuizSession | None: The quiz session, or None if it is not found or has expired.
+        """
+        fields: dict[bytes, bytes] = await self.redis_client.hgetall(_key(quiz_id))  # type: ignore
+        if not fields:
+            return None
+        data = json.loads(fields.pop(QUIZ_FIELD.encode()))
+        questions = [
+            QuizSessionQuestion.model_validate_json(value) for value in fields.values()
+        ]
+        data["questions"] = sorted(
+            questions, key=lambda question: question.question_number
+        )
+        return QuizSession.model_validate(data)
+
+    async def delete(self, quiz_id: int) -> None:
+        """Delete a quiz session if it exists.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+        """
+        await self.redis_client.delete(_key(quiz_id))
+
+
+class FallbackQuizSessionStore(QuizSessionStore):
+    """The store of the quiz sessions in a primary store, or in a fallback store while the primary one fails.
+
+    After the primary store fails, it is not tried again for `retry_seconds`, so that requests do
+    not wait for it to time out one after another. The quiz sessions saved in the fallback store
+    meanwhile are still read from it afterwards.
+    """
+
+    def __init__(
+        self,
+        primary: QuizSessionStore,
+        fallback: QuizSessionStore,
+        retry_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            primary (QuizSessionStore): The store used while it works, e.g. Redis.
+            fallback (QuizSessionStore): The store used while the primary one fails, e.g. in memory.
+            retry_seconds (float): The seconds after a failure for which the primary store is not tried.
+            clock (Callable[[], float]): The function that returns the current time in seconds.
+        """
+        self.primary = primary
+        self.fallback = fallback
+        self.retry_seconds = retry_seconds
+        self.clock = clock
+        self._failed_at: float | None = None
+
+    @property
+    def primary_available(self) -> bool:
+        """Whether the primary store is tried, i.e. it has not failed within the retry interval.
+
+        Returns:
+            bool: True if the primary store is tried.
+        """
+        return (
+            self._failed_at is None
+            or self.clock() - self._failed_at >= self.retry_seconds
+        )
+
+    async def save(self, quiz_session: QuizSession) -> None:
+        """Save a quiz session in the primary store, or in the fallback store if it fails.
+
+        Args:
+            quiz_session (QuizSession): The quiz session.
+        """
+        if self.primary_available:
+            try:
+                await self.primary.save(quiz_session)
+                return
+            except RedisError as e:
+                self._fail(e)
+        await self.fallback.save(quiz_session)
+
+    async def read(self, quiz_id: int) -> QuizSession | None:
+        """Read a quiz session from the primary store, or from the fallback store if it is not found there.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+
+        Returns:
+            QuizSession | None: The quiz session, or None if it is not found or has expired.
+        """
+        if self.primary_available:
+            try:
+                quiz_session = await self.primary.read(quiz_id)
+                if quiz_session is not None:
+                    return quiz_session
+            except RedisError as e:
+                self._fail(e)
+        return await self.fallback.read(quiz_id)
+
+    async def delete(self, quiz_id: int) -> None:
+        """Delete a quiz session from both stores.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+        """
+        if self.primary_available:
+            try:
+                await self.primary.delete(quiz_id)
+            except RedisError as e:
+                self._fail(e)
+        await self.fallback.delete(quiz_id)
+
+    def _fail(self, error: RedisError) -> None:
+        """Stop trying the primary store for the retry interval.
+
+        Args:
+            error (RedisError): The error raised by the primary store.
+        """
+        print(f"Falling back to the in-process quiz session store: {error!r}")
+        self._failed_at = self.clock()
+
+
+def create_redis_client() -> Redis | None:
+    """Create a Redis client with a connection pool configured by the settings.
+
+    Returns:
+        Redis | None: The client, or None if no Redis URL is configured.
+    """
+    if settings.REDIS_URL is None:
+        return None
+    return Redis(
+        connection_pool=ConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_TIMEOUT_SECONDS,
+        )
+    )
+
+
+def create_quiz_session_store(redis_client: Redis | None) -> QuizSessionStore:
+    """Create the quiz session store, which falls back to the memory of the process without Redis.
+
+    Args:
+        redis_client (Redis | None): The client shared by the app, if Redis is configured.
+
+    Returns:
+        QuizSessionStore: The quiz session store.
+    """
+    in_memory_store = InMemoryQuizSessionStore(
+        settings.QUIZ_SESSION_TTL_SECONDS, settings.QUIZ_SESSION_MAX_SIZE
+    )
+    if redis_client is None:
+        return in_memory_store
+    return FallbackQuizSessionStore(
+        RedisQuizSessionStore(redis_client, settings.QUIZ_SESSION_TTL_SECONDS),
+        in_memory_store,
+        settings.REDIS_RETRY_SECONDS,
+    )
+
+
+def _key(quiz_id: int) -> str:
+    """Get the Redis key of a quiz session.
+
+    Args:
+        quiz_id (int): The unique identifier for the quiz.
+
+    Returns:
+        str: The key.
+    """
+    return f"{QUIZ_SESSION_KEY_PREFIX}{quiz_id}"
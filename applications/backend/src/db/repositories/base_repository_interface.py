@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
 DomainModelType = TypeVar("DomainModelType", bound=BaseModel)
+ProjectionType = TypeVar("ProjectionType", bound=BaseModel)
+
+# The default number of records handled by a single statement in bulk operations.
+DEFAULT_BATCH_SIZE = 1000
 
 
 class IBaseRepository(ABC, Generic[DomainModelType]):
@@ -56,3 +61,117 @@ class IBaseRepository(ABC, Generic[DomainModelType]):
             DomainModelType: The domain entity created from the deleted record.
         """
         pass
+
+    @abstractmethod
+    async def create_many(
+        self,
+        domain_entities: Sequence[DomainModelType],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[DomainModelType]:
+        """Create new records in the database in bulk.
+
+        Args:
+            domain_entities (Sequence[DomainModelType]): The domain entities on which to base the new records.
+            batch_size (int): The maximum number of records inserted by a single statement.
+
+        Returns:
+            list[DomainModelType]: The domain entities reconstructed from the newly created records.
+        """
+        pass
+
+    @abstractmethod
+    async def read_many(
+        self,
+        ids: Sequence[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        missing_ok: bool = False,
+    ) -> list[DomainModelType]:
+        """Read records from the database in bulk.
+
+        Args:
+            ids (Sequence[int]): The ids of the records to read.
+            batch_size (int): The maximum number of records read by a single statement.
+            missing_ok (bool): Whether the records not found are skipped instead of raising an error.
+
+        Raises:
+            ValueError: If any of the records is not found and `missing_ok` is False.
+
+        Returns:
+            list[DomainModelType]: The domain entities created from the read records.
+        """
+        pass
+
+    @abstractmethod
+    async def update_many(
+        self,
+        domain_entities: Sequence[DomainModelType],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[DomainModelType]:
+        """Update records in the database in bulk.
+
+        Args:
+            domain_entities (Sequence[DomainModelType]): The domain entities used to update the records.
+            batch_size (int): The maximum number of records updated by a single statement.
+
+        Returns:
+            list[DomainModelType]: The domain entities reconstructed from the updated records.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(
+        self, ids: Sequence[int], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> list[DomainModelType]:
+        """Delete records from the database in bulk.
+
+        Args:
+            ids (Sequence[int]): The ids of the records to delete.
+            batch_size (int): The maximum number of records deleted by a single statement.
+
+        Returns:
+            list[DomainModelType]: The domain entities created from the deleted records.
+        """
+        pass
+
+    @abstractmethod
+    async def read_projected(
+        self,
+        projection: type[ProjectionType],
+        filters: Mapping[str, Any] | None = None,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> list[ProjectionType]:
+        """Read only the columns named by the fields of a projection, ordered by id.
+
+        This is a read-only path for lists whose records are not modified afterwards,
+        so the records are not tracked as entities.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            filters (Mapping[str, Any] | None): The values that the columns must be equal to.
+            cursor (int | None): The id of the last record of the previous page, if any.
+            limit (int | None): The maximum number of records to read. None means no limit.
+
+        Returns:
+            list[ProjectionType]: The projections of the read records.
+        """
+        pass
+
+    @abstractmethod
+    def stream_projected(
+        self,
+        projection: type[ProjectionType],
+        filters: Mapping[str, Any] | None = None,
+        cursor: int | None = None,
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream only the columns named by the fields of a projection, ordered by id.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            filters (Mapping[str, Any] | None): The values that the columns must be equal to.
+            cursor (int | None): The id of the last record already read, if any.
+
+        Returns:
+            AsyncIterator[ProjectionType]: The projections of the read records.
+        """
+        pass
@@ -1,16 +1,30 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any, Literal
 
-from src.domain.models import Deck
+from src.domain.models import Deck, Item
 
-from .base_repository_interface import IBaseRepository
+from .base_repository_interface import IBaseRepository, ProjectionType
+
+# The orders of the items in a deck: the order they were added in, by grade, or by creation time.
+DeckItemOrder = Literal["position", "grade", "created_at"]
+# The set operations combining the items of decks: the items in any of them, the items in all of them,
+# or the items in the first one but in none of the others.
+DeckSetOperation = Literal["union", "intersect", "difference"]
 
 
 class IDeckRepository(IBaseRepository[Deck], ABC):
     """The interface for the deck repository."""
 
     @abstractmethod
-    async def read_all(self) -> list[Deck]:
-        """Read all decks from the database.
+    async def read_all(
+        self, cursor: int | None = None, limit: int | None = None
+    ) -> list[Deck]:
+        """Read all decks from the database, ordered by their ids.
+
+        Args:
+            cursor (int | None): The id of the last deck of the previous page, if any.
+            limit (int | None): The maximum number of decks to read. None means no limit.
 
         Returns:
             list[Deck]: The list of all decks.
@@ -18,13 +32,207 @@ class IDeckRepository(IBaseRepository[Deck], ABC):
         pass
 
     @abstractmethod
-    async def read_by_user_id(self, user_id: int) -> list[Deck]:
-        """Read all decks from the database that belong to a specific user.
+    async def read_by_user_id(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[Deck]:
+        """Read all decks from the database that belong to a specific user, ordered by their ids.
 
         Args:
             user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last deck of the previous page, if any.
+            limit (int | None): The maximum number of decks to read. None means no limit.
 
         Returns:
             list[Deck]: The list of decks that belong to the user.
         """
         pass
+
+    @abstractmethod
+    def stream_by_user_id(
+        self, user_id: int, cursor: int | None = None
+    ) -> AsyncIterator[Deck]:
+        """Stream all decks that belong to a specific user without loading them into memory at once.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last deck already read, if any.
+
+        Returns:
+            AsyncIterator[Deck]: The decks that belong to the user, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    async def read_summaries_by_user_id(
+        self,
+        projection: type[ProjectionType],
+        user_id: int,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> list[ProjectionType]:
+        """Read a projection of the decks of a user together with their item counts and last quiz times.
+
+        Besides the columns of the decks, the projection may have the fields `item_count`,
+        the number of items in a deck, and `last_studied_at`, the time of the last quiz taken on it,
+        which is None if none has been taken.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last deck of the previous page, if any.
+            limit (int | None): The maximum number of decks to read. None means no limit.
+
+        Returns:
+            list[ProjectionType]: The projections of the decks of the user, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    def stream_summaries_by_user_id(
+        self,
+        projection: type[ProjectionType],
+        user_id: int,
+        cursor: int | None = None,
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream a projection of the decks of a user together with their item counts and last quiz times.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last deck already read, if any.
+
+        Returns:
+            AsyncIterator[ProjectionType]: The projections of the decks of the user, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    async def read_items(
+        self,
+        projection: type[ProjectionType],
+        deck_id: int,
+        cursor: int | None = None,
+        limit: int | None = None,
+        filters: Mapping[str, Any] | None = None,
+        order_by: DeckItemOrder = "position",
+    ) -> list[ProjectionType]:
+        """Read a projection of the items in a deck.
+
+        The fields of the projection are the columns of the items, and `position`, the position of an item in the deck.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+            cursor (int | None): The id of the last item of the previous page, if any.
+            limit (int | None): The maximum number of items to read. None means no limit.
+            filters (Mapping[str, Any] | None): The values that the columns of the items must be equal to.
+            order_by (DeckItemOrder): The order of the items, where ties are ordered by their ids.
+
+        Returns:
+            list[ProjectionType]: The projections of the items in the deck.
+        """
+        pass
+
+    @abstractmethod
+    def stream_items(
+        self,
+        projection: type[ProjectionType],
+        deck_id: int,
+        cursor: int | None = None,
+        filters: Mapping[str, Any] | None = None,
+        order_by: DeckItemOrder = "position",
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream a projection of the items in a deck without loading them into memory at once.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+            cursor (int | None): The id of the last item already read, if any.
+            filters (Mapping[str, Any] | None): The values that the columns of the items must be equal to.
+            order_by (DeckItemOrder): The order of the items, where ties are ordered by their ids.
+
+        Returns:
+            AsyncIterator[ProjectionType]: The projections of the items in the deck.
+        """
+        pass
+
+    @abstractmethod
+    async def add_items(
+        self,
+        deck_id: int,
+        item_ids: Sequence[int],
+        new_items: Sequence[Item] = (),
+        user_id: int | None = None,
+    ) -> tuple[list[int], list[int]]:
+        """Add existing items and new items to a deck in a single transaction.
+
+        The new items that duplicate existing items are not created, and the existing items are
+        added instead. The items already in the deck are skipped rather than failing the whole batch.
+
+        Args:
+            deck_id (int): The unique identifier for the deck.
+            item_ids (Sequence[int]): The ids of the existing items to add.
+            new_items (Sequence[Item]): The items to create and add, which must have the same owner.
+                Their ids are assigned by the database.
+            user_id (int | None): The unique identifier for the user whose items and shared items
+                (i.e. items without an owner) can be added, if any. None means any items can be added.
+                The new items must be owned by the user or shared to be added.
+
+        Raises:
+            ValueError: If the new items have different owners.
+
+        Returns:
+            tuple[list[int], list[int]]: The ids of the new items in the same order as `new_items`,
+                which are the ids of the existing items for the duplicates, and the ids of the items
+                added to the deck, which lack the items already in the deck and the items that do not
+                exist or cannot be added.
+        """
+        pass
+
+    @abstractmethod
+    async def remove_items(self, deck_id: int, item_ids: Sequence[int]) -> list[int]:
+        """Remove items from a deck.
+
+        Args:
+            deck_id (int): The unique identifier for the deck.
+            item_ids (Sequence[int]): The ids of the items to remove.
+
+        Returns:
+            list[int]: The ids of the removed items, which lack the items not in the deck.
+        """
+        pass
+
+    @abstractmethod
+    async def clone(self, deck_id: int, new_deck: Deck) -> tuple[Deck, int]:
+        """Create a deck with the same items as a deck, in the same order.
+
+        Args:
+            deck_id (int): The unique identifier for the deck to clone.
+            new_deck (Deck): The deck to create. Its id is assigned by the database.
+
+        Returns:
+            tuple[Deck, int]: The created deck and the number of items in it.
+        """
+        pass
+
+    @abstractmethod
+    async def create_from_decks(
+        self, operation: DeckSetOperation, deck_ids: Sequence[int], new_deck: Deck
+    ) -> tuple[Deck, int]:
+        """Create a deck with the items of a set operation over decks.
+
+        The items are in the order they were first added to any of the decks.
+
+        Args:
+            operation (DeckSetOperation): The set operation combining the items of the decks.
+            deck_ids (Sequence[int]): The unique identifiers for the decks, the first of which
+                the others are subtracted from by `difference`.
+            new_deck (Deck): The deck to create. Its id is assigned by the database.
+
+        Raises:
+            ValueError: If no deck is given.
+
+        Returns:
+            tuple[Deck, int]: The created deck and the number of items in it.
+        """
+        pass
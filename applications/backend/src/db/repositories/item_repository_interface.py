@@ -1,21 +1,245 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 
 from src.domain.models import Item
 
-from .base_repository_interface import IBaseRepository
+from .base_repository_interface import IBaseRepository, ProjectionType
 
 
 class IItemRepository(IBaseRepository[Item], ABC):
     """The interface for the item repository."""
 
     @abstractmethod
-    async def read_by_user_id(self, user_id: int) -> list[Item]:
-        """Read all items from the database that were made by a specific user.
+    async def read_by_user_id(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[Item]:
+        """Read all items from the database that were made by a specific user, ordered by their ids.
 
         Args:
             user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last item of the previous page, if any.
+            limit (int | None): The maximum number of items to read. None means no limit.
 
         Returns:
             list[Item]: The list of items that were made by the user.
         """
         pass
+
+    @abstractmethod
+    def stream_by_user_id(
+        self, user_id: int, cursor: int | None = None
+    ) -> AsyncIterator[Item]:
+        """Stream all items that were made by a specific user without loading them into memory at once.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last item already read, if any.
+
+        Returns:
+            AsyncIterator[Item]: The items that were made by the user, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    async def read_projected_by_deck_id(
+        self,
+        projection: type[ProjectionType],
+        deck_id: int,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> list[ProjectionType]:
+        """Read only the columns named by the fields of a projection of the items in a deck.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+            cursor (int | None): The id of the last item of the previous page, if any.
+            limit (int | None): The maximum number of items to read. None means no limit.
+
+        Returns:
+            list[ProjectionType]: The projections of the items in the deck, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    def stream_projected_by_deck_id(
+        self,
+        projection: type[ProjectionType],
+        deck_id: int,
+        cursor: int | None = None,
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream only the columns named by the fields of a projection of the items in a deck.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+            cursor (int | None): The id of the last item already read, if any.
+
+        Returns:
+            AsyncIterator[ProjectionType]: The projections of the items in the deck, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    async def read_projected_updated_since(
+        self, projection: type[ProjectionType], updated_since: datetime | None = None
+    ) -> list[ProjectionType]:
+        """Read only the columns named by the fields of a projection of the items updated since a time.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            updated_since (datetime | None): The time after which the items were updated.
+                None means all items.
+
+        Returns:
+            list[ProjectionType]: The projections of the items, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Count all items in the database.
+
+        Returns:
+            int: The number of items.
+        """
+        pass
+
+    @abstractmethod
+    async def read_id_checksum(self, max_item_id: int) -> tuple[int, int]:
+        """Count the items with ids up to an id and sum their ids.
+
+        Args:
+            max_item_id (int): The largest id of the items to count.
+
+        Returns:
+            tuple[int, int]: The number of the items and the sum of their ids.
+        """
+        pass
+
+    @abstractmethod
+    async def sample(
+        self,
+        num_items: int,
+        user_id: int | None,
+        deck_id: int | None = None,
+        grades: Sequence[int] | None = None,
+    ) -> list[Item]:
+        """Read distinct items chosen at random in a single query.
+
+        Args:
+            num_items (int): The maximum number of items to read.
+            user_id (int | None): The unique identifier for the user whose items and shared items
+                (i.e. items without an owner) are chosen from. Ignored if `deck_id` is given.
+            deck_id (int | None): The unique identifier for the deck whose items are chosen from, if any.
+            grades (Sequence[int] | None): The grades of the items to choose from. None means all grades.
+
+        Returns:
+            list[Item]: The items in random order, fewer than `num_items` if there are not enough.
+        """
+        pass
+
+    @abstractmethod
+    async def search_projected(
+        self,
+        projection: type[ProjectionType],
+        query: str | None = None,
+        user_id: int | None = None,
+        grades: Sequence[int] | None = None,
+        deck_id: int | None = None,
+        genre_id: int | None = None,
+        fuzzy: bool = False,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> list[ProjectionType]:
+        """Read only the columns named by the fields of a projection of the items matching a search.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            query (str | None): The text to search for in the English or Japanese text. None means all items.
+            user_id (int | None): The unique identifier for the user who made the items, if any.
+            grades (Sequence[int] | None): The grades of the items. None means all grades.
+            deck_id (int | None): The unique identifier for the deck of the items, if any.
+            genre_id (int | None): The unique identifier for the genre of the items, if any.
+            fuzzy (bool): Whether the English text also matches words similar to the query.
+            cursor (int | None): The id of the last item of the previous page, if any.
+            limit (int | None): The maximum number of items to read. None means no limit.
+
+        Returns:
+            list[ProjectionType]: The projections of the matching items, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    def stream_search_projected(
+        self,
+        projection: type[ProjectionType],
+        query: str | None = None,
+        user_id: int | None = None,
+        grades: Sequence[int] | None = None,
+        deck_id: int | None = None,
+        genre_id: int | None = None,
+        fuzzy: bool = False,
+        cursor: int | None = None,
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream only the columns named by the fields of a projection of the items matching a search.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            query (str | None): The text to search for in the English or Japanese text. None means all items.
+            user_id (int | None): The unique identifier for the user who made the items, if any.
+            grades (Sequence[int] | None): The grades of the items. None means all grades.
+            deck_id (int | None): The unique identifier for the deck of the items, if any.
+            genre_id (int | None): The unique identifier for the genre of the items, if any.
+            fuzzy (bool): Whether the English text also matches words similar to the query.
+            cursor (int | None): The id of the last item already read, if any.
+
+        Returns:
+            AsyncIterator[ProjectionType]: The projections of the matching items, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    async def add_many(self, items: Sequence[Item]) -> tuple[list[int], list[int]]:
+        """Create items of a user, skipping the duplicates of existing items and of each other.
+
+        Items are duplicates if they have the same owner and the same normalized texts.
+
+        Args:
+            items (Sequence[Item]): The items to create, which must have the same owner.
+                Their ids are assigned by the database.
+
+        Raises:
+            ValueError: If the items have different owners.
+
+        Returns:
+            tuple[list[int], list[int]]: The ids of the items in the same order as `items`, which are
+                the ids of the existing items for the duplicates, and the ids of the created items.
+        """
+        pass
+
+    @abstractmethod
+    async def copy_many(
+        self,
+        items: Sequence[Item],
+        deck_id: int | None = None,
+        genre_id: int | None = None,
+    ) -> list[int]:
+        """Load a large number of items of a user into the database at once, skipping the duplicates.
+
+        Args:
+            items (Sequence[Item]): The items to load, which must have the same owner.
+                Their ids are assigned by the database.
+            deck_id (int | None): The unique identifier for the deck to add the items to, if any.
+            genre_id (int | None): The unique identifier for the genre to tag the items with, if any.
+
+        Raises:
+            ValueError: If the items have different owners, or the deck or the genre does not exist,
+                in which case nothing is loaded.
+
+        Returns:
+            list[int]: The ids of the loaded items in the same order as `items`, which are the ids
+                of the existing items for the duplicates.
+        """
+        pass
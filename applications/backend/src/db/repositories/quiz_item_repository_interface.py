@@ -1,22 +1,28 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
-from src.domain.models import QuizItem
+from src.domain.models import QuizItem, ReviewState
 
-from .base_repository_interface import IBaseRepository
+from .base_repository_interface import DEFAULT_BATCH_SIZE, IBaseRepository
 
 
 class IQuizItemRepository(IBaseRepository[QuizItem], ABC):
     """The interface for the quiz item repository."""
 
     @abstractmethod
-    async def read_by_quiz_id(self, quiz_id: int) -> list[QuizItem]:
+    async def read_by_quiz_id(
+        self, quiz_id: int, user_id: int | None = None
+    ) -> list[QuizItem]:
         """Read all quiz items from the database that belong to a specific quiz.
 
         Args:
             quiz_id (int): The unique identifier for the quiz.
+            user_id (int | None): The unique identifier for the user who must have taken the quiz,
+                which is checked by the same query. None means any user.
 
         Returns:
             list[QuizItem]: The list of quiz items that belong to the quiz.
+                Empty if the quiz is not found or not taken by the user.
         """
         pass
 
@@ -31,3 +37,39 @@ class IQuizItemRepository(IBaseRepository[QuizItem], ABC):
             list[QuizItem]: The list of quiz items that ask for the item.
         """
         pass
+
+    @abstractmethod
+    async def read_by_choice_item_id(self, item_id: int) -> list[QuizItem]:
+        """Read all quiz items from the database that use a specific item as one of their choices.
+
+        Args:
+            item_id (int): The unique identifier for the item.
+
+        Returns:
+            list[QuizItem]: The list of quiz items that use the item as a choice, ordered by their ids.
+        """
+        pass
+
+    @abstractmethod
+    async def update_answers(
+        self,
+        quiz_items: Sequence[QuizItem],
+        review_states: Sequence[ReviewState] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[QuizItem]:
+        """Write the answers of quiz items to the database in bulk, and add them to the statistics of the user.
+
+        Args:
+            quiz_items (Sequence[QuizItem]): The answered quiz items, none of which were answered before.
+            review_states (Sequence[ReviewState]): The review states of the items after the answers,
+                written in the same transaction as the answers.
+            batch_size (int): The maximum number of quiz items updated by a single statement.
+
+        Raises:
+            ValueError: If any of the quiz items does not have an id, or has already been answered,
+                in which case nothing is written.
+
+        Returns:
+            list[QuizItem]: The quiz items.
+        """
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
 
-from src.domain.models import Quiz
+from src.domain.models import Quiz, QuizItem, QuizWithItems
 
 from .base_repository_interface import IBaseRepository
 
@@ -9,17 +10,36 @@ class IQuizRepository(IBaseRepository[Quiz], ABC):
     """The interface for the quiz repository."""
 
     @abstractmethod
-    async def read_by_user_id(self, user_id: int) -> list[Quiz]:
-        """Read all quizzes from the database that a specific user has taken.
+    async def read_by_user_id(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[Quiz]:
+        """Read all quizzes from the database that a specific user has taken, ordered by their ids.
 
         Args:
             user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last quiz of the previous page, if any.
+            limit (int | None): The maximum number of quizzes to read. None means no limit.
 
         Returns:
             list[Quiz]: The list of quizzes that the user has taken.
         """
         pass
 
+    @abstractmethod
+    def stream_by_user_id(
+        self, user_id: int, cursor: int | None = None
+    ) -> AsyncIterator[Quiz]:
+        """Stream all quizzes that a specific user has taken without loading them into memory at once.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last quiz already read, if any.
+
+        Returns:
+            AsyncIterator[Quiz]: The quizzes that the user has taken, ordered by their ids.
+        """
+        pass
+
     @abstractmethod
     async def read_by_deck_id(self, deck_id: int) -> list[Quiz]:
         """Read all quizzes from the database that were based on a specific deck.
@@ -31,3 +51,55 @@ class IQuizRepository(IBaseRepository[Quiz], ABC):
             list[Quiz]: The list of quizzes that were based on the deck.
         """
         pass
+
+    @abstractmethod
+    async def create_with_items(
+        self, quiz: Quiz, quiz_items: Sequence[QuizItem]
+    ) -> tuple[Quiz, list[QuizItem]]:
+        """Create a quiz and its quiz items in a single transaction.
+
+        Args:
+            quiz (Quiz): The quiz to create.
+            quiz_items (Sequence[QuizItem]): The quiz items of the quiz. Their `quiz_id` is ignored
+                and set to the id of the created quiz.
+
+        Returns:
+            tuple[Quiz, list[QuizItem]]: The created quiz and quiz items, in the same order as `quiz_items`.
+        """
+        pass
+
+    @abstractmethod
+    async def read_with_items(
+        self, quiz_id: int, user_id: int | None = None
+    ) -> QuizWithItems:
+        """Read a quiz together with its quiz items and the items of their choices.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+            user_id (int | None): The unique identifier for the user who must have taken the quiz.
+                None means any user.
+
+        Raises:
+            ValueError: If the quiz is not found or not taken by the user.
+
+        Returns:
+            QuizWithItems: The quiz with its quiz items and the items of their choices.
+        """
+        pass
+
+    @abstractmethod
+    async def read_answered_with_items(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[QuizWithItems]:
+        """Read the answered quizzes of a user together with their quiz items and the items of their choices.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last quiz of the previous page, if any.
+            limit (int | None): The maximum number of quizzes to read. None means no limit.
+
+        Returns:
+            list[QuizWithItems]: The quizzes with their quiz items and the items of their choices,
+                ordered by their ids.
+        """
+        pass
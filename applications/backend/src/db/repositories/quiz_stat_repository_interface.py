@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from src.domain.models import QuizStat
+
+from .base_repository_interface import IBaseRepository
+
+
+class IQuizStatRepository(IBaseRepository[QuizStat], ABC):
+    """The interface for the quiz statistics repository."""
+
+    @abstractmethod
+    async def read_by_user_id(
+        self, user_id: int, deck_id: int | None = None, since: date | None = None
+    ) -> list[QuizStat]:
+        """Read the statistics of a user by grade and day, summed over the decks.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            deck_id (int | None): The unique identifier for the deck to read the statistics of, if any.
+                Otherwise, the statistics of all the quizzes are read.
+            since (date | None): The first day to read the statistics of. None means all days.
+
+        Returns:
+            list[QuizStat]: The statistics ordered by day and grade, without ids.
+        """
+        pass
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from src.domain.models import ReviewState
+
+from .base_repository_interface import DEFAULT_BATCH_SIZE, IBaseRepository
+
+
+class IReviewStateRepository(IBaseRepository[ReviewState], ABC):
+    """The interface for the review state repository."""
+
+    @abstractmethod
+    async def read_due(
+        self,
+        user_id: int,
+        due_at: datetime,
+        limit: int,
+        deck_id: int | None = None,
+        grades: Sequence[int] | None = None,
+    ) -> list[ReviewState]:
+        """Read the review states of the items of a user due to be reviewed, most overdue first.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            due_at (datetime): The date and time by which the items are due, usually now.
+            limit (int): The maximum number of review states to read.
+            deck_id (int | None): The unique identifier for the deck whose items are read, if any.
+            grades (Sequence[int] | None): The grades of the items to read. None means all grades.
+
+        Returns:
+            list[ReviewState]: The review states ordered by their due dates.
+        """
+        pass
+
+    @abstractmethod
+    async def read_by_item_ids(
+        self, user_id: int, item_ids: Sequence[int]
+    ) -> list[ReviewState]:
+        """Read the review states of specific items of a user.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            item_ids (Sequence[int]): The unique identifiers for the items.
+
+        Returns:
+            list[ReviewState]: The review states of the items that have been reviewed, in no particular order.
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_many(
+        self,
+        review_states: Sequence[ReviewState],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[ReviewState]:
+        """Create or update the review states of items in bulk.
+
+        Args:
+            review_states (Sequence[ReviewState]): The review states, at most one per user and item.
+            batch_size (int): The maximum number of review states written by a single statement.
+
+        Returns:
+            list[ReviewState]: The review states reconstructed from the written records,
+                in the same order as `review_states`.
+        """
+        pass
@@ -1,5 +1,7 @@
-from typing import Generic, Type, TypeVar
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+from typing import Any, Generic, Type, TypeVar
 
+from sqlalchemy import ColumnElement, Select, delete, insert, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models.sqlalchemy_data_models import (
@@ -8,12 +10,20 @@ from src.db.models.sqlalchemy_data_models import (
     SQLAlchemyItem,
     SQLAlchemyQuiz,
     SQLAlchemyQuizItem,
+    SQLAlchemyQuizStat,
+    SQLAlchemyReviewState,
     SQLAlchemyUser,
     SQLAlchemyUserLoginHistory,
+    column_getter,
+    column_keys,
     orm_object_to_dict,
 )
-from src.db.repositories.base_repository_interface import IBaseRepository
-from src.domain.models.base_model import BaseDomainModel
+from src.db.repositories.base_repository_interface import (
+    DEFAULT_BATCH_SIZE,
+    IBaseRepository,
+    ProjectionType,
+)
+from src.domain.models.base_model import BaseDomainModel, construct_trusted
 
 DataModelType = TypeVar(
     "DataModelType",
@@ -24,8 +34,32 @@ DataModelType = TypeVar(
     SQLAlchemyItem,
     SQLAlchemyQuiz,
     SQLAlchemyQuizItem,
+    SQLAlchemyQuizStat,
+    SQLAlchemyReviewState,
 )
 DomainModelType = TypeVar("DomainModelType", bound=BaseDomainModel)
+T = TypeVar("T")
+
+
+def batched(sequence: Sequence[T], batch_size: int) -> Iterator[Sequence[T]]:
+    """Split a sequence into consecutive batches of at most `batch_size` elements.
+
+    Args:
+        sequence (Sequence[T]): The sequence to split.
+        batch_size (int): The maximum number of elements in a batch.
+
+    Raises:
+        ValueError: If `batch_size` is not a positive integer.
+
+    Yields:
+        Sequence[T]: The next batch of elements.
+    """
+    if batch_size < 1:
+        raise ValueError(
+            f"batch_size must be a positive integer, but it is {batch_size}."
+        )
+    for start in range(0, len(sequence), batch_size):
+        yield sequence[start : start + batch_size]
 
 
 class BaseRepository(
@@ -49,6 +83,17 @@ class BaseRepository(
         self.data_model = data_model  # type: ignore
         self.domain_model = domain_model
         self.async_session = async_session
+        # All data models have a single-column primary key, which bulk operations filter on.
+        self.primary_key = inspect(data_model).primary_key[0]
+        # Read only the columns that the domain model has, with a getter built once per data model.
+        self.domain_keys = tuple(
+            key for key in column_keys(data_model) if key in domain_model.model_fields
+        )
+        self.get_domain_values = column_getter(data_model, self.domain_keys)
+        # Records can be converted without validation only if they have all the domain fields.
+        self.is_trusted_conversion = len(self.domain_keys) == len(
+            domain_model.model_fields
+        )
 
     async def create(self, domain_entity: DomainModelType) -> DomainModelType:
         """Create a new record in the database.
@@ -64,8 +109,7 @@ class BaseRepository(
         async with self.async_session.begin():
             data_entity = self.data_model(**domain_entity.model_dump())
             self.async_session.add(data_entity)
-        data_entity_dict = orm_object_to_dict(data_entity)
-        domain_entity = self.domain_model.model_validate(data_entity_dict)
+        domain_entity = self._to_domain(data_entity)
         return domain_entity
 
     async def read(self, id: int) -> DomainModelType:
@@ -86,8 +130,7 @@ class BaseRepository(
                 f'The data with id {id} should be found in the "{self.data_model.__tablename__}" table \
                 to read, but it was not found.'
             )
-        data_entity_dict = orm_object_to_dict(data_entity)
-        read_domain_entity = self.domain_model.model_validate(data_entity_dict)
+        read_domain_entity = self._to_domain(data_entity)
         return read_domain_entity
 
     async def update(self, domain_entity: DomainModelType) -> DomainModelType:
@@ -135,6 +178,423 @@ class BaseRepository(
                     to delete, but it was not found.'
                 )
             await self.async_session.delete(data_entity)
-        data_entity_dict = orm_object_to_dict(data_entity)
-        deleted_domain_entity = self.domain_model.model_validate(data_entity_dict)
+        deleted_domain_entity = self._to_domain(data_entity)
         return deleted_domain_entity
+
+    async def create_many(
+        self,
+        domain_entities: Sequence[DomainModelType],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[DomainModelType]:
+        """Create new records in the database in bulk.
+
+        All records are inserted in a single transaction by `INSERT ... RETURNING` statements,
+        each of which inserts at most `batch_size` records.
+
+        Args:
+            domain_entities (Sequence[DomainModelType]): The domain entities on which to base the new records.
+            batch_size (int): The maximum number of records inserted by a single statement.
+
+        Returns:
+            list[DomainModelType]: The domain entities reconstructed from the newly created records,
+                in the same order as `domain_entities`.
+        """
+        if not domain_entities:
+            return []
+        data_entities: list[DataModelType] = []
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            for batch in batched(domain_entities, batch_size):
+                results = await self.async_session.scalars(
+                    insert(self.data_model).returning(
+                        self.data_model, sort_by_parameter_order=True
+                    ),
+                    [self._to_row(domain_entity) for domain_entity in batch],
+                )
+                data_entities.extend(results.all())
+        created_domain_entities = [
+            self._to_domain(data_entity) for data_entity in data_entities
+        ]
+        return created_domain_entities
+
+    async def read_many(
+        self,
+        ids: Sequence[int],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        missing_ok: bool = False,
+    ) -> list[DomainModelType]:
+        """Read records from the database in bulk.
+
+        Args:
+            ids (Sequence[int]): The ids of the records to read.
+            batch_size (int): The maximum number of records read by a single statement.
+            missing_ok (bool): Whether the records not found are skipped instead of raising an error.
+
+        Raises:
+            ValueError: If any of the records is not found and `missing_ok` is False.
+
+        Returns:
+            list[DomainModelType]: The domain entities created from the read records,
+                in the same order as `ids`.
+        """
+        if not ids:
+            return []
+        data_entities: list[DataModelType] = []
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            for batch in batched(ids, batch_size):
+                results = await self.async_session.scalars(
+                    select(self.data_model).where(self.primary_key.in_(batch))
+                )
+                data_entities.extend(results.all())
+        data_entity_by_id = {
+            getattr(data_entity, self.primary_key.name): data_entity
+            for data_entity in data_entities
+        }
+        if missing_ok:
+            ids = [id for id in ids if id in data_entity_by_id]
+        missing_ids = [id for id in ids if id not in data_entity_by_id]
+        if missing_ids:
+            raise ValueError(
+                f'The data with ids {missing_ids} should be found in the "{self.data_model.__tablename__}" table \
+                to read, but they were not found.'
+            )
+        read_domain_entities = [self._to_domain(data_entity_by_id[id]) for id in ids]
+        return read_domain_entities
+
+    async def update_many(
+        self,
+        domain_entities: Sequence[DomainModelType],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[DomainModelType]:
+        """Update records in the database in bulk.
+
+        All records are updated in a single transaction by executemany-style `UPDATE` statements
+        keyed on the primary key, preceded by a single existence check per batch instead of
+        loading every record. As with `update`, fields set to None in a domain entity are left unchanged.
+
+        Args:
+            domain_entities (Sequence[DomainModelType]): The domain entities used to update the records.
+            batch_size (int): The maximum number of records updated by a single statement.
+
+        Raises:
+            ValueError: If any of the domain entities does not have an id or any of the records
+                is not found. In the latter case, no records are updated.
+
+        Returns:
+            list[DomainModelType]: The domain entities reconstructed from the updated records.
+        """
+        if any(domain_entity.self_id is None for domain_entity in domain_entities):
+            raise ValueError(
+                f'All the data to update in the "{self.data_model.__tablename__}" table should have an id, \
+                but some of them do not.'
+            )
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            for batch in batched(domain_entities, batch_size):
+                # The rowcount of executemany statements is not reliable, so check the existence
+                # of the records with a single query per batch.
+                batch_ids = {domain_entity.self_id for domain_entity in batch}
+                results = await self.async_session.scalars(
+                    select(self.primary_key).where(self.primary_key.in_(batch_ids))
+                )
+                missing_ids = sorted(batch_ids - set(results.all()))  # type: ignore
+                if missing_ids:
+                    raise ValueError(
+                        f'The data with ids {missing_ids} should be found in the "{self.data_model.__tablename__}" table \
+                        to update, but they were not found.'
+                    )
+                await self.async_session.execute(
+                    update(self.data_model),
+                    [
+                        self._to_row(domain_entity, exclude_none=True)
+                        for domain_entity in batch
+                    ],
+                )
+        # Bulk updates bypass the identity map, so expire the cached copies of the updated records.
+        self._expire_cached([domain_entity.self_id for domain_entity in domain_entities])  # type: ignore
+        return list(domain_entities)
+
+    async def delete_many(
+        self, ids: Sequence[int], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> list[DomainModelType]:
+        """Delete records from the database in bulk.
+
+        All records are deleted in a single transaction by `DELETE ... WHERE id IN (...) RETURNING`
+        statements. Note that, unlike `delete`, only the cascades declared on the database side
+        (i.e. `ondelete`) are applied to the related records.
+
+        Args:
+            ids (Sequence[int]): The ids of the records to delete.
+            batch_size (int): The maximum number of records deleted by a single statement.
+
+        Raises:
+            ValueError: If any of the records is not found. In this case, no records are deleted.
+
+        Returns:
+            list[DomainModelType]: The domain entities created from the deleted records,
+                in the same order as `ids`.
+        """
+        if not ids:
+            return []
+        data_entities: list[DataModelType] = []
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            for batch in batched(ids, batch_size):
+                results = await self.async_session.scalars(
+                    delete(self.data_model)
+                    .where(self.primary_key.in_(batch))
+                    .returning(self.data_model)
+                )
+                data_entities.extend(results.all())
+            data_entity_by_id = {
+                getattr(data_entity, self.primary_key.name): data_entity
+                for data_entity in data_entities
+            }
+            missing_ids = [id for id in ids if id not in data_entity_by_id]
+            if missing_ids:
+                raise ValueError(
+                    f'The data with ids {missing_ids} should be found in the "{self.data_model.__tablename__}" table \
+                    to delete, but they were not found.'
+                )
+        deleted_domain_entities = [self._to_domain(data_entity_by_id[id]) for id in ids]
+        return deleted_domain_entities
+
+    async def read_projected(
+        self,
+        projection: type[ProjectionType],
+        filters: Mapping[str, Any] | None = None,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> list[ProjectionType]:
+        """Read only the columns named by the fields of a projection, ordered by id.
+
+        The columns are selected as plain rows and mapped directly to the projection,
+        so neither ORM instances nor identity map entries are created. The values are not
+        validated, so the field types of the projection must match the column types.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            filters (Mapping[str, Any] | None): The values that the columns must be equal to.
+            cursor (int | None): The id of the last record of the previous page, if any.
+            limit (int | None): The maximum number of records to read. None means no limit.
+
+        Returns:
+            list[ProjectionType]: The projections of the read records.
+        """
+        return await self._read_projected(
+            projection,
+            self._paginate(self._select_projected(projection, filters), cursor, limit),
+        )
+
+    def stream_projected(
+        self,
+        projection: type[ProjectionType],
+        filters: Mapping[str, Any] | None = None,
+        cursor: int | None = None,
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream only the columns named by the fields of a projection, ordered by id.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            filters (Mapping[str, Any] | None): The values that the columns must be equal to.
+            cursor (int | None): The id of the last record already read, if any.
+
+        Returns:
+            AsyncIterator[ProjectionType]: The projections of the read records.
+        """
+        return self._stream_projected(
+            projection,
+            self._paginate(self._select_projected(projection, filters), cursor, None),
+        )
+
+    def _to_domain(self, data_entity: DataModelType) -> DomainModelType:
+        """Convert a data entity read from the database to a domain entity.
+
+        The values already passed validation when they were written, so the domain entity is
+        constructed without validating them again, unless the data model lacks some domain fields.
+
+        Args:
+            data_entity (DataModelType): The data entity to convert.
+
+        Returns:
+            DomainModelType: The domain entity created from the data entity.
+        """
+        if not self.is_trusted_conversion:
+            return self.domain_model.model_validate(orm_object_to_dict(data_entity))
+        return self.domain_model.from_trusted(
+            dict(zip(self.domain_keys, self.get_domain_values(data_entity)))
+        )
+
+    def _to_row(
+        self, domain_entity: DomainModelType, exclude_none: bool = False
+    ) -> dict[str, Any]:
+        """Convert a domain entity to a column-value mapping for bulk statements.
+
+        Args:
+            domain_entity (DomainModelType): The domain entity to convert.
+            exclude_none (bool): Whether to exclude the fields set to None.
+
+        Returns:
+            dict[str, Any]: The column-value mapping of the domain entity.
+        """
+        domain_entity_dict = domain_entity.model_dump(exclude_none=exclude_none)
+        # Bulk statements bypass the ORM attribute events, so instantiate a transient data entity
+        # to apply the validators defined on the data model (e.g. `@validates`).
+        data_entity = self.data_model(**domain_entity_dict)
+        # The validators may also set other columns (e.g. the normalized texts of items).
+        values = inspect(data_entity).dict
+        row = {
+            key: values[key] for key in column_keys(self.data_model) if key in values
+        }
+        # Let the database assign the primary key if it is not given.
+        if row.get(self.primary_key.name) is None:
+            row.pop(self.primary_key.name, None)
+        return row
+
+    def _expire_cached(self, ids: Sequence[int]) -> None:
+        """Expire the records held in the identity map of the session so that they are reloaded on next access.
+
+        Args:
+            ids (Sequence[int]): The ids of the records to expire.
+        """
+        mapper = inspect(self.data_model)
+        identity_map = self.async_session.sync_session.identity_map
+        for id in ids:
+            data_entity = identity_map.get(mapper.identity_key_from_primary_key((id,)))
+            if data_entity is not None:
+                self.async_session.expire(data_entity)
+
+    def _paginate(
+        self, statement: Select, cursor: int | None, limit: int | None
+    ) -> Select:
+        """Apply keyset pagination on the primary key to a select statement.
+
+        Unlike `OFFSET`, the cost of keyset pagination does not grow with the page number,
+        as each page is a range scan of the primary key index starting after the cursor.
+
+        Args:
+            statement (Select): The select statement of the data model.
+            cursor (int | None): The id of the last record of the previous page, if any.
+            limit (int | None): The maximum number of records in a page. None means no limit.
+
+        Returns:
+            Select: The paginated select statement ordered by the primary key.
+        """
+        if cursor is not None:
+            statement = statement.where(self.primary_key > cursor)
+        statement = statement.order_by(self.primary_key)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
+
+    async def _stream(
+        self, statement: Select, yield_per: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[DomainModelType]:
+        """Stream the results of a select statement through a server-side cursor.
+
+        Only `yield_per` records are held in memory at a time, so the whole result is never materialized.
+
+        Args:
+            statement (Select): The select statement of the data model.
+            yield_per (int): The number of records fetched from the server at a time.
+
+        Yields:
+            DomainModelType: The domain entity created from the next record.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.stream_scalars(
+                statement.execution_options(yield_per=yield_per)
+            )
+            async for data_entity in results:
+                yield self._to_domain(data_entity)
+
+    def _column(self, key: str) -> ColumnElement[Any]:
+        """Get a column of the data model by its attribute name.
+
+        Args:
+            key (str): The attribute name of the column.
+
+        Raises:
+            ValueError: If the data model has no such column.
+
+        Returns:
+            ColumnElement[Any]: The column.
+        """
+        columns = inspect(self.data_model).columns
+        if key not in columns:
+            raise ValueError(
+                f'The "{self.data_model.__tablename__}" table should have the column {key}, \
+                but it does not.'
+            )
+        column: ColumnElement[Any] = columns[key]
+        return column
+
+    def _select_projected(
+        self,
+        projection: type[ProjectionType],
+        filters: Mapping[str, Any] | None = None,
+    ) -> Select:
+        """Make a select statement of the columns named by the fields of a projection.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            filters (Mapping[str, Any] | None): The values that the columns must be equal to.
+
+        Returns:
+            Select: The select statement of the columns.
+        """
+        statement = select(*(self._column(key) for key in projection.model_fields))
+        for key, value in (filters or {}).items():
+            statement = statement.where(self._column(key) == value)
+        return statement
+
+    async def _read_projected(
+        self, projection: type[ProjectionType], statement: Select
+    ) -> list[ProjectionType]:
+        """Execute a select statement of columns and map the rows to a projection.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the selected columns.
+            statement (Select): The select statement of the columns.
+
+        Returns:
+            list[ProjectionType]: The projections of the rows.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.execute(statement)
+            rows = results.all()
+        return [construct_trusted(projection, row._asdict()) for row in rows]
+
+    async def _stream_projected(
+        self,
+        projection: type[ProjectionType],
+        statement: Select,
+        yield_per: int = DEFAULT_BATCH_SIZE,
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream the rows of a select statement of columns through a server-side cursor.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the selected columns.
+            statement (Select): The select statement of the columns.
+            yield_per (int): The number of rows fetched from the server at a time.
+
+        Yields:
+            ProjectionType: The projection of the next row.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.stream(
+                statement.execution_options(yield_per=yield_per)
+            )
+            async for row in results:
+                yield construct_trusted(projection, row._asdict())
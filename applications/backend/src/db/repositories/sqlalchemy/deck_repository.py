@@ -1,11 +1,47 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    or_,
+    select,
+    true,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.models.sqlalchemy_data_models import SQLAlchemyDeck, orm_object_to_dict
-from src.db.repositories.deck_repository_interface import IDeckRepository
-from src.domain.models import Deck
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyDeck,
+    SQLAlchemyItem,
+    SQLAlchemyQuiz,
+    item_deck_mapper_table,
+)
+from src.db.repositories.base_repository_interface import ProjectionType
+from src.db.repositories.deck_repository_interface import (
+    DeckItemOrder,
+    DeckSetOperation,
+    IDeckRepository,
+)
+from src.domain.models import Deck, Item
 
 from .base_repository import BaseRepository
+from .item_repository import (
+    insert_new_items,
+    read_owner_id,
+    select_item_ids,
+    unnest_items,
+)
 
 
 class DeckRepository(BaseRepository[SQLAlchemyDeck, Deck], IDeckRepository):
@@ -21,8 +57,14 @@ class DeckRepository(BaseRepository[SQLAlchemyDeck, Deck], IDeckRepository):
             data_model=SQLAlchemyDeck, domain_model=Deck, async_session=async_session
         )
 
-    async def read_all(self) -> list[Deck]:
-        """Read all decks from the database.
+    async def read_all(
+        self, cursor: int | None = None, limit: int | None = None
+    ) -> list[Deck]:
+        """Read all decks from the database, ordered by their ids.
+
+        Args:
+            cursor (int | None): The id of the last deck of the previous page, if any.
+            limit (int | None): The maximum number of decks to read. None means no limit.
 
         Returns:
             list[Deck]: The list of all decks.
@@ -31,17 +73,21 @@ class DeckRepository(BaseRepository[SQLAlchemyDeck, Deck], IDeckRepository):
         # If an exception is raised, it automatically calls async_session.rollback().
         async with self.async_session.begin():
             results = await self.async_session.execute(
-                select(self.data_model).order_by(self.data_model.deck_id)
+                self._paginate(select(self.data_model), cursor, limit)
             )
             decks = results.scalars().all()
-        decks = [Deck.model_validate(orm_object_to_dict(deck)) for deck in decks]
+        decks = [self._to_domain(deck) for deck in decks]
         return decks
 
-    async def read_by_user_id(self, user_id: int) -> list[Deck]:
-        """Read all decks from the database that belong to a specific user.
+    async def read_by_user_id(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[Deck]:
+        """Read all decks from the database that belong to a specific user, ordered by their ids.
 
         Args:
             user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last deck of the previous page, if any.
+            limit (int | None): The maximum number of decks to read. None means no limit.
 
         Returns:
             list[Deck]: The list of decks that belong to the user.
@@ -50,10 +96,453 @@ class DeckRepository(BaseRepository[SQLAlchemyDeck, Deck], IDeckRepository):
         # If an exception is raised, it automatically calls async_session.rollback().
         async with self.async_session.begin():
             results = await self.async_session.execute(
-                select(self.data_model)
-                .where(self.data_model.user_id == user_id)
-                .order_by(self.data_model.deck_id)
+                self._paginate(
+                    select(self.data_model).where(self.data_model.user_id == user_id),
+                    cursor,
+                    limit,
+                )
             )
             decks = results.scalars().all()
-        decks = [Deck.model_validate(orm_object_to_dict(deck)) for deck in decks]
+        decks = [self._to_domain(deck) for deck in decks]
         return decks
+
+    def stream_by_user_id(
+        self, user_id: int, cursor: int | None = None
+    ) -> AsyncIterator[Deck]:
+        """Stream all decks that belong to a specific user without loading them into memory at once.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last deck already read, if any.
+
+        Returns:
+            AsyncIterator[Deck]: The decks that belong to the user, ordered by their ids.
+        """
+        return self._stream(
+            self._paginate(
+                select(self.data_model).where(self.data_model.user_id == user_id),
+                cursor,
+                None,
+            )
+        )
+
+    async def read_summaries_by_user_id(
+        self,
+        projection: type[ProjectionType],
+        user_id: int,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> list[ProjectionType]:
+        """Read a projection of the decks of a user together with their item counts and last quiz times.
+
+        Besides the columns of the decks, the projection may have the fields `item_count`,
+        the number of items in a deck, and `last_studied_at`, the time of the last quiz taken on it,
+        which is None if none has been taken. Both are aggregated in the same query by lateral
+        subqueries, which run only for the decks in the page.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last deck of the previous page, if any.
+            limit (int | None): The maximum number of decks to read. None means no limit.
+
+        Returns:
+            list[ProjectionType]: The projections of the decks of the user, ordered by their ids.
+        """
+        return await self._read_projected(
+            projection,
+            self._paginate(self._select_summaries(projection, user_id), cursor, limit),
+        )
+
+    def stream_summaries_by_user_id(
+        self,
+        projection: type[ProjectionType],
+        user_id: int,
+        cursor: int | None = None,
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream a projection of the decks of a user together with their item counts and last quiz times.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last deck already read, if any.
+
+        Returns:
+            AsyncIterator[ProjectionType]: The projections of the decks of the user, ordered by their ids.
+        """
+        return self._stream_projected(
+            projection,
+            self._paginate(self._select_summaries(projection, user_id), cursor, None),
+        )
+
+    async def read_items(
+        self,
+        projection: type[ProjectionType],
+        deck_id: int,
+        cursor: int | None = None,
+        limit: int | None = None,
+        filters: Mapping[str, Any] | None = None,
+        order_by: DeckItemOrder = "position",
+    ) -> list[ProjectionType]:
+        """Read a projection of the items in a deck.
+
+        The fields of the projection are the columns of the items, and `position`, the position of an item in the deck.
+        The items are read by joining `item_deck_mapper` to `items` in a single query, without
+        constructing ORM instances.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+            cursor (int | None): The id of the last item of the previous page, if any.
+            limit (int | None): The maximum number of items to read. None means no limit.
+            filters (Mapping[str, Any] | None): The values that the columns of the items must be equal to.
+            order_by (DeckItemOrder): The order of the items, where ties are ordered by their ids.
+
+        Returns:
+            list[ProjectionType]: The projections of the items in the deck.
+        """
+        statement = self._select_items(projection, deck_id, cursor, filters, order_by)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return await self._read_projected(projection, statement)
+
+    def stream_items(
+        self,
+        projection: type[ProjectionType],
+        deck_id: int,
+        cursor: int | None = None,
+        filters: Mapping[str, Any] | None = None,
+        order_by: DeckItemOrder = "position",
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream a projection of the items in a deck without loading them into memory at once.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+            cursor (int | None): The id of the last item already read, if any.
+            filters (Mapping[str, Any] | None): The values that the columns of the items must be equal to.
+            order_by (DeckItemOrder): The order of the items, where ties are ordered by their ids.
+
+        Returns:
+            AsyncIterator[ProjectionType]: The projections of the items in the deck.
+        """
+        return self._stream_projected(
+            projection,
+            self._select_items(projection, deck_id, cursor, filters, order_by),
+        )
+
+    def _select_items(
+        self,
+        projection: type[ProjectionType],
+        deck_id: int,
+        cursor: int | None,
+        filters: Mapping[str, Any] | None,
+        order_by: DeckItemOrder,
+    ) -> Select:
+        """Make a select statement of a projection of the items in a deck after a cursor, in an order.
+
+        The cursor is the id of an item, whose sort key is looked up in the same query, so the pages
+        are keyset paginated in any order. If the item of the cursor has been deleted (or removed from
+        the deck, when ordered by position), nothing is read after it.
+        In the order of positions, a page is a range scan of `ix_item_deck_mapper_deck_id_position`.
+        In the other orders, the items in the deck are sorted by the database, as the index of
+        an order cannot be restricted to a deck.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+            cursor (int | None): The id of the last item of the previous page, if any.
+            filters (Mapping[str, Any] | None): The values that the columns of the items must be equal to.
+            order_by (DeckItemOrder): The order of the items, where ties are ordered by their ids.
+
+        Raises:
+            ValueError: If the projection has a field that is neither a column of the items nor `position`.
+
+        Returns:
+            Select: The select statement ordered by the order.
+        """
+        mapper = item_deck_mapper_table.c
+        statement = (
+            select(
+                *(
+                    mapper.position if key == "position" else self._item_column(key)
+                    for key in projection.model_fields
+                )
+            )
+            .select_from(item_deck_mapper_table)
+            .join(SQLAlchemyItem, SQLAlchemyItem.item_id == mapper.item_id)
+            .where(mapper.deck_id == deck_id)
+        )
+        for key, value in (filters or {}).items():
+            statement = statement.where(self._item_column(key) == value)
+
+        if order_by == "position":
+            # The positions are unique, so they need no tie-breaker.
+            if cursor is not None:
+                statement = statement.where(
+                    mapper.position
+                    > select(mapper.position)
+                    .where(mapper.deck_id == deck_id, mapper.item_id == cursor)
+                    .scalar_subquery()
+                )
+            return statement.order_by(mapper.position)
+        sort_key = self._item_column(order_by)
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(sort_key, SQLAlchemyItem.item_id)
+                > tuple_(
+                    select(sort_key)
+                    .where(SQLAlchemyItem.item_id == cursor)
+                    .scalar_subquery(),
+                    literal(cursor),
+                )
+            )
+        return statement.order_by(sort_key, SQLAlchemyItem.item_id)
+
+    def _item_column(self, key: str) -> ColumnElement[Any]:
+        """Get a column of the items by its attribute name.
+
+        Args:
+            key (str): The attribute name of the column.
+
+        Raises:
+            ValueError: If the items have no such column.
+
+        Returns:
+            ColumnElement[Any]: The column.
+        """
+        columns = inspect(SQLAlchemyItem).columns
+        if key not in columns:
+            raise ValueError(
+                f'The "{SQLAlchemyItem.__tablename__}" table should have the column {key}, \
+                but it does not.'
+            )
+        column: ColumnElement[Any] = columns[key]
+        return column
+
+    async def add_items(
+        self,
+        deck_id: int,
+        item_ids: Sequence[int],
+        new_items: Sequence[Item] = (),
+        user_id: int | None = None,
+    ) -> tuple[list[int], list[int]]:
+        """Add existing items and new items to a deck in a single transaction.
+
+        The new items are created by a single `INSERT ... SELECT ... ON CONFLICT DO NOTHING`
+        statement, which skips the duplicates of existing items, and all the items are added by
+        another such statement, so the items already in the deck are skipped rather than failing
+        the whole batch.
+
+        Args:
+            deck_id (int): The unique identifier for the deck.
+            item_ids (Sequence[int]): The ids of the existing items to add.
+            new_items (Sequence[Item]): The items to create and add, which must have the same owner.
+                Their ids are assigned by the database.
+            user_id (int | None): The unique identifier for the user whose items and shared items
+                (i.e. items without an owner) can be added, if any. None means any items can be added.
+                The new items must be owned by the user or shared to be added.
+
+        Raises:
+            ValueError: If the new items have different owners.
+
+        Returns:
+            tuple[list[int], list[int]]: The ids of the new items in the same order as `new_items`,
+                which are the ids of the existing items for the duplicates, and the ids of the items
+                added to the deck, which lack the items already in the deck and the items that do not
+                exist or cannot be added.
+        """
+        mapper = item_deck_mapper_table.c
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            new_item_ids: list[int] = []
+            if new_items:
+                owner_id = read_owner_id(new_items)
+                requested_items = unnest_items(new_items)
+                await self.async_session.execute(
+                    insert_new_items(requested_items, owner_id)
+                )
+                results = await self.async_session.scalars(
+                    select_item_ids(requested_items, owner_id)
+                )
+                new_item_ids = list(results.all())
+            # The ids are bound as a single array, so there can be any number of them. The items are
+            # added in the order of the array, which is the order of their positions in the deck.
+            requested = (
+                func.unnest(
+                    bindparam(
+                        "item_ids", [*item_ids, *new_item_ids], type_=ARRAY(Integer)
+                    )
+                )
+                .table_valued("item_id", with_ordinality="ordinality")
+                .render_derived(name="requested")
+            )
+            candidates = (
+                select(SQLAlchemyItem.item_id, literal(deck_id))
+                .join_from(
+                    requested,
+                    SQLAlchemyItem,
+                    SQLAlchemyItem.item_id == requested.c.item_id,
+                )
+                .order_by(requested.c.ordinality)
+            )
+            if user_id is not None:
+                candidates = candidates.where(
+                    or_(
+                        SQLAlchemyItem.user_id == user_id,
+                        SQLAlchemyItem.user_id.is_(None),
+                    )
+                )
+            results = await self.async_session.scalars(
+                pg_insert(item_deck_mapper_table)
+                .from_select([mapper.item_id, mapper.deck_id], candidates)
+                .on_conflict_do_nothing()
+                .returning(mapper.item_id)
+            )
+            added_item_ids = list(results.all())
+        return new_item_ids, added_item_ids
+
+    async def remove_items(self, deck_id: int, item_ids: Sequence[int]) -> list[int]:
+        """Remove items from a deck by a single `DELETE` statement.
+
+        Args:
+            deck_id (int): The unique identifier for the deck.
+            item_ids (Sequence[int]): The ids of the items to remove.
+
+        Returns:
+            list[int]: The ids of the removed items, which lack the items not in the deck.
+        """
+        mapper = item_deck_mapper_table.c
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.scalars(
+                delete(item_deck_mapper_table)
+                .where(
+                    mapper.deck_id == deck_id,
+                    mapper.item_id
+                    == any_(
+                        bindparam("item_ids", list(item_ids), type_=ARRAY(Integer))
+                    ),
+                )
+                .returning(mapper.item_id)
+            )
+            removed_item_ids = list(results.all())
+        return removed_item_ids
+
+    async def clone(self, deck_id: int, new_deck: Deck) -> tuple[Deck, int]:
+        """Create a deck with the same items as a deck, in the same order.
+
+        The items are copied by a single `INSERT INTO item_deck_mapper SELECT ...` statement,
+        without reading them into Python.
+
+        Args:
+            deck_id (int): The unique identifier for the deck to clone.
+            new_deck (Deck): The deck to create. Its id is assigned by the database.
+
+        Returns:
+            tuple[Deck, int]: The created deck and the number of items in it.
+        """
+        return await self.create_from_decks("union", [deck_id], new_deck)
+
+    async def create_from_decks(
+        self, operation: DeckSetOperation, deck_ids: Sequence[int], new_deck: Deck
+    ) -> tuple[Deck, int]:
+        """Create a deck with the items of a set operation over decks.
+
+        The deck is created and the items are added in a single transaction. The items are
+        combined and copied by a single `INSERT INTO item_deck_mapper SELECT ...` statement,
+        which groups the rows of the decks by item, so they are never read into Python.
+        The items are in the order they were first added to any of the decks.
+
+        Args:
+            operation (DeckSetOperation): The set operation combining the items of the decks.
+            deck_ids (Sequence[int]): The unique identifiers for the decks, the first of which
+                the others are subtracted from by `difference`.
+            new_deck (Deck): The deck to create. Its id is assigned by the database.
+
+        Raises:
+            ValueError: If no deck is given.
+
+        Returns:
+            tuple[Deck, int]: The created deck and the number of items in it.
+        """
+        if not deck_ids:
+            raise ValueError(
+                "At least one deck should be given to combine the items of."
+            )
+        mapper = item_deck_mapper_table.c
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            data_entity = await self.async_session.scalar(
+                insert(self.data_model)
+                .values(self._to_row(new_deck))
+                .returning(self.data_model)
+            )
+            items = (
+                select(mapper.item_id, literal(data_entity.deck_id))  # type: ignore
+                .where(
+                    mapper.deck_id
+                    == any_(bindparam("deck_ids", list(deck_ids), type_=ARRAY(Integer)))
+                )
+                .group_by(mapper.item_id)
+                .order_by(func.min(mapper.position))
+            )
+            if operation == "intersect":
+                # An item is in each deck at most once, so it is in all of them if it has a row per deck.
+                items = items.having(func.count() == len(set(deck_ids)))
+            elif operation == "difference":
+                items = items.having(func.every(mapper.deck_id == deck_ids[0]))
+            results = await self.async_session.execute(
+                insert(item_deck_mapper_table).from_select(
+                    [mapper.item_id, mapper.deck_id], items
+                )
+            )
+        return self._to_domain(data_entity), results.rowcount  # type: ignore
+
+    def _select_summaries(
+        self, projection: type[ProjectionType], user_id: int
+    ) -> Select:
+        """Make a select statement of a projection of the decks of a user with their aggregates.
+
+        Each aggregate is a lateral subquery correlated with a deck, which counts its range of
+        `ix_item_deck_mapper_deck_id_item_id` and reads the end of its range of
+        `ix_quizzes_deck_id_quiz_timestamp`. Unlike grouping the joined tables, this aggregates
+        nothing for the decks outside the page, and the counts are not multiplied by the quizzes.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            user_id (int): The unique identifier for the user.
+
+        Returns:
+            Select: The select statement of the decks of the user.
+        """
+        item_counts = (
+            select(func.count().label("item_count"))
+            .where(item_deck_mapper_table.c.deck_id == self.data_model.deck_id)
+            .lateral("item_counts")
+        )
+        last_quizzes = (
+            select(func.max(SQLAlchemyQuiz.quiz_timestamp).label("last_studied_at"))
+            .where(SQLAlchemyQuiz.deck_id == self.data_model.deck_id)
+            .lateral("last_quizzes")
+        )
+        aggregates: dict[str, ColumnElement[Any]] = {
+            "item_count": item_counts.c.item_count,
+            "last_studied_at": last_quizzes.c.last_studied_at,
+        }
+        # An aggregate without `GROUP BY` returns a single row, so the joins keep every deck.
+        return (
+            select(
+                *(
+                    aggregates[key] if key in aggregates else self._column(key)
+                    for key in projection.model_fields
+                )
+            )
+            .select_from(self.data_model)
+            .join(item_counts, true())
+            .join(last_quizzes, true())
+            .where(self.data_model.user_id == user_id)
+        )
@@ -1,12 +1,193 @@
-from sqlalchemy import select
+import re
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    ColumnElement,
+    FromClause,
+    Insert,
+    Integer,
+    MetaData,
+    Select,
+    String,
+    Table,
+    and_,
+    bindparam,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.models.sqlalchemy_data_models import SQLAlchemyItem, orm_object_to_dict
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyItem,
+    item_deck_mapper_table,
+    item_genre_mapper_table,
+)
+from src.db.repositories.base_repository_interface import (
+    DEFAULT_BATCH_SIZE,
+    ProjectionType,
+)
 from src.db.repositories.item_repository_interface import IItemRepository
 from src.domain.models import Item
+from src.domain.models.item_model import normalize_text
 
 from .base_repository import BaseRepository
 
+# Queries shorter than a trigram have no trigrams to look up in the trigram indexes, so
+# the English text is matched by the prefixes of its words instead of its substrings.
+MIN_SUBSTRING_QUERY_LENGTH = 3
+# The columns of new items given by the caller, besides their owner.
+NEW_ITEM_COLUMNS = (
+    "english",
+    "japanese",
+    "grade",
+    "normalized_english",
+    "normalized_japanese",
+)
+
+# The temporary table that `ItemRepository.copy_many` loads items into by `COPY`, which cannot skip
+# duplicates, before inserting them by `INSERT ... SELECT ... ON CONFLICT DO NOTHING`. It lives in
+# its own metadata so that `Base.metadata.create_all` never creates it, and is dropped at the end
+# of the transaction that creates it.
+item_staging_table = Table(
+    "item_staging",
+    MetaData(),
+    Column("ordinality", BigInteger, nullable=False),
+    Column("english", String, nullable=False),
+    Column("japanese", String, nullable=False),
+    Column("grade", Integer, nullable=False),
+    Column("normalized_english", String, nullable=False),
+    Column("normalized_japanese", String, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+def read_owner_id(items: Sequence[Item]) -> int | None:
+    """Read the owner of new items, which must be the same for all of them.
+
+    Args:
+        items (Sequence[Item]): The new items, of which there is at least one.
+
+    Raises:
+        ValueError: If the items have different owners.
+
+    Returns:
+        int | None: The unique identifier for the user who owns the items, or None if they are shared.
+    """
+    user_ids = {item.user_id for item in items}
+    if len(user_ids) > 1:
+        raise ValueError(
+            f"The items to create should have the same owner, but they have {len(user_ids)} owners."
+        )
+    return items[0].user_id
+
+
+def unnest_items(items: Sequence[Item]) -> FromClause:
+    """Make a table of new items with their normalized texts, numbered in their order.
+
+    Each column is bound as a single array, so there can be any number of items.
+
+    Args:
+        items (Sequence[Item]): The new items.
+
+    Returns:
+        FromClause: The table of the items with the columns of `NEW_ITEM_COLUMNS` and `ordinality`.
+    """
+    return (
+        func.unnest(
+            bindparam("english", [item.english for item in items], type_=ARRAY(String)),
+            bindparam(
+                "japanese", [item.japanese for item in items], type_=ARRAY(String)
+            ),
+            bindparam("grade", [item.grade for item in items], type_=ARRAY(Integer)),
+            bindparam(
+                "normalized_english",
+                [normalize_text(item.english) for item in items],
+                type_=ARRAY(String),
+            ),
+            bindparam(
+                "normalized_japanese",
+                [normalize_text(item.japanese) for item in items],
+                type_=ARRAY(String),
+            ),
+        )
+        .table_valued(*NEW_ITEM_COLUMNS, with_ordinality="ordinality")
+        .render_derived(name="requested")
+    )
+
+
+def insert_new_items(requested: FromClause, user_id: int | None) -> Insert:
+    """Make a single statement inserting new items of a user in their order, skipping the duplicates.
+
+    The items that duplicate existing items or earlier ones among themselves conflict on
+    `ix_items_user_id_normalized_texts` and are skipped by `ON CONFLICT DO NOTHING`, so
+    the duplicates are neither read beforehand nor fail the statement.
+
+    Args:
+        requested (FromClause): The table of the new items, such as the one made by `unnest_items`.
+        user_id (int | None): The unique identifier for the user who owns the items, or None if they are shared.
+
+    Returns:
+        Insert: The statement returning the ids of the created items.
+    """
+    now = datetime.now()
+    return (
+        pg_insert(SQLAlchemyItem)
+        .from_select(
+            ["user_id", *NEW_ITEM_COLUMNS, "created_at", "updated_at"],
+            select(
+                literal(user_id, Integer),
+                *(requested.c[column] for column in NEW_ITEM_COLUMNS),
+                literal(now),
+                literal(now),
+            ).order_by(requested.c.ordinality),
+        )
+        .on_conflict_do_nothing(
+            index_elements=["user_id", "normalized_english", "normalized_japanese"]
+        )
+        .returning(SQLAlchemyItem.item_id)
+    )
+
+
+def select_item_ids(requested: FromClause, user_id: int | None) -> Select:
+    """Make a statement selecting the ids of the items of a user with the same normalized texts as new items.
+
+    Each new item is looked up in `ix_items_user_id_normalized_texts`, so this finds the existing
+    items that the duplicates were skipped for as well as the created items.
+
+    Args:
+        requested (FromClause): The table of the new items, such as the one made by `unnest_items`.
+        user_id (int | None): The unique identifier for the user who owns the items, or None if they are shared.
+
+    Returns:
+        Select: The statement of the ids of the items in the order of the new items.
+    """
+    items = SQLAlchemyItem
+    return (
+        select(items.item_id)
+        .join_from(
+            requested,
+            items,
+            and_(
+                items.user_id.is_(None)
+                if user_id is None
+                else items.user_id == user_id,
+                items.normalized_english == requested.c.normalized_english,
+                items.normalized_japanese == requested.c.normalized_japanese,
+            ),
+        )
+        .order_by(requested.c.ordinality)
+    )
+
 
 class ItemRepository(BaseRepository[SQLAlchemyItem, Item], IItemRepository):
     """The SQLAlchemy repository class for items."""
@@ -21,11 +202,51 @@ class ItemRepository(BaseRepository[SQLAlchemyItem, Item], IItemRepository):
             data_model=SQLAlchemyItem, domain_model=Item, async_session=async_session
         )
 
-    async def read_by_user_id(self, user_id: int) -> list[Item]:
-        """Read all items from the database that were made by a specific user.
+    async def update(self, domain_entity: Item) -> Item:
+        """Update an item in the database, setting its update time to now.
+
+        The update time is what the item index refreshes from, so it is set here rather than by callers.
+
+        Args:
+            domain_entity (Item): The domain entity used to update the item.
+
+        Returns:
+            Item: The domain entity reconstructed from the updated item.
+        """
+        return await super().update(
+            domain_entity.model_copy(update={"updated_at": datetime.now()})
+        )
+
+    async def update_many(
+        self, domain_entities: Sequence[Item], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> list[Item]:
+        """Update items in the database in bulk, setting their update times to now.
+
+        Args:
+            domain_entities (Sequence[Item]): The domain entities used to update the items.
+            batch_size (int): The maximum number of items updated by a single statement.
+
+        Returns:
+            list[Item]: The domain entities reconstructed from the updated items.
+        """
+        now = datetime.now()
+        return await super().update_many(
+            [
+                domain_entity.model_copy(update={"updated_at": now})
+                for domain_entity in domain_entities
+            ],
+            batch_size,
+        )
+
+    async def read_by_user_id(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[Item]:
+        """Read all items from the database that were made by a specific user, ordered by their ids.
 
         Args:
             user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last item of the previous page, if any.
+            limit (int | None): The maximum number of items to read. None means no limit.
 
         Returns:
             list[Item]: The list of items that were made by the user.
@@ -34,10 +255,493 @@ class ItemRepository(BaseRepository[SQLAlchemyItem, Item], IItemRepository):
         # If an exception is raised, it automatically calls async_session.rollback().
         async with self.async_session.begin():
             results = await self.async_session.execute(
-                select(self.data_model)
-                .where(self.data_model.user_id == user_id)
-                .order_by(self.data_model.item_id)
+                self._paginate(
+                    select(self.data_model).where(self.data_model.user_id == user_id),
+                    cursor,
+                    limit,
+                )
             )
             items = results.scalars().all()
-        items = [Item.model_validate(orm_object_to_dict(item)) for item in items]
+        items = [self._to_domain(item) for item in items]
         return items
+
+    def stream_by_user_id(
+        self, user_id: int, cursor: int | None = None
+    ) -> AsyncIterator[Item]:
+        """Stream all items that were made by a specific user without loading them into memory at once.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last item already read, if any.
+
+        Returns:
+            AsyncIterator[Item]: The items that were made by the user, ordered by their ids.
+        """
+        return self._stream(
+            self._paginate(
+                select(self.data_model).where(self.data_model.user_id == user_id),
+                cursor,
+                None,
+            )
+        )
+
+    async def read_projected_by_deck_id(
+        self,
+        projection: type[ProjectionType],
+        deck_id: int,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> list[ProjectionType]:
+        """Read only the columns named by the fields of a projection of the items in a deck.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+            cursor (int | None): The id of the last item of the previous page, if any.
+            limit (int | None): The maximum number of items to read. None means no limit.
+
+        Returns:
+            list[ProjectionType]: The projections of the items in the deck, ordered by their ids.
+        """
+        return await self._read_projected(
+            projection,
+            self._paginate(
+                self._select_projected_in_deck(projection, deck_id), cursor, limit
+            ),
+        )
+
+    def stream_projected_by_deck_id(
+        self,
+        projection: type[ProjectionType],
+        deck_id: int,
+        cursor: int | None = None,
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream only the columns named by the fields of a projection of the items in a deck.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+            cursor (int | None): The id of the last item already read, if any.
+
+        Returns:
+            AsyncIterator[ProjectionType]: The projections of the items in the deck, ordered by their ids.
+        """
+        return self._stream_projected(
+            projection,
+            self._paginate(
+                self._select_projected_in_deck(projection, deck_id), cursor, None
+            ),
+        )
+
+    async def read_projected_updated_since(
+        self, projection: type[ProjectionType], updated_since: datetime | None = None
+    ) -> list[ProjectionType]:
+        """Read only the columns named by the fields of a projection of the items updated since a time.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            updated_since (datetime | None): The time after which the items were updated.
+                None means all items.
+
+        Returns:
+            list[ProjectionType]: The projections of the items, ordered by their ids.
+        """
+        statement = self._select_projected(projection)
+        if updated_since is not None:
+            statement = statement.where(self.data_model.updated_at > updated_since)
+        return await self._read_projected(
+            projection, statement.order_by(self.data_model.item_id)
+        )
+
+    async def count(self) -> int:
+        """Count all items in the database.
+
+        Returns:
+            int: The number of items.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            num_items = await self.async_session.scalar(
+                select(func.count()).select_from(self.data_model)
+            )
+        return num_items or 0
+
+    async def read_id_checksum(self, max_item_id: int) -> tuple[int, int]:
+        """Count the items with ids up to an id and sum their ids.
+
+        Unlike the number of items, the sum changes if an item is deleted and another is inserted
+        in its place, so a copy of the items can tell if it has missed either.
+
+        Args:
+            max_item_id (int): The largest id of the items to count.
+
+        Returns:
+            tuple[int, int]: The number of the items and the sum of their ids.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.execute(
+                select(
+                    func.count(), func.coalesce(func.sum(self.data_model.item_id), 0)
+                ).where(self.data_model.item_id <= max_item_id)
+            )
+            num_items, id_sum = results.one()
+        return num_items, int(id_sum)
+
+    async def sample(
+        self,
+        num_items: int,
+        user_id: int | None,
+        deck_id: int | None = None,
+        grades: Sequence[int] | None = None,
+    ) -> list[Item]:
+        """Read distinct items chosen at random in a single query.
+
+        The candidates are shuffled by `ORDER BY random()`, which scans them once and keeps only
+        the top `num_items` rows in memory, so it is fast enough for word lists of tens of thousands of items.
+
+        Args:
+            num_items (int): The maximum number of items to read.
+            user_id (int | None): The unique identifier for the user whose items and shared items
+                (i.e. items without an owner) are chosen from. Ignored if `deck_id` is given.
+            deck_id (int | None): The unique identifier for the deck whose items are chosen from, if any.
+            grades (Sequence[int] | None): The grades of the items to choose from. None means all grades.
+
+        Returns:
+            list[Item]: The items in random order, fewer than `num_items` if there are not enough.
+        """
+        # Select the columns rather than the ORM objects, which are not needed for the read-only items.
+        statement = self._select_projected(self.domain_model)
+        if deck_id is not None:
+            statement = statement.join(
+                item_deck_mapper_table,
+                item_deck_mapper_table.c.item_id == self.data_model.item_id,
+            ).where(item_deck_mapper_table.c.deck_id == deck_id)
+        else:
+            statement = statement.where(
+                or_(
+                    self.data_model.user_id == user_id,
+                    self.data_model.user_id.is_(None),
+                )
+            )
+        if grades is not None:
+            statement = statement.where(self.data_model.grade.in_(grades))
+        return await self._read_projected(
+            self.domain_model, statement.order_by(func.random()).limit(num_items)
+        )
+
+    async def search_projected(
+        self,
+        projection: type[ProjectionType],
+        query: str | None = None,
+        user_id: int | None = None,
+        grades: Sequence[int] | None = None,
+        deck_id: int | None = None,
+        genre_id: int | None = None,
+        fuzzy: bool = False,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> list[ProjectionType]:
+        """Read only the columns named by the fields of a projection of the items matching a search.
+
+        A query of ASCII characters is matched against the English text case-insensitively, as a
+        substring if it has at least `MIN_SUBSTRING_QUERY_LENGTH` characters, or else as the
+        prefixes of its words. Any other query is matched against the Japanese text as a substring.
+        Each condition is served by an index, so that the search does not scan all the items.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            query (str | None): The text to search for. None means all items.
+            user_id (int | None): The unique identifier for the user who made the items, if any.
+            grades (Sequence[int] | None): The grades of the items. None means all grades.
+            deck_id (int | None): The unique identifier for the deck of the items, if any.
+            genre_id (int | None): The unique identifier for the genre of the items, if any.
+            fuzzy (bool): Whether the English text also matches words similar to the query,
+                e.g. misspelled ones. This needs the `pg_trgm` extension, without which the
+                query is matched as a substring only.
+            cursor (int | None): The id of the last item of the previous page, if any.
+            limit (int | None): The maximum number of items to read. None means no limit.
+
+        Returns:
+            list[ProjectionType]: The projections of the matching items, ordered by their ids.
+        """
+        fuzzy = fuzzy and await self._has_trigram_extension()
+        return await self._read_projected(
+            projection,
+            self._paginate(
+                self._select_search(
+                    projection, query, user_id, grades, deck_id, genre_id, fuzzy
+                ),
+                cursor,
+                limit,
+            ),
+        )
+
+    async def stream_search_projected(
+        self,
+        projection: type[ProjectionType],
+        query: str | None = None,
+        user_id: int | None = None,
+        grades: Sequence[int] | None = None,
+        deck_id: int | None = None,
+        genre_id: int | None = None,
+        fuzzy: bool = False,
+        cursor: int | None = None,
+    ) -> AsyncIterator[ProjectionType]:
+        """Stream only the columns named by the fields of a projection of the items matching a search.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            query (str | None): The text to search for. None means all items.
+            user_id (int | None): The unique identifier for the user who made the items, if any.
+            grades (Sequence[int] | None): The grades of the items. None means all grades.
+            deck_id (int | None): The unique identifier for the deck of the items, if any.
+            genre_id (int | None): The unique identifier for the genre of the items, if any.
+            fuzzy (bool): Whether the English text also matches words similar to the query,
+                if the `pg_trgm` extension is installed.
+            cursor (int | None): The id of the last item already read, if any.
+
+        Yields:
+            ProjectionType: The projections of the matching items, ordered by their ids.
+        """
+        fuzzy = fuzzy and await self._has_trigram_extension()
+        async for projected in self._stream_projected(
+            projection,
+            self._paginate(
+                self._select_search(
+                    projection, query, user_id, grades, deck_id, genre_id, fuzzy
+                ),
+                cursor,
+                None,
+            ),
+        ):
+            yield projected
+
+    async def add_many(self, items: Sequence[Item]) -> tuple[list[int], list[int]]:
+        """Create items of a user, skipping the duplicates of existing items and of each other.
+
+        The items are inserted by a single `INSERT ... SELECT ... ON CONFLICT DO NOTHING` statement,
+        and their ids are then read by a single lookup in the unique index of the normalized texts.
+
+        Args:
+            items (Sequence[Item]): The items to create, which must have the same owner.
+                Their ids are assigned by the database.
+
+        Raises:
+            ValueError: If the items have different owners.
+
+        Returns:
+            tuple[list[int], list[int]]: The ids of the items in the same order as `items`, which are
+                the ids of the existing items for the duplicates, and the ids of the created items.
+        """
+        if not items:
+            return [], []
+        user_id = read_owner_id(items)
+        requested = unnest_items(items)
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.scalars(
+                insert_new_items(requested, user_id)
+            )
+            # The ids are allocated in the order of the items, so sorting them restores it.
+            created_item_ids = sorted(results.all())
+            results = await self.async_session.scalars(
+                select_item_ids(requested, user_id)
+            )
+            item_ids = list(results.all())
+        return item_ids, created_item_ids
+
+    async def copy_many(
+        self,
+        items: Sequence[Item],
+        deck_id: int | None = None,
+        genre_id: int | None = None,
+    ) -> list[int]:
+        """Load a large number of items of a user into the database at once, skipping the duplicates.
+
+        The items are loaded into a temporary staging table by the PostgreSQL `COPY` protocol of
+        asyncpg, which is much faster than binding them as parameters, and then inserted from it
+        by a single `INSERT ... SELECT ... ON CONFLICT DO NOTHING` statement. Their associations
+        with the deck and the genre are inserted in the same way, all in a single transaction.
+        The timestamps of the items are set to the time of loading.
+
+        Args:
+            items (Sequence[Item]): The items to load, which must have the same owner.
+                Their ids are assigned by the database.
+            deck_id (int | None): The unique identifier for the deck to add the items to, if any.
+            genre_id (int | None): The unique identifier for the genre to tag the items with, if any.
+
+        Raises:
+            ValueError: If the items have different owners, or the deck or the genre does not exist,
+                in which case nothing is loaded.
+
+        Returns:
+            list[int]: The ids of the loaded items in the same order as `items`, which are the ids
+                of the existing items for the duplicates.
+        """
+        if not items:
+            return []
+        user_id = read_owner_id(items)
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            connection = await self.async_session.connection()
+            await connection.run_sync(item_staging_table.create)
+            # `COPY` is not supported by SQLAlchemy, so use the asyncpg connection underlying the session.
+            raw_connection = await connection.get_raw_connection()
+            asyncpg_connection = raw_connection.driver_connection
+            await asyncpg_connection.copy_records_to_table(  # type: ignore
+                item_staging_table.name,
+                columns=["ordinality", *NEW_ITEM_COLUMNS],
+                records=[
+                    (
+                        ordinality,
+                        item.english,
+                        item.japanese,
+                        item.grade,
+                        normalize_text(item.english),
+                        normalize_text(item.japanese),
+                    )
+                    for ordinality, item in enumerate(items, 1)
+                ],
+            )
+            await self.async_session.execute(
+                insert_new_items(item_staging_table, user_id)
+            )
+            item_ids_in_order = select_item_ids(item_staging_table, user_id)
+            results = await self.async_session.scalars(item_ids_in_order)
+            item_ids = list(results.all())
+            for table, key, value in (
+                (item_deck_mapper_table, "deck_id", deck_id),
+                (item_genre_mapper_table, "genre_id", genre_id),
+            ):
+                if value is None:
+                    continue
+                try:
+                    await self.async_session.execute(
+                        pg_insert(table)
+                        .from_select(
+                            ["item_id", key],
+                            item_ids_in_order.add_columns(literal(value)),
+                        )
+                        .on_conflict_do_nothing()
+                    )
+                except IntegrityError as e:
+                    raise ValueError(
+                        f'The {key.removesuffix("_id")} with the id {value} does not exist.'
+                    ) from e
+        return item_ids
+
+    def _select_projected_in_deck(
+        self, projection: type[ProjectionType], deck_id: int
+    ) -> Select:
+        """Make a select statement of the columns of a projection of the items in a deck.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            deck_id (int): The unique identifier for the deck.
+
+        Returns:
+            Select: The select statement of the columns.
+        """
+        return (
+            self._select_projected(projection)
+            .join(
+                item_deck_mapper_table,
+                item_deck_mapper_table.c.item_id == self.data_model.item_id,
+            )
+            .where(item_deck_mapper_table.c.deck_id == deck_id)
+        )
+
+    def _select_search(
+        self,
+        projection: type[ProjectionType],
+        query: str | None,
+        user_id: int | None,
+        grades: Sequence[int] | None,
+        deck_id: int | None,
+        genre_id: int | None,
+        fuzzy: bool,
+    ) -> Select:
+        """Make a select statement of the columns of a projection of the items matching a search.
+
+        Args:
+            projection (type[ProjectionType]): The model whose field names are the columns to read.
+            query (str | None): The text to search for. None means all items.
+            user_id (int | None): The unique identifier for the user who made the items, if any.
+            grades (Sequence[int] | None): The grades of the items. None means all grades.
+            deck_id (int | None): The unique identifier for the deck of the items, if any.
+            genre_id (int | None): The unique identifier for the genre of the items, if any.
+            fuzzy (bool): Whether the English text also matches words similar to the query.
+
+        Returns:
+            Select: The select statement of the columns.
+        """
+        statement = (
+            self._select_projected_in_deck(projection, deck_id)
+            if deck_id is not None
+            else self._select_projected(projection)
+        )
+        if genre_id is not None:
+            statement = statement.join(
+                item_genre_mapper_table,
+                item_genre_mapper_table.c.item_id == self.data_model.item_id,
+            ).where(item_genre_mapper_table.c.genre_id == genre_id)
+        if user_id is not None:
+            statement = statement.where(self.data_model.user_id == user_id)
+        if grades is not None:
+            statement = statement.where(self.data_model.grade.in_(grades))
+        query = (query or "").strip()
+        if query:
+            statement = statement.where(self._match(query, fuzzy))
+        return statement
+
+    async def _has_trigram_extension(self) -> bool:
+        """Check whether the `pg_trgm` extension, which the similarity operator `%` needs, is installed.
+
+        The extension is optional (see `create_item_trigram_indexes`), so fuzzy searches fall back
+        to substring matching without it instead of failing on the unknown operator.
+
+        Returns:
+            bool: True if the extension is installed.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            return bool(
+                await self.async_session.scalar(
+                    text(
+                        "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+                    )
+                )
+            )
+
+    def _match(self, query: str, fuzzy: bool) -> ColumnElement[bool]:
+        """Make the condition of the items matching a search query.
+
+        Args:
+            query (str): The text to search for, which is not empty.
+            fuzzy (bool): Whether the English text also matches words similar to the query.
+
+        Returns:
+            ColumnElement[bool]: The condition.
+        """
+        # Backslash is the escape character of `LIKE` patterns in PostgreSQL.
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", query) + "%"
+        condition: ColumnElement[bool]
+        # Only letters and digits are put in the text search query, so it needs no escaping.
+        words = re.findall(r"[^\W_]+", query.lower())
+        if not query.isascii():
+            condition = self.data_model.japanese.like(pattern)
+        elif len(query) < MIN_SUBSTRING_QUERY_LENGTH and words:
+            condition = self.data_model.english_tsv.op("@@")(
+                func.to_tsquery("simple", " & ".join(f"{word}:*" for word in words))
+            )
+        else:
+            condition = self.data_model.english.ilike(pattern)
+            if fuzzy:
+                condition = or_(condition, self.data_model.english.op("%")(query))
+        return condition
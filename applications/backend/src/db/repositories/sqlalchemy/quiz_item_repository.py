@@ -1,11 +1,20 @@
-from sqlalchemy import select
+from collections.abc import Sequence
+
+from sqlalchemy import Integer, column, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.models.sqlalchemy_data_models import SQLAlchemyQuizItem, orm_object_to_dict
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyQuiz,
+    SQLAlchemyQuizItem,
+    SQLAlchemyQuizItemChoice,
+)
+from src.db.repositories.base_repository_interface import DEFAULT_BATCH_SIZE
 from src.db.repositories.quiz_item_repository_interface import IQuizItemRepository
-from src.domain.models import QuizItem
+from src.domain.models import QuizItem, ReviewState
 
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, batched
+from .quiz_stat_repository import upsert_quiz_stats
+from .review_state_repository import upsert_review_states
 
 
 class QuizItemRepository(
@@ -25,28 +34,35 @@ class QuizItemRepository(
             async_session=async_session,
         )
 
-    async def read_by_quiz_id(self, quiz_id: int) -> list[QuizItem]:
+    async def read_by_quiz_id(
+        self, quiz_id: int, user_id: int | None = None
+    ) -> list[QuizItem]:
         """Read all quiz items from the database that belong to a specific quiz.
 
         Args:
             quiz_id (int): The unique identifier for the quiz.
+            user_id (int | None): The unique identifier for the user who must have taken the quiz,
+                which is checked by the same query. None means any user.
 
         Returns:
             list[QuizItem]: The list of quiz items that belong to the quiz.
+                Empty if the quiz is not found or not taken by the user.
         """
+        statement = (
+            select(self.data_model)
+            .where(self.data_model.quiz_id == quiz_id)
+            .order_by(self.data_model.quiz_item_id)
+        )
+        if user_id is not None:
+            statement = statement.join(SQLAlchemyQuiz).where(
+                SQLAlchemyQuiz.user_id == user_id
+            )
         # This context automatically calls async_session.commit() if no exceptions are raised.
         # If an exception is raised, it automatically calls async_session.rollback().
         async with self.async_session.begin():
-            results = await self.async_session.execute(
-                select(self.data_model)
-                .where(self.data_model.quiz_id == quiz_id)
-                .order_by(self.data_model.quiz_item_id)
-            )
+            results = await self.async_session.execute(statement)
             quiz_items = results.scalars().all()
-        quiz_items = [
-            QuizItem.model_validate(orm_object_to_dict(quiz_item))
-            for quiz_item in quiz_items
-        ]
+        quiz_items = [self._to_domain(quiz_item) for quiz_item in quiz_items]
         return quiz_items
 
     async def read_by_item_id(self, item_id: int) -> list[QuizItem]:
@@ -67,8 +83,125 @@ class QuizItemRepository(
                 .order_by(self.data_model.quiz_item_id)
             )
             quiz_items = results.scalars().all()
-        quiz_items = [
-            QuizItem.model_validate(orm_object_to_dict(quiz_item))
-            for quiz_item in quiz_items
-        ]
+        quiz_items = [self._to_domain(quiz_item) for quiz_item in quiz_items]
         return quiz_items
+
+    async def read_by_choice_item_id(self, item_id: int) -> list[QuizItem]:
+        """Read all quiz items from the database that use a specific item as one of their choices.
+
+        The quiz items are found by the index of the `quiz_item_choices` table
+        instead of scanning the choices of all quiz items.
+
+        Args:
+            item_id (int): The unique identifier for the item.
+
+        Returns:
+            list[QuizItem]: The list of quiz items that use the item as a choice, ordered by their ids.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.execute(
+                select(self.data_model)
+                .where(
+                    self.data_model.quiz_item_id.in_(
+                        select(SQLAlchemyQuizItemChoice.quiz_item_id).where(
+                            SQLAlchemyQuizItemChoice.item_id == item_id
+                        )
+                    )
+                )
+                .order_by(self.data_model.quiz_item_id)
+            )
+            quiz_items = results.scalars().all()
+        quiz_items = [self._to_domain(quiz_item) for quiz_item in quiz_items]
+        return quiz_items
+
+    async def update_answers(
+        self,
+        quiz_items: Sequence[QuizItem],
+        review_states: Sequence[ReviewState] = (),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[QuizItem]:
+        """Write the answers of quiz items to the database in bulk, and add them to the statistics of the user.
+
+        Only the user answers and the answer times are written, by a single
+        `UPDATE ... FROM (VALUES ...)` statement per batch instead of a statement per quiz item.
+        Only the quiz items that are not answered yet are updated, so that concurrent submissions of
+        the same answers (e.g. retries of a client) cannot both succeed; the later one waits for
+        the earlier one to commit and then finds nothing to update. The updated quiz items are
+        added to the statistics of the user by one more statement in the same transaction, and the
+        review states scheduled by the answers are upserted in it too, so that either all of them
+        are written or none of them is.
+
+        Args:
+            quiz_items (Sequence[QuizItem]): The answered quiz items, none of which were answered before.
+            review_states (Sequence[ReviewState]): The review states of the items after the answers,
+                at most one per user and item.
+            batch_size (int): The maximum number of quiz items updated by a single statement.
+
+        Raises:
+            ValueError: If any of the quiz items does not have an id, or has already been answered,
+                in which case nothing is written.
+
+        Returns:
+            list[QuizItem]: The quiz items.
+        """
+        if any(quiz_item.quiz_item_id is None for quiz_item in quiz_items):
+            raise ValueError(
+                f'All the data to update in the "{self.data_model.__tablename__}" table should have an id, \
+                but some of them do not.'
+            )
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            updated_quiz_item_ids: list[int] = []
+            for batch in batched(quiz_items, batch_size):
+                answers = values(
+                    column("quiz_item_id", Integer),
+                    column("user_answer", Integer),
+                    column("answer_time", Integer),
+                    name="answers",
+                ).data(
+                    [
+                        (
+                            quiz_item.quiz_item_id,
+                            quiz_item.user_answer,
+                            quiz_item.answer_time,
+                        )
+                        for quiz_item in batch
+                    ]
+                )
+                results = await self.async_session.scalars(
+                    update(self.data_model)
+                    .where(
+                        self.data_model.quiz_item_id == answers.c.quiz_item_id,
+                        self.data_model.user_answer.is_(None),
+                    )
+                    .values(
+                        user_answer=answers.c.user_answer,
+                        answer_time=answers.c.answer_time,
+                    )
+                    .returning(self.data_model.quiz_item_id)
+                )
+                updated_quiz_item_ids.extend(results.all())
+            if len(updated_quiz_item_ids) < len(quiz_items):
+                # Raising here rolls back the answers written by the previous batches.
+                raise ValueError(
+                    f"{len(quiz_items) - len(updated_quiz_item_ids)} of the quiz items have already been answered."
+                )
+            await self.async_session.execute(
+                upsert_quiz_stats(
+                    self.data_model.quiz_item_id.in_(updated_quiz_item_ids)
+                )
+            )
+            for review_state_batch in batched(review_states, batch_size):
+                await self.async_session.execute(
+                    upsert_review_states(),
+                    [
+                        review_state.model_dump(exclude={"review_state_id"})
+                        for review_state in review_state_batch
+                    ],
+                )
+        # Bulk updates bypass the identity map, so expire the cached copies of the updated records.
+        self._expire_cached([quiz_item.quiz_item_id for quiz_item in quiz_items])  # type: ignore
+        return list(quiz_items)
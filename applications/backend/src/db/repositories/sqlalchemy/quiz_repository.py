@@ -1,9 +1,20 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy import Row, Select, exists, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from src.db.models.sqlalchemy_data_models import SQLAlchemyQuiz, orm_object_to_dict
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyItem,
+    SQLAlchemyQuiz,
+    SQLAlchemyQuizItem,
+    SQLAlchemyQuizItemChoice,
+    orm_object_to_dict,
+)
 from src.db.repositories.quiz_repository_interface import IQuizRepository
-from src.domain.models import Quiz
+from src.domain.models import Item, Quiz, QuizItem, QuizWithItems
+from src.domain.models.base_model import construct_trusted
 
 from .base_repository import BaseRepository
 
@@ -21,11 +32,15 @@ class QuizRepository(BaseRepository[SQLAlchemyQuiz, Quiz], IQuizRepository):
             data_model=SQLAlchemyQuiz, domain_model=Quiz, async_session=async_session
         )
 
-    async def read_by_user_id(self, user_id: int) -> list[Quiz]:
-        """Read all quizzes from the database that a specific user has taken.
+    async def read_by_user_id(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[Quiz]:
+        """Read all quizzes from the database that a specific user has taken, ordered by their ids.
 
         Args:
             user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last quiz of the previous page, if any.
+            limit (int | None): The maximum number of quizzes to read. None means no limit.
 
         Returns:
             list[Quiz]: The list of quizzes that the user has taken.
@@ -34,14 +49,36 @@ class QuizRepository(BaseRepository[SQLAlchemyQuiz, Quiz], IQuizRepository):
         # If an exception is raised, it automatically calls async_session.rollback().
         async with self.async_session.begin():
             results = await self.async_session.execute(
-                select(self.data_model)
-                .where(self.data_model.user_id == user_id)
-                .order_by(self.data_model.quiz_id)
+                self._paginate(
+                    select(self.data_model).where(self.data_model.user_id == user_id),
+                    cursor,
+                    limit,
+                )
             )
             quizzes = results.scalars().all()
-        quizzes = [Quiz.model_validate(orm_object_to_dict(quiz)) for quiz in quizzes]
+        quizzes = [self._to_domain(quiz) for quiz in quizzes]
         return quizzes
 
+    def stream_by_user_id(
+        self, user_id: int, cursor: int | None = None
+    ) -> AsyncIterator[Quiz]:
+        """Stream all quizzes that a specific user has taken without loading them into memory at once.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last quiz already read, if any.
+
+        Returns:
+            AsyncIterator[Quiz]: The quizzes that the user has taken, ordered by their ids.
+        """
+        return self._stream(
+            self._paginate(
+                select(self.data_model).where(self.data_model.user_id == user_id),
+                cursor,
+                None,
+            )
+        )
+
     async def read_by_deck_id(self, deck_id: int) -> list[Quiz]:
         """Read all quizzes from the database that were based on a specific deck.
 
@@ -60,5 +97,195 @@ class QuizRepository(BaseRepository[SQLAlchemyQuiz, Quiz], IQuizRepository):
                 .order_by(self.data_model.quiz_id)
             )
             quizzes = results.scalars().all()
-        quizzes = [Quiz.model_validate(orm_object_to_dict(quiz)) for quiz in quizzes]
+        quizzes = [self._to_domain(quiz) for quiz in quizzes]
         return quizzes
+
+    async def create_with_items(
+        self, quiz: Quiz, quiz_items: Sequence[QuizItem]
+    ) -> tuple[Quiz, list[QuizItem]]:
+        """Create a quiz and its quiz items in a single transaction.
+
+        The quiz and all of its quiz items are inserted by two `INSERT ... RETURNING` statements
+        instead of one statement per quiz item, and the choices of all the quiz items are copied
+        to the `quiz_item_choices` table by one more statement.
+
+        Args:
+            quiz (Quiz): The quiz to create.
+            quiz_items (Sequence[QuizItem]): The quiz items of the quiz. Their `quiz_id` is ignored
+                and set to the id of the created quiz.
+
+        Returns:
+            tuple[Quiz, list[QuizItem]]: The created quiz and quiz items, in the same order as `quiz_items`.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            # Return only the ids, since the other columns are already known.
+            quiz_id = await self.async_session.scalar(
+                insert(self.data_model)
+                .values(self._to_row(quiz))
+                .returning(self.data_model.quiz_id)
+            )
+            quiz_item_ids: Sequence[int] = []
+            if quiz_items:
+                results = await self.async_session.scalars(
+                    insert(SQLAlchemyQuizItem).returning(
+                        SQLAlchemyQuizItem.quiz_item_id, sort_by_parameter_order=True
+                    ),
+                    [
+                        {
+                            **quiz_item.model_dump(exclude={"quiz_item_id"}),
+                            "quiz_id": quiz_id,
+                        }
+                        for quiz_item in quiz_items
+                    ],
+                )
+                quiz_item_ids = results.all()
+                await self.async_session.execute(
+                    insert(SQLAlchemyQuizItemChoice),
+                    [
+                        {
+                            "quiz_item_id": quiz_item_id,
+                            "position": position,
+                            "item_id": item_id,
+                        }
+                        for quiz_item, quiz_item_id in zip(quiz_items, quiz_item_ids)
+                        for position, item_id in enumerate(quiz_item.choice_item_ids)
+                    ],
+                )
+        created_quiz_items = [
+            quiz_item.model_copy(
+                update={"quiz_item_id": quiz_item_id, "quiz_id": quiz_id}
+            )
+            for quiz_item, quiz_item_id in zip(quiz_items, quiz_item_ids)
+        ]
+        return quiz.model_copy(update={"quiz_id": quiz_id}), created_quiz_items
+
+    async def read_with_items(
+        self, quiz_id: int, user_id: int | None = None
+    ) -> QuizWithItems:
+        """Read a quiz together with its quiz items and the items of their choices.
+
+        The quiz, its quiz items and the items of all their choices are read by three queries
+        in total, whatever the number of quiz items and choices.
+
+        Args:
+            quiz_id (int): The unique identifier for the quiz.
+            user_id (int | None): The unique identifier for the user who must have taken the quiz.
+                None means any user.
+
+        Raises:
+            ValueError: If the quiz is not found or not taken by the user.
+
+        Returns:
+            QuizWithItems: The quiz with its quiz items and the items of their choices.
+        """
+        statement = select(self.data_model).where(self.data_model.quiz_id == quiz_id)
+        if user_id is not None:
+            statement = statement.where(self.data_model.user_id == user_id)
+        quizzes = await self._read_with_items(statement)
+        if not quizzes:
+            raise ValueError(
+                f'The data with id {quiz_id} should be found in the "{self.data_model.__tablename__}" table \
+                to read, but it was not found.'
+            )
+        return quizzes[0]
+
+    async def read_answered_with_items(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[QuizWithItems]:
+        """Read the answered quizzes of a user together with their quiz items and the items of their choices.
+
+        A page of quizzes, their quiz items and the items of all their choices are read by three
+        queries in total, whatever the number of quizzes, quiz items and choices.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last quiz of the previous page, if any.
+            limit (int | None): The maximum number of quizzes to read. None means no limit.
+
+        Returns:
+            list[QuizWithItems]: The quizzes with their quiz items and the items of their choices,
+                ordered by their ids.
+        """
+        return await self._read_with_items(
+            self._paginate(
+                select(self.data_model).where(
+                    self.data_model.user_id == user_id,
+                    exists().where(
+                        SQLAlchemyQuizItem.quiz_id == self.data_model.quiz_id,
+                        SQLAlchemyQuizItem.user_answer.is_not(None),
+                    ),
+                ),
+                cursor,
+                limit,
+            )
+        )
+
+    async def _read_with_items(self, statement: Select) -> list[QuizWithItems]:
+        """Read quizzes together with their quiz items and the items of their choices.
+
+        The quiz items are loaded by `selectinload`, i.e. a single `IN` query for all the quizzes,
+        and the items of the choices by another `IN` query for all the quiz items, instead of
+        one query per quiz item and choice.
+
+        Args:
+            statement (Select): The select statement of the quizzes.
+
+        Returns:
+            list[QuizWithItems]: The quizzes with their quiz items and the items of their choices,
+                in the order of the statement.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.scalars(
+                statement.options(selectinload(self.data_model.quiz_items)),
+                # The quiz items may have been answered by bulk updates since they were cached.
+                execution_options={"populate_existing": True},
+            )
+            quizzes = results.all()
+            choice_item_ids = {
+                int(id)
+                for quiz in quizzes
+                for quiz_item in quiz.quiz_items
+                for id in quiz_item.choice_item_ids
+            }
+            item_rows: Sequence[Row[Any]] = []
+            if choice_item_ids:
+                # Select the columns rather than the ORM objects, which are not needed for the read-only items.
+                item_results = await self.async_session.execute(
+                    select(
+                        *(getattr(SQLAlchemyItem, key) for key in Item.model_fields)
+                    ).where(SQLAlchemyItem.item_id.in_(choice_item_ids))
+                )
+                item_rows = item_results.all()
+            quizzes_with_items = [
+                (
+                    self._to_domain(quiz),
+                    [
+                        QuizItem.from_trusted(orm_object_to_dict(quiz_item))
+                        for quiz_item in quiz.quiz_items
+                    ],
+                )
+                for quiz in quizzes
+            ]
+        items_by_id = {
+            item.item_id: item
+            for item in (construct_trusted(Item, row._asdict()) for row in item_rows)
+        }
+        return [
+            QuizWithItems(
+                quiz=quiz,
+                quiz_items=sorted(
+                    quiz_items, key=lambda quiz_item: quiz_item.question_number
+                ),
+                choice_items={
+                    id: items_by_id[id]
+                    for quiz_item in quiz_items
+                    for id in quiz_item.choice_item_ids
+                    if id in items_by_id
+                },
+            )
+            for quiz, quiz_items in quizzes_with_items
+        ]
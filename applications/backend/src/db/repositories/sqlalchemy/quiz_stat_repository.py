@@ -0,0 +1,143 @@
+from datetime import date
+
+from sqlalchemy import ColumnElement, Date, Insert, case, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyItem,
+    SQLAlchemyQuiz,
+    SQLAlchemyQuizItem,
+    SQLAlchemyQuizStat,
+)
+from src.db.repositories.quiz_stat_repository_interface import IQuizStatRepository
+from src.domain.models import QuizStat
+
+from .base_repository import BaseRepository
+
+# The columns summed up by the statistics.
+COUNTER_KEYS = ("attempts", "correct", "total_answer_time")
+
+
+def upsert_quiz_stats(
+    quiz_items_filter: ColumnElement[bool], accumulate: bool = True
+) -> Insert:
+    """Make a statement that aggregates answered quiz items into the statistics of their users.
+
+    The quiz items are counted by the user and the deck of their quizzes, the grade of their
+    items and the day when their quizzes were taken, in a single `INSERT ... SELECT ... GROUP BY
+    ... ON CONFLICT DO UPDATE` statement.
+
+    Args:
+        quiz_items_filter (ColumnElement[bool]): The condition that the quiz items to aggregate meet.
+        accumulate (bool): Whether the quiz items are added to the existing statistics,
+            or replace them, e.g. when the statistics are computed from all the quiz items.
+
+    Returns:
+        Insert: The statement.
+    """
+    day = cast(SQLAlchemyQuiz.quiz_timestamp, Date)
+    aggregated_quiz_items = (
+        select(
+            SQLAlchemyQuiz.user_id,
+            SQLAlchemyQuiz.deck_id,
+            SQLAlchemyItem.grade,
+            day,
+            func.count(),
+            func.sum(
+                case(
+                    (
+                        SQLAlchemyQuizItem.user_answer
+                        == SQLAlchemyQuizItem.correct_answer,
+                        1,
+                    ),
+                    else_=0,
+                )
+            ),
+            func.sum(func.coalesce(SQLAlchemyQuizItem.answer_time, 0)),
+        )
+        .join(SQLAlchemyQuiz, SQLAlchemyQuiz.quiz_id == SQLAlchemyQuizItem.quiz_id)
+        .join(SQLAlchemyItem, SQLAlchemyItem.item_id == SQLAlchemyQuizItem.item_id)
+        .where(quiz_items_filter, SQLAlchemyQuizItem.user_answer.is_not(None))
+        .group_by(
+            SQLAlchemyQuiz.user_id, SQLAlchemyQuiz.deck_id, SQLAlchemyItem.grade, day
+        )
+    )
+    statement = insert(SQLAlchemyQuizStat).from_select(
+        ["user_id", "deck_id", "grade", "day", *COUNTER_KEYS], aggregated_quiz_items
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[
+            SQLAlchemyQuizStat.user_id,
+            SQLAlchemyQuizStat.deck_id,
+            SQLAlchemyQuizStat.grade,
+            SQLAlchemyQuizStat.day,
+        ],
+        set_={
+            key: (
+                getattr(SQLAlchemyQuizStat, key) + statement.excluded[key]
+                if accumulate
+                else statement.excluded[key]
+            )
+            for key in COUNTER_KEYS
+        },
+    )
+
+
+class QuizStatRepository(
+    BaseRepository[SQLAlchemyQuizStat, QuizStat], IQuizStatRepository
+):
+    """The SQLAlchemy repository class for quiz statistics."""
+
+    def __init__(self, async_session: AsyncSession) -> None:
+        """Initialize the repository.
+
+        Args:
+            async_session (AsyncSession): The asynchronous session to use for database operations.
+        """
+        super().__init__(
+            data_model=SQLAlchemyQuizStat,
+            domain_model=QuizStat,
+            async_session=async_session,
+        )
+
+    async def read_by_user_id(
+        self, user_id: int, deck_id: int | None = None, since: date | None = None
+    ) -> list[QuizStat]:
+        """Read the statistics of a user by grade and day, summed over the decks.
+
+        The statistics have a row per deck, grade and day on which the user took quizzes,
+        so the number of rows read does not depend on the number of quizzes or questions.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            deck_id (int | None): The unique identifier for the deck to read the statistics of, if any.
+                Otherwise, the statistics of all the quizzes are read.
+            since (date | None): The first day to read the statistics of. None means all days.
+
+        Returns:
+            list[QuizStat]: The statistics ordered by day and grade, without ids.
+        """
+        statement = select(
+            self.data_model.grade,
+            self.data_model.day,
+            *(
+                func.sum(getattr(self.data_model, key)).label(key)
+                for key in COUNTER_KEYS
+            ),
+        ).where(self.data_model.user_id == user_id)
+        if deck_id is not None:
+            statement = statement.where(self.data_model.deck_id == deck_id)
+        if since is not None:
+            statement = statement.where(self.data_model.day >= since)
+        statement = statement.group_by(
+            self.data_model.grade, self.data_model.day
+        ).order_by(self.data_model.day, self.data_model.grade)
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.execute(statement)
+            rows = results.all()
+        return [
+            QuizStat(user_id=user_id, deck_id=deck_id, **row._asdict()) for row in rows
+        ]
@@ -0,0 +1,170 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import exists
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyItem,
+    SQLAlchemyReviewState,
+    item_deck_mapper_table,
+)
+from src.db.repositories.base_repository_interface import DEFAULT_BATCH_SIZE
+from src.db.repositories.review_state_repository_interface import (
+    IReviewStateRepository,
+)
+from src.domain.models import ReviewState
+
+from .base_repository import BaseRepository, batched
+
+# The columns of a review state that are not changed by a review.
+KEY_COLUMNS = ("review_state_id", "user_id", "item_id")
+
+
+def upsert_review_states() -> Insert:
+    """Make a statement that creates or updates the review states of items in bulk.
+
+    The statement is executed with the rows of the review states without their ids, and updates
+    the existing review state of a user and an item by `ON CONFLICT (user_id, item_id) DO UPDATE`,
+    so whether an item has been reviewed before does not need to be known.
+
+    Returns:
+        Insert: The statement.
+    """
+    statement = insert(SQLAlchemyReviewState)
+    return statement.on_conflict_do_update(
+        index_elements=[SQLAlchemyReviewState.user_id, SQLAlchemyReviewState.item_id],
+        set_={
+            column.key: statement.excluded[column.key]
+            for column in SQLAlchemyReviewState.__table__.columns
+            if column.key not in KEY_COLUMNS
+        },
+    )
+
+
+class ReviewStateRepository(
+    BaseRepository[SQLAlchemyReviewState, ReviewState], IReviewStateRepository
+):
+    """The SQLAlchemy repository class for review states."""
+
+    def __init__(self, async_session: AsyncSession) -> None:
+        """Initialize the repository.
+
+        Args:
+            async_session (AsyncSession): The asynchronous session to use for database operations.
+        """
+        super().__init__(
+            data_model=SQLAlchemyReviewState,
+            domain_model=ReviewState,
+            async_session=async_session,
+        )
+
+    async def read_due(
+        self,
+        user_id: int,
+        due_at: datetime,
+        limit: int,
+        deck_id: int | None = None,
+        grades: Sequence[int] | None = None,
+    ) -> list[ReviewState]:
+        """Read the review states of the items of a user due to be reviewed, most overdue first.
+
+        The review states are read by a single range scan of the `(user_id, due_at)` index in due
+        order, which stops after `limit` rows, so neither sorting nor the number of review states
+        of the user matters. The deck and the grades are checked by a primary key lookup per row.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            due_at (datetime): The date and time by which the items are due, usually now.
+            limit (int): The maximum number of review states to read.
+            deck_id (int | None): The unique identifier for the deck whose items are read, if any.
+            grades (Sequence[int] | None): The grades of the items to read. None means all grades.
+
+        Returns:
+            list[ReviewState]: The review states ordered by their due dates.
+        """
+        statement = self._select_projected(self.domain_model).where(
+            self.data_model.user_id == user_id, self.data_model.due_at <= due_at
+        )
+        if deck_id is not None:
+            statement = statement.where(
+                exists().where(
+                    item_deck_mapper_table.c.item_id == self.data_model.item_id,
+                    item_deck_mapper_table.c.deck_id == deck_id,
+                )
+            )
+        if grades is not None:
+            statement = statement.where(
+                exists().where(
+                    SQLAlchemyItem.item_id == self.data_model.item_id,
+                    SQLAlchemyItem.grade.in_(grades),
+                )
+            )
+        return await self._read_projected(
+            self.domain_model,
+            statement.order_by(self.data_model.due_at).limit(limit),
+        )
+
+    async def read_by_item_ids(
+        self, user_id: int, item_ids: Sequence[int]
+    ) -> list[ReviewState]:
+        """Read the review states of specific items of a user.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            item_ids (Sequence[int]): The unique identifiers for the items.
+
+        Returns:
+            list[ReviewState]: The review states of the items that have been reviewed, in no particular order.
+        """
+        if not item_ids:
+            return []
+        return await self._read_projected(
+            self.domain_model,
+            self._select_projected(self.domain_model).where(
+                self.data_model.user_id == user_id,
+                self.data_model.item_id.in_(item_ids),
+            ),
+        )
+
+    async def upsert_many(
+        self,
+        review_states: Sequence[ReviewState],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[ReviewState]:
+        """Create or update the review states of items in bulk.
+
+        All review states are written in a single transaction by
+        `INSERT ... ON CONFLICT (user_id, item_id) DO UPDATE ... RETURNING` statements,
+        so whether an item has been reviewed before does not need to be known.
+
+        Args:
+            review_states (Sequence[ReviewState]): The review states, at most one per user and item.
+            batch_size (int): The maximum number of review states written by a single statement.
+
+        Returns:
+            list[ReviewState]: The review states reconstructed from the written records,
+                in the same order as `review_states`.
+        """
+        if not review_states:
+            return []
+        statement = upsert_review_states()
+        data_entities: list[SQLAlchemyReviewState] = []
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            for batch in batched(review_states, batch_size):
+                # The existing records are updated by the statement, so refresh their cached copies.
+                results = await self.async_session.scalars(
+                    statement.returning(self.data_model, sort_by_parameter_order=True),
+                    [
+                        self._to_row(
+                            review_state.model_copy(update={"review_state_id": None})
+                        )
+                        for review_state in batch
+                    ],
+                    execution_options={"populate_existing": True},
+                )
+                data_entities.extend(results.all())
+        return [self._to_domain(data_entity) for data_entity in data_entities]
@@ -1,13 +1,15 @@
+from collections.abc import AsyncIterator, Sequence
 from typing import cast
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import invalidate_cached_users
 from src.db.models.sqlalchemy_data_models import (
     SQLAlchemyUser,
     SQLAlchemyUserLoginHistory,
-    orm_object_to_dict,
 )
+from src.db.repositories.base_repository_interface import DEFAULT_BATCH_SIZE
 from src.db.repositories.user_repository_interface import (
     IUserLoginHistoryRepository,
     IUserRepository,
@@ -30,6 +32,97 @@ class UserRepository(BaseRepository[SQLAlchemyUser, User], IUserRepository):
             data_model=SQLAlchemyUser, domain_model=User, async_session=async_session
         )
 
+    async def update(self, domain_entity: User) -> User:
+        """Update a user in the database and remove them from the cache of authenticated users.
+
+        Args:
+            domain_entity (User): The domain entity used to update the user.
+
+        Returns:
+            User: The domain entity reconstructed from the updated user.
+        """
+        user = await super().update(domain_entity)
+        invalidate_cached_users({domain_entity.self_id})  # type: ignore
+        return user
+
+    async def delete(self, id: int) -> User:
+        """Delete a user from the database and remove them from the cache of authenticated users.
+
+        Args:
+            id (int): The id of the user to delete.
+
+        Returns:
+            User: The domain entity created from the deleted user.
+        """
+        user = await super().delete(id)
+        invalidate_cached_users({id})
+        return user
+
+    async def update_many(
+        self, domain_entities: Sequence[User], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> list[User]:
+        """Update users in the database in bulk and remove them from the cache of authenticated users.
+
+        Args:
+            domain_entities (Sequence[User]): The domain entities used to update the users.
+            batch_size (int): The maximum number of users updated by a single statement.
+
+        Returns:
+            list[User]: The domain entities reconstructed from the updated users.
+        """
+        users = await super().update_many(domain_entities, batch_size)
+        invalidate_cached_users({user.self_id for user in domain_entities})  # type: ignore
+        return users
+
+    async def delete_many(
+        self, ids: Sequence[int], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> list[User]:
+        """Delete users from the database in bulk and remove them from the cache of authenticated users.
+
+        Args:
+            ids (Sequence[int]): The ids of the users to delete.
+            batch_size (int): The maximum number of users deleted by a single statement.
+
+        Returns:
+            list[User]: The domain entities created from the deleted users, in the same order as `ids`.
+        """
+        users = await super().delete_many(ids, batch_size)
+        invalidate_cached_users(set(ids))
+        return users
+
+    async def read_all(
+        self, cursor: int | None = None, limit: int | None = None
+    ) -> list[User]:
+        """Read all users from the database, ordered by their ids.
+
+        Args:
+            cursor (int | None): The id of the last user of the previous page, if any.
+            limit (int | None): The maximum number of users to read. None means no limit.
+
+        Returns:
+            list[User]: The list of all users.
+        """
+        # This context automatically calls async_session.commit() if no exceptions are raised.
+        # If an exception is raised, it automatically calls async_session.rollback().
+        async with self.async_session.begin():
+            results = await self.async_session.execute(
+                self._paginate(select(self.data_model), cursor, limit)
+            )
+            users = results.scalars().all()
+        users = [self._to_domain(user) for user in users]
+        return users
+
+    def stream_all(self, cursor: int | None = None) -> AsyncIterator[User]:
+        """Stream all users without loading them into memory at once.
+
+        Args:
+            cursor (int | None): The id of the last user already read, if any.
+
+        Returns:
+            AsyncIterator[User]: All users, ordered by their ids.
+        """
+        return self._stream(self._paginate(select(self.data_model), cursor, None))
+
     async def read_by_username(self, user_name: str) -> User | None:
         """Read a user from the database by their username.
 
@@ -51,7 +144,7 @@ class UserRepository(BaseRepository[SQLAlchemyUser, User], IUserRepository):
         if user is None:
             return user
         else:
-            user = User.model_validate(orm_object_to_dict(user))
+            user = self._to_domain(user)
             return cast(User, user)
 
     async def read_by_email(self, email: str) -> User | None:
@@ -75,7 +168,7 @@ class UserRepository(BaseRepository[SQLAlchemyUser, User], IUserRepository):
         if user is None:
             return user
         else:
-            user = User.model_validate(orm_object_to_dict(user))
+            user = self._to_domain(user)
             return cast(User, user)
 
 
@@ -97,11 +190,15 @@ class UserLoginHistoryRepository(
             async_session=async_session,
         )
 
-    async def read_by_user_id(self, user_id: int) -> list[UserLoginHistory]:
+    async def read_by_user_id(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[UserLoginHistory]:
         """Read all user login histories from the database that belong to a specific user.
 
         Args:
             user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last login history of the previous page, if any.
+            limit (int | None): The maximum number of login histories to read. None means no limit.
 
         Returns:
             list[UserLoginHistory]: The list of user login histories that belong to the user.
@@ -110,13 +207,35 @@ class UserLoginHistoryRepository(
         # If an exception is raised, it automatically calls session.rollback().
         async with self.async_session.begin():
             results = await self.async_session.execute(
-                select(self.data_model)
-                .where(self.data_model.user_id == user_id)
-                .order_by(self.data_model.user_login_history_id)
+                self._paginate(
+                    select(self.data_model).where(self.data_model.user_id == user_id),
+                    cursor,
+                    limit,
+                )
             )
             user_login_histories = results.scalars().all()
         user_login_histories = [
-            UserLoginHistory.model_validate(orm_object_to_dict(user_login_history))
+            self._to_domain(user_login_history)
             for user_login_history in user_login_histories
         ]
         return user_login_histories
+
+    def stream_by_user_id(
+        self, user_id: int, cursor: int | None = None
+    ) -> AsyncIterator[UserLoginHistory]:
+        """Stream all user login histories that belong to a specific user without loading them at once.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last login history already read, if any.
+
+        Returns:
+            AsyncIterator[UserLoginHistory]: The user login histories that belong to the user.
+        """
+        return self._stream(
+            self._paginate(
+                select(self.data_model).where(self.data_model.user_id == user_id),
+                cursor,
+                None,
+            )
+        )
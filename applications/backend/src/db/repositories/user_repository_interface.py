@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from src.domain.models import User, UserLoginHistory
 
@@ -8,6 +9,33 @@ from .base_repository_interface import IBaseRepository
 class IUserRepository(IBaseRepository[User], ABC):
     """The interface for the user repository."""
 
+    @abstractmethod
+    async def read_all(
+        self, cursor: int | None = None, limit: int | None = None
+    ) -> list[User]:
+        """Read all users from the database, ordered by their ids.
+
+        Args:
+            cursor (int | None): The id of the last user of the previous page, if any.
+            limit (int | None): The maximum number of users to read. None means no limit.
+
+        Returns:
+            list[User]: The list of all users.
+        """
+        pass
+
+    @abstractmethod
+    def stream_all(self, cursor: int | None = None) -> AsyncIterator[User]:
+        """Stream all users without loading them into memory at once.
+
+        Args:
+            cursor (int | None): The id of the last user already read, if any.
+
+        Returns:
+            AsyncIterator[User]: All users, ordered by their ids.
+        """
+        pass
+
     @abstractmethod
     async def read_by_username(self, user_name: str) -> User | None:
         """Read a user from the database by their username.
@@ -37,13 +65,32 @@ class IUserLoginHistoryRepository(IBaseRepository[UserLoginHistory], ABC):
     """The interface for the user login history repository."""
 
     @abstractmethod
-    async def read_by_user_id(self, user_id: int) -> list[UserLoginHistory]:
-        """Read all login history from the database that belong to a specific user.
+    async def read_by_user_id(
+        self, user_id: int, cursor: int | None = None, limit: int | None = None
+    ) -> list[UserLoginHistory]:
+        """Read all login history from the database that belong to a specific user, ordered by id.
 
         Args:
             user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last login history of the previous page, if any.
+            limit (int | None): The maximum number of login history to read. None means no limit.
 
         Returns:
             list[UserLoginHistory]: The list of login history that belong to the user.
         """
         pass
+
+    @abstractmethod
+    def stream_by_user_id(
+        self, user_id: int, cursor: int | None = None
+    ) -> AsyncIterator[UserLoginHistory]:
+        """Stream all login history that belong to a specific user without loading them at once.
+
+        Args:
+            user_id (int): The unique identifier for the user.
+            cursor (int | None): The id of the last login history already read, if any.
+
+        Returns:
+            AsyncIterator[UserLoginHistory]: The login history that belong to the user, ordered by id.
+        """
+        pass
@@ -1,6 +1,8 @@
 from .deck_model import Deck
 from .item_model import Item
-from .quiz_model import Quiz, QuizItem
+from .quiz_model import Quiz, QuizItem, QuizWithItems
+from .quiz_stat_model import QuizStat
+from .review_model import ReviewState
 from .user_model import User, UserLoginHistory
 
 __all__ = [
@@ -8,6 +10,9 @@ __all__ = [
     "Item",
     "Quiz",
     "QuizItem",
+    "QuizStat",
+    "QuizWithItems",
+    "ReviewState",
     "User",
     "UserLoginHistory",
 ]
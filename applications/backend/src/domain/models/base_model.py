@@ -1,7 +1,34 @@
 from abc import ABC, abstractproperty
+from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
+ModelType = TypeVar("ModelType", bound=BaseModel)
+DomainModelType = TypeVar("DomainModelType", bound="BaseDomainModel")
+
+
+def construct_trusted(model_type: type[ModelType], data: dict[str, Any]) -> ModelType:
+    """Construct a Pydantic model from trusted data without validation.
+
+    This is the fast path for data read from the database, which has already been
+    validated when it was written. Unlike `model_construct`, it neither fills in defaults
+    nor copies `data`, so `data` must have all the fields of the model and must not
+    be reused by the caller.
+
+    Args:
+        model_type (type[ModelType]): The Pydantic model to construct.
+        data (dict[str, Any]): The values of all the fields of the model.
+
+    Returns:
+        ModelType: The constructed model.
+    """
+    model = model_type.__new__(model_type)
+    object.__setattr__(model, "__dict__", data)
+    object.__setattr__(model, "__pydantic_fields_set__", set(data))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
 
 class BaseDomainModel(BaseModel, ABC):
     """The base domain model.
@@ -20,3 +47,21 @@ class BaseDomainModel(BaseModel, ABC):
             int | None: The unique identifier for the domain model.
         """
         pass
+
+    @classmethod
+    def from_trusted(
+        cls: type[DomainModelType], data: dict[str, Any]
+    ) -> DomainModelType:
+        """Construct the domain model from trusted data without validation.
+
+        See `construct_trusted` for the requirements on `data`. Subclasses override this
+        method to convert fields whose representation in the database differs from
+        the one in the domain model.
+
+        Args:
+            data (dict[str, Any]): The values of all the fields of the domain model.
+
+        Returns:
+            DomainModelType: The domain model.
+        """
+        return construct_trusted(cls, data)
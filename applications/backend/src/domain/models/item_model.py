@@ -1,3 +1,4 @@
+import unicodedata
 from datetime import datetime
 
 from pydantic import PastDatetime
@@ -5,6 +6,22 @@ from pydantic import PastDatetime
 from .base_model import BaseDomainModel
 
 
+def normalize_text(text: str) -> str:
+    """Normalize the English or Japanese text of an item to tell whether items duplicate each other.
+
+    The text is normalized by NFKC (e.g. full-width letters and half-width katakana become their
+    usual forms), case-folded, and its runs of whitespace are collapsed into single spaces
+    without leading and trailing ones.
+
+    Args:
+        text (str): The text to normalize.
+
+    Returns:
+        str: The normalized text.
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
 class Item(BaseDomainModel):
     """The domain model for an item.
 
@@ -1,8 +1,10 @@
 from datetime import datetime
+from typing import Any
 
-from pydantic import PastDatetime
+from pydantic import BaseModel, PastDatetime
 
 from .base_model import BaseDomainModel
+from .item_model import Item
 
 
 class Quiz(BaseDomainModel):
@@ -40,7 +42,8 @@ class QuizItem(BaseDomainModel):
 
     Attributes:
         quiz_item_id (int | None): The unique identifier for the quiz item.
-        quiz_id (int): The unique identifier for the quiz that owns the quiz item.
+        quiz_id (int | None): The unique identifier for the quiz that owns the quiz item.
+            None until the quiz item is created together with its quiz.
         item_id (int): The unique identifier for the item that the quiz item is based on.
         question_number (int): The number of the question the quiz item in the quiz.
         choice_item_ids (list[int]): The list of unique identifiers of items that are used
@@ -51,7 +54,7 @@ class QuizItem(BaseDomainModel):
     """
 
     quiz_item_id: int | None = None
-    quiz_id: int
+    quiz_id: int | None = None
     item_id: int | None
     question_number: int
     choice_item_ids: list[int]
@@ -70,3 +73,33 @@ class QuizItem(BaseDomainModel):
             int | None: The unique identifier for the quiz item.
         """
         return self.quiz_item_id
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "QuizItem":
+        """Construct the quiz item from trusted data without validation.
+
+        The choice item ids are stored in a JSON column, so they are converted into integers.
+
+        Args:
+            data (dict[str, Any]): The values of all the fields of the quiz item.
+
+        Returns:
+            QuizItem: The quiz item.
+        """
+        data["choice_item_ids"] = [int(id) for id in data["choice_item_ids"]]
+        return super().from_trusted(data)
+
+
+class QuizWithItems(BaseModel):
+    """A quiz read together with its quiz items and the items of their choices.
+
+    Attributes:
+        quiz (Quiz): The quiz.
+        quiz_items (list[QuizItem]): The quiz items of the quiz, ordered by their question numbers.
+        choice_items (dict[int, Item]): The items of the choices of the quiz items by their ids.
+            The items deleted since the quiz was taken are missing.
+    """
+
+    quiz: Quiz
+    quiz_items: list[QuizItem]
+    choice_items: dict[int, Item]
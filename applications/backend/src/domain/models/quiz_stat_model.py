@@ -0,0 +1,39 @@
+from datetime import date
+
+from .base_model import BaseDomainModel
+
+
+class QuizStat(BaseDomainModel):
+    """The domain model for the answers of a user aggregated by deck, grade and day.
+
+    Attributes:
+        quiz_stat_id (int | None): The unique identifier for the statistics.
+        user_id (int): The unique identifier for the user who answered.
+        deck_id (int | None): The unique identifier for the deck of the quizzes, if any.
+        grade (int): The grade of the items asked.
+        day (date): The day when the quizzes were taken.
+        attempts (int): The number of questions answered.
+        correct (int): The number of questions answered correctly.
+        total_answer_time (int): The total time (in seconds) taken to answer the questions.
+    """
+
+    quiz_stat_id: int | None = None
+    user_id: int
+    deck_id: int | None = None
+    grade: int
+    day: date
+    attempts: int = 0
+    correct: int = 0
+    total_answer_time: int = 0
+
+    @property
+    def self_id(self) -> int | None:
+        """The alias of unique identifier for the statistics.
+
+        This property is required by the base repository, which is solely responsible for
+        all CRUD operations.
+
+        Returns:
+            int | None: The unique identifier for the statistics.
+        """
+        return self.quiz_stat_id
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from .base_model import BaseDomainModel
+
+
+class ReviewState(BaseDomainModel):
+    """The domain model for the spaced-repetition state of an item studied by a user.
+
+    Attributes:
+        review_state_id (int | None): The unique identifier for the review state.
+        user_id (int): The unique identifier for the user who studies the item.
+        item_id (int): The unique identifier for the item.
+        repetitions (int): The number of consecutive correct answers to the item.
+        ease (float): The factor by which the interval grows after a correct answer.
+        interval_days (int): The number of days between the last review and the next one.
+        due_at (datetime): The date and time when the item is due to be reviewed next.
+        reviewed_at (datetime): The date and time when the item was last reviewed.
+    """
+
+    review_state_id: int | None = None
+    user_id: int
+    item_id: int
+    repetitions: int = 0
+    ease: float = 2.5
+    interval_days: int = 0
+    due_at: datetime
+    reviewed_at: datetime
+
+    @property
+    def self_id(self) -> int | None:
+        """The alias of unique identifier for the review state.
+
+        This property is required by the base repository, which is solely responsible for
+        all CRUD operations.
+
+        Returns:
+            int | None: The unique identifier for the review state.
+        """
+        return self.review_state_id
@@ -1,4 +1,6 @@
 from datetime import datetime
+from ipaddress import ip_address
+from typing import Any
 
 from pydantic import PastDatetime
 from pydantic.networks import IPvAnyAddress
@@ -72,3 +74,19 @@ class UserLoginHistory(BaseDomainModel):
             int | None: The unique identifier for the user login history.
         """
         return self.user_login_history_id
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "UserLoginHistory":
+        """Construct the user login history from trusted data without validation.
+
+        The IP address is stored as a string in the database, so it is converted into
+        an `IPv4Address` or `IPv6Address` as `IPvAnyAddress` does.
+
+        Args:
+            data (dict[str, Any]): The values of all the fields of the user login history.
+
+        Returns:
+            UserLoginHistory: The user login history.
+        """
+        data["ip_address"] = ip_address(data["ip_address"])
+        return super().from_trusted(data)
@@ -0,0 +1,74 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from src.db.repositories.base_repository_interface import ProjectionType
+from src.db.repositories.deck_repository_interface import (
+    DeckItemOrder,
+    IDeckRepository,
+)
+
+
+async def list_deck_items(
+    deck_repository: IDeckRepository,
+    projection: type[ProjectionType],
+    deck_id: int,
+    order_by: DeckItemOrder = "position",
+    grade: int | None = None,
+    cursor: int | None = None,
+    limit: int | None = None,
+) -> list[ProjectionType]:
+    """List a page of the items in a deck in an order.
+
+    Args:
+        deck_repository (IDeckRepository): The repository of decks.
+        projection (type[ProjectionType]): The model whose field names are the columns to read.
+        deck_id (int): The unique identifier for the deck.
+        order_by (DeckItemOrder): The order of the items, where ties are ordered by their ids.
+        grade (int | None): The grade of the items to list. None means all grades.
+        cursor (int | None): The id of the last item of the previous page, if any.
+        limit (int | None): The maximum number of items to list. None means no limit.
+
+    Returns:
+        list[ProjectionType]: The projections of the items in the deck.
+    """
+    return await deck_repository.read_items(
+        projection, deck_id, cursor, limit, _filter_items(grade), order_by
+    )
+
+
+def stream_deck_items(
+    deck_repository: IDeckRepository,
+    projection: type[ProjectionType],
+    deck_id: int,
+    order_by: DeckItemOrder = "position",
+    grade: int | None = None,
+    cursor: int | None = None,
+) -> AsyncIterator[ProjectionType]:
+    """Stream the items in a deck in an order, however many there are.
+
+    Args:
+        deck_repository (IDeckRepository): The repository of decks.
+        projection (type[ProjectionType]): The model whose field names are the columns to read.
+        deck_id (int): The unique identifier for the deck.
+        order_by (DeckItemOrder): The order of the items, where ties are ordered by their ids.
+        grade (int | None): The grade of the items to list. None means all grades.
+        cursor (int | None): The id of the last item already read, if any.
+
+    Returns:
+        AsyncIterator[ProjectionType]: The projections of the items in the deck.
+    """
+    return deck_repository.stream_items(
+        projection, deck_id, cursor, _filter_items(grade), order_by
+    )
+
+
+def _filter_items(grade: int | None) -> dict[str, Any]:
+    """Make the filters of the items in a deck.
+
+    Args:
+        grade (int | None): The grade of the items to list. None means all grades.
+
+    Returns:
+        dict[str, Any]: The values that the columns of the items must be equal to.
+    """
+    return {"grade": grade} if grade is not None else {}
@@ -0,0 +1,62 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from src.db.repositories.deck_repository_interface import IDeckRepository
+
+
+class DeckSummary(BaseModel):
+    """A deck of a user as shown in the list of the decks.
+
+    Attributes:
+        deck_id (int): The unique identifier for the deck.
+        deck_name (str): The name of the deck.
+        item_count (int): The number of items in the deck.
+        last_studied_at (datetime | None): The time of the last quiz taken on the deck, if any.
+    """
+
+    deck_id: int
+    deck_name: str
+    item_count: int
+    last_studied_at: datetime | None
+
+
+async def list_decks(
+    deck_repository: IDeckRepository,
+    user_id: int,
+    cursor: int | None = None,
+    limit: int | None = None,
+) -> list[DeckSummary]:
+    """List a page of the decks of a user with their item counts and last quiz times.
+
+    The whole page is read by a single query, however many decks it has.
+
+    Args:
+        deck_repository (IDeckRepository): The repository of decks.
+        user_id (int): The unique identifier for the user.
+        cursor (int | None): The id of the last deck of the previous page, if any.
+        limit (int | None): The maximum number of decks to list. None means no limit.
+
+    Returns:
+        list[DeckSummary]: The decks of the user, ordered by their ids.
+    """
+    return await deck_repository.read_summaries_by_user_id(
+        DeckSummary, user_id, cursor, limit
+    )
+
+
+def stream_decks(
+    deck_repository: IDeckRepository, user_id: int, cursor: int | None = None
+) -> AsyncIterator[DeckSummary]:
+    """Stream the decks of a user with their item counts and last quiz times.
+
+    Args:
+        deck_repository (IDeckRepository): The repository of decks.
+        user_id (int): The unique identifier for the user.
+        cursor (int | None): The id of the last deck already read, if any.
+
+    Returns:
+        AsyncIterator[DeckSummary]: The decks of the user, ordered by their ids.
+    """
+    return deck_repository.stream_summaries_by_user_id(DeckSummary, user_id, cursor)
@@ -0,0 +1,280 @@
+import asyncio
+import sys
+import time
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sized
+from datetime import datetime, timedelta
+
+from pydantic import BaseModel
+
+from src.db.repositories.item_repository_interface import IItemRepository
+
+# The items updated within this period before the latest update seen are read again on refresh,
+# since the transactions that updated them may have committed after the previous refresh.
+REFRESH_OVERLAP = timedelta(seconds=5)
+# The owner id of the shared items (i.e. items without an owner) in the index.
+SHARED_OWNER_ID = -1
+# The separator of the English word and its Japanese translation in the text buffer,
+# which PostgreSQL does not allow in text columns.
+TEXT_SEPARATOR = "\0"
+
+
+class ItemIndexEntry(BaseModel):
+    """The columns of an item kept in the index.
+
+    Attributes:
+        item_id (int): The unique identifier for the item.
+        user_id (int | None): The unique identifier for the user who owns the item.
+        grade (int): The grade of the item.
+        english (str): The English word of the item.
+        japanese (str): The Japanese translation of the item.
+        updated_at (datetime): The date and time when the item was last updated.
+    """
+
+    item_id: int
+    user_id: int | None
+    grade: int
+    english: str
+    japanese: str
+    updated_at: datetime
+
+
+class BaseItemIndex(ABC):
+    """The base class of the process-local indexes of items, which answer requests without querying the database.
+
+    The ids, owners and grades of the items are kept in parallel typed arrays sorted by id, and
+    their English words and Japanese translations in a single UTF-8 buffer. Item ids are 32-bit
+    integer columns, so the arrays take about 20 bytes per item besides the texts.
+
+    The index is refreshed on demand at most once per `refresh_seconds` by reading only the items
+    updated since the previous refresh. Since deleted items cannot be read, the index is reloaded
+    entirely if the number and the sum of its ids differ from those of the items in the database
+    up to its largest id afterwards, which also catches an item deleted while another is inserted.
+    """
+
+    def __init__(
+        self, refresh_seconds: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            refresh_seconds (float): The minimum interval between refreshes in seconds.
+            clock (Callable[[], float]): The function that returns the current time in seconds.
+        """
+        self.refresh_seconds = refresh_seconds
+        self.clock = clock
+        self._lock = asyncio.Lock()
+        self.clear()
+
+    def __len__(self) -> int:
+        """Get the number of items in the index.
+
+        Returns:
+            int: The number of items.
+        """
+        return len(self._ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        """Check if an item is in the index.
+
+        Args:
+            item_id (object): The unique identifier for the item.
+
+        Returns:
+            bool: True if the item is in the index.
+        """
+        return isinstance(item_id, int) and self._find(item_id) is not None
+
+    def clear(self) -> None:
+        """Remove all items, so that the index is loaded entirely on the next refresh."""
+        self._ids = array("i")
+        self._owner_ids = array("i")
+        self._grades = array("h")
+        self._text_offsets = array("I")
+        self._text_lengths = array("I")
+        self._texts = bytearray()
+        # The sum of the item ids, compared with the database to detect deleted items.
+        self._id_sum = 0
+        self._latest_updated_at: datetime | None = None
+        self._refreshed_at: float | None = None
+
+    def expire(self) -> None:
+        """Make the next refresh read the updated items regardless of the interval."""
+        self._refreshed_at = None
+
+    async def refresh(self, item_repository: IItemRepository) -> bool:
+        """Refresh the index if the refresh interval has passed since the previous refresh.
+
+        Loading all items takes seconds for hundreds of thousands of items, so it is done in
+        a thread, and the requests arriving meanwhile are told that the index is cold instead
+        of waiting for it. The requests arriving during other refreshes use the index as it is.
+
+        Args:
+            item_repository (IItemRepository): The repository to read the items with.
+
+        Returns:
+            bool: Whether the index can be used, i.e. the items are loaded.
+        """
+        if self._lock.locked():
+            return self._latest_updated_at is not None
+        async with self._lock:
+            await self._refresh_if_due(item_repository)
+        return True
+
+    def memory_bytes(self) -> int:
+        """Estimate the memory used by the index.
+
+        Returns:
+            int: The number of bytes allocated for the arrays and the buffer of the index.
+        """
+        return sum(sys.getsizeof(values) for values in self._arrays())
+
+    def load(self, entries: Iterable[ItemIndexEntry]) -> None:
+        """Replace the items of the index.
+
+        Args:
+            entries (Iterable[ItemIndexEntry]): The items ordered by their ids.
+        """
+        self.clear()
+        self.upsert(entries)
+
+    @abstractmethod
+    def upsert(self, entries: Iterable[ItemIndexEntry]) -> None:
+        """Add items to the index, or update them if they are already in the index.
+
+        Args:
+            entries (Iterable[ItemIndexEntry]): The items to add or update.
+        """
+        pass
+
+    async def _refresh_if_due(self, item_repository: IItemRepository) -> float:
+        """Refresh the items if the refresh interval has passed, while holding the lock.
+
+        Args:
+            item_repository (IItemRepository): The repository to read the items with.
+
+        Returns:
+            float: The current time in seconds.
+        """
+        now = self.clock()
+        if (
+            self._refreshed_at is None
+            or now - self._refreshed_at >= self.refresh_seconds
+        ):
+            await self._refresh_items(item_repository)
+            self._refreshed_at = now
+        return now
+
+    async def _refresh_items(self, item_repository: IItemRepository) -> None:
+        """Read the items updated since the previous refresh, or all items if some were deleted.
+
+        Args:
+            item_repository (IItemRepository): The repository to read the items with.
+        """
+        if self._latest_updated_at is not None:
+            self.upsert(
+                await item_repository.read_projected_updated_since(
+                    ItemIndexEntry, self._latest_updated_at - REFRESH_OVERLAP
+                )
+            )
+            if not self._ids:
+                return
+            # The items inserted after the read above mostly have larger ids, so they are left out.
+            checksum = await item_repository.read_id_checksum(self._ids[-1])
+            if checksum == (len(self), self._id_sum):
+                return
+        entries = await item_repository.read_projected_updated_since(ItemIndexEntry)
+        # Build a new index in a thread and swap it in at once, so that the requests using
+        # the current index meanwhile never see it half-built.
+        loaded = type(self)(self.refresh_seconds, self.clock)
+        await asyncio.to_thread(loaded.load, entries)
+        for name, value in vars(loaded).items():
+            if name not in {"refresh_seconds", "clock", "_lock"}:
+                setattr(self, name, value)
+
+    def _arrays(self) -> list[Sized]:
+        """List the arrays and the buffers of the index to estimate its memory by.
+
+        Returns:
+            list[Sized]: The arrays and the buffers.
+        """
+        return [
+            self._ids,
+            self._owner_ids,
+            self._grades,
+            self._text_offsets,
+            self._text_lengths,
+            self._texts,
+        ]
+
+    def _find(self, item_id: int) -> int | None:
+        """Find the position of an item in the parallel arrays.
+
+        Args:
+            item_id (int): The unique identifier for the item.
+
+        Returns:
+            int | None: The position of the item, or None if it is not in the index.
+        """
+        position = bisect_left(self._ids, item_id)
+        if position == len(self._ids) or self._ids[position] != item_id:
+            return None
+        return position
+
+    def _insert(self, position: int, owner_id: int, entry: ItemIndexEntry) -> None:
+        """Insert an item that is not in the index yet into the parallel arrays.
+
+        Args:
+            position (int): The position of the item in the parallel arrays.
+            owner_id (int): The unique identifier for the owner, or `SHARED_OWNER_ID`.
+            entry (ItemIndexEntry): The item.
+        """
+        self._ids.insert(position, entry.item_id)
+        self._id_sum += entry.item_id
+        self._owner_ids.insert(position, owner_id)
+        self._grades.insert(position, entry.grade)
+        self._text_offsets.insert(position, 0)
+        self._text_lengths.insert(position, 0)
+        self._set_text(position, entry)
+
+    def _text(self, position: int) -> tuple[str, str]:
+        """Get the English word and the Japanese translation of an item from the buffer.
+
+        Args:
+            position (int): The position of the item in the parallel arrays.
+
+        Returns:
+            tuple[str, str]: The English word and the Japanese translation.
+        """
+        offset = self._text_offsets[position]
+        text = self._texts[offset : offset + self._text_lengths[position]].decode()
+        english, japanese = text.split(TEXT_SEPARATOR)
+        return english, japanese
+
+    def _set_text(self, position: int, entry: ItemIndexEntry) -> None:
+        """Append the texts of an item to the buffer and point the item at them.
+
+        The previous texts are left in the buffer until the index is reloaded entirely.
+
+        Args:
+            position (int): The position of the item in the parallel arrays.
+            entry (ItemIndexEntry): The item.
+        """
+        encoded = f"{entry.english}{TEXT_SEPARATOR}{entry.japanese}".encode()
+        self._text_offsets[position] = len(self._texts)
+        self._text_lengths[position] = len(encoded)
+        self._texts += encoded
+
+    def _update_latest(self, entry: ItemIndexEntry) -> None:
+        """Remember the update time of an item if it is the latest seen.
+
+        Args:
+            entry (ItemIndexEntry): The item.
+        """
+        if (
+            self._latest_updated_at is None
+            or entry.updated_at > self._latest_updated_at
+        ):
+            self._latest_updated_at = entry.updated_at
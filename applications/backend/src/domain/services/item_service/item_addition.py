@@ -0,0 +1,67 @@
+from collections.abc import Sequence
+
+from pydantic import BaseModel
+
+from src.db.repositories.item_repository_interface import IItemRepository
+from src.domain.models import Item
+from src.domain.models.item_model import normalize_text
+
+
+class ItemAdditionResult(BaseModel):
+    """The result of adding items.
+
+    Attributes:
+        item_ids (list[int]): The ids of the items in the order they were given, which are the ids
+            of the existing items for the duplicates.
+        num_created (int): The number of the created items.
+        num_skipped (int): The number of the items skipped as duplicates of existing items or of each other.
+    """
+
+    item_ids: list[int]
+    num_created: int
+    num_skipped: int
+
+
+async def add_items(
+    item_repository: IItemRepository, items: Sequence[Item]
+) -> ItemAdditionResult:
+    """Add items of a user idempotently, creating only the ones that the user does not have yet.
+
+    Items are duplicates if their English and Japanese texts are the same after normalization
+    (NFKC, case-folding and collapsing whitespace), so adding the same items again creates nothing.
+    The duplicates are skipped by the database in the same statement that creates the others,
+    rather than by reading the existing items beforehand.
+
+    Args:
+        item_repository (IItemRepository): The repository of items.
+        items (Sequence[Item]): The items to add, which must have the same owner.
+
+    Raises:
+        ValueError: If a text of an item is blank or the items have different owners.
+
+    Returns:
+        ItemAdditionResult: The ids of the items and the numbers of the created and the skipped items.
+    """
+    check_item_texts(items)
+    item_ids, created_item_ids = await item_repository.add_many(items)
+    return ItemAdditionResult(
+        item_ids=item_ids,
+        num_created=len(created_item_ids),
+        num_skipped=len(items) - len(created_item_ids),
+    )
+
+
+def check_item_texts(items: Sequence[Item]) -> None:
+    """Check that none of the texts of items is blank, i.e. empty or only whitespace.
+
+    Args:
+        items (Sequence[Item]): The items to check.
+
+    Raises:
+        ValueError: If a text of an item is blank.
+    """
+    for index, item in enumerate(items):
+        if not normalize_text(item.english) or not normalize_text(item.japanese):
+            raise ValueError(
+                f"The item at index {index} should have English and Japanese texts, but one of them is blank."
+            )
@@ -0,0 +1,268 @@
+import unicodedata
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Iterator, Sequence, Sized
+from heapq import merge
+from itertools import islice
+
+from pydantic import BaseModel
+
+from src.core.config import settings
+
+from .base_item_index import SHARED_OWNER_ID, BaseItemIndex, ItemIndexEntry
+
+# Katakana are matched as the hiragana of the same sounds, e.g. "リン" suggests "りんご".
+KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(ord("ァ"), ord("ヶ") + 1)}
+# The matching items scanned for suggestions at most, which bounds the time to suggest
+# when few of them have the grades asked for.
+MAX_SCANNED_ITEMS = 1000
+
+
+def english_key(english: str) -> str:
+    """Get the key of an English word that prefixes are matched with, ignoring case.
+
+    Args:
+        english (str): The English word.
+
+    Returns:
+        str: The key.
+    """
+    return english.lower()
+
+
+def japanese_key(japanese: str) -> str:
+    """Get the key of a Japanese translation that prefixes are matched with, ignoring the kind of kana.
+
+    Half-width and full-width characters are unified by NFKC, and katakana are turned into hiragana.
+
+    Args:
+        japanese (str): The Japanese translation.
+
+    Returns:
+        str: The key.
+    """
+    return unicodedata.normalize("NFKC", japanese).translate(KATAKANA_TO_HIRAGANA)
+
+
+class ItemSuggestion(BaseModel):
+    """An item suggested for a prefix.
+
+    Attributes:
+        item_id (int): The unique identifier for the item.
+        english (str): The English word.
+        japanese (str): The Japanese translation.
+        grade (int): The grade of the item.
+    """
+
+    item_id: int
+    english: str
+    japanese: str
+    grade: int
+
+
+class TypeaheadIndex(BaseItemIndex):
+    """A process-local index of the items to suggest while a user types a word, without querying the database.
+
+    Besides the parallel arrays and the text buffer of `BaseItemIndex`, the ids of the items of
+    each owner are sorted by the keys of their English words and of their Japanese translations,
+    so the items starting with a prefix are found by a binary search. The keys are not stored but
+    derived from the texts on each comparison, so an item takes about 30 bytes besides its texts.
+    """
+
+    def clear(self) -> None:
+        """Remove all items, so that the index is loaded entirely on the next refresh."""
+        super().clear()
+        # The item ids of each owner sorted by the keys of their English words and Japanese translations.
+        self._english_orders: dict[int, array[int]] = {}
+        self._japanese_orders: dict[int, array[int]] = {}
+
+    def suggest(
+        self,
+        prefix: str,
+        user_id: int | None,
+        grades: Sequence[int] | None = None,
+        limit: int = 10,
+    ) -> list[ItemSuggestion]:
+        """Suggest the items whose English words or Japanese translations start with a prefix.
+
+        An ASCII prefix is matched with the English words ignoring case, and any other prefix with
+        the Japanese translations ignoring the kind of kana. The suggestions are ordered by the
+        matched texts, so the shortest completions come first.
+
+        Args:
+            prefix (str): The text typed so far, which is not empty.
+            user_id (int | None): The unique identifier for the user whose items and shared items
+                are suggested.
+            grades (Sequence[int] | None): The grades of the items to suggest. None means all grades.
+            limit (int): The maximum number of suggestions.
+
+        Returns:
+            list[ItemSuggestion]: The suggested items.
+        """
+        if prefix.isascii():
+            orders, key, key_of = (
+                self._english_orders,
+                english_key(prefix),
+                self._english_key,
+            )
+        else:
+            orders, key, key_of = (
+                self._japanese_orders,
+                japanese_key(prefix),
+                self._japanese_key,
+            )
+        owner_ids = {SHARED_OWNER_ID, SHARED_OWNER_ID if user_id is None else user_id}
+        matches = merge(
+            *(
+                self._scan(orders[owner_id], key, key_of)
+                for owner_id in owner_ids
+                if owner_id in orders
+            )
+        )
+        suggestions: list[ItemSuggestion] = []
+        for _, item_id in islice(matches, MAX_SCANNED_ITEMS):
+            position = bisect_left(self._ids, item_id)
+            grade = self._grades[position]
+            if grades is None or grade in grades:
+                english, japanese = self._text(position)
+                suggestions.append(
+                    ItemSuggestion.model_construct(
+                        item_id=item_id, english=english, japanese=japanese, grade=grade
+                    )
+                )
+                if len(suggestions) == limit:
+                    break
+        return suggestions
+
+    def load(self, entries: Iterable[ItemIndexEntry]) -> None:
+        """Replace the items of the index, sorting the items of each owner by their keys only once.
+
+        Args:
+            entries (Iterable[ItemIndexEntry]): The items ordered by their ids.
+        """
+        self.clear()
+        ids_by_owner: dict[int, list[int]] = {}
+        for entry in entries:
+            owner_id = SHARED_OWNER_ID if entry.user_id is None else entry.user_id
+            self._insert(len(self._ids), owner_id, entry)
+            ids_by_owner.setdefault(owner_id, []).append(entry.item_id)
+            self._update_latest(entry)
+        for owner_id, item_ids in ids_by_owner.items():
+            self._english_orders[owner_id] = array(
+                "i", sorted(item_ids, key=self._english_key)
+            )
+            self._japanese_orders[owner_id] = array(
+                "i", sorted(item_ids, key=self._japanese_key)
+            )
+
+    def upsert(self, entries: Iterable[ItemIndexEntry]) -> None:
+        """Add items to the index, or update them if they are already in the index.
+
+        Args:
+            entries (Iterable[ItemIndexEntry]): The items to add or update.
+        """
+        for entry in entries:
+            owner_id = SHARED_OWNER_ID if entry.user_id is None else entry.user_id
+            position = bisect_left(self._ids, entry.item_id)
+            if position < len(self._ids) and self._ids[position] == entry.item_id:
+                # Items updated within the overlap are read again, so replace only changed items.
+                old_item = (
+                    self._owner_ids[position],
+                    self._grades[position],
+                    self._text(position),
+                )
+                if old_item == (owner_id, entry.grade, (entry.english, entry.japanese)):
+                    continue
+                # Remove the item from the orders by its old keys before replacing its texts.
+                self._remove_from_orders(self._owner_ids[position], entry.item_id)
+                self._owner_ids[position] = owner_id
+                self._grades[position] = entry.grade
+                self._set_text(position, entry)
+            else:
+                self._insert(position, owner_id, entry)
+            insort(
+                self._english_orders.setdefault(owner_id, array("i")),
+                entry.item_id,
+                key=self._english_key,
+            )
+            insort(
+                self._japanese_orders.setdefault(owner_id, array("i")),
+                entry.item_id,
+                key=self._japanese_key,
+            )
+            self._update_latest(entry)
+
+    def _arrays(self) -> list[Sized]:
+        """List the arrays and the buffers of the index to estimate its memory by.
+
+        Returns:
+            list[Sized]: The arrays, the buffer and the orders of the index.
+        """
+        return [
+            *super()._arrays(),
+            *self._english_orders.values(),
+            *self._japanese_orders.values(),
+        ]
+
+    def _scan(
+        self, order: "array[int]", prefix: str, key_of: Callable[[int], str]
+    ) -> Iterator[tuple[str, int]]:
+        """Scan the items starting with a prefix in an order of items.
+
+        Args:
+            order (array[int]): The item ids sorted by their keys.
+            prefix (str): The key prefix.
+            key_of (Callable[[int], str]): The function that gets the key of an item by its id.
+
+        Yields:
+            tuple[str, int]: The key and the id of the next matching item, in the order of the keys.
+        """
+        for position in range(bisect_left(order, prefix, key=key_of), len(order)):
+            item_id = order[position]
+            key = key_of(item_id)
+            if not key.startswith(prefix):
+                return
+            yield key, item_id
+
+    def _remove_from_orders(self, owner_id: int, item_id: int) -> None:
+        """Remove an item from the orders of its owner by its current keys.
+
+        Args:
+            owner_id (int): The unique identifier for the owner, or `SHARED_OWNER_ID`.
+            item_id (int): The unique identifier for the item.
+        """
+        for order, key_of in (
+            (self._english_orders[owner_id], self._english_key),
+            (self._japanese_orders[owner_id], self._japanese_key),
+        ):
+            # Skip the items with the same key that come before the item.
+            position = bisect_left(order, key_of(item_id), key=key_of)
+            while order[position] != item_id:
+                position += 1
+            del order[position]
+
+    def _english_key(self, item_id: int) -> str:
+        """Get the key of the English word of an item in the index.
+
+        Args:
+            item_id (int): The unique identifier for the item.
+
+        Returns:
+            str: The key.
+        """
+        return english_key(self._text(bisect_left(self._ids, item_id))[0])
+
+    def _japanese_key(self, item_id: int) -> str:
+        """Get the key of the Japanese translation of an item in the index.
+
+        Args:
+            item_id (int): The unique identifier for the item.
+
+        Returns:
+            str: The key.
+        """
+        return japanese_key(self._text(bisect_left(self._ids, item_id))[1])
+
+
+# The index shared by the requests handled by this process.
+typeahead_index = TypeaheadIndex(settings.TYPEAHEAD_INDEX_REFRESH_SECONDS)
@@ -0,0 +1,158 @@
+import asyncio
+import csv
+import time
+from collections.abc import Callable, Iterator
+from typing import TextIO
+
+from pydantic import BaseModel
+
+from src.db.repositories.item_repository_interface import IItemRepository
+from src.domain.models import Item
+
+# The default number of items loaded into the database at once.
+DEFAULT_CHUNK_SIZE = 10000
+# The columns that a word list must have. Other columns (e.g. `id`) are ignored.
+REQUIRED_COLUMNS = ("english", "japanese", "grade")
+
+
+class WordListImportResult(BaseModel):
+    """The statistics of a word list import.
+
+    Attributes:
+        num_items (int): The number of items imported so far.
+        elapsed_seconds (float): The time elapsed since the import started.
+        items_per_second (float): The throughput of the import.
+    """
+
+    num_items: int
+    elapsed_seconds: float
+    items_per_second: float
+
+
+def read_word_list(
+    stream: TextIO, user_id: int | None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[Item]]:
+    """Read a CSV/TSV word list with a header row in chunks of items.
+
+    The delimiter is detected from the header row, so both comma-separated and
+    tab-separated word lists are accepted.
+
+    Args:
+        stream (TextIO): The text stream of the word list.
+        user_id (int | None): The unique identifier for the user who owns the items.
+        chunk_size (int): The maximum number of items in a chunk.
+
+    Raises:
+        ValueError: If the header lacks a required column or a row is malformed.
+
+    Yields:
+        list[Item]: The next chunk of items.
+    """
+    header_line = stream.readline()
+    delimiter = "\t" if "\t" in header_line else ","
+    header = [
+        column.strip().lower()
+        for column in next(csv.reader([header_line], delimiter=delimiter), [])
+    ]
+    missing_columns = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing_columns:
+        raise ValueError(
+            f"The word list should have the columns {list(REQUIRED_COLUMNS)} in its header, \
+            but {missing_columns} are missing."
+        )
+    english_index, japanese_index, grade_index = (
+        header.index(column) for column in REQUIRED_COLUMNS
+    )
+
+    chunk: list[Item] = []
+    # The header is the first line, so the data rows start from the second line.
+    for line_number, row in enumerate(csv.reader(stream, delimiter=delimiter), 2):
+        # Skip blank lines.
+        if not row:
+            continue
+        try:
+            chunk.append(
+                Item(
+                    user_id=user_id,
+                    english=row[english_index].strip(),
+                    japanese=row[japanese_index].strip(),
+                    grade=int(row[grade_index]),
+                )
+            )
+        except (IndexError, ValueError) as e:
+            raise ValueError(
+                f"Line {line_number} of the word list is malformed."
+            ) from e
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def import_word_list(
+    item_repository: IItemRepository,
+    stream: TextIO,
+    user_id: int | None,
+    deck_id: int | None = None,
+    genre_id: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_progress: Callable[[WordListImportResult], None] | None = None,
+) -> WordListImportResult:
+    """Import a CSV/TSV word list of arbitrary size into the database.
+
+    The word list is streamed in chunks, each of which is loaded into the database in bulk,
+    so the memory usage does not depend on the size of the word list. Parsing runs in a
+    worker thread so as not to block the event loop.
+
+    Each chunk is committed in its own transaction, so the chunks loaded before an error
+    (e.g. a malformed line late in the word list) stay imported; `on_progress` tells how many.
+    The duplicates of existing items are skipped, so the corrected word list can simply be
+    imported again as a whole.
+
+    Args:
+        item_repository (IItemRepository): The repository to load the items with.
+        stream (TextIO): The text stream of the word list.
+        user_id (int | None): The unique identifier for the user who owns the items.
+        deck_id (int | None): The unique identifier for the deck to add the items to, if any.
+        genre_id (int | None): The unique identifier for the genre to tag the items with, if any.
+        chunk_size (int): The maximum number of items loaded into the database at once.
+        on_progress (Callable[[WordListImportResult], None] | None): The callback called
+            with the statistics so far after each chunk is loaded.
+
+    Raises:
+        ValueError: If the word list is malformed, or the deck or the genre does not exist.
+
+    Returns:
+        WordListImportResult: The statistics of the import.
+    """
+    start_time = time.perf_counter()
+    num_items = 0
+    chunks = read_word_list(stream, user_id, chunk_size)
+    while True:
+        chunk = await asyncio.to_thread(next, chunks, None)
+        if chunk is None:
+            break
+        await item_repository.copy_many(chunk, deck_id=deck_id, genre_id=genre_id)
+        num_items += len(chunk)
+        if on_progress is not None:
+            on_progress(_make_result(num_items, start_time))
+    return _make_result(num_items, start_time)
+
+
+def _make_result(num_items: int, start_time: float) -> WordListImportResult:
+    """Make the statistics of an import.
+
+    Args:
+        num_items (int): The number of items imported so far.
+        start_time (float): The value of `time.perf_counter()` when the import started.
+
+    Returns:
+        WordListImportResult: The statistics of the import.
+    """
+    elapsed_seconds = time.perf_counter() - start_time
+    return WordListImportResult(
+        num_items=num_items,
+        elapsed_seconds=elapsed_seconds,
+        items_per_second=num_items / elapsed_seconds if elapsed_seconds > 0 else 0.0,
+    )
@@ -0,0 +1,336 @@
+import random
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from collections.abc import Iterable, Sequence, Sized
+from heapq import nlargest
+from itertools import accumulate
+from operator import itemgetter
+
+from pydantic import BaseModel
+
+from src.core.config import settings
+from src.db.repositories.item_repository_interface import IItemRepository
+from src.domain.models.item_model import normalize_text
+from src.domain.services.item_service.base_item_index import (
+    SHARED_OWNER_ID,
+    BaseItemIndex,
+    ItemIndexEntry,
+)
+
+# The n-grams shared by more items of a grade than this are too common to tell similar items apart,
+# so they are not counted when looking for similar items, which also bounds the time to look.
+MAX_POSTINGS = 2000
+# The number of items sharing the most n-grams with an item that are scored as similar items.
+SIMILAR_CANDIDATES_PER_ITEM = 20
+
+
+def ngrams(english: str, japanese: str) -> set[str]:
+    """Split an item into the character n-grams compared to find similar items.
+
+    The English word is split into trigrams of its lowercase letters padded with spaces, so that
+    words sharing a prefix or a suffix are similar, and the Japanese translation into bigrams,
+    since a few kana or kanji already carry as much as an English trigram.
+
+    Args:
+        english (str): The English word.
+        japanese (str): The Japanese translation.
+
+    Returns:
+        set[str]: The n-grams of the item.
+    """
+    padded = f" {' '.join(english.lower().split())} "
+    grams = {padded[i : i + 3] for i in range(len(padded) - 2)}
+    japanese = "".join(japanese.split())
+    if len(japanese) == 1:
+        grams.add(japanese)
+    grams.update(japanese[i : i + 2] for i in range(len(japanese) - 1))
+    return grams
+
+
+class ItemIdProjection(BaseModel):
+    """The id column of an item.
+
+    Attributes:
+        item_id (int): The unique identifier for the item.
+    """
+
+    item_id: int
+
+
+class ItemIndex(BaseItemIndex):
+    """A process-local index of the items to sample quiz choices from without querying the database.
+
+    Besides the parallel arrays and the text buffer of `BaseItemIndex`, the ids are grouped by
+    owner and grade, and by deck, in sorted arrays to sample from, and by grade and character
+    n-gram to find similar items in. The latter form a sparse item-by-n-gram matrix stored by
+    column, so only the columns of the n-grams of an item are read to find similar items.
+    The items of a deck are loaded on the first request for the deck and then at most once per
+    `refresh_seconds` like the items.
+    """
+
+    def clear(self) -> None:
+        """Remove all items, so that the index is loaded entirely on the next refresh."""
+        super().clear()
+        self._ngram_counts = array("h")
+        # The sorted item ids grouped by owner and grade, and by deck and grade with the time of loading.
+        self._ids_by_owner: dict[int, dict[int, array[int]]] = {}
+        self._ids_by_deck: dict[int, tuple[float, dict[int, array[int]]]] = {}
+        # The sorted item ids grouped by grade and n-gram. Item ids are 32-bit integer columns.
+        self._postings: dict[int, dict[str, array[int]]] = {}
+
+    def expire(self) -> None:
+        """Make the next refresh read the updated items and the decks regardless of the interval."""
+        super().expire()
+        self._ids_by_deck.clear()
+
+    async def refresh(
+        self, item_repository: IItemRepository, deck_id: int | None = None
+    ) -> bool:
+        """Refresh the index if the refresh interval has passed since the previous refresh.
+
+        The items are refreshed as by `BaseItemIndex.refresh`, and then the deck, if any.
+
+        Args:
+            item_repository (IItemRepository): The repository to read the items with.
+            deck_id (int | None): The unique identifier for the deck to load the items of, if any.
+
+        Returns:
+            bool: Whether the index can be sampled from, i.e. the items and the deck, if any, are loaded.
+        """
+        if self._lock.locked():
+            return self._latest_updated_at is not None and (
+                deck_id is None or deck_id in self._ids_by_deck
+            )
+        async with self._lock:
+            now = await self._refresh_if_due(item_repository)
+            if deck_id is not None:
+                loaded = self._ids_by_deck.get(deck_id)
+                if loaded is None or now - loaded[0] >= self.refresh_seconds:
+                    projections = await item_repository.read_projected_by_deck_id(
+                        ItemIdProjection, deck_id
+                    )
+                    ids_by_grade: dict[int, array[int]] = {}
+                    for projection in projections:
+                        # Items added since the refresh above are left out until the next one.
+                        position = self._find(projection.item_id)
+                        if position is not None:
+                            grade = self._grades[position]
+                            ids_by_grade.setdefault(grade, array("q")).append(
+                                projection.item_id
+                            )
+                    self._ids_by_deck[deck_id] = (now, ids_by_grade)
+        return True
+
+    def sample(
+        self,
+        num_items: int,
+        user_id: int | None,
+        deck_id: int | None = None,
+        grades: Sequence[int] | None = None,
+        rng: random.Random | None = None,
+    ) -> list[int]:
+        """Choose distinct items at random in time proportional to the number of items chosen.
+
+        Args:
+            num_items (int): The maximum number of items to choose.
+            user_id (int | None): The unique identifier for the user whose items and shared items
+                are chosen from. Ignored if `deck_id` is given.
+            deck_id (int | None): The unique identifier for the deck whose items are chosen from,
+                if any. The deck must have been loaded by `refresh`.
+            grades (Sequence[int] | None): The grades of the items to choose from. None means all grades.
+            rng (random.Random | None): The random number generator. None means the global one.
+
+        Returns:
+            list[int]: The ids of the items in random order, fewer than `num_items` if there are not enough.
+        """
+        if deck_id is not None:
+            groups = [
+                ids
+                for grade, ids in self._ids_by_deck[deck_id][1].items()
+                if grades is None or grade in grades
+            ]
+        else:
+            owner_ids = {
+                SHARED_OWNER_ID,
+                SHARED_OWNER_ID if user_id is None else user_id,
+            }
+            groups = [
+                ids
+                for owner_id in owner_ids
+                for grade, ids in self._ids_by_owner.get(owner_id, {}).items()
+                if grades is None or grade in grades
+            ]
+        # Draw distinct positions in the concatenation of the groups and map them back to the groups.
+        group_ends = list(accumulate(len(group) for group in groups))
+        total = group_ends[-1] if group_ends else 0
+        positions = (rng or random).sample(range(total), min(num_items, total))
+        item_ids = []
+        for position in positions:
+            group_index = bisect_right(group_ends, position)
+            group_start = group_ends[group_index - 1] if group_index > 0 else 0
+            item_ids.append(groups[group_index][position - group_start])
+        return item_ids
+
+    def similar(self, item_id: int, num_items: int, user_id: int | None) -> list[int]:
+        """Find the items of the same grade most similar to an item by their character n-grams.
+
+        The similarity is the Dice coefficient of the n-gram sets of the two items. Only the items
+        sharing the most n-grams with the item are scored, and n-grams too common to tell items
+        apart are ignored, so the time does not grow with the number of items of the grade.
+        The items with the same Japanese translation as the item after normalization are not
+        similar but synonyms, which would be indistinguishable as choices, so they are left out.
+
+        Args:
+            item_id (int): The unique identifier for the item to find similar items to.
+            num_items (int): The maximum number of similar items.
+            user_id (int | None): The unique identifier for the user whose items and shared items
+                are found.
+
+        Returns:
+            list[int]: The ids of the similar items, most similar first. Empty if the item is not
+                in the index, e.g. before it is loaded.
+        """
+        position = self._find(item_id)
+        if position is None:
+            return []
+        english, japanese = self._text(position)
+        grams = ngrams(english, japanese)
+        normalized_japanese = normalize_text(japanese)
+        postings_of_grade = self._postings.get(self._grades[position], {})
+        shared_counts: Counter[int] = Counter()
+        for gram in grams:
+            postings = postings_of_grade.get(gram)
+            if postings is not None and len(postings) <= MAX_POSTINGS:
+                shared_counts.update(postings)
+        del shared_counts[item_id]
+
+        owner_ids = {SHARED_OWNER_ID, SHARED_OWNER_ID if user_id is None else user_id}
+        scored_ids = []
+        for candidate_id, shared_count in nlargest(
+            num_items * SIMILAR_CANDIDATES_PER_ITEM,
+            shared_counts.items(),
+            key=itemgetter(1),
+        ):
+            candidate_position = self._find(candidate_id)
+            if (
+                candidate_position is not None
+                and self._owner_ids[candidate_position] in owner_ids
+                and normalize_text(self._text(candidate_position)[1])
+                != normalized_japanese
+            ):
+                num_grams = len(grams) + self._ngram_counts[candidate_position]
+                scored_ids.append((2 * shared_count / num_grams, candidate_id))
+        return [id for _, id in nlargest(num_items, scored_ids)]
+
+    def gloss(self, item_id: int) -> str:
+        """Get the Japanese translation of an item in the index.
+
+        Args:
+            item_id (int): The unique identifier for the item.
+
+        Raises:
+            KeyError: If the item is not in the index.
+
+        Returns:
+            str: The Japanese translation of the item.
+        """
+        position = self._find(item_id)
+        if position is None:
+            raise KeyError(item_id)
+        return self._text(position)[1]
+
+    def upsert(self, entries: Iterable[ItemIndexEntry]) -> None:
+        """Add items to the index, or update them if they are already in the index.
+
+        Args:
+            entries (Iterable[ItemIndexEntry]): The items to add or update.
+        """
+        for entry in entries:
+            owner_id = SHARED_OWNER_ID if entry.user_id is None else entry.user_id
+            position = bisect_left(self._ids, entry.item_id)
+            if position < len(self._ids) and self._ids[position] == entry.item_id:
+                old_owner_id = self._owner_ids[position]
+                old_grade = self._grades[position]
+                old_text = self._text(position)
+                if (old_owner_id, old_grade) != (owner_id, entry.grade):
+                    group = self._ids_by_owner[old_owner_id][old_grade]
+                    del group[bisect_left(group, entry.item_id)]
+                    insort(self._group(owner_id, entry.grade), entry.item_id)
+                    self._owner_ids[position] = owner_id
+                    self._grades[position] = entry.grade
+                # Items updated within the overlap are read again, so replace only changed texts.
+                new_text = (entry.english, entry.japanese)
+                if (old_grade, old_text) != (entry.grade, new_text):
+                    for gram in ngrams(*old_text):
+                        postings = self._postings[old_grade][gram]
+                        del postings[bisect_left(postings, entry.item_id)]
+                    self._set_text(position, entry)
+            else:
+                self._ngram_counts.insert(position, 0)
+                self._insert(position, owner_id, entry)
+                insort(self._group(owner_id, entry.grade), entry.item_id)
+            self._update_latest(entry)
+
+    def _arrays(self) -> list[Sized]:
+        """List the arrays and the buffers of the index to estimate its memory by.
+
+        Returns:
+            list[Sized]: The arrays, the buffer and the n-grams of the index.
+        """
+        return [
+            *super()._arrays(),
+            self._ngram_counts,
+            *(
+                ids
+                for ids_by_grade in self._ids_by_owner.values()
+                for ids in ids_by_grade.values()
+            ),
+            *(
+                ids
+                for _, ids_by_grade in self._ids_by_deck.values()
+                for ids in ids_by_grade.values()
+            ),
+            *self._postings.values(),
+            *(
+                value
+                for postings_of_grade in self._postings.values()
+                for gram_and_postings in postings_of_grade.items()
+                for value in gram_and_postings
+            ),
+        ]
+
+    def _group(self, owner_id: int, grade: int) -> "array[int]":
+        """Get the sorted item ids of an owner and a grade, creating them if missing.
+
+        Args:
+            owner_id (int): The unique identifier for the owner, or `SHARED_OWNER_ID`.
+            grade (int): The grade.
+
+        Returns:
+            array[int]: The sorted item ids.
+        """
+        return self._ids_by_owner.setdefault(owner_id, {}).setdefault(grade, array("q"))
+
+    def _set_text(self, position: int, entry: ItemIndexEntry) -> None:
+        """Append the texts of an item to the buffer, point the item at them and index their n-grams.
+
+        The previous texts are left in the buffer until the index is reloaded entirely.
+
+        Args:
+            position (int): The position of the item in the parallel arrays.
+            entry (ItemIndexEntry): The item.
+        """
+        super()._set_text(position, entry)
+        grams = ngrams(entry.english, entry.japanese)
+        self._ngram_counts[position] = len(grams)
+        postings_of_grade = self._postings.setdefault(entry.grade, {})
+        for gram in grams:
+            postings = postings_of_grade.get(gram)
+            if postings is None:
+                postings = postings_of_grade[gram] = array("i")
+            insort(postings, entry.item_id)
+
+
+# The index shared by the requests handled by this process.
+item_index = ItemIndex(settings.ITEM_INDEX_REFRESH_SECONDS)
@@ -0,0 +1,285 @@
+import random
+from collections.abc import Sequence
+from datetime import datetime
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from src.db.repositories.item_repository_interface import IItemRepository
+from src.db.repositories.quiz_repository_interface import IQuizRepository
+from src.db.repositories.review_state_repository_interface import (
+    IReviewStateRepository,
+)
+from src.domain.models import Item, Quiz, QuizItem
+from src.domain.models.item_model import normalize_text
+from src.domain.services.quiz_service.item_index import ItemIndex
+
+# The type of the quizzes that ask for the Japanese translation of an English word.
+MULTIPLE_CHOICE_QUIZ_TYPE = "multiple_choice"
+# The default number of choices of a question, including the correct one.
+DEFAULT_NUM_CHOICES = 4
+
+ChoiceType = TypeVar("ChoiceType")
+
+
+class GeneratedQuestion(BaseModel):
+    """A question of a generated quiz.
+
+    Attributes:
+        quiz_item (QuizItem): The quiz item stored for the question.
+        question (Item): The item asked for.
+        choices (list[str]): The Japanese translations of the choices, including the correct one.
+    """
+
+    quiz_item: QuizItem
+    question: Item
+    choices: list[str]
+
+
+class GeneratedQuiz(BaseModel):
+    """A generated quiz.
+
+    Attributes:
+        quiz (Quiz): The quiz stored for the quiz.
+        questions (list[GeneratedQuestion]): The questions of the quiz, ordered by their numbers.
+    """
+
+    quiz: Quiz
+    questions: list[GeneratedQuestion]
+
+
+def assign_choices(
+    items: Sequence[ChoiceType],
+    num_questions: int,
+    num_choices: int = DEFAULT_NUM_CHOICES,
+    rng: random.Random | None = None,
+) -> list[tuple[ChoiceType, list[ChoiceType], int]]:
+    """Make questions out of items in random order, using the other items as distractors.
+
+    If there are enough items, the first `num_questions` items are the questions and the rest
+    are split into disjoint sets of distractors, so no choice appears twice in a quiz.
+    Otherwise, the distractors of each question are sampled from all the other items.
+
+    Args:
+        items (Sequence[ChoiceType]): The distinct items, or their ids, in random order.
+        num_questions (int): The maximum number of questions.
+        num_choices (int): The number of choices of each question, including the correct one.
+        rng (random.Random | None): The random number generator. None means the global one.
+
+    Raises:
+        ValueError: If there are fewer items than the choices of a question.
+
+    Returns:
+        list[tuple[ChoiceType, list[ChoiceType], int]]: The item asked for, the items of the choices
+            and the index of the correct choice of each question.
+    """
+    if len(items) < num_choices:
+        raise ValueError(
+            f"A quiz with {num_choices} choices per question needs at least {num_choices} items, \
+            but only {len(items)} items are available."
+        )
+    rng = rng or random.Random()
+    num_questions = min(num_questions, len(items))
+    num_distractors = num_choices - 1
+    disjoint = len(items) >= num_questions * num_choices
+
+    questions = []
+    for question_index, item in enumerate(items[:num_questions]):
+        if disjoint:
+            start = num_questions + question_index * num_distractors
+            distractors = list(items[start : start + num_distractors])
+        else:
+            others = [*items[:question_index], *items[question_index + 1 :]]
+            distractors = rng.sample(others, num_distractors)
+        correct_answer = rng.randrange(num_choices)
+        distractors.insert(correct_answer, item)
+        questions.append((item, distractors, correct_answer))
+    return questions
+
+
+def replace_with_similar_distractors(
+    item_index: ItemIndex,
+    questions: Sequence[tuple[int, list[int], int]],
+    user_id: int,
+) -> list[tuple[int, list[int], int]]:
+    """Replace the random distractors of questions with the items most similar to the questions.
+
+    The random distractors are kept for the questions with too few similar items,
+    e.g. while the index is cold. The choices of a question have distinct Japanese translations
+    after normalization, so that no two of them look the same, unless there are too few
+    random distractors to make up for the repeated ones.
+
+    Args:
+        item_index (ItemIndex): The index to find the similar items in.
+        questions (Sequence[tuple[int, list[int], int]]): The item ids asked for, the item ids of
+            the choices and the index of the correct choice of each question, from `assign_choices`.
+        user_id (int): The unique identifier for the user whose items and shared items are the distractors.
+
+    Returns:
+        list[tuple[int, list[int], int]]: The questions with the similar distractors.
+    """
+    replaced_questions = []
+    for item_id, choice_ids, correct_answer in questions:
+        num_distractors = len(choice_ids) - 1
+        random_ids = [choice_id for choice_id in choice_ids if choice_id != item_id]
+        seen_glosses = {normalize_text(item_index.gloss(item_id))}
+        distractor_ids: list[int] = []
+        for candidate_id in [
+            *item_index.similar(item_id, num_distractors, user_id),
+            *random_ids,
+        ]:
+            gloss = normalize_text(item_index.gloss(candidate_id))
+            if candidate_id not in distractor_ids and gloss not in seen_glosses:
+                distractor_ids.append(candidate_id)
+                seen_glosses.add(gloss)
+        # Fall back on the random distractors with repeated translations if there are too few others.
+        distractor_ids += [
+            random_id for random_id in random_ids if random_id not in distractor_ids
+        ]
+        distractor_ids = distractor_ids[:num_distractors]
+        distractor_ids.insert(correct_answer, item_id)
+        replaced_questions.append((item_id, distractor_ids, correct_answer))
+    return replaced_questions
+
+
+async def generate_quiz(
+    item_repository: IItemRepository,
+    quiz_repository: IQuizRepository,
+    user_id: int,
+    num_questions: int,
+    deck_id: int | None = None,
+    grades: Sequence[int] | None = None,
+    num_choices: int = DEFAULT_NUM_CHOICES,
+    rng: random.Random | None = None,
+    item_index: ItemIndex | None = None,
+    similar_distractors: bool = False,
+    review_state_repository: IReviewStateRepository | None = None,
+) -> GeneratedQuiz:
+    """Generate a multiple-choice quiz and store it.
+
+    The questions and the distractors of the whole quiz are sampled by a single query, or from
+    the item index without a query if it is given, and the quiz and its quiz items are stored by
+    a single round trip per table, so the number of queries does not depend on the number of questions.
+    If the review states are given, the items due to be reviewed are asked first, which takes
+    one more query, and the sampled items fill the rest of the questions.
+
+    Args:
+        item_repository (IItemRepository): The repository to sample the items with.
+        quiz_repository (IQuizRepository): The repository to store the quiz with.
+        user_id (int): The unique identifier for the user who takes the quiz.
+        num_questions (int): The maximum number of questions.
+        deck_id (int | None): The unique identifier for the deck to ask about, if any.
+            Otherwise, the items of the user and the shared items are asked about.
+        grades (Sequence[int] | None): The grades of the items to ask about. None means all grades.
+        num_choices (int): The number of choices of each question, including the correct one.
+        rng (random.Random | None): The random number generator. None means the global one.
+        item_index (ItemIndex | None): The index to sample the items from, if any.
+            Only the items asked for are read from the database then, unless the index is cold.
+        similar_distractors (bool): Whether the distractors are the items of the same grade most
+            similar to the question instead of random ones. It takes effect only with a warm
+            `item_index`, and the distractors may then be outside the deck.
+        review_state_repository (IReviewStateRepository | None): The repository to read the items
+            due to be reviewed with, if any.
+
+    Raises:
+        ValueError: If there are fewer items than the choices of a question.
+
+    Returns:
+        GeneratedQuiz: The stored quiz with its questions.
+    """
+    if item_index is not None and not await item_index.refresh(
+        item_repository, deck_id
+    ):
+        # Sample with a query while the index is loaded by another request.
+        item_index = None
+    due_item_ids: list[int] = []
+    if review_state_repository is not None:
+        due_item_ids = [
+            review_state.item_id
+            for review_state in await review_state_repository.read_due(
+                user_id, datetime.now(), num_questions, deck_id=deck_id, grades=grades
+            )
+        ]
+    questions: list[tuple[Item, list[str], list[int], int]]
+    if item_index is None:
+        items = await item_repository.read_many(due_item_ids)
+        items += [
+            item
+            for item in await item_repository.sample(
+                num_questions * num_choices, user_id, deck_id=deck_id, grades=grades
+            )
+            if item.item_id not in due_item_ids
+        ]
+        questions = [
+            (
+                item,
+                [choice.japanese for choice in choices],
+                [choice.item_id for choice in choices],  # type: ignore
+                correct_answer,
+            )
+            for item, choices, correct_answer in assign_choices(
+                items, num_questions, num_choices, rng
+            )
+        ]
+    else:
+        # The choices are glossed from the index, so the items due but not loaded yet are not asked.
+        item_ids = [item_id for item_id in due_item_ids if item_id in item_index]
+        item_ids += [
+            item_id
+            for item_id in item_index.sample(
+                num_questions * num_choices,
+                user_id,
+                deck_id=deck_id,
+                grades=grades,
+                rng=rng,
+            )
+            if item_id not in due_item_ids
+        ]
+        id_questions = assign_choices(item_ids, num_questions, num_choices, rng)
+        if similar_distractors:
+            id_questions = replace_with_similar_distractors(
+                item_index, id_questions, user_id
+            )
+        # Items deleted since the last refresh of the index are not read, and not asked about.
+        items_by_id = {
+            item.item_id: item
+            for item in await item_repository.read_many(
+                [item_id for item_id, _, _ in id_questions], missing_ok=True
+            )
+        }
+        questions = [
+            (
+                items_by_id[item_id],
+                [item_index.gloss(choice_id) for choice_id in choice_ids],
+                choice_ids,
+                correct_answer,
+            )
+            for item_id, choice_ids, correct_answer in id_questions
+            if item_id in items_by_id
+        ]
+    quiz, quiz_items = await quiz_repository.create_with_items(
+        Quiz(
+            user_id=user_id,
+            deck_id=deck_id,
+            quiz_type=MULTIPLE_CHOICE_QUIZ_TYPE,
+            quiz_timestamp=datetime.now(),
+        ),
+        [
+            QuizItem(
+                item_id=item.item_id,
+                question_number=question_number,
+                choice_item_ids=choice_ids,
+                correct_answer=correct_answer,
+            )
+            for question_number, (item, _, choice_ids, correct_answer) in enumerate(
+                questions, 1
+            )
+        ],
+    )
+    return GeneratedQuiz(
+        quiz=quiz,
+        questions=[
+            GeneratedQuestion(quiz_item=quiz_item, question=item, choices=choices)
+            for quiz_item, (item, choices, _, _) in zip(quiz_items, questions)
+        ],
+    )
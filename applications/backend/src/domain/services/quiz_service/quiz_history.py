@@ -0,0 +1,85 @@
+from collections.abc import Iterable
+from datetime import date
+
+from pydantic import BaseModel
+
+from src.domain.models import QuizStat
+
+
+class QuizStatsTotal(BaseModel):
+    """The answers of a user summed over some statistics.
+
+    Attributes:
+        attempts (int): The number of questions answered.
+        correct (int): The number of questions answered correctly.
+        total_answer_time (int): The total time (in seconds) taken to answer the questions.
+    """
+
+    attempts: int = 0
+    correct: int = 0
+    total_answer_time: int = 0
+
+    @property
+    def accuracy(self) -> float:
+        """The ratio of the questions answered correctly.
+
+        Returns:
+            float: The accuracy, or 0 if no question is answered.
+        """
+        return self.correct / self.attempts if self.attempts else 0.0
+
+    @property
+    def average_answer_time(self) -> float:
+        """The average time (in seconds) taken to answer a question.
+
+        Returns:
+            float: The average answer time, or 0 if no question is answered.
+        """
+        return self.total_answer_time / self.attempts if self.attempts else 0.0
+
+    def add(self, quiz_stat: QuizStat) -> None:
+        """Add statistics to the total.
+
+        Args:
+            quiz_stat (QuizStat): The statistics.
+        """
+        self.attempts += quiz_stat.attempts
+        self.correct += quiz_stat.correct
+        self.total_answer_time += quiz_stat.total_answer_time
+
+
+class QuizStatsSummary(BaseModel):
+    """The answers of a user summed in total, by grade and by day.
+
+    Attributes:
+        total (QuizStatsTotal): The sum of all the statistics.
+        by_grade (dict[int, QuizStatsTotal]): The sums by grade, ordered by grade.
+        by_day (dict[date, QuizStatsTotal]): The sums by day, ordered by day.
+    """
+
+    total: QuizStatsTotal
+    by_grade: dict[int, QuizStatsTotal]
+    by_day: dict[date, QuizStatsTotal]
+
+
+def summarize_quiz_stats(quiz_stats: Iterable[QuizStat]) -> QuizStatsSummary:
+    """Sum the statistics of a user in total, by grade and by day in a single pass.
+
+    Args:
+        quiz_stats (Iterable[QuizStat]): The statistics by grade and day.
+
+    Returns:
+        QuizStatsSummary: The sums.
+    """
+    total = QuizStatsTotal()
+    by_grade: dict[int, QuizStatsTotal] = {}
+    by_day: dict[date, QuizStatsTotal] = {}
+    for quiz_stat in quiz_stats:
+        total.add(quiz_stat)
+        by_grade.setdefault(quiz_stat.grade, QuizStatsTotal()).add(quiz_stat)
+        by_day.setdefault(quiz_stat.day, QuizStatsTotal()).add(quiz_stat)
+    return QuizStatsSummary(
+        total=total,
+        by_grade=dict(sorted(by_grade.items())),
+        by_day=dict(sorted(by_day.items())),
+    )
@@ -0,0 +1,98 @@
+from collections.abc import Iterable, Sequence
+
+from pydantic import BaseModel
+
+from src.db.repositories.item_repository_interface import IItemRepository
+from src.domain.models import QuizItem
+
+
+class QuizAnswer(BaseModel):
+    """The answer of a user to a question of a quiz.
+
+    Attributes:
+        question_number (int): The number of the question in the quiz.
+        user_answer (int): The index of the choice the user answered.
+        answer_time (int): The time taken by the user to answer the question.
+    """
+
+    question_number: int
+    user_answer: int
+    answer_time: int
+
+
+def grade_answers(
+    quiz_items: Sequence[QuizItem], answers: Iterable[QuizAnswer]
+) -> list[QuizItem]:
+    """Grade the answers to all the questions of a quiz in a single pass.
+
+    Args:
+        quiz_items (Sequence[QuizItem]): The quiz items of the quiz, none of which is answered yet.
+        answers (Iterable[QuizAnswer]): The answers, one to each question of the quiz in any order.
+
+    Raises:
+        ValueError: If an answer is not to a question of the quiz, a question is answered twice or
+            not at all, or an answer is not the index of a choice.
+
+    Returns:
+        list[QuizItem]: The quiz items with the answers set, ordered by their question numbers.
+            Whether an answer is correct is told by comparing it with the correct answer.
+    """
+    quiz_item_by_number = {
+        quiz_item.question_number: quiz_item for quiz_item in quiz_items
+    }
+    answered_items: dict[int, QuizItem] = {}
+    for answer in answers:
+        quiz_item = quiz_item_by_number.get(answer.question_number)
+        if quiz_item is None:
+            raise ValueError(
+                f"The quiz has no question number {answer.question_number}."
+            )
+        if answer.question_number in answered_items:
+            raise ValueError(
+                f"The question number {answer.question_number} is answered twice."
+            )
+        if not 0 <= answer.user_answer < len(quiz_item.choice_item_ids):
+            raise ValueError(
+                f"The answer to the question number {answer.question_number} should be the index \
+                of one of its {len(quiz_item.choice_item_ids)} choices, but it is {answer.user_answer}."
+            )
+        answered_items[answer.question_number] = quiz_item.model_copy(
+            update={
+                "user_answer": answer.user_answer,
+                "answer_time": answer.answer_time,
+            }
+        )
+    unanswered_numbers = sorted(quiz_item_by_number.keys() - answered_items.keys())
+    if unanswered_numbers:
+        raise ValueError(
+            f"All the questions should be answered, but the question numbers {unanswered_numbers} are not."
+        )
+    return [answered_items[number] for number in sorted(answered_items)]
+
+
+async def read_choices(
+    item_repo: IItemRepository, quiz_items: Sequence[QuizItem]
+) -> dict[int, list[str]]:
+    """Read the Japanese translations of the choices of quiz items by a single query.
+
+    This is needed only if the quiz session, which holds the choices, has expired.
+
+    Args:
+        item_repo (IItemRepository): The item repository.
+        quiz_items (Sequence[QuizItem]): The quiz items.
+
+    Returns:
+        dict[int, list[str]]: The choices of each quiz item by its question number. The choices
+            whose items have been deleted since the quiz was taken are empty.
+    """
+    item_ids = list(
+        {id for quiz_item in quiz_items for id in quiz_item.choice_item_ids}
+    )
+    items = await item_repo.read_many(item_ids, missing_ok=True)
+    japanese_by_id = {item.item_id: item.japanese for item in items}
+    return {
+        quiz_item.question_number: [
+            japanese_by_id.get(id, "") for id in quiz_item.choice_item_ids
+        ]
+        for quiz_item in quiz_items
+    }
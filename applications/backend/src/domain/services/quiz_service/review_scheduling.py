@@ -0,0 +1,155 @@
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from src.db.repositories.review_state_repository_interface import (
+    IReviewStateRepository,
+)
+from src.domain.models import QuizItem, ReviewState
+
+# The ease of an item never reviewed, and the lowest ease, of SM-2.
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+# The lowest quality of an answer that counts as recalled, out of 0 to 5 in SM-2.
+MIN_RECALLED_QUALITY = 3
+# The correct answers taken at most these seconds are recalled easily and with hesitation respectively.
+EASY_ANSWER_SECONDS = 5
+HESITANT_ANSWER_SECONDS = 15
+
+
+def answer_quality(quiz_item: QuizItem) -> int:
+    """Rate how well the item of an answered quiz item is recalled, on the scale of SM-2.
+
+    A multiple-choice answer tells only whether the item is recalled, so the time taken to answer
+    tells how easily it is.
+
+    Args:
+        quiz_item (QuizItem): The answered quiz item.
+
+    Returns:
+        int: 5 for a correct answer taken at most `EASY_ANSWER_SECONDS`, 4 for one taken at most
+            `HESITANT_ANSWER_SECONDS`, 3 for a slower one, and 1 for a wrong or missing answer.
+    """
+    if quiz_item.user_answer != quiz_item.correct_answer:
+        return 1
+    answer_time = quiz_item.answer_time or 0
+    if answer_time <= EASY_ANSWER_SECONDS:
+        return 5
+    if answer_time <= HESITANT_ANSWER_SECONDS:
+        return 4
+    return MIN_RECALLED_QUALITY
+
+
+def schedule_review(
+    review_state: ReviewState, quality: int, reviewed_at: datetime
+) -> ReviewState:
+    """Schedule the next review of an item by the SM-2 algorithm.
+
+    A recalled item is reviewed after 1 day, 6 days, and then intervals growing by its ease,
+    which goes down the harder the item is recalled. A forgotten item starts over from 1 day.
+
+    Args:
+        review_state (ReviewState): The review state before the review.
+        quality (int): How well the item is recalled, from 0 (blackout) to 5 (perfect).
+        reviewed_at (datetime): The date and time of the review.
+
+    Returns:
+        ReviewState: The review state after the review.
+    """
+    if quality >= MIN_RECALLED_QUALITY:
+        if review_state.repetitions == 0:
+            interval_days = 1
+        elif review_state.repetitions == 1:
+            interval_days = 6
+        else:
+            interval_days = round(review_state.interval_days * review_state.ease)
+        repetitions = review_state.repetitions + 1
+    else:
+        interval_days = 1
+        repetitions = 0
+    lapse = 5 - quality
+    ease = max(MIN_EASE, review_state.ease + 0.1 - lapse * (0.08 + lapse * 0.02))
+    return review_state.model_copy(
+        update={
+            "repetitions": repetitions,
+            "ease": ease,
+            "interval_days": interval_days,
+            "due_at": reviewed_at + timedelta(days=interval_days),
+            "reviewed_at": reviewed_at,
+        }
+    )
+
+
+async def schedule_reviews(
+    review_state_repository: IReviewStateRepository,
+    user_id: int,
+    quiz_items: Sequence[QuizItem],
+    reviewed_at: datetime,
+) -> list[ReviewState]:
+    """Schedule the next reviews of the items asked in a graded quiz, without writing them.
+
+    The review states of all the items are read by a single query, so the number of queries does
+    not depend on the number of questions. The review states are returned to be written with the
+    answers, e.g. by `IQuizItemRepository.update_answers`.
+
+    Args:
+        review_state_repository (IReviewStateRepository): The repository of the review states.
+        user_id (int): The unique identifier for the user who took the quiz.
+        quiz_items (Sequence[QuizItem]): The answered quiz items.
+        reviewed_at (datetime): The date and time when the quiz was answered.
+
+    Returns:
+        list[ReviewState]: The review states after the reviews, one per distinct item asked.
+    """
+    item_ids = list(
+        dict.fromkeys(
+            quiz_item.item_id
+            for quiz_item in quiz_items
+            if quiz_item.item_id is not None
+        )
+    )
+    review_states = {
+        review_state.item_id: review_state
+        for review_state in await review_state_repository.read_by_item_ids(
+            user_id, item_ids
+        )
+    }
+    for quiz_item in quiz_items:
+        if quiz_item.item_id is None:
+            continue
+        review_state = review_states.get(quiz_item.item_id) or ReviewState(
+            user_id=user_id,
+            item_id=quiz_item.item_id,
+            ease=INITIAL_EASE,
+            due_at=reviewed_at,
+            reviewed_at=reviewed_at,
+        )
+        review_states[quiz_item.item_id] = schedule_review(
+            review_state, answer_quality(quiz_item), reviewed_at
+        )
+    return [review_states[item_id] for item_id in item_ids]
+
+
+async def update_review_states(
+    review_state_repository: IReviewStateRepository,
+    user_id: int,
+    quiz_items: Sequence[QuizItem],
+    reviewed_at: datetime,
+) -> list[ReviewState]:
+    """Schedule the next reviews of the items asked in a graded quiz, and write them.
+
+    The review states are read by a single query and written back by a single upsert.
+
+    Args:
+        review_state_repository (IReviewStateRepository): The repository of the review states.
+        user_id (int): The unique identifier for the user who took the quiz.
+        quiz_items (Sequence[QuizItem]): The answered quiz items.
+        reviewed_at (datetime): The date and time when the quiz was answered.
+
+    Returns:
+        list[ReviewState]: The updated review states, one per distinct item asked.
+    """
+    return await review_state_repository.upsert_many(
+        await schedule_reviews(
+            review_state_repository, user_id, quiz_items, reviewed_at
+        )
+    )
@@ -0,0 +1,230 @@
+# ruff: noqa: INP001
+import argparse
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.db.engine import create_database_engine
+from src.db.migrations import migrate
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyDeck,
+    SQLAlchemyItem,
+    SQLAlchemyUser,
+    item_deck_mapper_table,
+)
+from src.db.repositories.deck_repository_interface import DeckSetOperation
+from src.db.repositories.sqlalchemy.deck_repository import DeckRepository
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import Deck, Item, User
+
+USER_NAME = "deck_copy_benchmark_user"
+
+
+class DeckItemId(BaseModel):
+    """The id of an item in a deck."""
+
+    item_id: int
+
+
+def make_items(user_id: int, start: int, num_items: int) -> list[Item]:
+    """Make items of a user.
+
+    Args:
+        user_id (int): The unique identifier for the user who makes the items.
+        start (int): The number of the first item.
+        num_items (int): The number of items.
+
+    Returns:
+        list[Item]: The items.
+    """
+    return [
+        Item(user_id=user_id, english=f"english{i}", japanese=f"訳{i}", grade=i % 8)
+        for i in range(start, start + num_items)
+    ]
+
+
+async def clone_one_by_one(
+    async_session: AsyncSession,
+    deck_repository: DeckRepository,
+    deck_id: int,
+    user_id: int,
+) -> None:
+    """Clone a deck by reading its items into Python and inserting them one by one.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        deck_repository (DeckRepository): The repository of decks.
+        deck_id (int): The unique identifier for the deck to clone.
+        user_id (int): The unique identifier for the user who owns the clone.
+    """
+    items = await deck_repository.read_items(DeckItemId, deck_id)
+    new_deck = await deck_repository.create(Deck(user_id=user_id, deck_name="clone"))
+    async with async_session.begin():
+        for item in items:
+            await async_session.execute(
+                insert(item_deck_mapper_table).values(
+                    item_id=item.item_id, deck_id=new_deck.deck_id
+                )
+            )
+
+
+async def clone_in_bulk(
+    deck_repository: DeckRepository, deck_id: int, user_id: int
+) -> None:
+    """Clone a deck by reading its items into Python and inserting them by a single statement.
+
+    Args:
+        deck_repository (DeckRepository): The repository of decks.
+        deck_id (int): The unique identifier for the deck to clone.
+        user_id (int): The unique identifier for the user who owns the clone.
+    """
+    items = await deck_repository.read_items(DeckItemId, deck_id)
+    new_deck = await deck_repository.create(Deck(user_id=user_id, deck_name="clone"))
+    await deck_repository.add_items(
+        new_deck.deck_id, [item.item_id for item in items]  # type: ignore
+    )
+
+
+async def measure(run: Callable[[], Awaitable[object]], repeat: int) -> float:
+    """Measure the median elapsed time of running a function.
+
+    Args:
+        run (Callable[[], Awaitable[object]]): The function to run.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The median elapsed time in milliseconds.
+    """
+    elapsed_milliseconds = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        await run()
+        elapsed_milliseconds.append((time.perf_counter() - start_time) * 1000)
+    return statistics.median(elapsed_milliseconds)
+
+
+async def main(num_items: int, repeat: int) -> None:
+    """Benchmark cloning and combining decks in SQL against copying their items through Python.
+
+    Args:
+        num_items (int): The number of items in each of the two decks, half of which are in both.
+        repeat (int): The number of times each operation is measured.
+    """
+    engine = create_database_engine()
+    async with engine.begin() as conn:
+        await migrate(conn)
+    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with async_session_maker() as async_session:
+        user = await UserRepository(async_session).create(
+            User(user_name=USER_NAME, email=f"{USER_NAME}@example.com", password="")
+        )
+        user_id: int = user.user_id  # type: ignore
+        deck_repository = DeckRepository(async_session)
+        try:
+            decks = [
+                await deck_repository.create(
+                    Deck(user_id=user_id, deck_name=f"deck{i}")
+                )
+                for i in range(2)
+            ]
+            deck_ids: list[int] = [deck.deck_id for deck in decks]  # type: ignore
+            item_repository = ItemRepository(async_session)
+            half = num_items // 2
+            await item_repository.copy_many(
+                make_items(user_id, 0, half), deck_id=deck_ids[0]
+            )
+            shared_item_ids = await item_repository.copy_many(
+                make_items(user_id, half, half), deck_id=deck_ids[0]
+            )
+            await deck_repository.add_items(deck_ids[1], shared_item_ids)
+            await item_repository.copy_many(
+                make_items(user_id, 2 * half, half), deck_id=deck_ids[1]
+            )
+            async with async_session.begin():
+                await async_session.execute(
+                    text(f"ANALYZE {item_deck_mapper_table.fullname}")
+                )
+            print(f"Created 2 decks of {2 * half} items, {half} of which are in both")
+
+            print("clone a deck:")
+            clones: list[tuple[str, Callable[[], Awaitable[object]], int]] = [
+                (
+                    "Python, one by one",
+                    partial(
+                        clone_one_by_one,
+                        async_session,
+                        deck_repository,
+                        deck_ids[0],
+                        user_id,
+                    ),
+                    1,
+                ),
+                (
+                    "Python, in bulk   ",
+                    partial(clone_in_bulk, deck_repository, deck_ids[0], user_id),
+                    repeat,
+                ),
+                (
+                    "SQL               ",
+                    partial(
+                        deck_repository.clone,
+                        deck_ids[0],
+                        Deck(user_id=user_id, deck_name="clone"),
+                    ),
+                    repeat,
+                ),
+            ]
+            for name, run, runs in clones:
+                print(f"  {name}: median {await measure(run, runs):.2f} ms")
+            operations: list[DeckSetOperation] = ["union", "intersect", "difference"]
+            for operation in operations:
+                elapsed = await measure(
+                    partial(
+                        deck_repository.create_from_decks,
+                        operation,
+                        deck_ids,
+                        Deck(user_id=user_id, deck_name=operation),
+                    ),
+                    repeat,
+                )
+                print(f"{operation} of the decks in SQL: median {elapsed:.2f} ms")
+        finally:
+            # Remove everything created by the benchmark.
+            async with async_session.begin():
+                user_decks = select(SQLAlchemyDeck.deck_id).where(
+                    SQLAlchemyDeck.user_id == user_id
+                )
+                await async_session.execute(
+                    delete(item_deck_mapper_table).where(
+                        item_deck_mapper_table.c.deck_id.in_(user_decks)
+                    )
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyDeck).where(SQLAlchemyDeck.user_id == user_id)
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyItem).where(SQLAlchemyItem.user_id == user_id)
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyUser).where(SQLAlchemyUser.user_id == user_id)
+                )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark cloning and combining decks in SQL."
+    )
+    parser.add_argument("--num-items", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.num_items, args.repeat))
@@ -0,0 +1,331 @@
+# ruff: noqa: INP001
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from functools import partial
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.db.engine import create_database_engine
+from src.db.migrations import migrate
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyDeck,
+    SQLAlchemyItem,
+    SQLAlchemyQuiz,
+    SQLAlchemyUser,
+    item_deck_mapper_table,
+)
+from src.db.repositories.sqlalchemy.deck_repository import DeckRepository
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import Item, User
+from src.domain.services.deck_service.deck_listing import DeckSummary, list_decks
+from src.domain.services.quiz_service.quiz_generation import MULTIPLE_CHOICE_QUIZ_TYPE
+
+USER_NAME = "deck_listing_benchmark_user"
+
+
+async def list_decks_one_by_one(
+    async_session: AsyncSession, user_id: int, cursor: int | None, limit: int | None
+) -> list[DeckSummary]:
+    """List the decks of a user by reading the decks and then aggregating each of them by two queries.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        user_id (int): The unique identifier for the user.
+        cursor (int | None): The id of the last deck of the previous page, if any.
+        limit (int | None): The maximum number of decks to list. None means no limit.
+
+    Returns:
+        list[DeckSummary]: The decks of the user, ordered by their ids.
+    """
+    decks = await DeckRepository(async_session).read_by_user_id(user_id, cursor, limit)
+    summaries = []
+    async with async_session.begin():
+        for deck in decks:
+            item_count = await async_session.scalar(
+                select(func.count()).where(
+                    item_deck_mapper_table.c.deck_id == deck.deck_id
+                )
+            )
+            last_studied_at = await async_session.scalar(
+                select(func.max(SQLAlchemyQuiz.quiz_timestamp)).where(
+                    SQLAlchemyQuiz.deck_id == deck.deck_id
+                )
+            )
+            summaries.append(
+                DeckSummary(
+                    deck_id=deck.deck_id,  # type: ignore
+                    deck_name=deck.deck_name,
+                    item_count=item_count,  # type: ignore
+                    last_studied_at=last_studied_at,
+                )
+            )
+    return summaries
+
+
+async def list_decks_grouped(
+    async_session: AsyncSession, user_id: int, cursor: int | None, limit: int | None
+) -> list[DeckSummary]:
+    """List the decks of a user by grouping the items and the quizzes of all their decks.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        user_id (int): The unique identifier for the user.
+        cursor (int | None): The id of the last deck of the previous page, if any.
+        limit (int | None): The maximum number of decks to list. None means no limit.
+
+    Returns:
+        list[DeckSummary]: The decks of the user, ordered by their ids.
+    """
+    item_counts = (
+        select(
+            item_deck_mapper_table.c.deck_id,
+            func.count().label("item_count"),
+        )
+        .group_by(item_deck_mapper_table.c.deck_id)
+        .subquery()
+    )
+    last_quizzes = (
+        select(
+            SQLAlchemyQuiz.deck_id,
+            func.max(SQLAlchemyQuiz.quiz_timestamp).label("last_studied_at"),
+        )
+        .group_by(SQLAlchemyQuiz.deck_id)
+        .subquery()
+    )
+    statement = (
+        select(
+            SQLAlchemyDeck.deck_id,
+            SQLAlchemyDeck.deck_name,
+            func.coalesce(item_counts.c.item_count, 0).label("item_count"),
+            last_quizzes.c.last_studied_at,
+        )
+        .outerjoin(item_counts, item_counts.c.deck_id == SQLAlchemyDeck.deck_id)
+        .outerjoin(last_quizzes, last_quizzes.c.deck_id == SQLAlchemyDeck.deck_id)
+        .where(SQLAlchemyDeck.user_id == user_id)
+        .order_by(SQLAlchemyDeck.deck_id)
+        .limit(limit)
+    )
+    if cursor is not None:
+        statement = statement.where(SQLAlchemyDeck.deck_id > cursor)
+    async with async_session.begin():
+        results = await async_session.execute(statement)
+        return [DeckSummary(**row._asdict()) for row in results.all()]
+
+
+async def measure(run: Callable[[], Awaitable[object]], repeat: int) -> float:
+    """Measure the median elapsed time of running a function.
+
+    Args:
+        run (Callable[[], Awaitable[object]]): The function to run.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The median elapsed time in milliseconds.
+    """
+    elapsed_milliseconds = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        await run()
+        elapsed_milliseconds.append((time.perf_counter() - start_time) * 1000)
+    return statistics.median(elapsed_milliseconds)
+
+
+async def create_user_decks(
+    async_session: AsyncSession,
+    rng: random.Random,
+    user_index: int,
+    num_decks: int,
+    num_items: int,
+    num_quizzes: int,
+) -> int:
+    """Create a user with decks of random items, some of which have been studied.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        rng (random.Random): The random number generator.
+        user_index (int): The index of the user among the users of the benchmark.
+        num_decks (int): The number of decks of the user.
+        num_items (int): The number of items in each deck.
+        num_quizzes (int): The number of quizzes of the user, taken on random decks.
+
+    Returns:
+        int: The unique identifier for the user.
+    """
+    user_name = f"{USER_NAME}{user_index}"
+    user = await UserRepository(async_session).create(
+        User(user_name=user_name, email=f"{user_name}@example.com", password="")
+    )
+    item_ids = await ItemRepository(async_session).copy_many(
+        [
+            Item(
+                user_id=user.user_id,
+                english=f"english{i}",
+                japanese=f"japanese{i}",
+                grade=i % 8,
+            )
+            for i in range(num_items * 10)
+        ]
+    )
+    now = datetime.now()
+    async with async_session.begin():
+        deck_ids = list(
+            await async_session.scalars(
+                insert(SQLAlchemyDeck).returning(SQLAlchemyDeck.deck_id),
+                [
+                    {"user_id": user.user_id, "deck_name": f"deck{i}"}
+                    for i in range(num_decks)
+                ],
+            )
+        )
+        await async_session.execute(
+            insert(item_deck_mapper_table),
+            [
+                {"item_id": item_id, "deck_id": deck_id}
+                for deck_id in deck_ids
+                for item_id in rng.sample(item_ids, num_items)
+            ],
+        )
+        await async_session.execute(
+            insert(SQLAlchemyQuiz),
+            [
+                {
+                    "user_id": user.user_id,
+                    "deck_id": rng.choice(deck_ids),
+                    "quiz_type": MULTIPLE_CHOICE_QUIZ_TYPE,
+                    "quiz_timestamp": now - timedelta(minutes=rng.randrange(10**5)),
+                }
+                for _ in range(num_quizzes)
+            ],
+        )
+    return user.user_id  # type: ignore
+
+
+async def main(
+    num_users: int, num_decks: int, num_items: int, num_quizzes: int, repeat: int
+) -> None:
+    """Benchmark listing the decks of users with their item counts and last quiz times.
+
+    Args:
+        num_users (int): The number of users.
+        num_decks (int): The number of decks of each user.
+        num_items (int): The number of items in each deck.
+        num_quizzes (int): The number of quizzes of each user.
+        repeat (int): The number of times each listing is measured.
+    """
+    engine = create_database_engine()
+    async with engine.begin() as conn:
+        await migrate(conn)
+    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with async_session_maker() as async_session:
+        user_ids: list[int] = []
+        try:
+            rng = random.Random(0)
+            for user_index in range(num_users):
+                user_ids.append(
+                    await create_user_decks(
+                        async_session,
+                        rng,
+                        user_index,
+                        num_decks,
+                        num_items,
+                        num_quizzes,
+                    )
+                )
+            async with async_session.begin():
+                for table in (SQLAlchemyDeck, SQLAlchemyQuiz):
+                    await async_session.execute(
+                        text(f"ANALYZE {table.__table__.fullname}")  # type: ignore
+                    )
+                await async_session.execute(
+                    text(f"ANALYZE {item_deck_mapper_table.fullname}")
+                )
+            print(
+                f"Created {num_users} users with {num_decks} decks of {num_items} items "
+                f"and {num_quizzes} quizzes each"
+            )
+
+            user_id = user_ids[-1]
+            deck_repository = DeckRepository(async_session)
+            middle_cursor: int | None = (
+                await list_decks(deck_repository, user_id, None, num_decks // 2)
+            )[-1].deck_id
+            for operation, cursor, limit in (
+                ("list the first page", None, settings.DEFAULT_PAGE_SIZE),
+                ("list a middle page", middle_cursor, settings.DEFAULT_PAGE_SIZE),
+                ("list all the decks", None, None),
+            ):
+                expected = await list_decks(deck_repository, user_id, cursor, limit)
+                print(f"{operation} ({len(expected)} decks):")
+                for name, list_function in (
+                    ("N+1 queries  ", list_decks_one_by_one),
+                    ("GROUP BY     ", list_decks_grouped),
+                ):
+                    assert (
+                        await list_function(async_session, user_id, cursor, limit)
+                        == expected
+                    )
+                    elapsed = await measure(
+                        partial(list_function, async_session, user_id, cursor, limit),
+                        repeat,
+                    )
+                    print(f"  {name}: median {elapsed:.2f} ms")
+                elapsed = await measure(
+                    partial(list_decks, deck_repository, user_id, cursor, limit),
+                    repeat,
+                )
+                print(f"  lateral joins: median {elapsed:.2f} ms")
+        finally:
+            # Remove everything created by the benchmark.
+            async with async_session.begin():
+                user_decks = select(SQLAlchemyDeck.deck_id).where(
+                    SQLAlchemyDeck.user_id.in_(user_ids)
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyQuiz).where(SQLAlchemyQuiz.user_id.in_(user_ids))
+                )
+                await async_session.execute(
+                    delete(item_deck_mapper_table).where(
+                        item_deck_mapper_table.c.deck_id.in_(user_decks)
+                    )
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyDeck).where(SQLAlchemyDeck.user_id.in_(user_ids))
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyItem).where(SQLAlchemyItem.user_id.in_(user_ids))
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyUser).where(SQLAlchemyUser.user_id.in_(user_ids))
+                )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark listing the decks of users with their aggregates."
+    )
+    parser.add_argument("--num-users", type=int, default=10)
+    parser.add_argument("--num-decks", type=int, default=1000)
+    parser.add_argument("--num-items", type=int, default=20)
+    parser.add_argument("--num-quizzes", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            args.num_users,
+            args.num_decks,
+            args.num_items,
+            args.num_quizzes,
+            args.repeat,
+        )
+    )
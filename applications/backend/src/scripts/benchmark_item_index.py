@@ -0,0 +1,126 @@
+# ruff: noqa: INP001
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+
+from src.domain.services.quiz_service.item_index import ItemIndex, ItemIndexEntry
+
+# Japanese characters to make up glosses of realistic byte lengths from.
+KANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
+# English syllables to make up words sharing n-grams with each other from.
+SYLLABLES = [consonant + vowel for consonant in "bcdfghklmnprstvw" for vowel in "aeiou"]
+
+
+def make_entries(num_items: int, num_users: int) -> list[ItemIndexEntry]:
+    """Make entries of items owned by a few users, or shared, with words of 2 to 4 syllables
+    and glosses of 2 to 6 characters.
+
+    Args:
+        num_items (int): The number of items.
+        num_users (int): The number of users owning the items besides the shared ones.
+
+    Returns:
+        list[ItemIndexEntry]: The entries ordered by their ids.
+    """
+    rng = random.Random(0)
+    now = datetime.now()
+    return [
+        ItemIndexEntry(
+            item_id=item_id,
+            user_id=rng.choice([None, *range(1, num_users + 1)]),
+            grade=rng.randrange(1, 9),
+            english="".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))),
+            japanese="".join(rng.choices(KANA, k=rng.randint(2, 6))),
+            updated_at=now,
+        )
+        for item_id in range(1, num_items + 1)
+    ]
+
+
+def main(num_items: int, num_users: int, num_samples: int, repeat: int) -> None:
+    """Measure the memory of the item index and the time of sampling and finding similar items.
+
+    Args:
+        num_items (int): The number of items in the index.
+        num_users (int): The number of users owning the items besides the shared ones.
+        num_samples (int): The number of items sampled at once, e.g. questions times choices.
+        repeat (int): The number of samples measured.
+    """
+    entries = make_entries(num_items, num_users)
+    item_index = ItemIndex(refresh_seconds=60)
+    start_time = time.perf_counter()
+    item_index.upsert(entries)
+    build_seconds = time.perf_counter() - start_time
+    # Build the index again while tracing, which slows allocations down too much to time it.
+    tracemalloc.start()
+    traced_index = ItemIndex(refresh_seconds=60)
+    traced_index.upsert(entries)
+    traced_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced_index
+    print(f"Indexed {num_items} items in {build_seconds * 1000:.0f} ms")
+    for name, num_bytes in (
+        ("memory_bytes()", item_index.memory_bytes()),
+        ("traced allocations", traced_bytes),
+        ("entries as Pydantic models", _deep_size(entries)),
+    ):
+        print(
+            f"  {name}: {num_bytes / 2**20:.1f} MiB, "
+            f"{num_bytes / num_items * 100_000 / 2**20:.1f} MiB per 100k items"
+        )
+
+    for name, grades in (("all grades", None), ("one grade", [1])):
+        elapsed_microseconds = []
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            item_index.sample(num_samples, user_id=1, grades=grades)
+            elapsed_microseconds.append((time.perf_counter() - start_time) * 1_000_000)
+        print(
+            f"Sampled {num_samples} items of {name}: "
+            f"median {statistics.median(elapsed_microseconds):.0f} µs"
+        )
+
+    rng = random.Random(0)
+    elapsed_microseconds = []
+    for _ in range(repeat):
+        item_id = rng.randint(1, num_items)
+        start_time = time.perf_counter()
+        item_index.similar(item_id, 3, user_id=1)
+        elapsed_microseconds.append((time.perf_counter() - start_time) * 1_000_000)
+    percentiles = statistics.quantiles(elapsed_microseconds, n=100, method="inclusive")
+    print(
+        f"Found 3 similar items of an item: "
+        f"p50 {percentiles[49]:.0f} µs, p99 {percentiles[98]:.0f} µs"
+    )
+
+
+def _deep_size(entries: list[ItemIndexEntry]) -> int:
+    """Measure the memory of entries and their field values.
+
+    Args:
+        entries (list[ItemIndexEntry]): The entries.
+
+    Returns:
+        int: The number of bytes allocated for the entries.
+    """
+    tracemalloc.start()
+    copies = [entry.model_copy(deep=True) for entry in entries]
+    num_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del copies
+    return num_bytes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the memory and the sampling time of the item index."
+    )
+    parser.add_argument("--num-items", type=int, default=100_000)
+    parser.add_argument("--num-users", type=int, default=100)
+    parser.add_argument("--num-samples", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.num_items, args.num_users, args.num_samples, args.repeat)
@@ -0,0 +1,167 @@
+# ruff: noqa: INP001
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from pydantic import BaseModel
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.config import settings
+from src.db.engine import create_database_engine
+from src.db.migrations import create_item_trigram_indexes, migrate
+from src.db.models.sqlalchemy_data_models import SQLAlchemyItem, SQLAlchemyUser
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import Item, User
+
+USER_NAME = "item_search_benchmark_user"
+# Japanese characters to make up glosses of realistic byte lengths from.
+KANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
+# English syllables to make up words sharing n-grams with each other from.
+SYLLABLES = [consonant + vowel for consonant in "bcdfghklmnprstvw" for vowel in "aeiou"]
+# The number of items loaded by a single `COPY`.
+COPY_BATCH_SIZE = 100_000
+
+
+class ItemSearchProjection(BaseModel):
+    """The columns of an item returned by the search."""
+
+    item_id: int
+    english: str
+    japanese: str
+    grade: int
+
+
+def make_item(rng: random.Random, user_id: int) -> Item:
+    """Make an item with a phrase of 1 to 2 words of 2 to 4 syllables and a gloss of 2 to 6 characters.
+
+    Args:
+        rng (random.Random): The random number generator.
+        user_id (int): The unique identifier for the user who makes the item.
+
+    Returns:
+        Item: The item.
+    """
+    return Item(
+        user_id=user_id,
+        english=" ".join(
+            "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+            for _ in range(rng.randint(1, 2))
+        ),
+        japanese="".join(rng.choices(KANA, k=rng.randint(2, 6))),
+        grade=rng.randrange(1, 9),
+    )
+
+
+def misspell(rng: random.Random, word: str) -> str:
+    """Replace a letter of a word with another one.
+
+    Args:
+        rng (random.Random): The random number generator.
+        word (str): The word.
+
+    Returns:
+        str: The misspelled word.
+    """
+    index = rng.randrange(len(word))
+    return word[:index] + rng.choice("aeiou") + word[index + 1 :]
+
+
+async def main(num_items: int, repeat: int) -> None:
+    """Measure the latency of searching items by the kinds of queries.
+
+    Args:
+        num_items (int): The number of items searched.
+        repeat (int): The number of queries measured per kind.
+    """
+    engine = create_database_engine()
+    async with engine.begin() as conn:
+        await migrate(conn)
+        has_trigram_indexes = await create_item_trigram_indexes(conn)
+    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with async_session_maker() as async_session:
+        user = await UserRepository(async_session).create(
+            User(user_name=USER_NAME, email=f"{USER_NAME}@example.com", password="")
+        )
+        user_id: int = user.user_id  # type: ignore
+        try:
+            rng = random.Random(0)
+            item_repository = ItemRepository(async_session)
+            items = []
+            start_time = time.perf_counter()
+            for start in range(0, num_items, COPY_BATCH_SIZE):
+                batch = [
+                    make_item(rng, user_id)
+                    for _ in range(min(COPY_BATCH_SIZE, num_items - start))
+                ]
+                await item_repository.copy_many(batch)
+                items.extend(rng.sample(batch, min(len(batch), repeat)))
+            async with async_session.begin():
+                await async_session.execute(
+                    text(f"ANALYZE {SQLAlchemyItem.__table__.fullname}")  # type: ignore
+                )
+            print(
+                f"Loaded {num_items} items in {time.perf_counter() - start_time:.0f} s "
+                f"(trigram indexes: {'yes' if has_trigram_indexes else 'no, pg_trgm is not available'})"
+            )
+
+            kinds: list[tuple[str, Callable[[Item], str], bool]] = [
+                ("English substring", lambda item: item.english[1:5], False),
+                ("English word prefix", lambda item: item.english[:2], False),
+                ("Japanese substring", lambda item: item.japanese[:2], False),
+            ]
+            if has_trigram_indexes:
+                kinds.append(
+                    (
+                        "misspelled English",
+                        lambda item: misspell(rng, item.english),
+                        True,
+                    )
+                )
+            for name, make_query, fuzzy in kinds:
+                elapsed_milliseconds = []
+                for item in rng.sample(items, min(len(items), repeat)):
+                    query = make_query(item)
+                    start_time = time.perf_counter()
+                    await item_repository.search_projected(
+                        ItemSearchProjection,
+                        query,
+                        user_id=user_id,
+                        fuzzy=fuzzy,
+                        limit=settings.DEFAULT_PAGE_SIZE,
+                    )
+                    elapsed_milliseconds.append(
+                        (time.perf_counter() - start_time) * 1000
+                    )
+                percentiles = statistics.quantiles(
+                    elapsed_milliseconds, n=100, method="inclusive"
+                )
+                print(
+                    f"{name}: p50 {percentiles[49]:.2f} ms, p95 {percentiles[94]:.2f} ms"
+                )
+        finally:
+            # Remove everything created by the benchmark.
+            async with async_session.begin():
+                await async_session.execute(
+                    delete(SQLAlchemyItem).where(SQLAlchemyItem.user_id == user_id)
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyUser).where(SQLAlchemyUser.user_id == user_id)
+                )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the latency of searching items."
+    )
+    parser.add_argument("--num-items", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.num_items, args.repeat))
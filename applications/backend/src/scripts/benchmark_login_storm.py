@@ -0,0 +1,136 @@
+# ruff: noqa: INP001
+import argparse
+import asyncio
+import statistics
+import time
+
+from asgi_lifespan import LifespanManager
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core import security
+from src.core.config import settings
+from src.core.main import app
+from src.core.security import PasswordHashingExecutor, get_password_hash
+from src.db.engine import create_database_engine
+from src.db.migrations import migrate
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import User
+
+USER_NAME = "login_storm_user"
+PASSWORD = "login_storm_password"
+
+
+async def probe(client: AsyncClient, stop: asyncio.Event) -> list[float]:
+    """Request an unrelated endpoint repeatedly until told to stop.
+
+    Args:
+        client (AsyncClient): The client authorized as the benchmark user.
+        stop (asyncio.Event): The event set when the login storm is over.
+
+    Returns:
+        list[float]: The latency of each request in milliseconds.
+    """
+    latency_milliseconds = []
+    while not stop.is_set():
+        start_time = time.perf_counter()
+        response = await client.get("/decks/", params={"limit": 1})
+        response.raise_for_status()
+        latency_milliseconds.append((time.perf_counter() - start_time) * 1000)
+        await asyncio.sleep(0.01)
+    return latency_milliseconds
+
+
+async def storm(client: AsyncClient, num_logins: int) -> float:
+    """Log in concurrently.
+
+    Args:
+        client (AsyncClient): The client to log in with.
+        num_logins (int): The number of concurrent logins.
+
+    Returns:
+        float: The elapsed time of all logins in seconds.
+    """
+    start_time = time.perf_counter()
+    responses = await asyncio.gather(
+        *(
+            client.post(
+                "/login/access-token",
+                data={"username": USER_NAME, "password": PASSWORD},
+                headers={"Authorization": ""},
+            )
+            for _ in range(num_logins)
+        )
+    )
+    for response in responses:
+        response.raise_for_status()
+    return time.perf_counter() - start_time
+
+
+async def create_benchmark_user() -> None:
+    """Migrate the database and create the user to log in as if it does not exist."""
+    engine = create_database_engine()
+    async with engine.begin() as conn:
+        await migrate(conn)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as async_session:
+        user_repository = UserRepository(async_session)
+        if await user_repository.read_by_username(USER_NAME) is None:
+            await user_repository.create(
+                User(
+                    user_name=USER_NAME,
+                    email="login_storm_user@example.com",
+                    password=get_password_hash(PASSWORD),
+                )
+            )
+    await engine.dispose()
+
+
+async def main(num_logins: int, max_workers: int) -> None:
+    """Measure the latency of an unrelated endpoint during a login storm, with and without the hashing pool.
+
+    Args:
+        num_logins (int): The number of concurrent logins.
+        max_workers (int): The maximum number of threads of the password hashing pool.
+    """
+    await create_benchmark_user()
+    async with LifespanManager(app), AsyncClient(
+        app=app, base_url=f"http://benchmark{settings.API_V1_STR}"
+    ) as client:
+        response = await client.post(
+            "/login/access-token", data={"username": USER_NAME, "password": PASSWORD}
+        )
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+        print(f"GET /decks/ latency during {num_logins} concurrent logins")
+        for name, workers in (
+            ("before (on the event loop)", 0),
+            (f"after ({max_workers} hashing threads)", max_workers),
+        ):
+            security.password_hashing_executor = PasswordHashingExecutor(workers)
+            stop = asyncio.Event()
+            probe_task = asyncio.create_task(probe(client, stop))
+            # Let the probe warm up before the storm.
+            await asyncio.sleep(0.2)
+            storm_seconds = await storm(client, num_logins)
+            stop.set()
+            latency_milliseconds = await probe_task
+            percentiles = statistics.quantiles(
+                latency_milliseconds, n=100, method="inclusive"
+            )
+            print(
+                f"  {name}: p50 {percentiles[49]:.1f} ms, p99 {percentiles[98]:.1f} ms, "
+                f"max {max(latency_milliseconds):.1f} ms over {len(latency_milliseconds)} requests; "
+                f"logins took {storm_seconds:.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the latency of an unrelated endpoint during a login storm."
+    )
+    parser.add_argument("--num-logins", type=int, default=20)
+    parser.add_argument(
+        "--max-workers", type=int, default=settings.PASSWORD_HASHING_MAX_WORKERS
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.num_logins, args.max_workers))
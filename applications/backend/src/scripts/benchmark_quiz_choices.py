@@ -0,0 +1,322 @@
+# ruff: noqa: INP001
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+from sqlalchemy import cast, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.db.engine import create_database_engine
+from src.db.migrations import migrate
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyItem,
+    SQLAlchemyQuiz,
+    SQLAlchemyQuizItem,
+    SQLAlchemyQuizItemChoice,
+    SQLAlchemyUser,
+)
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.db.repositories.sqlalchemy.quiz_item_repository import QuizItemRepository
+from src.db.repositories.sqlalchemy.quiz_repository import QuizRepository
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import Item, Quiz, QuizItem, User
+from src.domain.services.quiz_service.quiz_generation import (
+    DEFAULT_NUM_CHOICES,
+    MULTIPLE_CHOICE_QUIZ_TYPE,
+)
+
+USER_NAME = "quiz_choices_benchmark_user"
+
+
+def make_quiz_items(item_ids: Sequence[int], num_questions: int) -> list[QuizItem]:
+    """Make the quiz items of a quiz with random choices.
+
+    Args:
+        item_ids (Sequence[int]): The ids of the items to choose from.
+        num_questions (int): The number of questions.
+
+    Returns:
+        list[QuizItem]: The quiz items.
+    """
+    return [
+        QuizItem(
+            item_id=choice_ids[0],
+            question_number=question_number,
+            choice_item_ids=choice_ids,
+            correct_answer=0,
+        )
+        for question_number, choice_ids in enumerate(
+            (
+                random.sample(item_ids, DEFAULT_NUM_CHOICES)
+                for _ in range(num_questions)
+            ),
+            1,
+        )
+    ]
+
+
+async def create_with_json_choices(
+    async_session: AsyncSession, user_id: int, quiz_items: Sequence[QuizItem]
+) -> None:
+    """Create a quiz whose choices are stored only in the JSON column of its quiz items.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        user_id (int): The unique identifier for the user who takes the quiz.
+        quiz_items (Sequence[QuizItem]): The quiz items of the quiz.
+    """
+    async with async_session.begin():
+        quiz_id = await async_session.scalar(
+            insert(SQLAlchemyQuiz)
+            .values(user_id=user_id, quiz_type=MULTIPLE_CHOICE_QUIZ_TYPE)
+            .returning(SQLAlchemyQuiz.quiz_id)
+        )
+        await async_session.execute(
+            insert(SQLAlchemyQuizItem),
+            [
+                {**quiz_item.model_dump(exclude={"quiz_item_id"}), "quiz_id": quiz_id}
+                for quiz_item in quiz_items
+            ],
+        )
+
+
+async def read_json_choices(
+    async_session: AsyncSession, quiz_ids: Sequence[int]
+) -> dict[int, list[int]]:
+    """Read the choices of the quiz items of quizzes from the JSON column.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        quiz_ids (Sequence[int]): The ids of the quizzes.
+
+    Returns:
+        dict[int, list[int]]: The item ids of the choices by quiz item id.
+    """
+    async with async_session.begin():
+        results = await async_session.execute(
+            select(
+                SQLAlchemyQuizItem.quiz_item_id, SQLAlchemyQuizItem.choice_item_ids
+            ).where(SQLAlchemyQuizItem.quiz_id.in_(quiz_ids))
+        )
+        return {
+            quiz_item_id: [int(id) for id in choice_item_ids]
+            for quiz_item_id, choice_item_ids in results.all()
+        }
+
+
+async def read_table_choices(
+    async_session: AsyncSession, quiz_ids: Sequence[int]
+) -> dict[int, list[int]]:
+    """Read the choices of the quiz items of quizzes from the `quiz_item_choices` table.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        quiz_ids (Sequence[int]): The ids of the quizzes.
+
+    Returns:
+        dict[int, list[int]]: The item ids of the choices by quiz item id.
+    """
+    async with async_session.begin():
+        results = await async_session.execute(
+            select(
+                SQLAlchemyQuizItemChoice.quiz_item_id,
+                func.array_agg(
+                    SQLAlchemyQuizItemChoice.item_id.op("ORDER BY")(
+                        SQLAlchemyQuizItemChoice.position
+                    )
+                ),
+            )
+            .join(
+                SQLAlchemyQuizItem,
+                SQLAlchemyQuizItem.quiz_item_id
+                == SQLAlchemyQuizItemChoice.quiz_item_id,
+            )
+            .where(SQLAlchemyQuizItem.quiz_id.in_(quiz_ids))
+            .group_by(SQLAlchemyQuizItemChoice.quiz_item_id)
+        )
+        return {
+            quiz_item_id: list(choice_item_ids)
+            for quiz_item_id, choice_item_ids in results.tuples().all()
+        }
+
+
+async def read_json_quiz_items_by_choice(
+    async_session: AsyncSession, item_id: int
+) -> list[int]:
+    """Find the quiz items using an item as a choice by scanning the JSON column.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        item_id (int): The unique identifier for the item.
+
+    Returns:
+        list[int]: The ids of the quiz items.
+    """
+    async with async_session.begin():
+        results = await async_session.scalars(
+            select(SQLAlchemyQuizItem.quiz_item_id).where(
+                cast(SQLAlchemyQuizItem.choice_item_ids, JSONB).contains([item_id])
+            )
+        )
+        return list(results.all())
+
+
+async def measure(run: Callable[[], Awaitable[object]], repeat: int) -> float:
+    """Measure the median elapsed time of running a function.
+
+    Args:
+        run (Callable[[], Awaitable[object]]): The function to run.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The median elapsed time in milliseconds.
+    """
+    elapsed_milliseconds = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        await run()
+        elapsed_milliseconds.append((time.perf_counter() - start_time) * 1000)
+    return statistics.median(elapsed_milliseconds)
+
+
+async def main(
+    num_items: int, num_quizzes: int, num_questions: int, repeat: int
+) -> None:
+    """Benchmark storing the choices of quiz items as JSON against the `quiz_item_choices` table.
+
+    Args:
+        num_items (int): The number of items of the user.
+        num_quizzes (int): The number of quizzes created before reading.
+        num_questions (int): The number of questions of each quiz.
+        repeat (int): The number of times each operation is measured.
+    """
+    engine = create_database_engine()
+    async with engine.begin() as conn:
+        await migrate(conn)
+    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with async_session_maker() as async_session:
+        user = await UserRepository(async_session).create(
+            User(user_name=USER_NAME, email=f"{USER_NAME}@example.com", password="")
+        )
+        user_id: int = user.user_id  # type: ignore
+        try:
+            item_ids = await ItemRepository(async_session).copy_many(
+                [
+                    Item(
+                        user_id=user_id,
+                        english=f"english{i}",
+                        japanese=f"japanese{i}",
+                        grade=i % 8,
+                    )
+                    for i in range(num_items)
+                ]
+            )
+            quiz_repository = QuizRepository(async_session)
+            quiz_ids: list[int] = []
+            for _ in range(num_quizzes):
+                quiz, _ = await quiz_repository.create_with_items(
+                    Quiz(
+                        user_id=user_id,
+                        deck_id=None,
+                        quiz_type=MULTIPLE_CHOICE_QUIZ_TYPE,
+                    ),
+                    make_quiz_items(item_ids, num_questions),
+                )
+                quiz_ids.append(quiz.quiz_id)  # type: ignore
+            print(
+                f"Stored the choices of {num_quizzes * num_questions} quiz items "
+                f"({num_quizzes} quizzes of {num_questions} questions)"
+            )
+
+            page_quiz_ids = quiz_ids[-100:]
+            quiz_item_repository = QuizItemRepository(async_session)
+            for operation, runs in (
+                (
+                    "create a quiz",
+                    (
+                        (
+                            "JSON column        ",
+                            lambda: create_with_json_choices(
+                                async_session,
+                                user_id,
+                                make_quiz_items(item_ids, num_questions),
+                            ),
+                        ),
+                        (
+                            "JSON + choice table",
+                            lambda: quiz_repository.create_with_items(
+                                Quiz(
+                                    user_id=user_id,
+                                    deck_id=None,
+                                    quiz_type=MULTIPLE_CHOICE_QUIZ_TYPE,
+                                ),
+                                make_quiz_items(item_ids, num_questions),
+                            ),
+                        ),
+                    ),
+                ),
+                (
+                    "read the choices of 100 quizzes",
+                    (
+                        (
+                            "JSON column        ",
+                            lambda: read_json_choices(async_session, page_quiz_ids),
+                        ),
+                        (
+                            "choice table       ",
+                            lambda: read_table_choices(async_session, page_quiz_ids),
+                        ),
+                    ),
+                ),
+                (
+                    "find the quiz items using an item as a choice",
+                    (
+                        (
+                            "JSON column        ",
+                            lambda: read_json_quiz_items_by_choice(
+                                async_session, random.choice(item_ids)
+                            ),
+                        ),
+                        (
+                            "choice table       ",
+                            lambda: quiz_item_repository.read_by_choice_item_id(
+                                random.choice(item_ids)
+                            ),
+                        ),
+                    ),
+                ),
+            ):
+                print(f"{operation}:")
+                for name, run in runs:
+                    print(f"  {name}: median {await measure(run, repeat):.2f} ms")
+        finally:
+            # Remove everything created by the benchmark.
+            async with async_session.begin():
+                await async_session.execute(
+                    delete(SQLAlchemyQuiz).where(SQLAlchemyQuiz.user_id == user_id)
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyItem).where(SQLAlchemyItem.user_id == user_id)
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyUser).where(SQLAlchemyUser.user_id == user_id)
+                )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the layouts of the choices of quiz items."
+    )
+    parser.add_argument("--num-items", type=int, default=10000)
+    parser.add_argument("--num-quizzes", type=int, default=2000)
+    parser.add_argument("--num-questions", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.num_items, args.num_quizzes, args.num_questions, args.repeat))
@@ -0,0 +1,188 @@
+# ruff: noqa: INP001
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.db.engine import create_database_engine
+from src.db.migrations import migrate
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyItem,
+    SQLAlchemyQuiz,
+    SQLAlchemyUser,
+)
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.db.repositories.sqlalchemy.quiz_item_repository import QuizItemRepository
+from src.db.repositories.sqlalchemy.quiz_repository import QuizRepository
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import Item, Quiz, QuizItem, User
+from src.domain.services.quiz_service.item_index import ItemIndex
+from src.domain.services.quiz_service.quiz_generation import (
+    DEFAULT_NUM_CHOICES,
+    MULTIPLE_CHOICE_QUIZ_TYPE,
+    generate_quiz,
+)
+
+USER_NAME = "quiz_generation_benchmark_user"
+
+
+async def legacy_generate_quiz(
+    async_session: AsyncSession, user_id: int, num_questions: int
+) -> None:
+    """Generate a quiz as the old test usecase did, with a query per distractor and per quiz item.
+
+    Args:
+        async_session (AsyncSession): The async session.
+        user_id (int): The unique identifier for the user who takes the quiz.
+        num_questions (int): The number of questions.
+    """
+    item_repository = ItemRepository(async_session)
+    item_ids = [item.item_id for item in await item_repository.read_by_user_id(user_id)]
+    questions = await item_repository.read_many(random.sample(item_ids, num_questions))  # type: ignore
+    quiz = await QuizRepository(async_session).create(
+        Quiz(user_id=user_id, deck_id=None, quiz_type=MULTIPLE_CHOICE_QUIZ_TYPE)
+    )
+    quiz_item_repository = QuizItemRepository(async_session)
+    for question_number, question in enumerate(questions, 1):
+        distractor_ids = random.sample(
+            [id for id in item_ids if id != question.item_id], DEFAULT_NUM_CHOICES - 1
+        )
+        choice_ids = [(await item_repository.read(id)).item_id for id in distractor_ids]  # type: ignore
+        correct_answer = random.randrange(DEFAULT_NUM_CHOICES)
+        choice_ids.insert(correct_answer, question.item_id)
+        await quiz_item_repository.create(
+            QuizItem(
+                quiz_id=quiz.quiz_id,
+                item_id=question.item_id,
+                question_number=question_number,
+                choice_item_ids=choice_ids,  # type: ignore
+                correct_answer=correct_answer,
+            )
+        )
+
+
+async def measure(
+    generate: Callable[[], Awaitable[object]], repeat: int
+) -> list[float]:
+    """Measure the elapsed time of generating quizzes.
+
+    Args:
+        generate (Callable[[], Awaitable[object]]): The function that generates a quiz.
+        repeat (int): The number of quizzes to generate.
+
+    Returns:
+        list[float]: The elapsed time of each generation in milliseconds.
+    """
+    elapsed_milliseconds = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        await generate()
+        elapsed_milliseconds.append((time.perf_counter() - start_time) * 1000)
+    return elapsed_milliseconds
+
+
+async def main(num_items: int, num_questions: int, repeat: int) -> None:
+    """Benchmark generating a quiz out of the items of a user.
+
+    Args:
+        num_items (int): The number of items of the user.
+        num_questions (int): The number of questions of each quiz.
+        repeat (int): The number of quizzes generated by each method.
+    """
+    engine = create_database_engine()
+    async with engine.begin() as conn:
+        await migrate(conn)
+    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with async_session_maker() as async_session:
+        user = await UserRepository(async_session).create(
+            User(user_name=USER_NAME, email=f"{USER_NAME}@example.com", password="")
+        )
+        user_id: int = user.user_id  # type: ignore
+        try:
+            await ItemRepository(async_session).copy_many(
+                [
+                    Item(
+                        user_id=user_id,
+                        english=f"english{i}",
+                        japanese=f"japanese{i}",
+                        grade=i % 8,
+                    )
+                    for i in range(num_items)
+                ]
+            )
+            print(
+                f"Generated quizzes of {num_questions} questions out of {num_items} items"
+            )
+            item_index = ItemIndex(refresh_seconds=60)
+            await item_index.refresh(ItemRepository(async_session))
+            for name, generate in (
+                (
+                    "before (a query per distractor)",
+                    lambda: legacy_generate_quiz(async_session, user_id, num_questions),
+                ),
+                (
+                    "after (generate_quiz)          ",
+                    lambda: generate_quiz(
+                        ItemRepository(async_session),
+                        QuizRepository(async_session),
+                        user_id,
+                        num_questions,
+                    ),
+                ),
+                (
+                    "after (item index)             ",
+                    lambda: generate_quiz(
+                        ItemRepository(async_session),
+                        QuizRepository(async_session),
+                        user_id,
+                        num_questions,
+                        item_index=item_index,
+                    ),
+                ),
+                (
+                    "after (similar distractors)    ",
+                    lambda: generate_quiz(
+                        ItemRepository(async_session),
+                        QuizRepository(async_session),
+                        user_id,
+                        num_questions,
+                        item_index=item_index,
+                        similar_distractors=True,
+                    ),
+                ),
+            ):
+                elapsed_milliseconds = await measure(generate, repeat)
+                print(
+                    f"  {name}: median {statistics.median(elapsed_milliseconds):.1f} ms"
+                )
+        finally:
+            # Remove everything created by the benchmark.
+            async with async_session.begin():
+                await async_session.execute(
+                    delete(SQLAlchemyQuiz).where(SQLAlchemyQuiz.user_id == user_id)
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyItem).where(SQLAlchemyItem.user_id == user_id)
+                )
+                await async_session.execute(
+                    delete(SQLAlchemyUser).where(SQLAlchemyUser.user_id == user_id)
+                )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark generating a multiple-choice quiz."
+    )
+    parser.add_argument("--num-items", type=int, default=10000)
+    parser.add_argument("--num-questions", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.num_items, args.num_questions, args.repeat))
@@ -0,0 +1,84 @@
+# ruff: noqa: INP001
+import argparse
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.db.engine import create_database_engine
+from src.db.migrations import check_schema_version, migrate
+from src.db.models.sqlalchemy_data_models import Base
+
+
+async def create_all(connection: AsyncConnection) -> None:
+    """Create the tables of the data models as every worker used to on startup.
+
+    Args:
+        connection (AsyncConnection): The connection to the database.
+    """
+    await connection.run_sync(Base.metadata.create_all)
+
+
+async def measure(
+    prepare_schema: Callable[[AsyncConnection], Awaitable[object]], repeat: int
+) -> tuple[list[float], list[float]]:
+    """Measure the database part of the app startup, from a new engine to the first ready connection.
+
+    Args:
+        prepare_schema (Callable[[AsyncConnection], Awaitable[object]]): The schema step of the startup.
+        repeat (int): The number of startups.
+
+    Returns:
+        tuple[list[float], list[float]]: The elapsed time of each startup and of each schema step
+            in milliseconds.
+    """
+    startup_milliseconds = []
+    schema_milliseconds = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        engine = create_database_engine()
+        async with engine.begin() as connection:
+            schema_start_time = time.perf_counter()
+            await prepare_schema(connection)
+            end_time = time.perf_counter()
+        startup_milliseconds.append((end_time - start_time) * 1000)
+        schema_milliseconds.append((end_time - schema_start_time) * 1000)
+        await engine.dispose()
+    return startup_milliseconds, schema_milliseconds
+
+
+async def main(repeat: int) -> None:
+    """Benchmark the startup with `create_all` against the startup with the schema version check.
+
+    Args:
+        repeat (int): The number of startups of each kind.
+    """
+    engine = create_database_engine()
+    async with engine.begin() as connection:
+        await migrate(connection)
+    await engine.dispose()
+
+    for name, prepare_schema in (
+        ("before (Base.metadata.create_all)", create_all),
+        ("after (check_schema_version)     ", check_schema_version),
+    ):
+        startup_milliseconds, schema_milliseconds = await measure(
+            prepare_schema, repeat
+        )
+        print(
+            f"  {name}: startup median {statistics.median(startup_milliseconds):.1f} ms, "
+            f"schema step median {statistics.median(schema_milliseconds):.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the database part of the app startup."
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    print(f"Started the app {args.repeat} times against a migrated database")
+    asyncio.run(main(args.repeat))
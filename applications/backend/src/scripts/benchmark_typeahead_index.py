@@ -0,0 +1,97 @@
+# ruff: noqa: INP001
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from src.domain.services.item_service.base_item_index import ItemIndexEntry
+from src.domain.services.item_service.typeahead_index import TypeaheadIndex
+
+# Japanese characters to make up glosses of realistic byte lengths from, in hiragana and katakana.
+KANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
+KATAKANA = "アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン"
+# English syllables to make up words sharing prefixes with each other from.
+SYLLABLES = [consonant + vowel for consonant in "bcdfghklmnprstvw" for vowel in "aeiou"]
+
+
+def make_entries(num_items: int, num_users: int) -> list[ItemIndexEntry]:
+    """Make entries of items owned by a few users, or shared, with words of 2 to 4 syllables
+    and glosses of 2 to 6 characters.
+
+    Args:
+        num_items (int): The number of items.
+        num_users (int): The number of users owning the items besides the shared ones.
+
+    Returns:
+        list[ItemIndexEntry]: The entries ordered by their ids.
+    """
+    rng = random.Random(0)
+    now = datetime.now()
+    return [
+        ItemIndexEntry(
+            item_id=item_id,
+            user_id=rng.choice([None, *range(1, num_users + 1)]),
+            grade=rng.randrange(1, 9),
+            english="".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))),
+            japanese="".join(
+                rng.choices(rng.choice([KANA, KATAKANA]), k=rng.randint(2, 6))
+            ),
+            updated_at=now,
+        )
+        for item_id in range(1, num_items + 1)
+    ]
+
+
+def main(num_items: int, num_users: int, repeat: int) -> None:
+    """Measure the memory of the typeahead index and the time of suggesting items by prefixes.
+
+    Args:
+        num_items (int): The number of items in the index.
+        num_users (int): The number of users owning the items besides the shared ones.
+        repeat (int): The number of suggestions measured per prefix length.
+    """
+    entries = make_entries(num_items, num_users)
+    index = TypeaheadIndex(refresh_seconds=60)
+    start_time = time.perf_counter()
+    index.load(entries)
+    load_seconds = time.perf_counter() - start_time
+    num_bytes = index.memory_bytes()
+    print(
+        f"Indexed {num_items} items in {load_seconds * 1000:.0f} ms: "
+        f"{num_bytes / 2**20:.1f} MiB, {num_bytes / num_items:.1f} bytes per item"
+    )
+
+    rng = random.Random(0)
+    kinds: list[tuple[str, Callable[[ItemIndexEntry], str], list[int] | None]] = [
+        ("English, 1 letter", lambda entry: entry.english[:1], None),
+        ("English, 3 letters", lambda entry: entry.english[:3], None),
+        ("English, 3 letters of one grade", lambda entry: entry.english[:3], [1]),
+        ("Japanese, 2 kana", lambda entry: entry.japanese[:2], None),
+    ]
+    for name, make_prefix, grades in kinds:
+        elapsed_microseconds = []
+        for _ in range(repeat):
+            prefix = make_prefix(rng.choice(entries))
+            start_time = time.perf_counter()
+            index.suggest(prefix, user_id=1, grades=grades)
+            elapsed_microseconds.append((time.perf_counter() - start_time) * 1_000_000)
+        percentiles = statistics.quantiles(
+            elapsed_microseconds, n=100, method="inclusive"
+        )
+        print(
+            f"Suggested 10 items for {name}: "
+            f"p50 {percentiles[49]:.0f} µs, p99 {percentiles[98]:.0f} µs"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the memory and the suggestion time of the typeahead index."
+    )
+    parser.add_argument("--num-items", type=int, default=1_000_000)
+    parser.add_argument("--num-users", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.num_items, args.num_users, args.repeat)
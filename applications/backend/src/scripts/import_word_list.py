@@ -0,0 +1,89 @@
+# ruff: noqa: INP001
+import argparse
+from typing import TextIO
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.db.engine import create_database_engine
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.domain.services.item_service.word_list_import import (
+    DEFAULT_CHUNK_SIZE,
+    WordListImportResult,
+    import_word_list,
+)
+
+
+def print_progress(result: WordListImportResult) -> None:
+    """Print the progress of an import.
+
+    Args:
+        result (WordListImportResult): The statistics of the import so far.
+    """
+    print(
+        f"Imported {result.num_items} items in {result.elapsed_seconds:.2f} s "
+        f"({result.items_per_second:.0f} items/s)"
+    )
+
+
+async def main(
+    stream: TextIO,
+    user_id: int | None,
+    deck_id: int | None,
+    genre_id: int | None,
+    chunk_size: int,
+) -> None:
+    """Import a CSV/TSV word list into the `items` table.
+
+    Args:
+        stream (TextIO): The text stream of the word list.
+        user_id (int | None): The unique identifier for the user who owns the items.
+        deck_id (int | None): The unique identifier for the deck to add the items to, if any.
+        genre_id (int | None): The unique identifier for the genre to tag the items with, if any.
+        chunk_size (int): The maximum number of items loaded into the database at once.
+    """
+    # Create a new async engine instance, which offers a session environment to manage a database.
+    engine = create_database_engine()
+
+    # Create a factiry that returns a new AsyncSession instance.
+    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    # This context automatically calls async_session.close() when the code block is exited.
+    async with async_session_maker() as async_session:
+        result = await import_word_list(
+            ItemRepository(async_session),
+            stream,
+            user_id=user_id,
+            deck_id=deck_id,
+            genre_id=genre_id,
+            chunk_size=chunk_size,
+            on_progress=print_progress,
+        )
+    await engine.dispose()
+
+    print("The word list has successfully been imported!")
+    print_progress(result)
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    parser = argparse.ArgumentParser(
+        description="Import a CSV/TSV word list with `english`, `japanese` and `grade` columns."
+    )
+    parser.add_argument("path", help="The path to the word list.")
+    parser.add_argument("--user-id", type=int, help="The owner of the items.")
+    parser.add_argument("--deck-id", type=int, help="The deck to add the items to.")
+    parser.add_argument("--genre-id", type=int, help="The genre of the items.")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="The number of items loaded into the database at once.",
+    )
+    args = parser.parse_args()
+
+    # `utf-8-sig` also accepts word lists saved with a BOM (e.g. by Excel).
+    with open(args.path, encoding="utf-8-sig", newline="") as stream:
+        asyncio.run(
+            main(stream, args.user_id, args.deck_id, args.genre_id, args.chunk_size)
+        )
@@ -1,31 +1,45 @@
 # ruff: noqa: INP001
-# This is necessary to ensure the models are all imported and registered.
-from typing import cast
-
-from db.models.sqlalchemy_data_models import Base
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from src.core.config import settings
 from src.core.security import get_password_hash
+from src.db.engine import create_database_engine
+from src.db.migrations import migrate, migration_metadata
+
+# This is necessary to ensure the models are all imported and registered.
+from src.db.models.sqlalchemy_data_models import Base
 from src.db.repositories.sqlalchemy.user_repository import UserRepository
 from src.domain.models import User
 
 
-async def create_first_superuser() -> None:
-    """Create the first superuser.
+async def create_first_superuser(reset: bool = False) -> None:
+    """Migrate the database and create the first superuser.
 
-    This function creates the first superuser if it doesn't exist.
+    This function applies the migrations that have not been applied yet and creates
+    the first superuser if it doesn't exist. It is safe to run repeatedly, e.g. on every deployment.
+
+    Args:
+        reset (bool): Whether to drop all tables, including the applied schema versions, beforehand.
     """
     # Create a new async engine instance, which offers a session environment to manage a database.
-    engine = create_async_engine(cast(str, settings.SQLALCHEMY_DATABASE_URI))
+    engine = create_database_engine()
 
     # Create a factiry that returns a new AsyncSession instance.
     async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
-    # Drop and create all tables defined as data models under `src/db`.
+    if reset:
+        # Drop all tables defined as data models under `src/db`.
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(migration_metadata.drop_all)
+
+    # Create and upgrade the tables in a single transaction.
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+        versions = await migrate(conn)
+    if versions:
+        print(f"Applied migrations: {', '.join(map(str, versions))}")
+    else:
+        print("The database schema is up to date!")
 
     # This context automatically calls async_session.close() when the code block is exited.
     async with async_session_maker() as async_session:
@@ -42,13 +56,23 @@ async def create_first_superuser() -> None:
                 is_superuser=True,
             )
             await user_repository.create(user_in)
+            print("First superuser has successfully been created!")
         else:
             print("First superuser already exists!")
-
-    print("First superuser has successfully been created!")
+    await engine.dispose()
 
 
 if __name__ == "__main__":
+    import argparse
     import asyncio
 
-    asyncio.run(create_first_superuser())
+    parser = argparse.ArgumentParser(
+        description="Migrate the database and create the first superuser."
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Drop all tables before migrating. All data will be lost.",
+    )
+    args = parser.parse_args()
+    asyncio.run(create_first_superuser(args.reset))
@@ -3,6 +3,8 @@ from asgi_lifespan import LifespanManager
 
 from src.core.config import settings
 from src.core.main import app
+from src.db.engine import create_database_engine
+from src.db.migrations import migrate
 from tests.utils import random_email
 
 settings.TEST_USER_EMAIL = random_email()
@@ -24,8 +26,14 @@ async def lifespan_manager() -> LifespanManager:
     Yields:
         LifespanManager: An instance of LifespanManager.
     """
+    # The app only checks the schema version on startup, so migrate the database beforehand.
+    engine = create_database_engine()
+    async with engine.begin() as conn:
+        await migrate(conn)
+    await engine.dispose()
+
     # On entering/exiting the context, the lifespan manager executes the `startup/shutdown` event.
-    # Startup events include 1. creating an engine, 2. creating session factory, and 3. initializing database tables.
+    # Startup events include 1. creating an engine, 2. creating session factory, and 3. checking the schema version.
     # Shutdown events include closing the engine.
     async with LifespanManager(app) as manager:
         yield manager
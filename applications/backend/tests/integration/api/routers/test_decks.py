@@ -1,6 +1,12 @@
+import json
+
 import pytest
 from httpx import AsyncClient
 
+from src.core.security import get_password_hash
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import User
+
 pytestmark = pytest.mark.anyio
 
 
@@ -30,7 +36,8 @@ async def test_deck_get(normal_async_test_client: AsyncClient) -> None:
     print(normal_async_test_client.build_request("GET", "/decks/").url)
     response = await normal_async_test_client.get("/decks/")
     assert response.status_code == 200
-    assert response.json() == [{"deck_id": 1, "deck_name": "dummy_deck"}]
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
 
 
 async def test_deck_post(normal_async_test_client: AsyncClient) -> None:
@@ -45,3 +52,330 @@ async def test_deck_post(normal_async_test_client: AsyncClient) -> None:
     )
     assert response.status_code == 200
     assert response.json() == {"deck_id": 1, "deck_name": "dummy_deck"}
+
+
+async def test_deck_post_as_another_user(
+    normal_async_test_client: AsyncClient,
+) -> None:
+    """Test if the POST /decks/ endpoint creates the deck of the current user, who is not user1.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    # Import `async_session_factory` here to make sure the lifespan manager is executed before creating the session.
+    from src.core.main import async_session_factory
+
+    # Log in as another user, whose id is 2.
+    async with async_session_factory() as async_session:
+        await UserRepository(async_session).create(
+            User(
+                user_name="another_user@example.com",
+                email="another_user@example.com",
+                password=get_password_hash("another_password"),
+            )
+        )
+    response = await normal_async_test_client.post(
+        "/login/access-token",
+        data={"username": "another_user@example.com", "password": "another_password"},
+    )
+    token = response.json()["access_token"]
+    normal_async_test_client.headers = {"Authorization": f"bearer {token}"}
+
+    response = await normal_async_test_client.post(
+        "/decks/", json={"deck_name": "another_deck"}
+    )
+    assert response.status_code == 200
+    deck_id = response.json()["deck_id"]
+    # Test if the deck is listed and readable by the user who created it.
+    response = await normal_async_test_client.get("/decks/")
+    assert [deck["deck_id"] for deck in response.json()] == [deck_id]
+    response = await normal_async_test_client.get(f"/decks/{deck_id}/items")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+async def test_deck_get_paginated(normal_async_test_client: AsyncClient) -> None:
+    """Test the keyset pagination and the streaming mode of the GET /decks/ endpoint.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    for deck_name in ["dummy_deck1", "dummy_deck2", "dummy_deck3"]:
+        response = await normal_async_test_client.post(
+            "/decks/", json={"deck_name": deck_name}
+        )
+        assert response.status_code == 200
+
+    # Test if the first page has a cursor to the next page.
+    response = await normal_async_test_client.get("/decks/", params={"limit": 2})
+    assert response.status_code == 200
+    assert [deck["deck_id"] for deck in response.json()] == [1, 2]
+    assert response.headers["X-Next-Cursor"] == "2"
+
+    # Test if the last page is read with the cursor.
+    response = await normal_async_test_client.get(
+        "/decks/", params={"cursor": response.headers["X-Next-Cursor"], "limit": 2}
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "deck_id": 3,
+            "deck_name": "dummy_deck3",
+            "item_count": 0,
+            "last_studied_at": None,
+        }
+    ]
+    assert "X-Next-Cursor" not in response.headers
+
+    # Test if the streaming mode returns all the decks after the cursor as NDJSON.
+    response = await normal_async_test_client.get(
+        "/decks/", params={"cursor": 1, "stream": True}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {
+            "deck_id": 2,
+            "deck_name": "dummy_deck2",
+            "item_count": 0,
+            "last_studied_at": None,
+        },
+        {
+            "deck_id": 3,
+            "deck_name": "dummy_deck3",
+            "item_count": 0,
+            "last_studied_at": None,
+        },
+    ]
+
+    # Test if a limit beyond the maximum page size is rejected.
+    response = await normal_async_test_client.get("/decks/", params={"limit": 10**6})
+    assert response.status_code == 422
+
+
+async def test_deck_items_get(normal_async_test_client: AsyncClient) -> None:
+    """Test the GET /decks/{deck_id}/items endpoint.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    response = await normal_async_test_client.post(
+        "/decks/", json={"deck_name": "dummy_deck"}
+    )
+    deck_id = response.json()["deck_id"]
+    word_list = "english,japanese,grade\napple,りんご,1\ndog,犬,2\n"
+    response = await normal_async_test_client.post(
+        "/items/import",
+        params={"deck_id": deck_id},
+        files={"file": ("word_list.csv", word_list.encode("utf-8"))},
+    )
+    assert response.status_code == 200
+
+    # Test if the items in the deck are paginated.
+    response = await normal_async_test_client.get(
+        f"/decks/{deck_id}/items", params={"limit": 1}
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"item_id": 1, "english": "apple", "japanese": "りんご", "grade": 1}
+    ]
+    assert response.headers["X-Next-Cursor"] == "1"
+
+    # Test if the rest of the items in the deck are streamed as NDJSON.
+    response = await normal_async_test_client.get(
+        f"/decks/{deck_id}/items", params={"cursor": 1, "stream": True}
+    )
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"item_id": 2, "english": "dog", "japanese": "犬", "grade": 2}
+    ]
+
+    # Test if the items in the deck are filtered by grade and ordered by a known order only.
+    response = await normal_async_test_client.get(
+        f"/decks/{deck_id}/items", params={"order_by": "grade", "grade": 2}
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"item_id": 2, "english": "dog", "japanese": "犬", "grade": 2}
+    ]
+    response = await normal_async_test_client.get(
+        f"/decks/{deck_id}/items", params={"order_by": "english"}
+    )
+    assert response.status_code == 422
+
+    # Test if the items are counted in the list of the decks.
+    response = await normal_async_test_client.get("/decks/")
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "deck_id": deck_id,
+            "deck_name": "dummy_deck",
+            "item_count": 2,
+            "last_studied_at": None,
+        }
+    ]
+
+    # Test if the items in a non-existent deck are not found.
+    response = await normal_async_test_client.get("/decks/100/items")
+    assert response.status_code == 404
+
+
+async def test_deck_items_post_and_delete(
+    normal_async_test_client: AsyncClient,
+) -> None:
+    """Test the endpoints adding items to and removing items from a deck, one by one and in batches.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    response = await normal_async_test_client.post(
+        "/decks/", json={"deck_name": "dummy_deck"}
+    )
+    deck_id = response.json()["deck_id"]
+
+    # Test if a new item is created in the deck.
+    response = await normal_async_test_client.post(
+        f"/decks/{deck_id}/items",
+        json={"english": "apple", "japanese": "りんご", "grade": 1},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "item_id": 1,
+        "english": "apple",
+        "japanese": "りんご",
+        "grade": 1,
+    }
+
+    # Test if new items are created and existing items are added at once, skipping the items
+    # already in the deck and the missing items.
+    response = await normal_async_test_client.post(
+        f"/decks/{deck_id}/items/batch",
+        json={
+            "item_ids": [1, 100],
+            "items": [
+                {"english": "dog", "japanese": "犬", "grade": 2},
+                {"english": "cat", "japanese": "猫", "grade": 2},
+            ],
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() == {"num_added": 2, "num_skipped": 2, "item_ids": [2, 3]}
+    response = await normal_async_test_client.get(f"/decks/{deck_id}/items")
+    assert [item["english"] for item in response.json()] == ["apple", "dog", "cat"]
+
+    # Test if new items with blank texts are rejected in the same way as by POST /items/.
+    blank_item = {"english": "cow", "japanese": " ", "grade": 1}
+    response = await normal_async_test_client.post("/items/", json=blank_item)
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    response = await normal_async_test_client.post(
+        f"/decks/{deck_id}/items", json=blank_item
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+    response = await normal_async_test_client.post(
+        f"/decks/{deck_id}/items/batch", json={"items": [blank_item]}
+    )
+    assert response.status_code == 400
+    response = await normal_async_test_client.get(f"/decks/{deck_id}/items")
+    assert len(response.json()) == 3
+
+    # Test if items are removed at once, skipping the items not in the deck.
+    response = await normal_async_test_client.request(
+        "DELETE", f"/decks/{deck_id}/items", json={"item_ids": [1, 3, 100]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"num_removed": 2, "num_skipped": 1}
+
+    # Test if an item is removed, and an item not in the deck is not found.
+    response = await normal_async_test_client.delete(f"/decks/{deck_id}/items/2")
+    assert response.status_code == 200
+    assert response.json() is True
+    response = await normal_async_test_client.delete(f"/decks/{deck_id}/items/2")
+    assert response.status_code == 404
+    response = await normal_async_test_client.get(f"/decks/{deck_id}/items")
+    assert response.json() == []
+
+    # Test if the items of a non-existent deck are not changed.
+    response = await normal_async_test_client.post(
+        "/decks/100/items/batch", json={"item_ids": [1]}
+    )
+    assert response.status_code == 404
+
+
+async def test_deck_clone_and_combine(normal_async_test_client: AsyncClient) -> None:
+    """Test the POST /decks/{deck_id}/clone and POST /decks/combine endpoints.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    deck_ids = []
+    for deck_name, items in [
+        ("deck1", [["apple", "りんご"], ["dog", "犬"]]),
+        ("deck2", [["cat", "猫"]]),
+    ]:
+        response = await normal_async_test_client.post(
+            "/decks/", json={"deck_name": deck_name}
+        )
+        deck_ids.append(response.json()["deck_id"])
+        response = await normal_async_test_client.post(
+            f"/decks/{deck_ids[-1]}/items/batch",
+            json={
+                "items": [
+                    {"english": english, "japanese": japanese, "grade": 1}
+                    for english, japanese in items
+                ]
+            },
+        )
+        assert response.status_code == 200
+    # Add "dog" to deck2 as well.
+    await normal_async_test_client.post(
+        f"/decks/{deck_ids[1]}/items/batch", json={"item_ids": [2]}
+    )
+
+    # Test if a deck is cloned with its items.
+    response = await normal_async_test_client.post(
+        f"/decks/{deck_ids[0]}/clone", json={"deck_name": "clone"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "deck_id": 3,
+        "deck_name": "clone",
+        "item_count": 2,
+        "last_studied_at": None,
+    }
+    response = await normal_async_test_client.get("/decks/3/items")
+    assert [item["english"] for item in response.json()] == ["apple", "dog"]
+
+    # Test if the decks are combined by the set operations.
+    for operation, expected_english in [
+        ("union", ["apple", "dog", "cat"]),
+        ("intersect", ["dog"]),
+        ("difference", ["apple"]),
+    ]:
+        response = await normal_async_test_client.post(
+            "/decks/combine",
+            json={"deck_name": operation, "operation": operation, "deck_ids": deck_ids},
+        )
+        assert response.status_code == 200
+        assert response.json()["item_count"] == len(expected_english)
+        response = await normal_async_test_client.get(
+            f"/decks/{response.json()['deck_id']}/items"
+        )
+        assert [item["english"] for item in response.json()] == expected_english
+
+    # Test if a non-existent deck is neither cloned nor combined.
+    response = await normal_async_test_client.post(
+        "/decks/100/clone", json={"deck_name": "clone"}
+    )
+    assert response.status_code == 404
+    response = await normal_async_test_client.post(
+        "/decks/combine",
+        json={"deck_name": "union", "operation": "union", "deck_ids": [1, 100]},
+    )
+    assert response.status_code == 404
+    response = await normal_async_test_client.post(
+        "/decks/combine",
+        json={"deck_name": "union", "operation": "union", "deck_ids": []},
+    )
+    assert response.status_code == 422
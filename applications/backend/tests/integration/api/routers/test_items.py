@@ -0,0 +1,201 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from src.domain.services.item_service.word_list_import import DEFAULT_CHUNK_SIZE
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_item_import(normal_async_test_client: AsyncClient) -> None:
+    """Test the POST /items/import endpoint.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    word_list = "id\tenglish\tjapanese\tgrade\n1\tapple\tりんご\t1\n2\tdog\t犬\t2\n"
+    response = await normal_async_test_client.post(
+        "/items/import",
+        files={"file": ("word_list.tsv", word_list.encode("utf-8"))},
+    )
+    assert response.status_code == 200
+    assert response.json()["num_items"] == 2
+
+    # Test if a malformed word list is rejected.
+    response = await normal_async_test_client.post(
+        "/items/import",
+        files={"file": ("word_list.csv", b"english,grade\napple,1\n")},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"]["num_items"] == 0
+
+    # Test if the items before a malformed line late in a word list are kept and counted.
+    word_list_with_error = "english,japanese,grade\n" + "".join(
+        f"word{i},単語{i},1\n" for i in range(DEFAULT_CHUNK_SIZE)
+    )
+    response = await normal_async_test_client.post(
+        "/items/import",
+        files={
+            "file": (
+                "word_list.csv",
+                (word_list_with_error + "cow,牛,first\n").encode("utf-8"),
+            )
+        },
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"]["num_items"] == DEFAULT_CHUNK_SIZE
+    assert "Line" in response.json()["detail"]["message"]
+
+    # Test if importing into a non-existent deck is rejected.
+    response = await normal_async_test_client.post(
+        "/items/import",
+        params={"deck_id": 100},
+        files={"file": ("word_list.tsv", word_list.encode("utf-8"))},
+    )
+    assert response.status_code == 404
+
+    # Test if importing with a non-existent genre is rejected without importing anything.
+    response = await normal_async_test_client.post(
+        "/items/import",
+        params={"genre_id": 100},
+        files={"file": ("word_list.tsv", "english\tjapanese\tgrade\ncat\t猫\t1\n")},
+    )
+    assert response.status_code == 400
+    response = await normal_async_test_client.get("/items/", params={"q": "cat"})
+    assert response.json() == []
+
+
+async def test_item_get(normal_async_test_client: AsyncClient) -> None:
+    """Test the GET /items/ endpoint.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    word_list = "english,japanese,grade\napple,りんご,1\ndog,犬,2\ncat,猫,2\n"
+    response = await normal_async_test_client.post(
+        "/items/import",
+        files={"file": ("word_list.csv", word_list.encode("utf-8"))},
+    )
+    assert response.status_code == 200
+
+    # Test if the items are paginated.
+    response = await normal_async_test_client.get("/items/", params={"limit": 2})
+    assert response.status_code == 200
+    assert response.json() == [
+        {"item_id": 1, "english": "apple", "japanese": "りんご", "grade": 1},
+        {"item_id": 2, "english": "dog", "japanese": "犬", "grade": 2},
+    ]
+    assert response.headers["X-Next-Cursor"] == "2"
+
+    # Test if the rest of the items are streamed as NDJSON.
+    response = await normal_async_test_client.get(
+        "/items/", params={"cursor": 2, "stream": True}
+    )
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"item_id": 3, "english": "cat", "japanese": "猫", "grade": 2}
+    ]
+
+    # Test if the items are searched in English and Japanese, and filtered by grade.
+    response = await normal_async_test_client.get("/items/", params={"q": "do"})
+    assert response.status_code == 200
+    assert [item["english"] for item in response.json()] == ["dog"]
+    response = await normal_async_test_client.get("/items/", params={"q": "猫"})
+    assert [item["english"] for item in response.json()] == ["cat"]
+    response = await normal_async_test_client.get(
+        "/items/", params={"q": "PPL", "grades": [1, 2]}
+    )
+    assert [item["english"] for item in response.json()] == ["apple"]
+    response = await normal_async_test_client.get(
+        "/items/", params={"grades": [2], "stream": True}
+    )
+    assert [json.loads(line)["english"] for line in response.text.splitlines()] == [
+        "dog",
+        "cat",
+    ]
+
+    # Test if searching a non-existent deck is rejected.
+    response = await normal_async_test_client.get("/items/", params={"deck_id": 100})
+    assert response.status_code == 404
+
+
+async def test_item_suggest(normal_async_test_client: AsyncClient) -> None:
+    """Test the GET /items/suggest endpoint.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    word_list = "english,japanese,grade\napple,りんご,1\napplication,アプリ,2\ndog,犬,2\n"
+    response = await normal_async_test_client.post(
+        "/items/import",
+        files={"file": ("word_list.csv", word_list.encode("utf-8"))},
+    )
+    assert response.status_code == 200
+
+    # Test if the imported items are suggested by their prefixes without waiting for a refresh.
+    response = await normal_async_test_client.get("/items/suggest", params={"q": "Ap"})
+    assert response.status_code == 200
+    assert response.json() == [
+        {"item_id": 1, "english": "apple", "japanese": "りんご", "grade": 1},
+        {"item_id": 2, "english": "application", "japanese": "アプリ", "grade": 2},
+    ]
+    response = await normal_async_test_client.get(
+        "/items/suggest", params={"q": "ap", "grades": [2]}
+    )
+    assert [item["item_id"] for item in response.json()] == [2]
+    response = await normal_async_test_client.get("/items/suggest", params={"q": "あぷ"})
+    assert [item["item_id"] for item in response.json()] == [2]
+
+    # Test if an empty prefix is rejected.
+    response = await normal_async_test_client.get("/items/suggest", params={"q": ""})
+    assert response.status_code == 422
+
+
+async def test_item_create(normal_async_test_client: AsyncClient) -> None:
+    """Test the POST /items/ and POST /items/batch endpoints.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    response = await normal_async_test_client.post(
+        "/items/", json={"english": "Take off", "japanese": "離陸する", "grade": 1}
+    )
+    assert response.status_code == 200
+    item = response.json()
+    assert item["english"] == "Take off"
+
+    # Test if creating the same item again with different case and whitespace returns the existing item.
+    response = await normal_async_test_client.post(
+        "/items/", json={"english": " take  OFF", "japanese": "離陸する", "grade": 2}
+    )
+    assert response.status_code == 200
+    assert response.json() == item
+
+    # Test if the duplicates of existing items and of each other are skipped in a batch.
+    response = await normal_async_test_client.post(
+        "/items/batch",
+        json={
+            "items": [
+                {"english": "apple", "japanese": "りんご", "grade": 1},
+                {"english": "TAKE OFF", "japanese": "離陸する", "grade": 1},
+                {"english": "Apple", "japanese": "りんご", "grade": 1},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["num_created"] == 1
+    assert result["num_skipped"] == 2
+    apple_id = result["item_ids"][0]
+    assert result["item_ids"] == [apple_id, item["item_id"], apple_id]
+    response = await normal_async_test_client.get("/items/", params={"q": "apple"})
+    assert [item["item_id"] for item in response.json()] == [apple_id]
+
+    # Test if blank texts and empty batches are rejected.
+    response = await normal_async_test_client.post(
+        "/items/", json={"english": " ", "japanese": "離陸する", "grade": 1}
+    )
+    assert response.status_code == 400
+    response = await normal_async_test_client.post("/items/batch", json={"items": []})
+    assert response.status_code == 422
@@ -0,0 +1,24 @@
+import pytest
+from httpx import AsyncClient
+
+from src.core.config import settings
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_metrics_get(admin_async_test_client: AsyncClient) -> None:
+    """Test the GET /metrics/ endpoint.
+
+    Args:
+        admin_async_test_client (AsyncClient): An asynchronous test client authorized as an admin user.
+    """
+    response = await admin_async_test_client.get("/metrics/")
+    assert response.status_code == 200
+    database_pool = response.json()["database_pool"]
+    assert database_pool["pool_size"] == settings.SQLALCHEMY_POOL_SIZE
+    assert database_pool["checkouts"] > 0
+    # The admin client has logged in, which verified a password in the hashing executor.
+    password_hashing = response.json()["password_hashing"]
+    assert password_hashing["max_workers"] == settings.PASSWORD_HASHING_MAX_WORKERS
+    assert password_hashing["tasks"] > 0
+    assert password_hashing["in_flight"] == 0
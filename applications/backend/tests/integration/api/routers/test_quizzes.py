@@ -0,0 +1,178 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete
+
+from src.api.dependencies import get_quiz_session_store
+from src.db.models.sqlalchemy_data_models import SQLAlchemyItem
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_quiz_post(normal_async_test_client: AsyncClient) -> None:
+    """Test the POST /quizzes/ endpoint.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    # Test if a quiz cannot be made without enough items.
+    response = await normal_async_test_client.post("/quizzes/", json={})
+    assert response.status_code == 400
+
+    word_list = "english,japanese,grade\n" + "".join(
+        f"english{i},japanese{i},{i % 2}\n" for i in range(10)
+    )
+    response = await normal_async_test_client.post(
+        "/items/import",
+        files={"file": ("word_list.csv", word_list.encode("utf-8"))},
+    )
+    assert response.status_code == 200
+
+    response = await normal_async_test_client.post(
+        "/quizzes/", json={"num_questions": 2, "grades": [0]}
+    )
+    assert response.status_code == 200
+    quiz = response.json()
+    assert quiz["quiz_id"] == 1
+    assert [quiz_item["question_number"] for quiz_item in quiz["quiz_items"]] == [1, 2]
+    for quiz_item in quiz["quiz_items"]:
+        # Test if the correct answer is one of the choices, all of which are of the grade.
+        answer = quiz_item["question"].replace("english", "japanese")
+        assert answer in quiz_item["choices"]
+        assert len(set(quiz_item["choices"])) == 4
+        assert all(int(choice[-1]) % 2 == 0 for choice in quiz_item["choices"])
+
+    # Test if a quiz cannot be made of a non-existent deck.
+    response = await normal_async_test_client.post("/quizzes/", json={"deck_id": 100})
+    assert response.status_code == 404
+
+    # Test if the quiz being taken is read back, but not a quiz that does not exist.
+    response = await normal_async_test_client.get(f"/quizzes/{quiz['quiz_id']}")
+    assert response.status_code == 200
+    assert response.json() == quiz
+    response = await normal_async_test_client.get("/quizzes/100")
+    assert response.status_code == 404
+
+    # Test if the answers are graded, and the choices are the ones shown in the quiz.
+    answers = [
+        {
+            "question_number": quiz_item["question_number"],
+            "choices": quiz_item["choices"],
+            "user_answer": 0,
+            "answer_time": 5,
+        }
+        for quiz_item in quiz["quiz_items"]
+    ]
+    response = await normal_async_test_client.post(
+        f"/quizzes/{quiz['quiz_id']}", json=answers
+    )
+    assert response.status_code == 200
+    checked_quiz = response.json()
+    assert checked_quiz["quiz_id"] == quiz["quiz_id"]
+    assert checked_quiz["timestamp"] == quiz["timestamp"]
+    for quiz_item, checked_item in zip(quiz["quiz_items"], checked_quiz["quiz_items"]):
+        answer = quiz_item["question"].replace("english", "japanese")
+        assert checked_item["choices"] == quiz_item["choices"]
+        assert checked_item["correct_answer"] == quiz_item["choices"].index(answer)
+        assert checked_item["user_answer"] == 0
+        assert checked_item["answer_time"] == 5
+
+    # Test if the answers are counted in the statistics.
+    response = await normal_async_test_client.get("/quizzes/stats")
+    assert response.status_code == 200
+    stats = response.json()
+    num_correct = sum(
+        checked_item["correct_answer"] == 0
+        for checked_item in checked_quiz["quiz_items"]
+    )
+    assert (stats["attempts"], stats["correct"]) == (2, num_correct)
+    assert stats["average_answer_time"] == 5
+    assert [grade_stats["grade"] for grade_stats in stats["grades"]] == [0]
+    assert [day_stats["day"] for day_stats in stats["days"]] == [
+        checked_quiz["timestamp"][:10]
+    ]
+    response = await normal_async_test_client.get("/quizzes/stats?deck_id=100")
+    assert response.json()["attempts"] == 0
+
+    # Test if the answered quiz is read back with the texts of its choices, also in the history.
+    response = await normal_async_test_client.get(f"/quizzes/{quiz['quiz_id']}/items")
+    assert response.status_code == 200
+    assert response.json() == checked_quiz["quiz_items"]
+    response = await normal_async_test_client.get("/quizzes/history")
+    assert response.status_code == 200
+    assert response.json() == [checked_quiz]
+    response = await normal_async_test_client.get("/quizzes/100/items")
+    assert response.status_code == 404
+
+    # Test if the quiz is no longer being taken, and cannot be answered again.
+    response = await normal_async_test_client.get(f"/quizzes/{quiz['quiz_id']}")
+    assert response.status_code == 404
+    response = await normal_async_test_client.post(
+        f"/quizzes/{quiz['quiz_id']}", json=answers
+    )
+    assert response.status_code == 409
+
+
+async def test_quiz_answer_post(normal_async_test_client: AsyncClient) -> None:
+    """Test the POST /quizzes/{quiz_id} endpoint after the quiz session has expired.
+
+    Args:
+        normal_async_test_client (AsyncClient): An asynchronous test client authorized as a normal user.
+    """
+    word_list = "english,japanese,grade\n" + "".join(
+        f"english{i},japanese{i},1\n" for i in range(4)
+    )
+    response = await normal_async_test_client.post(
+        "/items/import",
+        files={"file": ("word_list.csv", word_list.encode("utf-8"))},
+    )
+    assert response.status_code == 200
+    response = await normal_async_test_client.post(
+        "/quizzes/", json={"num_questions": 1}
+    )
+    quiz = response.json()
+    quiz_item = quiz["quiz_items"][0]
+    await get_quiz_session_store().delete(quiz["quiz_id"])
+    # Test if the correct answers are not revealed before the quiz is answered.
+    response = await normal_async_test_client.get(f"/quizzes/{quiz['quiz_id']}/items")
+    assert response.status_code == 409
+
+    # Test if answers that do not match the questions are rejected.
+    answer = {
+        "question_number": 1,
+        "choices": quiz_item["choices"],
+        "user_answer": 4,
+        "answer_time": 5,
+    }
+    response = await normal_async_test_client.post(
+        f"/quizzes/{quiz['quiz_id']}", json=[answer]
+    )
+    assert response.status_code == 400
+
+    # Delete a distractor, which the quiz still refers to.
+    question_japanese = quiz_item["question"].replace("english", "japanese")
+    distractor = next(
+        choice for choice in quiz_item["choices"] if choice != question_japanese
+    )
+    # Import `async_session_factory` here to make sure the lifespan manager is executed before creating the session.
+    from src.core.main import async_session_factory
+
+    async with async_session_factory() as async_session, async_session.begin():
+        await async_session.execute(
+            delete(SQLAlchemyItem).where(SQLAlchemyItem.japanese == distractor)
+        )
+
+    # Test if the choices are read from the items, leaving the deleted one empty.
+    answer["user_answer"] = 1
+    response = await normal_async_test_client.post(
+        f"/quizzes/{quiz['quiz_id']}", json=[answer]
+    )
+    assert response.status_code == 200
+    checked_item = response.json()["quiz_items"][0]
+    assert checked_item["choices"] == [
+        "" if choice == distractor else choice for choice in quiz_item["choices"]
+    ]
+    assert checked_item["user_answer"] == 1
+
+    # Test if a quiz that does not exist cannot be answered.
+    response = await normal_async_test_client.post("/quizzes/100", json=[answer])
+    assert response.status_code == 404
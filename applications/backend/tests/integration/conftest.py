@@ -3,8 +3,11 @@ from asgi_lifespan import LifespanManager
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import user_cache
 from src.core.config import settings
 from src.db.models.sqlalchemy_data_models import Base
+from src.domain.services.item_service.typeahead_index import typeahead_index
+from src.domain.services.quiz_service.item_index import item_index
 from tests.utils import (
     DomainModelDict,
     create_random_test_user,
@@ -33,6 +36,10 @@ async def repository_class_provision(
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+    # The recreated tables reuse the user and item ids, so forget the ones cached by the previous test.
+    user_cache.clear()
+    item_index.clear()
+    typeahead_index.clear()
 
     # This context automatically calls async_session.close() when the code block is exited.
     async with async_session_factory() as async_session:
@@ -74,6 +81,10 @@ async def normal_async_test_client(async_test_client: AsyncClient) -> AsyncClien
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+    # The recreated tables reuse the user and item ids, so forget the ones cached by the previous test.
+    user_cache.clear()
+    item_index.clear()
+    typeahead_index.clear()
 
     # This context automatically calls async_session.close() when the code block is exited.
     async with async_session_factory() as async_session:
@@ -115,6 +126,10 @@ async def admin_async_test_client(async_test_client: AsyncClient) -> AsyncClient
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+    # The recreated tables reuse the user and item ids, so forget the ones cached by the previous test.
+    user_cache.clear()
+    item_index.clear()
+    typeahead_index.clear()
 
     # This context automatically calls async_session.close() when the code block is exited.
     async with async_session_factory() as async_session:
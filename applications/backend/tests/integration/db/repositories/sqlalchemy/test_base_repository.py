@@ -288,3 +288,181 @@ class TestBaseRepositorySuccess:
         deck2 = await deck_repository.read(id=2)
         assert deck1.user_id is None
         assert deck2.user_id is None
+
+    async def test_create_many(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `BaseRepository.create_many` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        # Create domain models to add, one of which leaves the id to the database.
+        item_domain_models = [
+            Item(
+                item_id=10,
+                user_id=1,
+                english="dummy_english10",
+                japanese="dummy_japanese10",
+                grade=1,
+            ),
+            Item(
+                item_id=11,
+                user_id=2,
+                english="dummy_english11",
+                japanese="dummy_japanese11",
+                grade=2,
+            ),
+            Item(
+                user_id=2,
+                english="dummy_english7",
+                japanese="dummy_japanese7",
+                grade=3,
+            ),
+        ]
+        user_login_history_domain_models = [
+            UserLoginHistory(
+                user_login_history_id=4, user_id=1, ip_address="127.0.0.4"
+            ),
+            UserLoginHistory(user_login_history_id=5, user_id=2, ip_address="::1"),
+        ]
+        # Instantiate the `BaseRepository` class.
+        item_repository = BaseRepository[SQLAlchemyItem, Item](
+            SQLAlchemyItem, Item, async_db_session
+        )
+        user_login_history_repository = BaseRepository[
+            SQLAlchemyUserLoginHistory, UserLoginHistory
+        ](SQLAlchemyUserLoginHistory, UserLoginHistory, async_db_session)
+        # Create the domain models in batches smaller than the number of the domain models.
+        items = await item_repository.create_many(item_domain_models, batch_size=2)
+        user_login_histories = await user_login_history_repository.create_many(
+            user_login_history_domain_models
+        )
+        # Test if the returned data are correct and keep the order of the input.
+        assert len(items) == 3
+        assert items[:2] == item_domain_models[:2]
+        assert items[2].item_id == 5
+        assert items[2].english == "dummy_english7"
+        assert user_login_histories == user_login_history_domain_models
+        assert await item_repository.read_many([10, 11]) == item_domain_models[:2]
+
+    async def test_read_many(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `BaseRepository.read_many` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        # Instantiate the `BaseRepository` class.
+        item_repository = BaseRepository[SQLAlchemyItem, Item](
+            SQLAlchemyItem, Item, async_db_session
+        )
+        # Get the data by IDs in batches smaller than the number of the IDs.
+        items = await item_repository.read_many([4, 1, 3], batch_size=2)
+        # Test if the returned data are correct and keep the order of the input.
+        item_domain_models = domain_model_dict["item_domain_models"]
+        assert items == [
+            item_domain_models[3],
+            item_domain_models[0],
+            item_domain_models[2],
+        ]
+        # Test if reading a non-existent id raises an error.
+        with pytest.raises(ValueError):
+            await item_repository.read_many([1, 100])
+        # Test if non-existent ids are skipped if asked.
+        assert await item_repository.read_many([100, 1], missing_ok=True) == [
+            item_domain_models[0]
+        ]
+
+    async def test_update_many(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `BaseRepository.update_many` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        # Create all domain models to update.
+        updated_item_domain_models = [
+            Item(
+                item_id=item_id,
+                user_id=1,
+                english=f"updated_dummy_english{item_id}",
+                japanese=f"updated_dummy_japanese{item_id}",
+                grade=5,
+            )
+            for item_id in (1, 2, 3)
+        ]
+        # Instantiate the `BaseRepository` class.
+        item_repository = BaseRepository[SQLAlchemyItem, Item](
+            SQLAlchemyItem, Item, async_db_session
+        )
+        # Update the data in batches smaller than the number of the domain models.
+        items = await item_repository.update_many(
+            updated_item_domain_models, batch_size=2
+        )
+        # Test if the returned and stored data are correct.
+        assert items == updated_item_domain_models
+        assert await item_repository.read_many([1, 2, 3]) == updated_item_domain_models
+        # Test if updating a domain model without id raises an error.
+        with pytest.raises(ValueError):
+            await item_repository.update_many(
+                [Item(user_id=1, english="english", japanese="japanese", grade=1)]
+            )
+        # Test if updating a non-existent record raises an error and updates nothing.
+        with pytest.raises(ValueError):
+            await item_repository.update_many(
+                [
+                    Item(item_id=4, user_id=1, english="e", japanese="j", grade=1),
+                    Item(item_id=100, user_id=1, english="e", japanese="j", grade=1),
+                ]
+            )
+        item4 = await item_repository.read(id=4)
+        assert item4.english == "dummy_english4"
+
+    async def test_delete_many(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `BaseRepository.delete_many` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        # Instantiate the `BaseRepository` class.
+        quiz_repository = BaseRepository[SQLAlchemyQuiz, Quiz](
+            SQLAlchemyQuiz, Quiz, async_db_session
+        )
+        quiz_item_repository = BaseRepository[SQLAlchemyQuizItem, QuizItem](
+            SQLAlchemyQuizItem, QuizItem, async_db_session
+        )
+        # Test if deleting a non-existent id raises an error and deletes nothing.
+        with pytest.raises(ValueError):
+            await quiz_repository.delete_many([1, 100])
+        assert (
+            await quiz_repository.read(id=1)
+            == domain_model_dict["quiz_domain_models"][0]
+        )
+        # Delete the quizzes in batches smaller than the number of the IDs.
+        quizzes = await quiz_repository.delete_many([2, 1], batch_size=1)
+        # Test if the returned data are correct and keep the order of the input.
+        quiz_domain_models = domain_model_dict["quiz_domain_models"]
+        assert quizzes == [quiz_domain_models[1], quiz_domain_models[0]]
+        # Test if the quizzes and their quiz items (delete cascade) are deleted.
+        with pytest.raises(ValueError):
+            await quiz_repository.read_many([1, 2])
+        with pytest.raises(ValueError):
+            await quiz_item_repository.read(id=1)
+        assert await quiz_repository.read(id=3) == quiz_domain_models[2]
@@ -1,12 +1,33 @@
+from datetime import timedelta
+from typing import Any
+
 import pytest
+from pydantic import BaseModel
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyQuiz,
+    item_deck_mapper_table,
+)
+from src.db.repositories.deck_repository_interface import DeckSetOperation
 from src.db.repositories.sqlalchemy.deck_repository import DeckRepository
+from src.domain.models import Deck, Item
+from src.domain.services.deck_service.deck_listing import DeckSummary
 from tests.utils import DomainModelDict
 
 pytestmark = pytest.mark.anyio
 
 
+class DeckItem(BaseModel):
+    """The columns of an item in a deck read by the tests."""
+
+    item_id: int
+    english: str
+    grade: int
+    position: int
+
+
 class TestDeckRepositorySuccess:
     """Test cases for the `DeckRepository` class when successful."""
 
@@ -53,3 +74,282 @@ class TestDeckRepositorySuccess:
         assert user1_decks[1] == domain_model_dict["deck_domain_models"][1]
         assert len(user2_decks) == 1
         assert user2_decks[0] == domain_model_dict["deck_domain_models"][2]
+
+    async def test_read_all_paginated(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the keyset pagination of the `DeckRepository.read_all` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        # Instantiate the `DeckRepository` class.
+        deck_repository = DeckRepository(async_db_session)
+        # Get the decks page by page.
+        first_page = await deck_repository.read_all(limit=2)
+        second_page = await deck_repository.read_all(
+            cursor=first_page[-1].deck_id, limit=2
+        )
+        # Test if the pages are correct and do not overlap.
+        assert first_page == domain_model_dict["deck_domain_models"][:2]
+        assert second_page == domain_model_dict["deck_domain_models"][2:]
+        # Test if paging by user also works.
+        assert await deck_repository.read_by_user_id(user_id=1, cursor=1) == [
+            domain_model_dict["deck_domain_models"][1]
+        ]
+
+    async def test_stream_by_user_id(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `DeckRepository.stream_by_user_id` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        # Instantiate the `DeckRepository` class.
+        deck_repository = DeckRepository(async_db_session)
+        # Stream the decks of user1, from the beginning and after the first one.
+        user1_decks = [deck async for deck in deck_repository.stream_by_user_id(1)]
+        user1_rest = [
+            deck async for deck in deck_repository.stream_by_user_id(1, cursor=1)
+        ]
+        # Test if the streamed decks are the same as the ones read at once.
+        assert user1_decks == domain_model_dict["deck_domain_models"][:2]
+        assert user1_rest == domain_model_dict["deck_domain_models"][1:2]
+
+    async def test_read_summaries_by_user_id(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `DeckRepository.read_summaries_by_user_id` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+        quizzes = domain_model_dict["quiz_domain_models"]
+        # Put items 1 and 2 into deck 1, and take another quiz on deck 2 later than the others.
+        last_quiz_timestamp = quizzes[2].quiz_timestamp + timedelta(days=1)
+        async with async_db_session.begin():
+            await async_db_session.execute(
+                insert(item_deck_mapper_table),
+                [{"item_id": 1, "deck_id": 1}, {"item_id": 2, "deck_id": 1}],
+            )
+            await async_db_session.execute(
+                insert(SQLAlchemyQuiz).values(
+                    user_id=1,
+                    deck_id=2,
+                    quiz_type="dummy_quiz_type4",
+                    quiz_timestamp=last_quiz_timestamp,
+                )
+            )
+
+        # Instantiate the `DeckRepository` class.
+        deck_repository = DeckRepository(async_db_session)
+        # Get the summaries of the decks of user1, at once, page by page and streamed.
+        summaries = await deck_repository.read_summaries_by_user_id(
+            DeckSummary, user_id=1
+        )
+        first_page = await deck_repository.read_summaries_by_user_id(
+            DeckSummary, user_id=1, limit=1
+        )
+        second_page = await deck_repository.read_summaries_by_user_id(
+            DeckSummary, user_id=1, cursor=first_page[-1].deck_id, limit=1
+        )
+        streamed = [
+            summary
+            async for summary in deck_repository.stream_summaries_by_user_id(
+                DeckSummary, user_id=1
+            )
+        ]
+        # Test if the items are counted and the last quiz is found per deck.
+        assert summaries == [
+            DeckSummary(
+                deck_id=1,
+                deck_name="dummy_deck1",
+                item_count=2,
+                last_studied_at=quizzes[0].quiz_timestamp,
+            ),
+            DeckSummary(
+                deck_id=2,
+                deck_name="dummy_deck2",
+                item_count=0,
+                last_studied_at=last_quiz_timestamp,
+            ),
+        ]
+        assert first_page + second_page == summaries
+        assert streamed == summaries
+        # Test if a deck without quizzes has no last quiz time.
+        assert await deck_repository.read_summaries_by_user_id(
+            DeckSummary, user_id=2
+        ) == [
+            DeckSummary(
+                deck_id=3, deck_name="dummy_deck3", item_count=0, last_studied_at=None
+            )
+        ]
+
+    async def test_read_items(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `DeckRepository.read_items` and `DeckRepository.stream_items` methods.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+        # Add the items to deck 1 in an order different from their ids and grades.
+        async with async_db_session.begin():
+            for item_id in [3, 1, 4, 2]:
+                await async_db_session.execute(
+                    insert(item_deck_mapper_table).values(item_id=item_id, deck_id=1)
+                )
+
+        # Instantiate the `DeckRepository` class.
+        deck_repository = DeckRepository(async_db_session)
+
+        async def read_item_ids(**kwargs: Any) -> list[int]:
+            items = await deck_repository.read_items(DeckItem, 1, **kwargs)
+            return [item.item_id for item in items]
+
+        # Test if the items are ordered by the order they were added in, by grade or by creation time.
+        assert await read_item_ids() == [3, 1, 4, 2]
+        assert await read_item_ids(order_by="grade") == [1, 4, 2, 3]
+        assert await read_item_ids(order_by="created_at") == [1, 2, 3, 4]
+        # Test if the pages of every order continue after the item of the cursor.
+        assert await read_item_ids(limit=2) == [3, 1]
+        assert await read_item_ids(cursor=1, limit=2) == [4, 2]
+        assert await read_item_ids(order_by="grade", cursor=4) == [2, 3]
+        assert await read_item_ids(order_by="created_at", cursor=2, limit=1) == [3]
+        # Test if the items are filtered by their columns.
+        assert await read_item_ids(filters={"grade": 3}) == [2]
+        assert await deck_repository.read_items(DeckItem, 2) == []
+
+        # Test if the streamed items are the same as the ones read at once, with their positions.
+        items = await deck_repository.read_items(DeckItem, 1, order_by="grade")
+        assert [
+            item
+            async for item in deck_repository.stream_items(
+                DeckItem, 1, order_by="grade"
+            )
+        ] == items
+        assert [item.item_id for item in sorted(items, key=lambda i: i.position)] == [
+            3,
+            1,
+            4,
+            2,
+        ]
+        assert items[0].english == domain_model_dict["item_domain_models"][0].english
+
+        # Test if a projection with a field that is not a column is rejected.
+        class UnknownProjection(BaseModel):
+            unknown: int
+
+        with pytest.raises(ValueError):
+            await deck_repository.read_items(UnknownProjection, 1)
+
+    async def test_add_and_remove_items(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `DeckRepository.add_items` and `DeckRepository.remove_items` methods.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        # Instantiate the `DeckRepository` class.
+        deck_repository = DeckRepository(async_db_session)
+        # Add items of user1, an item of user2, a duplicate, a missing item and a new item to deck 1.
+        new_item_ids, added_item_ids = await deck_repository.add_items(
+            1,
+            [2, 1, 3, 1, 100],
+            [Item(user_id=1, english="new_english", japanese="new_japanese", grade=1)],
+            user_id=1,
+        )
+        # Test if only the new items and the items available to user1 are added, in the given order.
+        assert new_item_ids == [5]
+        assert added_item_ids == [2, 1, 5]
+        items = await deck_repository.read_items(DeckItem, 1)
+        assert [item.item_id for item in items] == [2, 1, 5]
+        assert items[2].english == "new_english"
+        # Test if the items already in the deck are skipped.
+        assert await deck_repository.add_items(1, [1, 2]) == ([], [])
+        # Test if a new item duplicating an existing item adds the existing item instead.
+        assert await deck_repository.add_items(
+            2,
+            [],
+            [
+                Item(
+                    user_id=1,
+                    english=" Dummy_English1",
+                    japanese="dummy_japanese1",
+                    grade=2,
+                )
+            ],
+            user_id=1,
+        ) == ([1], [1])
+
+        # Test if only the items in the deck are removed.
+        assert await deck_repository.remove_items(1, [1, 3, 100]) == [1]
+        assert [
+            item.item_id for item in await deck_repository.read_items(DeckItem, 1)
+        ] == [2, 5]
+        assert await deck_repository.remove_items(2, [2, 5]) == []
+
+    async def test_create_from_decks(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `DeckRepository.clone` and `DeckRepository.create_from_decks` methods.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        # Instantiate the `DeckRepository` class.
+        deck_repository = DeckRepository(async_db_session)
+        await deck_repository.add_items(1, [3, 1, 2])
+        await deck_repository.add_items(2, [2, 4])
+
+        async def create(
+            operation: DeckSetOperation, deck_ids: list[int]
+        ) -> tuple[int, list[int]]:
+            deck, item_count = await deck_repository.create_from_decks(
+                operation, deck_ids, Deck(user_id=2, deck_name=operation)
+            )
+            assert deck.user_id == 2
+            assert deck.deck_name == operation
+            items = await deck_repository.read_items(DeckItem, deck.deck_id)  # type: ignore
+            return item_count, [item.item_id for item in items]
+
+        # Test if a clone has the same items in the same order.
+        deck, item_count = await deck_repository.clone(
+            1, Deck(user_id=2, deck_name="clone")
+        )
+        assert deck == Deck(deck_id=4, user_id=2, deck_name="clone")
+        assert item_count == 3
+        assert [
+            item.item_id for item in await deck_repository.read_items(DeckItem, 4)
+        ] == [3, 1, 2]
+        # Test if the items are in the order they were first added to any of the decks.
+        assert await create("union", [1, 2]) == (4, [3, 1, 2, 4])
+        assert await create("intersect", [1, 2]) == (1, [2])
+        assert await create("intersect", [1, 1]) == (3, [3, 1, 2])
+        assert await create("difference", [1, 2]) == (2, [3, 1])
+        assert await create("difference", [2, 1]) == (1, [4])
+        assert await create("union", [3]) == (0, [])
+
+        # Test if no deck to combine is rejected.
+        with pytest.raises(ValueError):
+            await deck_repository.create_from_decks(
+                "union", [], Deck(user_id=2, deck_name="empty")
+            )
@@ -1,12 +1,37 @@
+from typing import Any
+
 import pytest
+from pydantic import BaseModel
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.migrations import create_item_trigram_indexes
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyDeck,
+    SQLAlchemyGenre,
+    item_deck_mapper_table,
+)
+from src.db.repositories.sqlalchemy.deck_repository import DeckRepository
 from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.domain.models import Item
 from tests.utils import DomainModelDict
 
 pytestmark = pytest.mark.anyio
 
 
+class ItemProjection(BaseModel):
+    """The projection of the columns of an item used in the tests."""
+
+    item_id: int
+    english: str
+
+
+class UnknownProjection(BaseModel):
+    """The projection of a column that items do not have."""
+
+    unknown_column: int
+
+
 class TestItemRepositorySuccess:
     """Test cases for the `ItemRepository` class when successful."""
 
@@ -33,3 +58,395 @@ class TestItemRepositorySuccess:
         assert len(user2_items) == 2
         assert user2_items[0] == domain_model_dict["item_domain_models"][2]
         assert user2_items[1] == domain_model_dict["item_domain_models"][3]
+
+    async def test_read_projected(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `ItemRepository.read_projected` and `ItemRepository.stream_projected` methods.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        # Instantiate the `ItemRepository` class.
+        item_repository = ItemRepository(async_db_session)
+        # Read the projections of the items of user2, all at once and page by page.
+        expected_projections = [
+            ItemProjection(item_id=item.item_id, english=item.english)
+            for item in domain_model_dict["item_domain_models"][2:]
+        ]
+        projections = await item_repository.read_projected(
+            ItemProjection, {"user_id": 2}
+        )
+        last_page = await item_repository.read_projected(
+            ItemProjection, {"user_id": 2}, cursor=3, limit=1
+        )
+        streamed_projections = [
+            projection
+            async for projection in item_repository.stream_projected(
+                ItemProjection, {"user_id": 2}
+            )
+        ]
+        # Test if only the projected columns of the filtered items are returned.
+        assert projections == expected_projections
+        assert last_page == expected_projections[1:]
+        assert streamed_projections == expected_projections
+        # Test if a projection with a non-existent column is rejected.
+        with pytest.raises(ValueError):
+            await item_repository.read_projected(UnknownProjection)
+
+    async def test_read_projected_by_deck_id(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `ItemRepository.read_projected_by_deck_id` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        # Add item1 and item2 to deck1, and item2 to deck2.
+        async with async_db_session.begin():
+            await async_db_session.execute(
+                insert(item_deck_mapper_table),
+                [
+                    {"item_id": 1, "deck_id": 1},
+                    {"item_id": 2, "deck_id": 1},
+                    {"item_id": 2, "deck_id": 2},
+                ],
+            )
+
+        # Instantiate the `ItemRepository` class.
+        item_repository = ItemRepository(async_db_session)
+        # Read the projections of the items in each deck.
+        deck1_items = await item_repository.read_projected_by_deck_id(
+            ItemProjection, deck_id=1
+        )
+        deck1_rest = [
+            projection
+            async for projection in item_repository.stream_projected_by_deck_id(
+                ItemProjection, deck_id=1, cursor=1
+            )
+        ]
+        deck2_items = await item_repository.read_projected_by_deck_id(
+            ItemProjection, deck_id=2, limit=1
+        )
+        # Test if the projections are correct.
+        item1, item2 = domain_model_dict["item_domain_models"][:2]
+        assert deck1_items == [
+            ItemProjection(item_id=1, english=item1.english),
+            ItemProjection(item_id=2, english=item2.english),
+        ]
+        assert deck1_rest == deck1_items[1:]
+        assert deck2_items == deck1_items[1:]
+
+    async def test_copy_many(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `ItemRepository.copy_many` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        # Instantiate the `ItemRepository` and `DeckRepository` classes.
+        item_repository = ItemRepository(async_db_session)
+        deck_repository = DeckRepository(async_db_session)
+        # Load the items into deck3.
+        item_domain_models = [
+            Item(
+                user_id=2,
+                english=f"copied_english{i}",
+                japanese=f"copied_japanese{i}",
+                grade=i,
+            )
+            for i in range(3)
+        ]
+        item_ids = await item_repository.copy_many(item_domain_models, deck_id=3)
+        # Test if the loaded items are assigned new ids and stored correctly.
+        assert item_ids == [5, 6, 7]
+        items = await item_repository.read_many(item_ids)
+        for item, item_domain_model in zip(items, item_domain_models):
+            assert item.user_id == item_domain_model.user_id
+            assert item.english == item_domain_model.english
+            assert item.japanese == item_domain_model.japanese
+            assert item.grade == item_domain_model.grade
+        # Test if the loaded items are added to deck3.
+        async with async_db_session.begin():
+            deck3 = await async_db_session.get(SQLAlchemyDeck, 3)
+            deck3_items = await deck3.awaitable_attrs.items  # type: ignore
+        assert [item.item_id for item in deck3_items] == item_ids
+        # Test if loading no items does nothing.
+        assert await item_repository.copy_many([]) == []
+        assert len(await deck_repository.read_all()) == 3
+        # Test if the duplicates of the loaded items and of each other are skipped.
+        duplicate_item = Item(
+            user_id=2, english="Copied_English0 ", japanese="copied_japanese0", grade=1
+        )
+        assert await item_repository.copy_many(
+            [duplicate_item, item_domain_models[1], duplicate_item], deck_id=3
+        ) == [5, 6, 5]
+        assert await item_repository.count() == 7
+        # Test if items of different owners are rejected.
+        with pytest.raises(ValueError):
+            await item_repository.copy_many(
+                [
+                    item_domain_models[0],
+                    duplicate_item.model_copy(update={"user_id": 1}),
+                ]
+            )
+
+    async def test_add_many(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `ItemRepository.add_many` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        # Instantiate the `ItemRepository` class.
+        item_repository = ItemRepository(async_db_session)
+        # Add items of user1 duplicating an existing item and each other, and an item with user2's texts.
+        items = [
+            Item(user_id=1, english="Take  Off", japanese="ﾘﾘｸ", grade=3),
+            Item(
+                user_id=1, english="DUMMY_ENGLISH1", japanese="dummy_japanese1", grade=3
+            ),
+            Item(user_id=1, english=" take off", japanese="リリク", grade=1),
+            Item(
+                user_id=1, english="dummy_english3", japanese="dummy_japanese3", grade=4
+            ),
+        ]
+        item_ids, created_item_ids = await item_repository.add_many(items)
+        # Test if only the items that user1 does not have yet are created, in the given order.
+        assert len(created_item_ids) == 2
+        assert item_ids == [
+            created_item_ids[0],
+            1,
+            created_item_ids[0],
+            created_item_ids[1],
+        ]
+        created_items = await item_repository.read_many(created_item_ids)
+        assert [(item.english, item.grade) for item in created_items] == [
+            ("Take  Off", 3),
+            ("dummy_english3", 4),
+        ]
+        # Test if adding the same items again creates nothing.
+        assert await item_repository.add_many(items) == (item_ids, [])
+        assert await item_repository.add_many([]) == ([], [])
+        # Test if shared items are told apart from the items of users.
+        shared_item_ids, created_item_ids = await item_repository.add_many(
+            [Item(user_id=None, english="take off", japanese="リリク", grade=1)] * 2
+        )
+        assert shared_item_ids == created_item_ids * 2
+        assert created_item_ids[0] not in item_ids
+        assert await item_repository.count() == 7
+        # Test if items of different owners are rejected.
+        with pytest.raises(ValueError):
+            await item_repository.add_many(
+                [items[0], items[0].model_copy(update={"user_id": 2})]
+            )
+
+    async def test_sample(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `ItemRepository.sample` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        # Instantiate the `ItemRepository` class.
+        item_repository = ItemRepository(async_db_session)
+        # Share a new item with all users.
+        shared_item = await item_repository.create(
+            Item(user_id=None, english="shared", japanese="共有", grade=1)
+        )
+        # Test if the items of the user and the shared items are sampled without duplicates.
+        items = await item_repository.sample(10, user_id=1)
+        assert sorted(item.item_id for item in items) == [1, 2, shared_item.item_id]  # type: ignore
+        assert domain_model_dict["item_domain_models"][0] in items
+        # Test if the number of items and their grades are limited.
+        assert len(await item_repository.sample(1, user_id=1)) == 1
+        items = await item_repository.sample(10, user_id=1, grades=[1])
+        assert sorted(item.item_id for item in items) == [1, shared_item.item_id]  # type: ignore
+        # Test if the items of a deck are sampled regardless of their owners.
+        async with async_db_session.begin():
+            await async_db_session.execute(
+                insert(item_deck_mapper_table),
+                [{"item_id": 3, "deck_id": 1}, {"item_id": 4, "deck_id": 2}],
+            )
+        items = await item_repository.sample(10, user_id=1, deck_id=1)
+        assert [item.item_id for item in items] == [3]
+
+    async def test_read_projected_updated_since(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `ItemRepository.read_projected_updated_since`, `count` and `read_id_checksum` methods.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        # Instantiate the `ItemRepository` class.
+        item_repository = ItemRepository(async_db_session)
+        projections = await item_repository.read_projected_updated_since(ItemProjection)
+        assert [projection.item_id for projection in projections] == [1, 2, 3, 4]
+        assert await item_repository.count() == 4
+        assert await item_repository.read_id_checksum(3) == (3, 6)
+        assert await item_repository.read_id_checksum(0) == (0, 0)
+        # Test if updating an item moves its update time forward, so only it is read afterwards.
+        latest_updated_at = max(
+            item.updated_at for item in await item_repository.read_many([1, 2, 3, 4])
+        )
+        updated_item = domain_model_dict["item_domain_models"][1].model_copy(
+            update={"english": "updated_english2"}
+        )
+        await item_repository.update(updated_item)
+        projections = await item_repository.read_projected_updated_since(
+            ItemProjection, latest_updated_at
+        )
+        assert projections == [ItemProjection(item_id=2, english="updated_english2")]
+
+    async def test_search_projected(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `ItemRepository.search_projected` and `ItemRepository.stream_search_projected` methods.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        # Load items of user1 into deck3, and others tagged with a new genre.
+        async with async_db_session.begin():
+            async_db_session.add(SQLAlchemyGenre(genre_id=1, genre_name="dummy_genre"))
+        item_repository = ItemRepository(async_db_session)
+        await item_repository.copy_many(
+            [
+                Item(user_id=1, english="apple", japanese="りんご", grade=1),
+                Item(user_id=1, english="pineapple", japanese="パイナップル", grade=2),
+            ],
+            deck_id=3,
+        )
+        await item_repository.copy_many(
+            [
+                Item(user_id=1, english="take off", japanese="離陸する", grade=3),
+                Item(user_id=1, english="100%_pure", japanese="純粋な", grade=1),
+            ],
+            genre_id=1,
+        )
+
+        async def search(query: str | None, **filters: Any) -> list[int]:
+            projections = await item_repository.search_projected(
+                ItemProjection, query, user_id=1, **filters
+            )
+            return [projection.item_id for projection in projections]
+
+        # Test if a query of three or more letters matches substrings of English case-insensitively.
+        assert await search("APP") == [5, 6]
+        assert await search("e of") == [7]
+        # Test if a shorter query matches the prefixes of English words only.
+        assert await search("ap") == [5]
+        assert await search("of") == [7]
+        # Test if the wildcards of `LIKE` in a query are matched literally.
+        assert await search("%_") == [8]
+        assert await search("0_p") == []
+        # Test if a non-ASCII query matches substrings of Japanese.
+        assert await search("りんご") == [5]
+        assert await search("ナップ") == [6]
+        assert await search("陸") == [7]
+        # Test if the items are filtered by user, grade, deck and genre.
+        assert await search("dummy") == [1, 2]
+        assert await search(None, grades=[1]) == [1, 5, 8]
+        assert await search("app", grades=[2]) == [6]
+        assert await search(None, deck_id=3) == [5, 6]
+        assert await search(None, genre_id=1) == [7, 8]
+        assert await search("pure", deck_id=3) == []
+        # Test if the search is paginated by the ids of the items.
+        assert await search("  ", cursor=4, limit=2) == [5, 6]
+        streamed_projections = [
+            projection
+            async for projection in item_repository.stream_search_projected(
+                ItemProjection, "app", user_id=1, cursor=5
+            )
+        ]
+        assert [projection.item_id for projection in streamed_projections] == [6]
+
+    async def test_search_projected_fuzzy_without_trigram(
+        self,
+        repository_class_provision: tuple[AsyncSession, DomainModelDict],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test if a fuzzy search falls back to substring matching without the `pg_trgm` extension.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+            monkeypatch (pytest.MonkeyPatch): The fixture to temporarily hide the extension.
+        """
+        async_db_session, _ = repository_class_provision
+
+        item_repository = ItemRepository(async_db_session)
+
+        async def has_no_trigram_extension() -> bool:
+            return False
+
+        monkeypatch.setattr(
+            item_repository, "_has_trigram_extension", has_no_trigram_extension
+        )
+        projections = await item_repository.search_projected(
+            ItemProjection, "english", user_id=1, fuzzy=True
+        )
+        assert [projection.item_id for projection in projections] == [1, 2]
+        streamed_projections = [
+            projection
+            async for projection in item_repository.stream_search_projected(
+                ItemProjection, "english2", user_id=1, fuzzy=True
+            )
+        ]
+        assert [projection.item_id for projection in streamed_projections] == [2]
+
+    async def test_search_projected_fuzzy(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test if the `ItemRepository.search_projected` method matches misspelled English words.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        async with async_db_session.begin():
+            connection = await async_db_session.connection()
+            has_trigram_indexes = await create_item_trigram_indexes(connection)
+        if not has_trigram_indexes:
+            pytest.skip("The pg_trgm extension is not available.")
+        item_repository = ItemRepository(async_db_session)
+        item_ids = await item_repository.copy_many(
+            [Item(user_id=1, english="necessary", japanese="必要な", grade=3)]
+        )
+        projections = await item_repository.search_projected(
+            ItemProjection, "neccesary", user_id=1, fuzzy=True
+        )
+        assert [projection.item_id for projection in projections] == item_ids
+        assert (
+            await item_repository.search_projected(
+                ItemProjection, "neccesary", user_id=1
+            )
+            == []
+        )
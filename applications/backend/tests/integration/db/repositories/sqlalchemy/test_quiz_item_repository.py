@@ -1,7 +1,18 @@
+from datetime import datetime
+
 import pytest
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.migrations import create_quiz_item_choices_table
+from src.db.models.sqlalchemy_data_models import SQLAlchemyQuiz, SQLAlchemyQuizItem
 from src.db.repositories.sqlalchemy.quiz_item_repository import QuizItemRepository
+from src.db.repositories.sqlalchemy.quiz_repository import QuizRepository
+from src.db.repositories.sqlalchemy.quiz_stat_repository import QuizStatRepository
+from src.db.repositories.sqlalchemy.review_state_repository import (
+    ReviewStateRepository,
+)
+from src.domain.models import Quiz, QuizItem, ReviewState
 from tests.utils import DomainModelDict
 
 pytestmark = pytest.mark.anyio
@@ -65,3 +76,195 @@ class TestQuizItemRepositorySuccess:
         assert item3_quiz_items[0] == domain_model_dict["quiz_item_domain_models"][2]
         assert len(item4_quiz_items) == 1
         assert item4_quiz_items[0] == domain_model_dict["quiz_item_domain_models"][4]
+
+    async def test_read_by_quiz_id_of_user(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test if the `QuizItemRepository.read_by_quiz_id` method reads only the quizzes of a user.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        quiz_item_repository = QuizItemRepository(async_db_session)
+        # Quiz1 is taken by user1, and quiz3 by user2.
+        quiz1_items = await quiz_item_repository.read_by_quiz_id(quiz_id=1, user_id=1)
+        assert quiz1_items == domain_model_dict["quiz_item_domain_models"][:2]
+        assert await quiz_item_repository.read_by_quiz_id(quiz_id=3, user_id=1) == []
+
+    async def test_update_answers(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `QuizItemRepository.update_answers` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+        # Make the prepared quiz items unanswered.
+        async with async_db_session.begin():
+            await async_db_session.execute(
+                update(SQLAlchemyQuizItem).values(user_answer=None, answer_time=None)
+            )
+        unanswered_quiz_items = [
+            quiz_item.model_copy(update={"user_answer": None, "answer_time": None})
+            for quiz_item in domain_model_dict["quiz_item_domain_models"]
+        ]
+
+        quiz_item_repository = QuizItemRepository(async_db_session)
+        quiz_items = [
+            quiz_item.model_copy(update={"user_answer": 1, "answer_time": 3})
+            for quiz_item in unanswered_quiz_items[:3]
+        ]
+        review_states = [
+            ReviewState(
+                user_id=1,
+                item_id=item_id,
+                interval_days=1,
+                due_at=datetime(2024, 1, 2),
+                reviewed_at=datetime(2024, 1, 1),
+            )
+            for item_id in (1, 2, 3)
+        ]
+        # Test if the answers are written by batches, and the other quiz items are left unchanged.
+        assert (
+            await quiz_item_repository.update_answers(
+                quiz_items, review_states, batch_size=2
+            )
+            == quiz_items
+        )
+        assert await quiz_item_repository.read_by_quiz_id(quiz_id=1) == quiz_items[:2]
+        quiz2_items = await quiz_item_repository.read_by_quiz_id(quiz_id=2)
+        assert quiz2_items == [quiz_items[2], unanswered_quiz_items[3]]
+
+        # Test if the answers are added to the statistics by grade, and by deck if asked.
+        quiz_stat_repository = QuizStatRepository(async_db_session)
+        quiz_stats = await quiz_stat_repository.read_by_user_id(user_id=1)
+        assert [
+            (quiz_stat.grade, quiz_stat.attempts, quiz_stat.total_answer_time)
+            for quiz_stat in quiz_stats
+        ] == [(1, 1, 3), (3, 1, 3), (4, 1, 3)]
+        assert all(quiz_stat.correct == 0 for quiz_stat in quiz_stats)
+        quiz_stats = await quiz_stat_repository.read_by_user_id(user_id=1, deck_id=2)
+        assert [(quiz_stat.grade, quiz_stat.attempts) for quiz_stat in quiz_stats] == [
+            (4, 1)
+        ]
+        # Test if the review states are written with the answers.
+        review_state_repository = ReviewStateRepository(async_db_session)
+        written_states = await review_state_repository.read_by_item_ids(1, [1, 2, 3, 4])
+        assert sorted(
+            (review_state.item_id, review_state.interval_days)
+            for review_state in written_states
+        ) == [(1, 1), (2, 1), (3, 1)]
+
+        # Test if answering again is rejected without writing anything or counting the answers twice.
+        with pytest.raises(ValueError):
+            await quiz_item_repository.update_answers(
+                [
+                    unanswered_quiz_items[3].model_copy(
+                        update={"user_answer": 1, "answer_time": 3}
+                    ),
+                    quiz_items[0].model_copy(update={"user_answer": 2}),
+                ],
+                [
+                    review_state.model_copy(update={"interval_days": 6})
+                    for review_state in review_states
+                ],
+            )
+        assert await quiz_item_repository.read_by_quiz_id(quiz_id=1) == quiz_items[:2]
+        assert await quiz_item_repository.read_by_quiz_id(quiz_id=2) == quiz2_items
+        quiz_stats = await quiz_stat_repository.read_by_user_id(user_id=1)
+        assert [quiz_stat.attempts for quiz_stat in quiz_stats] == [1, 1, 1]
+        assert sorted(
+            review_state.interval_days
+            for review_state in await review_state_repository.read_by_item_ids(
+                1, [1, 2, 3]
+            )
+        ) == [1, 1, 1]
+
+        # Test if nothing is written if any of the quiz items does not have an id.
+        with pytest.raises(ValueError):
+            await quiz_item_repository.update_answers(
+                [quiz_items[0].model_copy(update={"quiz_item_id": None})]
+            )
+
+    async def test_update_answers_without_deck(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test if the answers of quizzes without a deck are added to the same statistics.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+        # Make the prepared quiz items unanswered, and the quizzes without a deck.
+        async with async_db_session.begin():
+            await async_db_session.execute(
+                update(SQLAlchemyQuizItem).values(user_answer=None, answer_time=None)
+            )
+            await async_db_session.execute(update(SQLAlchemyQuiz).values(deck_id=None))
+
+        quiz_item_repository = QuizItemRepository(async_db_session)
+        # Quiz item 2 of quiz 1 and quiz item 4 of quiz 2 both ask user1 for item2.
+        for quiz_item in (
+            domain_model_dict["quiz_item_domain_models"][1],
+            domain_model_dict["quiz_item_domain_models"][3],
+        ):
+            await quiz_item_repository.update_answers(
+                [quiz_item.model_copy(update={"user_answer": 0, "answer_time": 3})]
+            )
+        quiz_stats = await QuizStatRepository(async_db_session).read_by_user_id(
+            user_id=1
+        )
+        assert [
+            (quiz_stat.attempts, quiz_stat.total_answer_time)
+            for quiz_stat in quiz_stats
+        ] == [(2, 6)]
+
+    async def test_read_by_choice_item_id(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `QuizItemRepository.read_by_choice_item_id` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        quiz_item_repository = QuizItemRepository(async_db_session)
+        # The prepared quiz items are inserted without copying their choices.
+        assert await quiz_item_repository.read_by_choice_item_id(item_id=4) == []
+
+        # Test if the migration copies the choices of the existing quiz items, and only once.
+        for _ in range(2):
+            async with async_db_session.begin():
+                await create_quiz_item_choices_table(
+                    await async_db_session.connection()
+                )
+        quiz_items = await quiz_item_repository.read_by_choice_item_id(item_id=4)
+        assert quiz_items == domain_model_dict["quiz_item_domain_models"]
+
+        # Test if the choices of a new quiz are copied when it is created.
+        _, created_quiz_items = await QuizRepository(
+            async_db_session
+        ).create_with_items(
+            Quiz(user_id=1, deck_id=None, quiz_type="dummy_quiz_type"),
+            [
+                QuizItem(
+                    item_id=1,
+                    question_number=1,
+                    choice_item_ids=[1, 2, 3, 5],
+                    correct_answer=0,
+                )
+            ],
+        )
+        assert (
+            await quiz_item_repository.read_by_choice_item_id(item_id=5)
+            == created_quiz_items
+        )
+        assert len(await quiz_item_repository.read_by_choice_item_id(item_id=4)) == 5
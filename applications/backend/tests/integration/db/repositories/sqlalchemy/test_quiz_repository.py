@@ -1,7 +1,12 @@
+from typing import Any
+
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.repositories.sqlalchemy.quiz_item_repository import QuizItemRepository
 from src.db.repositories.sqlalchemy.quiz_repository import QuizRepository
+from src.domain.models import Quiz, QuizItem
 from tests.utils import DomainModelDict
 
 pytestmark = pytest.mark.anyio
@@ -55,3 +60,94 @@ class TestQuizRepositorySuccess:
         assert len(deck2_quizzes) == 2
         assert deck2_quizzes[0] == domain_model_dict["quiz_domain_models"][1]
         assert deck2_quizzes[1] == domain_model_dict["quiz_domain_models"][2]
+
+    async def test_create_with_items(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `QuizRepository.create_with_items` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        # Instantiate the `QuizRepository` and `QuizItemRepository` classes.
+        quiz_repository = QuizRepository(async_db_session)
+        quiz_item_repository = QuizItemRepository(async_db_session)
+        # Create a quiz with two quiz items.
+        quiz, quiz_items = await quiz_repository.create_with_items(
+            Quiz(user_id=1, deck_id=None, quiz_type="dummy_quiz_type4"),
+            [
+                QuizItem(
+                    item_id=item_id,
+                    question_number=question_number,
+                    choice_item_ids=[1, 2, 3, 4],
+                    correct_answer=item_id - 1,
+                )
+                for question_number, item_id in enumerate([2, 1], 1)
+            ],
+        )
+        # Test if the quiz items are created for the new quiz in order.
+        assert quiz.quiz_id == 4
+        assert [quiz_item.quiz_id for quiz_item in quiz_items] == [4, 4]
+        assert [quiz_item.item_id for quiz_item in quiz_items] == [2, 1]
+        assert await quiz_repository.read(4) == quiz
+        assert await quiz_item_repository.read_by_quiz_id(4) == quiz_items
+        # Test if a quiz without items can be created.
+        quiz, quiz_items = await quiz_repository.create_with_items(
+            Quiz(user_id=1, deck_id=1, quiz_type="dummy_quiz_type5"), []
+        )
+        assert quiz.quiz_id == 5
+        assert quiz_items == []
+
+    async def test_read_with_items(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `QuizRepository.read_with_items` and `read_answered_with_items` methods.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+        statements: list[str] = []
+
+        def count_statement(*args: Any) -> None:
+            statements.append(args[2])
+
+        quiz_repository = QuizRepository(async_db_session)
+        engine = async_db_session.bind.sync_engine  # type: ignore
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            quiz_with_items = await quiz_repository.read_with_items(1, user_id=1)
+            # Test if the quiz, its quiz items and the items of their choices are read by three queries.
+            assert len(statements) == 3
+            quizzes_with_items = await quiz_repository.read_answered_with_items(1)
+            assert len(statements) == 6
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert quiz_with_items.quiz == domain_model_dict["quiz_domain_models"][0]
+        assert (
+            quiz_with_items.quiz_items
+            == domain_model_dict["quiz_item_domain_models"][:2]
+        )
+        assert quiz_with_items.choice_items == {
+            item.item_id: item for item in domain_model_dict["item_domain_models"]
+        }
+        assert [
+            quiz_with_items.quiz.quiz_id for quiz_with_items in quizzes_with_items
+        ] == [1, 2]
+        assert quizzes_with_items[0] == quiz_with_items
+
+        # Test if the pages start after the cursor.
+        quizzes_with_items = await quiz_repository.read_answered_with_items(
+            1, cursor=1, limit=10
+        )
+        assert [
+            quiz_with_items.quiz.quiz_id for quiz_with_items in quizzes_with_items
+        ] == [2]
+        # Test if the quizzes of other users are not read.
+        with pytest.raises(ValueError):
+            await quiz_repository.read_with_items(3, user_id=1)
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyReviewState,
+    item_deck_mapper_table,
+)
+from src.db.repositories.sqlalchemy.review_state_repository import (
+    ReviewStateRepository,
+)
+from src.domain.models import ReviewState
+from tests.utils import DomainModelDict
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2024, 1, 10)
+
+
+def make_review_state(user_id: int, item_id: int, due_in_days: int) -> ReviewState:
+    """Make a review state of an item reviewed a day before `NOW`.
+
+    Args:
+        user_id (int): The unique identifier for the user.
+        item_id (int): The unique identifier for the item.
+        due_in_days (int): The number of days from `NOW` to the due date, negative if overdue.
+
+    Returns:
+        ReviewState: The review state.
+    """
+    return ReviewState(
+        user_id=user_id,
+        item_id=item_id,
+        repetitions=1,
+        interval_days=1,
+        due_at=NOW + timedelta(days=due_in_days),
+        reviewed_at=NOW - timedelta(days=1),
+    )
+
+
+class TestReviewStateRepositorySuccess:
+    """Test cases for the `ReviewStateRepository` class when successful."""
+
+    async def test_upsert_many(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `ReviewStateRepository.upsert_many` and `read_by_item_ids` methods.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        review_state_repository = ReviewStateRepository(async_db_session)
+        created_states = await review_state_repository.upsert_many(
+            [make_review_state(1, 1, 0), make_review_state(1, 2, 1)]
+        )
+        assert [state.review_state_id for state in created_states] == [1, 2]
+
+        # Test if the existing review state is updated in place and a new one is created.
+        updated_state = make_review_state(1, 2, 6).model_copy(update={"repetitions": 2})
+        upserted_states = await review_state_repository.upsert_many(
+            [updated_state, make_review_state(2, 2, 0)], batch_size=1
+        )
+        assert upserted_states[0] == updated_state.model_copy(
+            update={"review_state_id": 2}
+        )
+        assert upserted_states[1].review_state_id == 4
+        read_states = await review_state_repository.read_by_item_ids(1, [2, 3])
+        assert read_states == [upserted_states[0]]
+
+    async def test_read_due(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `ReviewStateRepository.read_due` method.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        review_state_repository = ReviewStateRepository(async_db_session)
+        await review_state_repository.upsert_many(
+            [
+                make_review_state(1, 1, -1),
+                make_review_state(1, 2, -3),
+                make_review_state(1, 3, 0),
+                make_review_state(1, 4, 2),
+                make_review_state(2, 1, -5),
+            ]
+        )
+        async with async_db_session.begin():
+            await async_db_session.execute(
+                insert(item_deck_mapper_table),
+                [{"item_id": 1, "deck_id": 1}, {"item_id": 3, "deck_id": 1}],
+            )
+
+        # Test if the items due are read most overdue first.
+        due_states = await review_state_repository.read_due(1, NOW, 10)
+        assert [state.item_id for state in due_states] == [2, 1, 3]
+        due_states = await review_state_repository.read_due(1, NOW, 2)
+        assert [state.item_id for state in due_states] == [2, 1]
+        # Test if the items are filtered by deck and grade.
+        due_states = await review_state_repository.read_due(1, NOW, 10, deck_id=1)
+        assert [state.item_id for state in due_states] == [1, 3]
+        due_states = await review_state_repository.read_due(1, NOW, 10, grades=[1, 3])
+        assert [state.item_id for state in due_states] == [2, 1]
+
+    async def test_read_due_plan(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test if the items due are read by a range scan of the due-date index without sorting.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, _ = repository_class_provision
+
+        async with async_db_session.begin():
+            # The table is too small for the planner to prefer the index, so rule out the other plans.
+            await async_db_session.execute(text("SET LOCAL enable_seqscan = off"))
+            await async_db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+            results = await async_db_session.execute(
+                text(
+                    f"EXPLAIN SELECT * FROM {SQLAlchemyReviewState.__table__.fullname} "
+                    "WHERE user_id = 1 AND due_at <= now() ORDER BY due_at LIMIT 10"
+                )
+            )
+            plan = "\n".join(results.scalars().all())
+        assert "ix_review_states_user_id_due_at" in plan
+        assert "Sort" not in plan
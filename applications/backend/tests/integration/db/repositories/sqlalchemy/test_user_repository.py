@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import user_cache
 from src.db.repositories.sqlalchemy.user_repository import (
     UserLoginHistoryRepository,
     UserRepository,
@@ -13,6 +14,28 @@ pytestmark = pytest.mark.anyio
 class TestUserRepositorySuccess:
     """Test cases for the `UserRepository` class when successful."""
 
+    async def test_read_all(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test the `UserRepository.read_all` and `UserRepository.stream_all` methods.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+
+        # Instantiate the `UserRepository` class.
+        user_repository = UserRepository(async_db_session)
+        # Get the users page by page, and stream them.
+        first_page = await user_repository.read_all(limit=1)
+        second_page = await user_repository.read_all(cursor=1, limit=1)
+        users = [user async for user in user_repository.stream_all()]
+        # Test if the returned users are correct (i.e. equals to the ones created above).
+        assert first_page == domain_model_dict["user_domain_models"][:1]
+        assert second_page == domain_model_dict["user_domain_models"][1:]
+        assert users == domain_model_dict["user_domain_models"]
+
     async def test_read_by_username(
         self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
     ) -> None:
@@ -49,6 +72,29 @@ class TestUserRepositorySuccess:
         # Test if the returned user is correct (i.e. equals to the one created above).
         assert user == domain_model_dict["user_domain_models"][0]
 
+    async def test_update_invalidates_cache(
+        self, repository_class_provision: tuple[AsyncSession, DomainModelDict]
+    ) -> None:
+        """Test if `UserRepository.update` and `UserRepository.delete` remove the user from the user cache.
+
+        Args:
+            repository_class_provision (tuple[AsyncSession, DomainModelDict]):
+                A tuple of an asynchronous database session and a dictionary of prepared domain models.
+        """
+        async_db_session, domain_model_dict = repository_class_provision
+        user1, user2 = domain_model_dict["user_domain_models"]
+        user_cache.set(user1.user_name, user1)
+        user_cache.set(user2.user_name, user2)
+
+        # Instantiate the `UserRepository` class.
+        user_repository = UserRepository(async_db_session)
+        # Deactivate the first user, which must not be authenticated from the cache anymore.
+        await user_repository.update(user1.model_copy(update={"is_active": False}))
+        assert user_cache.get(user1.user_name) is None
+        assert user_cache.get(user2.user_name) == user2
+        await user_repository.delete(2)
+        assert user_cache.get(user2.user_name) is None
+
 
 class TestUserLoginHistoryRepositorySuccess:
     """Test cases for the `UserLoginHistoryRepository` class when successful."""
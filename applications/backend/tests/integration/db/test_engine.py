@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError
+
+from src.core.config import settings
+from src.db.engine import create_database_engine, get_pool_statistics
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_database_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if the engine is configured by the settings and its pool records metrics.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The fixture to temporarily override the settings.
+    """
+    monkeypatch.setattr(settings, "SQLALCHEMY_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "SQLALCHEMY_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "SQLALCHEMY_POOL_TIMEOUT", 0.1)
+    monkeypatch.setattr(settings, "POSTGRES_STATEMENT_TIMEOUT_MS", 5000)
+    engine = create_database_engine()
+    try:
+        async with engine.connect() as connection:
+            # Test if the server-side statement timeout is applied to the connection.
+            result = await connection.execute(text("SHOW statement_timeout"))
+            assert result.scalar_one() == "5s"
+            # Test if a checkout from the exhausted pool times out.
+            with pytest.raises(TimeoutError):
+                await engine.connect().start()
+            statistics = get_pool_statistics(engine)
+            assert statistics.checked_out == 1
+            assert statistics.checkout_timeouts == 1
+
+        statistics = get_pool_statistics(engine)
+        assert statistics.pool_size == 1
+        assert statistics.checked_in == 1
+        assert statistics.checked_out == 0
+        assert statistics.checkouts == 1
+        assert statistics.connects == 1
+        assert statistics.max_checkout_seconds > 0
+    finally:
+        await engine.dispose()
+
+    # Test if the metrics are kept after the pool is recreated on dispose.
+    assert get_pool_statistics(engine).checkouts == 1
@@ -0,0 +1,218 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, insert, select, text
+
+from src.db.engine import create_database_engine
+from src.db.migrations import (
+    MIGRATIONS,
+    add_item_normalized_texts,
+    check_schema_version,
+    latest_schema_version,
+    migrate,
+    read_schema_version,
+    replace_quiz_stats_key_index,
+    schema_migrations_table,
+)
+from src.db.models.sqlalchemy_data_models import (
+    SQLAlchemyDeck,
+    SQLAlchemyItem,
+    SQLAlchemyQuiz,
+    SQLAlchemyQuizItem,
+    SQLAlchemyQuizItemChoice,
+    SQLAlchemyQuizStat,
+    SQLAlchemyUser,
+    item_deck_mapper_table,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_migrate() -> None:
+    """Test if migrating records the schema version and is idempotent."""
+    engine = create_database_engine()
+    try:
+        async with engine.begin() as connection:
+            await migrate(connection)
+        # Test if nothing is applied once the database is up to date.
+        async with engine.begin() as connection:
+            assert await migrate(connection) == []
+            assert await read_schema_version(connection) == latest_schema_version()
+            assert await check_schema_version(connection) == latest_schema_version()
+
+        async with engine.connect() as connection:
+            # Test if the check fails on a database that has not been migrated.
+            # The connection rolls back the deletion on exit.
+            await connection.execute(delete(schema_migrations_table))
+            assert await read_schema_version(connection) is None
+            with pytest.raises(RuntimeError):
+                await check_schema_version(connection)
+            # Test if all migrations are applied again without failing on the existing tables.
+            assert await migrate(connection) == sorted(MIGRATIONS)
+    finally:
+        await engine.dispose()
+
+
+async def test_add_item_normalized_texts() -> None:
+    """Test if the migration of the normalized texts of items merges the existing duplicates."""
+    engine = create_database_engine()
+    try:
+        # The connection rolls back all the changes on exit.
+        async with engine.connect() as connection:
+            await migrate(connection)
+            # Make the items table as it was before the migration.
+            items_table = SQLAlchemyItem.__table__.fullname  # type: ignore
+            await connection.execute(
+                text(
+                    f"ALTER TABLE {items_table} "
+                    "DROP COLUMN normalized_english, DROP COLUMN normalized_japanese"
+                )
+            )
+            user_id = await connection.scalar(
+                insert(SQLAlchemyUser)
+                .values(user_name="migration_user", email="m@example.com", password="")
+                .returning(SQLAlchemyUser.user_id)
+            )
+            deck_id = await connection.scalar(
+                insert(SQLAlchemyDeck)
+                .values(user_id=user_id, deck_name="deck")
+                .returning(SQLAlchemyDeck.deck_id)
+            )
+            item_ids = list(
+                await connection.scalars(
+                    insert(SQLAlchemyItem).returning(
+                        SQLAlchemyItem.item_id, sort_by_parameter_order=True
+                    ),
+                    [
+                        {
+                            "user_id": user_id,
+                            "english": english,
+                            "japanese": japanese,
+                            "grade": 1,
+                        }
+                        for english, japanese in (
+                            ("Take off", "離陸する"),
+                            ("take  OFF ", "離陸する"),
+                            ("take off", "ﾘﾘｸ"),
+                        )
+                    ],
+                )
+            )
+            await connection.execute(
+                insert(item_deck_mapper_table),
+                [{"item_id": item_id, "deck_id": deck_id} for item_id in item_ids[1:]],
+            )
+            # Take a quiz on the duplicate, which is also a choice by its id as a number and as a string.
+            quiz_id = await connection.scalar(
+                insert(SQLAlchemyQuiz)
+                .values(
+                    user_id=user_id,
+                    deck_id=deck_id,
+                    quiz_type="dummy_quiz_type",
+                    quiz_timestamp=datetime(2024, 1, 1),
+                )
+                .returning(SQLAlchemyQuiz.quiz_id)
+            )
+            choice_item_ids = [item_ids[2], item_ids[1], str(item_ids[1])]
+            quiz_item_id = await connection.scalar(
+                insert(SQLAlchemyQuizItem)
+                .values(
+                    quiz_id=quiz_id,
+                    item_id=item_ids[1],
+                    question_number=1,
+                    choice_item_ids=choice_item_ids,
+                    correct_answer=1,
+                )
+                .returning(SQLAlchemyQuizItem.quiz_item_id)
+            )
+            await connection.execute(
+                insert(SQLAlchemyQuizItemChoice),
+                [
+                    {
+                        "quiz_item_id": quiz_item_id,
+                        "position": position,
+                        "item_id": int(id),
+                    }
+                    for position, id in enumerate(choice_item_ids)
+                ],
+            )
+
+            await add_item_normalized_texts(connection)
+            # Test if running the migration again changes nothing.
+            await add_item_normalized_texts(connection)
+
+            # Test if the duplicate is merged into the first item, which takes over its place in the deck.
+            results = await connection.execute(
+                select(
+                    SQLAlchemyItem.item_id,
+                    SQLAlchemyItem.normalized_english,
+                    SQLAlchemyItem.normalized_japanese,
+                )
+                .where(SQLAlchemyItem.user_id == user_id)
+                .order_by(SQLAlchemyItem.item_id)
+            )
+            assert results.all() == [
+                (item_ids[0], "take off", "離陸する"),
+                (item_ids[2], "take off", "リリク"),
+            ]
+            results = await connection.scalars(
+                select(item_deck_mapper_table.c.item_id)
+                .where(item_deck_mapper_table.c.deck_id == deck_id)
+                .order_by(item_deck_mapper_table.c.item_id)
+            )
+            assert results.all() == [item_ids[0], item_ids[2]]
+            # Test if the quiz item and its choices refer to the first item instead of the duplicate.
+            results = await connection.execute(
+                select(
+                    SQLAlchemyQuizItem.item_id, SQLAlchemyQuizItem.choice_item_ids
+                ).where(SQLAlchemyQuizItem.quiz_item_id == quiz_item_id)
+            )
+            assert results.one() == (
+                item_ids[0],
+                [item_ids[2], item_ids[0], str(item_ids[0])],
+            )
+            results = await connection.scalars(
+                select(SQLAlchemyQuizItemChoice.item_id)
+                .where(SQLAlchemyQuizItemChoice.quiz_item_id == quiz_item_id)
+                .order_by(SQLAlchemyQuizItemChoice.position)
+            )
+            assert results.all() == [item_ids[2], item_ids[0], item_ids[0]]
+    finally:
+        await engine.dispose()
+
+
+async def test_replace_quiz_stats_key_index() -> None:
+    """Test if the migration of the unique index of the quiz statistics drops the old index."""
+    engine = create_database_engine()
+    try:
+        # The connection rolls back all the changes on exit.
+        async with engine.connect() as connection:
+            await migrate(connection)
+            # Make the index as it was before the migration.
+            quiz_stats_table = SQLAlchemyQuizStat.__table__
+            await connection.execute(
+                text(f"DROP INDEX {quiz_stats_table.schema}.uq_quiz_stats_key")  # type: ignore
+            )
+            await connection.execute(
+                text(
+                    "CREATE UNIQUE INDEX uq_quiz_stats_user_id_deck_id_grade_day "
+                    f"ON {quiz_stats_table.fullname} "  # type: ignore
+                    "(user_id, coalesce(deck_id, 0), grade, day)"
+                )
+            )
+
+            await replace_quiz_stats_key_index(connection)
+            # Test if running the migration again changes nothing.
+            await replace_quiz_stats_key_index(connection)
+
+            results = await connection.scalars(
+                text(
+                    "SELECT indexname FROM pg_indexes "
+                    "WHERE schemaname = :schema AND tablename = 'quiz_stats' "
+                    "AND indexname LIKE 'uq_%'"
+                ),
+                {"schema": quiz_stats_table.schema},  # type: ignore
+            )
+            assert results.all() == ["uq_quiz_stats_key"]
+    finally:
+        await engine.dispose()
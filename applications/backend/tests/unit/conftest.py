@@ -2,7 +2,10 @@ import pytest
 from asgi_lifespan import LifespanManager
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import user_cache
 from src.db.models.sqlalchemy_data_models import Base
+from src.domain.services.item_service.typeahead_index import typeahead_index
+from src.domain.services.quiz_service.item_index import item_index
 
 
 @pytest.fixture(scope="function")
@@ -23,6 +26,10 @@ async def async_db_session(
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+    # The recreated tables reuse the user and item ids, so forget the ones cached by the previous test.
+    user_cache.clear()
+    item_index.clear()
+    typeahead_index.clear()
 
     # This context automatically calls async_session.close() when the code block is exited.
     async with async_session_factory() as async_session:
@@ -0,0 +1,64 @@
+from src.core.cache import TTLCache
+
+
+class FakeClock:
+    """A clock that only advances when told to."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at 0 seconds."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time.
+
+        Returns:
+            float: The current time in seconds.
+        """
+        return self.now
+
+
+class TestTTLCache:
+    """Test cases for the `TTLCache` class."""
+
+    def test_expire(self) -> None:
+        """Test if an entry expires after the TTL."""
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evict_least_recently_used(self) -> None:
+        """Test if the least recently used entry is evicted when the cache is full."""
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        # Reading "a" makes "b" the least recently used entry.
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_invalidate(self) -> None:
+        """Test if entries are removed by their keys and by their values."""
+        cache: TTLCache[str, int] = TTLCache(max_size=4, ttl_seconds=10)
+        for key, value in (("a", 1), ("b", 2), ("c", 3)):
+            cache.set(key, value)
+        cache.pop("a")
+        cache.pop("missing")
+        cache.pop_where(lambda value: value == 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_disabled(self) -> None:
+        """Test if nothing is cached when the TTL is 0."""
+        cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
@@ -0,0 +1,50 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.core.security import (
+    PasswordHashingExecutor,
+    async_get_password_hash,
+    async_verify_password,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class TestPasswordHashingExecutor:
+    """Test cases for the `PasswordHashingExecutor` class."""
+
+    async def test_run(self) -> None:
+        """Test if functions run in the pool up to the concurrency limit and their queue wait is recorded."""
+        executor = PasswordHashingExecutor(max_workers=1)
+        release = threading.Event()
+
+        def wait_for_release() -> str:
+            release.wait(timeout=5)
+            return threading.current_thread().name
+
+        tasks = [asyncio.create_task(executor.run(wait_for_release)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        # Test if the event loop is not blocked and the second task waits in the queue.
+        assert executor.metrics.in_flight == 2
+        release.set()
+        thread_names = await asyncio.gather(*tasks)
+        assert all(name.startswith("password-hashing") for name in thread_names)
+        assert executor.metrics.tasks == 2
+        assert executor.metrics.in_flight == 0
+        assert executor.metrics.max_queue_wait_seconds > 0.04
+
+    async def test_run_inline(self) -> None:
+        """Test if functions run on the event loop when the pool is disabled."""
+        executor = PasswordHashingExecutor(max_workers=0)
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+        assert thread_name == threading.current_thread().name
+        assert executor.metrics.tasks == 1
+
+
+async def test_async_password_hash() -> None:
+    """Test if a password hashed off the event loop is verified off the event loop."""
+    hashed_password = await async_get_password_hash("password")
+    assert await async_verify_password("password", hashed_password)
+    assert not await async_verify_password("wrong_password", hashed_password)
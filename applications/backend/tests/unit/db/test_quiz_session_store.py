@@ -0,0 +1,183 @@
+from datetime import datetime
+from types import TracebackType
+from typing import Any
+
+import pytest
+from redis.asyncio import Redis
+
+from src.db.quiz_session_store import (
+    FallbackQuizSessionStore,
+    InMemoryQuizSessionStore,
+    QuizSession,
+    QuizSessionQuestion,
+    RedisQuizSessionStore,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeRedis:
+    """A stand-in for the Redis client that keeps hashes in memory and counts round trips."""
+
+    def __init__(self) -> None:
+        """Initialize an empty server."""
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.ttls: dict[str, int] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        """Start a pipeline.
+
+        Args:
+            transaction (bool): Whether the commands are run in a transaction.
+
+        Returns:
+            FakePipeline: The pipeline.
+        """
+        return FakePipeline(self)
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        """Read all fields of a hash.
+
+        Args:
+            key (str): The key of the hash.
+
+        Returns:
+            dict[bytes, bytes]: The fields, or an empty dictionary if the hash does not exist.
+        """
+        self.round_trips += 1
+        return dict(self.hashes.get(key, {}))
+
+    async def delete(self, key: str) -> None:
+        """Delete a key.
+
+        Args:
+            key (str): The key.
+        """
+        self.round_trips += 1
+        self.hashes.pop(key, None)
+
+
+class FakePipeline:
+    """A stand-in for a Redis pipeline that runs its commands in a single round trip."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        """Initialize an empty pipeline.
+
+        Args:
+            redis (FakeRedis): The server to run the commands on.
+        """
+        self.redis = redis
+        self.commands: list[tuple[str, Any]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        """Enter the context of the pipeline.
+
+        Returns:
+            FakePipeline: The pipeline.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context of the pipeline.
+
+        Args:
+            exc_type (type[BaseException] | None): The type of the exception raised in the context, if any.
+            exc (BaseException | None): The exception raised in the context, if any.
+            traceback (TracebackType | None): The traceback of the exception, if any.
+        """
+
+    def hset(self, key: str, mapping: dict[str, str]) -> None:
+        """Queue setting fields of a hash.
+
+        Args:
+            key (str): The key of the hash.
+            mapping (dict[str, str]): The fields to set.
+        """
+        self.commands.append(("hset", (key, mapping)))
+
+    def expire(self, key: str, ttl_seconds: int) -> None:
+        """Queue setting the expiration of a key.
+
+        Args:
+            key (str): The key.
+            ttl_seconds (int): The seconds after which the key expires.
+        """
+        self.commands.append(("expire", (key, ttl_seconds)))
+
+    async def execute(self) -> None:
+        """Run the queued commands in a single round trip."""
+        self.redis.round_trips += 1
+        for command, (key, value) in self.commands:
+            if command == "hset":
+                self.redis.hashes.setdefault(key, {}).update(
+                    {field.encode(): data.encode() for field, data in value.items()}
+                )
+            else:
+                self.redis.ttls[key] = value
+
+
+def make_quiz_session(quiz_id: int, num_questions: int) -> QuizSession:
+    """Make a quiz session.
+
+    Args:
+        quiz_id (int): The unique identifier for the quiz.
+        num_questions (int): The number of questions.
+
+    Returns:
+        QuizSession: The quiz session.
+    """
+    return QuizSession(
+        quiz_id=quiz_id,
+        user_id=1,
+        quiz_timestamp=datetime(2024, 1, 1),
+        questions=[
+            QuizSessionQuestion(
+                question_number=question_number,
+                question=f"english{question_number}",
+                choices=[f"訳{question_number}", "犬", "猫", "鳥"],
+                correct_answer=0,
+            )
+            for question_number in range(1, num_questions + 1)
+        ],
+    )
+
+
+async def test_redis_store() -> None:
+    """Test if a quiz session is written and read back by a single round trip each."""
+    redis = FakeRedis()
+    store = RedisQuizSessionStore(redis, ttl_seconds=60)  # type: ignore
+    quiz_session = make_quiz_session(1, 12)
+    await store.save(quiz_session)
+    assert redis.round_trips == 1
+    assert redis.ttls == {"quiz_session:1": 60}
+    # The questions are read back in order although hash fields are not ordered by number.
+    assert await store.read(1) == quiz_session
+    assert redis.round_trips == 2
+
+    assert await store.read(2) is None
+    await store.delete(1)
+    assert await store.read(1) is None
+
+
+async def test_fallback_store() -> None:
+    """Test if quiz sessions are kept in memory while Redis is unavailable."""
+    # Nothing listens on port 1, so connecting to it fails immediately.
+    redis = Redis.from_url("redis://127.0.0.1:1/0", socket_connect_timeout=1)
+    store = FallbackQuizSessionStore(
+        RedisQuizSessionStore(redis, ttl_seconds=60),
+        InMemoryQuizSessionStore(ttl_seconds=60, max_size=10),
+        retry_seconds=30,
+    )
+    quiz_session = make_quiz_session(1, 3)
+    await store.save(quiz_session)
+    assert not store.primary_available
+    assert await store.read(1) == quiz_session
+    await store.delete(1)
+    assert await store.read(1) is None
+    await redis.aclose()
@@ -0,0 +1,178 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.domain.models import Item
+from src.domain.services.item_service.base_item_index import ItemIndexEntry
+from src.domain.services.item_service.typeahead_index import (
+    MAX_SCANNED_ITEMS,
+    TypeaheadIndex,
+    japanese_key,
+)
+
+
+def make_entry(
+    item_id: int, user_id: int | None, grade: int, english: str, japanese: str
+) -> ItemIndexEntry:
+    """Make an entry of the index.
+
+    Args:
+        item_id (int): The unique identifier for the item.
+        user_id (int | None): The unique identifier for the user who owns the item.
+        grade (int): The grade of the item.
+        english (str): The English word of the item.
+        japanese (str): The Japanese translation of the item.
+
+    Returns:
+        ItemIndexEntry: The entry.
+    """
+    return ItemIndexEntry(
+        item_id=item_id,
+        user_id=user_id,
+        grade=grade,
+        english=english,
+        japanese=japanese,
+        updated_at=datetime(2024, 1, 1) + timedelta(seconds=item_id),
+    )
+
+
+ENTRIES = [
+    make_entry(1, None, 1, "apple", "りんご"),
+    make_entry(2, 1, 2, "Application", "アプリケーション"),
+    make_entry(3, 1, 1, "apply", "申し込む"),
+    make_entry(4, 2, 1, "apricot", "あんず"),
+    make_entry(5, None, 2, "banana", "バナナ"),
+    make_entry(6, 1, 3, "ap", "ｱﾌﾟﾘ"),
+]
+
+
+class TestTypeaheadIndex:
+    """Test cases for the `TypeaheadIndex` class."""
+
+    @pytest.mark.parametrize("loaded", [True, False])
+    def test_suggest(self, loaded: bool) -> None:
+        """Test if the items of the user and the shared items starting with a prefix are suggested.
+
+        Args:
+            loaded (bool): Whether the items are loaded at once or upserted one by one out of order.
+        """
+        index = TypeaheadIndex(refresh_seconds=10)
+        if loaded:
+            index.load(ENTRIES)
+        else:
+            for entry in reversed(ENTRIES):
+                index.upsert([entry])
+        assert len(index) == 6
+
+        def suggest(prefix: str, **kwargs: Any) -> list[int]:
+            return [
+                suggestion.item_id
+                for suggestion in index.suggest(prefix, user_id=1, **kwargs)
+            ]
+
+        # Test if English words are matched ignoring case, shortest completions first.
+        assert suggest("AP") == [6, 1, 2, 3]
+        assert suggest("appl") == [1, 2, 3]
+        assert suggest("appl", limit=2) == [1, 2]
+        assert suggest("appl", grades=[1]) == [1, 3]
+        assert suggest("c") == []
+        # Test if Japanese translations are matched ignoring the kind and width of kana.
+        assert suggest("あぷ") == [6, 2]
+        assert suggest("リン") == [1]
+        assert suggest("申") == [3]
+        # Test if the items of other users are not suggested.
+        assert suggest("apr") == []
+        assert [
+            suggestion.model_dump() for suggestion in index.suggest("apr", user_id=2)
+        ] == [{"item_id": 4, "english": "apricot", "japanese": "あんず", "grade": 1}]
+        assert [s.item_id for s in index.suggest("a", user_id=None)] == [1]
+
+    def test_upsert_existing(self) -> None:
+        """Test if an updated item is suggested by its new texts, owner and grade only."""
+        index = TypeaheadIndex(refresh_seconds=10)
+        index.load(ENTRIES)
+        memory_bytes = index.memory_bytes()
+        # Reading an unchanged item again does not grow the index.
+        index.upsert([ENTRIES[0]])
+        assert index.memory_bytes() == memory_bytes
+
+        index.upsert([make_entry(1, 2, 3, "pineapple", "パイナップル")])
+        assert len(index) == 6
+        assert [s.item_id for s in index.suggest("app", user_id=1)] == [2, 3]
+        assert [s.item_id for s in index.suggest("pine", user_id=2)] == [1]
+        assert [s.item_id for s in index.suggest("ぱい", user_id=2)] == [1]
+        assert index.suggest("pine", user_id=2, grades=[1]) == []
+
+    def test_scan_limit(self) -> None:
+        """Test if no more than `MAX_SCANNED_ITEMS` matching items are scanned for the grades."""
+        index = TypeaheadIndex(refresh_seconds=10)
+        index.load(
+            make_entry(item_id, None, 1, f"word{item_id:05}", "語")
+            for item_id in range(1, MAX_SCANNED_ITEMS + 2)
+        )
+        index.upsert([make_entry(MAX_SCANNED_ITEMS + 2, None, 2, "word99999", "語")])
+        assert index.suggest("word", user_id=1, grades=[2]) == []
+        assert len(index.suggest("word", user_id=1, limit=20)) == 20
+
+
+def test_japanese_key() -> None:
+    """Test if katakana and half-width kana are keyed as hiragana."""
+    assert japanese_key("アプリ") == "あぷり"
+    assert japanese_key("ｱﾌﾟﾘ") == "あぷり"
+    assert japanese_key("申し込む") == "申し込む"
+
+
+@pytest.mark.anyio()
+async def test_refresh(async_db_session: AsyncSession) -> None:
+    """Test if the index is refreshed incrementally from the database.
+
+    Args:
+        async_db_session (AsyncSession): An asynchronous database session.
+    """
+    index = TypeaheadIndex(refresh_seconds=10)
+    item_repository = ItemRepository(async_db_session)
+    items = await item_repository.create_many(
+        [
+            Item(user_id=None, english=f"english{i}", japanese=f"訳{i}", grade=1)
+            for i in range(3)
+        ]
+    )
+    # Test if the index is cold while another request is loading it.
+    async with index._lock:
+        assert not await index.refresh(item_repository)
+    assert await index.refresh(item_repository)
+    assert len(index.suggest("eng", user_id=1)) == 3
+
+    # Test if an update is seen after expiring the index.
+    await item_repository.update(items[0].model_copy(update={"english": "updated"}))
+    index.expire()
+    await index.refresh(item_repository)
+    assert [s.item_id for s in index.suggest("upd", user_id=1)] == [items[0].item_id]
+
+    # Test if a deleted item is removed by reloading the index.
+    await item_repository.delete(items[1].item_id)  # type: ignore
+    index.expire()
+    await index.refresh(item_repository)
+    assert len(index) == 2
+    assert [s.item_id for s in index.suggest("eng", user_id=1)] == [items[2].item_id]
+
+    # Test if an item deleted while another is inserted is removed, even if the inserted item is
+    # not read as updated, e.g. since its transaction committed long after it began.
+    await item_repository.delete(items[2].item_id)  # type: ignore
+    inserted_item = await item_repository.create(
+        Item(
+            user_id=None,
+            english="english late",
+            japanese="遅刻",
+            grade=1,
+            updated_at=datetime(2000, 1, 1),
+        )
+    )
+    index.expire()
+    await index.refresh(item_repository)
+    assert [s.item_id for s in index.suggest("eng", user_id=1)] == [
+        inserted_item.item_id
+    ]
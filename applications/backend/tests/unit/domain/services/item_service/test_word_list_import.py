@@ -0,0 +1,54 @@
+import io
+
+import pytest
+
+from src.domain.models import Item
+from src.domain.services.item_service.word_list_import import read_word_list
+
+
+class TestReadWordList:
+    """Test cases for the `read_word_list` function."""
+
+    def test_read_csv(self) -> None:
+        """Test reading a comma-separated word list in chunks."""
+        stream = io.StringIO(
+            "id,english,japanese,grade\n"
+            "1,apple,りんご,1\n"
+            "2, banana ,バナナ,2\n"
+            "\n"
+            '3,"ice cream",アイスクリーム,3\n'
+        )
+        chunks = list(read_word_list(stream, user_id=1, chunk_size=2))
+        # Test if the items are split into chunks of at most two items.
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert chunks[0][1] == Item(
+            user_id=1,
+            english="banana",
+            japanese="バナナ",
+            grade=2,
+            created_at=chunks[0][1].created_at,
+            updated_at=chunks[0][1].updated_at,
+        )
+        assert chunks[1][0].english == "ice cream"
+
+    def test_read_tsv(self) -> None:
+        """Test reading a tab-separated word list whose columns are in a different order."""
+        stream = io.StringIO("Grade\tJapanese\tEnglish\n4\t犬\tdog\n")
+        chunks = list(read_word_list(stream, user_id=None))
+        assert len(chunks) == 1
+        assert chunks[0][0].user_id is None
+        assert chunks[0][0].english == "dog"
+        assert chunks[0][0].japanese == "犬"
+        assert chunks[0][0].grade == 4
+
+    def test_read_malformed(self) -> None:
+        """Test if reading a malformed word list raises an error."""
+        with pytest.raises(ValueError):
+            list(read_word_list(io.StringIO("english,japanese\ncat,猫\n"), user_id=1))
+        with pytest.raises(ValueError, match="Line 3"):
+            list(
+                read_word_list(
+                    io.StringIO("english,japanese,grade\ncat,猫,1\ncow,牛,first\n"),
+                    user_id=1,
+                )
+            )
@@ -0,0 +1,185 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.domain.models import Item
+from src.domain.services.quiz_service.item_index import ItemIndex, ItemIndexEntry
+
+
+class FakeClock:
+    """A clock that only advances when told to."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at 0 seconds."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time.
+
+        Returns:
+            float: The current time in seconds.
+        """
+        return self.now
+
+
+def make_entry(
+    item_id: int, user_id: int | None, grade: int, japanese: str, english: str = ""
+) -> ItemIndexEntry:
+    """Make an entry of the index.
+
+    Args:
+        item_id (int): The unique identifier for the item.
+        user_id (int | None): The unique identifier for the user who owns the item.
+        grade (int): The grade of the item.
+        japanese (str): The Japanese translation of the item.
+        english (str): The English word of the item. It is made of the id by default.
+
+    Returns:
+        ItemIndexEntry: The entry.
+    """
+    return ItemIndexEntry(
+        item_id=item_id,
+        user_id=user_id,
+        grade=grade,
+        english=english or f"english{item_id}",
+        japanese=japanese,
+        updated_at=datetime(2024, 1, 1) + timedelta(seconds=item_id),
+    )
+
+
+class TestItemIndex:
+    """Test cases for the `ItemIndex` class."""
+
+    def test_sample(self) -> None:
+        """Test if distinct items of the user and shared items of the grades are sampled."""
+        index = ItemIndex(refresh_seconds=10)
+        # Add the items out of order to test if they are kept sorted.
+        index.upsert(
+            make_entry(item_id, user_id, grade, f"訳{item_id}")
+            for item_id, user_id, grade in (
+                (4, None, 2),
+                (1, 1, 1),
+                (3, 2, 1),
+                (2, None, 1),
+                (5, 1, 2),
+            )
+        )
+        assert len(index) == 5
+        assert index.gloss(4) == "訳4"
+        with pytest.raises(KeyError):
+            index.gloss(6)
+
+        rng = random.Random(0)
+        assert sorted(index.sample(10, user_id=1, rng=rng)) == [1, 2, 4, 5]
+        assert sorted(index.sample(10, user_id=1, grades=[1], rng=rng)) == [1, 2]
+        assert sorted(index.sample(10, user_id=None, rng=rng)) == [2, 4]
+        sampled_ids = index.sample(3, user_id=1, rng=rng)
+        assert len(set(sampled_ids)) == 3
+        assert index.sample(3, user_id=1, grades=[9], rng=rng) == []
+
+    def test_upsert_existing(self) -> None:
+        """Test if updating an item moves it to the group of its new owner and grade."""
+        index = ItemIndex(refresh_seconds=10)
+        index.upsert([make_entry(1, 1, 1, "犬"), make_entry(2, 1, 1, "猫")])
+        memory_bytes = index.memory_bytes()
+        # Reading an unchanged item again does not grow the index.
+        index.upsert([make_entry(1, 1, 1, "犬")])
+        assert index.memory_bytes() == memory_bytes
+
+        index.upsert([make_entry(1, None, 2, "いぬ")])
+        assert len(index) == 2
+        assert index.gloss(1) == "いぬ"
+        assert index.sample(10, user_id=1, grades=[1]) == [2]
+        assert index.sample(10, user_id=2, grades=[2]) == [1]
+
+    def test_similar(self) -> None:
+        """Test if the items of the grade most similar to an item are found."""
+        index = ItemIndex(refresh_seconds=10)
+        index.upsert(
+            make_entry(item_id, user_id, grade, japanese, english)
+            for item_id, user_id, grade, english, japanese in (
+                (1, None, 1, "station", "駅"),
+                (2, None, 1, "nation", "国家"),
+                (3, None, 1, "stationery", "文房具"),
+                (4, None, 1, "apple", "りんご"),
+                (5, None, 2, "stations", "駅"),
+                (6, 2, 1, "station master", "駅長"),
+                (7, 1, 1, "station building", "駅舎"),
+            )
+        )
+        # Test if the shared and own items of the grade are found, most similar first,
+        # except for the items of another grade or user and the items sharing no n-grams.
+        assert index.similar(1, 10, user_id=1) == [3, 7, 2]
+        assert index.similar(1, 1, user_id=1) == [3]
+        assert index.similar(8, 3, user_id=1) == []
+
+        # Test if an updated item is found by its new texts only.
+        index.upsert([make_entry(4, None, 1, "駅前", "station front")])
+        assert 4 in index.similar(1, 10, user_id=1)
+        index.upsert([make_entry(4, None, 1, "りんご", "apple")])
+        assert 4 not in index.similar(1, 10, user_id=1)
+
+        # Test if the items with the same translation after normalization are left out.
+        index.upsert([make_entry(8, None, 1, " 駅 ", "stationary")])
+        assert index.similar(1, 10, user_id=1) == [3, 7, 2]
+
+
+@pytest.mark.anyio()
+async def test_refresh(async_db_session: AsyncSession) -> None:
+    """Test if the index is refreshed incrementally from the database at most once per interval.
+
+    Args:
+        async_db_session (AsyncSession): An asynchronous database session.
+    """
+    clock = FakeClock()
+    index = ItemIndex(refresh_seconds=10, clock=clock)
+    item_repository = ItemRepository(async_db_session)
+    items = await item_repository.create_many(
+        [
+            Item(user_id=None, english=f"english{i}", japanese=f"訳{i}", grade=i % 2)
+            for i in range(4)
+        ]
+    )
+    # Test if the index is cold while another request is loading it.
+    async with index._lock:
+        assert not await index.refresh(item_repository)
+    assert await index.refresh(item_repository)
+    assert sorted(index.sample(10, user_id=1)) == [item.item_id for item in items]
+
+    # Test if an update is not seen until the interval has passed.
+    await item_repository.update(items[0].model_copy(update={"japanese": "更新"}))
+    await index.refresh(item_repository)
+    assert index.gloss(items[0].item_id) == "訳0"  # type: ignore
+    clock.now = 10
+    await index.refresh(item_repository)
+    assert index.gloss(items[0].item_id) == "更新"  # type: ignore
+
+    # Test if a deleted item is removed by reloading the index, or by expiring it.
+    await item_repository.delete(items[1].item_id)  # type: ignore
+    index.expire()
+    await index.refresh(item_repository)
+    assert len(index) == 3
+    assert items[1].item_id not in index.sample(10, user_id=1)
+
+    # Test if an item deleted while another is inserted is removed, even if the inserted item is
+    # not read as updated, e.g. since its transaction committed long after it began.
+    await item_repository.delete(items[2].item_id)  # type: ignore
+    inserted_item = await item_repository.create(
+        Item(
+            user_id=None,
+            english="late",
+            japanese="遅刻",
+            grade=1,
+            updated_at=datetime(2000, 1, 1),
+        )
+    )
+    clock.now = 20
+    await index.refresh(item_repository)
+    assert sorted(index.sample(10, user_id=1)) == [
+        items[0].item_id,
+        items[3].item_id,
+        inserted_item.item_id,
+    ]
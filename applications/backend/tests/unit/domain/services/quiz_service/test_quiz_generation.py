@@ -0,0 +1,158 @@
+import random
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.db.repositories.sqlalchemy.quiz_repository import QuizRepository
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import Item, User
+from src.domain.services.quiz_service.item_index import ItemIndex, ItemIndexEntry
+from src.domain.services.quiz_service.quiz_generation import (
+    assign_choices,
+    generate_quiz,
+    replace_with_similar_distractors,
+)
+
+
+def make_items(num_items: int) -> list[Item]:
+    """Make items with distinct ids.
+
+    Args:
+        num_items (int): The number of items.
+
+    Returns:
+        list[Item]: The items.
+    """
+    return [
+        Item(
+            item_id=i,
+            user_id=1,
+            english=f"english{i}",
+            japanese=f"japanese{i}",
+            grade=1,
+        )
+        for i in range(1, num_items + 1)
+    ]
+
+
+class TestAssignChoices:
+    """Test cases for the `assign_choices` function."""
+
+    def test_disjoint_distractors(self) -> None:
+        """Test if no choice appears twice in a quiz when there are enough items."""
+        questions = assign_choices(make_items(12), 3, rng=random.Random(0))
+        assert len(questions) == 3
+        choice_ids = [
+            choice.item_id for _, choices, _ in questions for choice in choices
+        ]
+        assert sorted(choice_ids) == list(range(1, 13))  # type: ignore
+        for item, choices, correct_answer in questions:
+            assert choices[correct_answer] is item
+
+    def test_shared_distractors(self) -> None:
+        """Test if the distractors are sampled from the other items when there are few items."""
+        items = make_items(5)
+        questions = assign_choices(items, 10, rng=random.Random(0))
+        # Test if every item is asked for once, with distinct choices.
+        assert [item for item, _, _ in questions] == items
+        for item, choices, correct_answer in questions:
+            assert len(choices) == 4
+            assert len({choice.item_id for choice in choices}) == 4
+            assert choices[correct_answer] is item
+
+    def test_too_few_items(self) -> None:
+        """Test if a quiz cannot be made with fewer items than the choices."""
+        with pytest.raises(ValueError):
+            assign_choices(make_items(3), 1)
+
+
+def test_replace_with_similar_distractors() -> None:
+    """Test if the random distractors are replaced with similar items, or kept if there are not enough."""
+    item_index = ItemIndex(refresh_seconds=10)
+    item_index.upsert(
+        ItemIndexEntry(
+            item_id=item_id,
+            user_id=None,
+            grade=1,
+            english=english,
+            japanese=f"訳{item_id}",
+            updated_at=datetime(2024, 1, 1),
+        )
+        for item_id, english in enumerate(
+            ["station", "stationery", "stations", "nation", "apple", "banana"], 1
+        )
+    )
+    questions = replace_with_similar_distractors(
+        item_index, [(1, [5, 1, 6, 4], 1), (5, [5, 6, 1, 2], 0)], user_id=1
+    )
+    # The question about "station" gets the three similar words as its distractors.
+    assert questions[0][1][1] == 1
+    assert sorted(questions[0][1]) == [1, 2, 3, 4]
+    # No word is similar to "apple", so the random distractors are kept.
+    assert questions[1] == (5, [5, 6, 1, 2], 0)
+
+    # Test if the choices with the same translations as others are replaced if possible.
+    item_index.upsert(
+        ItemIndexEntry(
+            item_id=item_id,
+            user_id=None,
+            grade=1,
+            english=english,
+            japanese=japanese,
+            updated_at=datetime(2024, 1, 1),
+        )
+        for item_id, english, japanese in [
+            (7, "railway station", "訳1"),
+            (8, "ringo", "ﾘﾝｺﾞ"),
+            (9, "fruit", "リンゴ "),
+        ]
+    )
+    questions = replace_with_similar_distractors(
+        item_index, [(5, [9, 5, 8, 6], 1), (8, [8, 9, 5, 6], 0)], user_id=1
+    )
+    # "railway station" would be similar to "station", but has the same translation.
+    assert (
+        7
+        not in replace_with_similar_distractors(
+            item_index, [(1, [5, 1, 6, 4], 1)], user_id=1
+        )[0][1]
+    )
+    # The two random distractors with the same translation are kept only while others are missing.
+    assert questions[0] == (5, [9, 5, 6, 8], 1)
+    assert questions[1] == (8, [8, 5, 6, 9], 0)
+
+
+@pytest.mark.anyio()
+async def test_generate_quiz_from_stale_index(async_db_session: AsyncSession) -> None:
+    """Test if the items deleted since the last refresh of the index are not asked about.
+
+    Args:
+        async_db_session (AsyncSession): An asynchronous database session.
+    """
+    user = await UserRepository(async_db_session).create(
+        User(user_name="user", email="email", password="password")
+    )
+    item_repository = ItemRepository(async_db_session)
+    items = await item_repository.create_many(
+        [
+            Item(user_id=None, english=f"english{i}", japanese=f"訳{i}", grade=1)
+            for i in range(8)
+        ]
+    )
+    item_index = ItemIndex(refresh_seconds=3600)
+    assert await item_index.refresh(item_repository)
+    deleted_item = await item_repository.delete(items[0].item_id)  # type: ignore
+
+    generated_quiz = await generate_quiz(
+        item_repository,
+        QuizRepository(async_db_session),
+        user.user_id,  # type: ignore
+        8,
+        rng=random.Random(0),
+        item_index=item_index,
+    )
+    question_ids = [question.question.item_id for question in generated_quiz.questions]
+    assert sorted(question_ids) == [item.item_id for item in items[1:]]  # type: ignore
+    assert deleted_item.item_id not in question_ids
@@ -0,0 +1,31 @@
+from datetime import date
+
+from src.domain.models import QuizStat
+from src.domain.services.quiz_service.quiz_history import summarize_quiz_stats
+
+
+def test_summarize_quiz_stats() -> None:
+    """Test if the statistics are summed in total, by grade and by day."""
+    quiz_stats = [
+        QuizStat(
+            user_id=1,
+            grade=grade,
+            day=date(2024, 1, day),
+            attempts=4,
+            correct=grade,
+            total_answer_time=20,
+        )
+        for day in (2, 1)
+        for grade in (3, 1)
+    ]
+    summary = summarize_quiz_stats(quiz_stats)
+    assert summary.total.attempts == 16
+    assert summary.total.accuracy == 0.5
+    assert summary.total.average_answer_time == 5
+    assert list(summary.by_grade) == [1, 3]
+    assert summary.by_grade[3].accuracy == 0.75
+    assert list(summary.by_day) == [date(2024, 1, 1), date(2024, 1, 2)]
+    assert summary.by_day[date(2024, 1, 1)].correct == 4
+
+    # Test if no answers have no accuracy rather than dividing by zero.
+    assert summarize_quiz_stats([]).total.accuracy == 0
@@ -0,0 +1,82 @@
+import pytest
+
+from src.domain.models import QuizItem
+from src.domain.services.quiz_service.quiz_solving import QuizAnswer, grade_answers
+
+
+def make_quiz_items(num_questions: int) -> list[QuizItem]:
+    """Make the unanswered quiz items of a quiz.
+
+    Args:
+        num_questions (int): The number of questions.
+
+    Returns:
+        list[QuizItem]: The quiz items.
+    """
+    return [
+        QuizItem(
+            quiz_item_id=question_number,
+            quiz_id=1,
+            item_id=question_number,
+            question_number=question_number,
+            choice_item_ids=[question_number, 101, 102, 103],
+            correct_answer=question_number % 4,
+        )
+        for question_number in range(1, num_questions + 1)
+    ]
+
+
+class TestGradeAnswers:
+    """Test cases for the `grade_answers` function."""
+
+    def test_grade_answers(self) -> None:
+        """Test if the answers given in any order are set to the quiz items ordered by question number."""
+        quiz_items = make_quiz_items(100)
+        answers = [
+            QuizAnswer(question_number=question_number, user_answer=1, answer_time=5)
+            for question_number in range(100, 0, -1)
+        ]
+        graded_items = grade_answers(quiz_items, answers)
+        assert [quiz_item.question_number for quiz_item in graded_items] == list(
+            range(1, 101)
+        )
+        assert all(
+            quiz_item.user_answer == 1 and quiz_item.answer_time == 5
+            for quiz_item in graded_items
+        )
+        assert (
+            sum(
+                quiz_item.user_answer == quiz_item.correct_answer
+                for quiz_item in graded_items
+            )
+            == 25
+        )
+        # Test if the given quiz items are left unanswered.
+        assert all(quiz_item.user_answer is None for quiz_item in quiz_items)
+
+    @pytest.mark.parametrize(
+        ("question_numbers", "user_answer"),
+        [
+            ([1, 2, 3], 0),  # A question not in the quiz.
+            ([1, 1], 0),  # A question answered twice.
+            ([1], 0),  # A question not answered.
+            ([1, 2], 4),  # An answer that is not the index of a choice.
+        ],
+    )
+    def test_invalid_answers(
+        self, question_numbers: list[int], user_answer: int
+    ) -> None:
+        """Test if answers that do not match the questions are rejected.
+
+        Args:
+            question_numbers (list[int]): The question numbers answered.
+            user_answer (int): The answer to each question.
+        """
+        answers = [
+            QuizAnswer(
+                question_number=question_number, user_answer=user_answer, answer_time=5
+            )
+            for question_number in question_numbers
+        ]
+        with pytest.raises(ValueError):
+            grade_answers(make_quiz_items(2), answers)
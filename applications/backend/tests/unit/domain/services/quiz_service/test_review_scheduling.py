@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.repositories.sqlalchemy.item_repository import ItemRepository
+from src.db.repositories.sqlalchemy.quiz_repository import QuizRepository
+from src.db.repositories.sqlalchemy.review_state_repository import (
+    ReviewStateRepository,
+)
+from src.db.repositories.sqlalchemy.user_repository import UserRepository
+from src.domain.models import Item, QuizItem, ReviewState, User
+from src.domain.services.quiz_service.quiz_generation import generate_quiz
+from src.domain.services.quiz_service.review_scheduling import (
+    MIN_EASE,
+    answer_quality,
+    schedule_review,
+    update_review_states,
+)
+
+NOW = datetime(2024, 1, 1)
+
+
+def make_quiz_item(user_answer: int, answer_time: int) -> QuizItem:
+    """Make an answered quiz item whose correct answer is the first choice.
+
+    Args:
+        user_answer (int): The index of the choice answered.
+        answer_time (int): The seconds taken to answer.
+
+    Returns:
+        QuizItem: The quiz item.
+    """
+    return QuizItem(
+        item_id=1,
+        question_number=1,
+        choice_item_ids=[1, 2, 3, 4],
+        correct_answer=0,
+        user_answer=user_answer,
+        answer_time=answer_time,
+    )
+
+
+def test_answer_quality() -> None:
+    """Test if correct answers are rated by the time taken, and wrong answers as forgotten."""
+    assert answer_quality(make_quiz_item(0, 3)) == 5
+    assert answer_quality(make_quiz_item(0, 10)) == 4
+    assert answer_quality(make_quiz_item(0, 30)) == 3
+    assert answer_quality(make_quiz_item(1, 3)) == 1
+
+
+def test_schedule_review() -> None:
+    """Test if the intervals follow SM-2 and a forgotten item starts over."""
+    review_state = ReviewState(user_id=1, item_id=1, due_at=NOW, reviewed_at=NOW)
+    intervals = []
+    for _ in range(4):
+        review_state = schedule_review(review_state, 5, NOW)
+        intervals.append(review_state.interval_days)
+    assert intervals == [1, 6, 16, 45]
+    assert review_state.repetitions == 4
+    assert review_state.due_at == NOW + timedelta(days=45)
+
+    ease = review_state.ease
+    review_state = schedule_review(review_state, 1, NOW)
+    assert review_state.repetitions == 0
+    assert review_state.interval_days == 1
+    assert review_state.ease < ease
+    # Test if the ease does not fall below the minimum however often the item is forgotten.
+    for _ in range(10):
+        review_state = schedule_review(review_state, 0, NOW)
+    assert review_state.ease == MIN_EASE
+
+
+@pytest.mark.anyio()
+async def test_review_due_items(async_db_session: AsyncSession) -> None:
+    """Test if the reviews of a graded quiz are scheduled in bulk and the items due are asked first.
+
+    Args:
+        async_db_session (AsyncSession): An asynchronous database session.
+    """
+    user = await UserRepository(async_db_session).create(
+        User(user_name="user", email="email", password="password")
+    )
+    item_repository = ItemRepository(async_db_session)
+    items = await item_repository.create_many(
+        [
+            Item(user_id=None, english=f"english{i}", japanese=f"訳{i}", grade=1)
+            for i in range(20)
+        ]
+    )
+    review_state_repository = ReviewStateRepository(async_db_session)
+    quiz_items = [
+        make_quiz_item(0, 3).model_copy(update={"item_id": items[i].item_id})
+        for i in (3, 7)
+    ]
+    # Test if the first review of an item is due a day later.
+    reviewed_at = datetime.now() - timedelta(days=2)
+    review_states = await update_review_states(
+        review_state_repository, user.user_id, quiz_items, reviewed_at  # type: ignore
+    )
+    assert [review_state.due_at for review_state in review_states] == [
+        reviewed_at + timedelta(days=1)
+    ] * 2
+
+    generated_quiz = await generate_quiz(
+        item_repository,
+        QuizRepository(async_db_session),
+        user.user_id,  # type: ignore
+        3,
+        review_state_repository=review_state_repository,
+    )
+    question_ids = [question.question.item_id for question in generated_quiz.questions]
+    assert question_ids[:2] == [items[3].item_id, items[7].item_id]
+    assert question_ids[2] not in question_ids[:2]
+
+    # Test if the review states are updated in place by the next review.
+    review_states = await update_review_states(
+        review_state_repository, user.user_id, quiz_items[:1], datetime.now()  # type: ignore
+    )
+    assert review_states[0].review_state_id == 1
+    assert review_states[0].interval_days == 6
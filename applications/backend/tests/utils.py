@@ -2,11 +2,13 @@ import random
 import string
 from typing import TypedDict
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
 from src.core.security import get_password_hash
 from src.db.models.sqlalchemy_data_models import (
+    Base,
     SQLAlchemyDeck,
     SQLAlchemyItem,
     SQLAlchemyQuiz,
@@ -47,6 +49,29 @@ def random_email() -> str:
     return f"{random_lower_string()}@{random_lower_string()}.com"
 
 
+async def synchronize_id_sequences(async_session: AsyncSession) -> None:
+    """Advance the id sequences of all tables past the largest ids stored in them.
+
+    The test data are inserted with explicit ids, which do not advance the sequences that
+    generate ids for the records inserted without them.
+
+    Args:
+        async_session (AsyncSession): The SQLAlchemy async session.
+    """
+    async with async_session.begin():
+        for table in Base.metadata.sorted_tables:
+            primary_key = table.primary_key.columns.values()
+            # Association tables have composite primary keys without sequences.
+            if len(primary_key) != 1:
+                continue
+            await async_session.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.fullname}', '{primary_key[0].name}'), "
+                    f"coalesce(max({primary_key[0].name}), 0) + 1, false) FROM {table.fullname}"
+                )
+            )
+
+
 async def create_random_test_user(async_session: AsyncSession) -> dict[str, str]:
     """Create a random normal user in the database for testing.
 
@@ -311,6 +336,7 @@ async def prepare_data_repository_test(async_session: AsyncSession) -> DomainMod
 
     async with async_session.begin():
         async_session.add_all(all_data_models)
+    await synchronize_id_sequences(async_session)
 
     return DomainModelDict(
         user_domain_models=user_domain_models,